@@ -0,0 +1,346 @@
+using System;
+using System.Collections.Generic;
+using System.Drawing;
+using System.Threading;
+using System.Threading.Tasks;
+
+using Rhino;
+using Rhino.DocObjects;
+using Rhino.Geometry;
+using RhinoAI.Core;
+
+namespace RhinoAI.AI
+{
+    /// <summary>
+    /// Adds arrays of prototype geometry to a document. Each prototype is built once by the
+    /// caller; copies are duplicated and transformed in parallel off the calling thread, then
+    /// added in one batch under a single undo record with one redraw at the end. In instance
+    /// mode each prototype becomes one block definition and every copy a block instance.
+    /// </summary>
+    public static class ArrayGenerator
+    {
+        /// <summary>Below this many copies the parallel loop costs more than it saves</summary>
+        private const int ParallelThreshold = 64;
+
+        /// <summary>Default for Geometry:InstancingThreshold</summary>
+        public const int DefaultInstancingThreshold = 1000;
+
+        /// <summary>
+        /// Whether an array of <paramref name="copyCount"/> objects should be placed as block instances;
+        /// a threshold of zero or less turns instancing off
+        /// </summary>
+        public static bool ShouldUseInstances(int copyCount, int instancingThreshold)
+        {
+            return instancingThreshold > 0 && copyCount >= instancingThreshold;
+        }
+
+        /// <summary>
+        /// One translation per offset, in offset order
+        /// </summary>
+        public static Transform[] ToTransforms(ArrayOffsets offsets)
+        {
+            var transforms = new Transform[offsets.Count];
+            for (int i = 0; i < transforms.Length; i++)
+            {
+                transforms[i] = Transform.Translation(offsets.X[i], offsets.Y[i], offsets.Z[i]);
+            }
+            return transforms;
+        }
+
+        /// <summary>
+        /// Attributes for array copies: the object colour when <paramref name="color"/> is given, otherwise the layer's
+        /// </summary>
+        public static ObjectAttributes CreateAttributes(Color? color)
+        {
+            var attributes = new ObjectAttributes();
+            if (color.HasValue)
+            {
+                attributes.ObjectColor = color.Value;
+                attributes.ColorSource = ObjectColorSource.ColorFromObject;
+            }
+            return attributes;
+        }
+
+        /// <summary>
+        /// Transformed duplicates of every prototype at every placement, placement-major:
+        /// copy (placement, prototype) is at index placement * prototypes.Count + prototype
+        /// </summary>
+        public static GeometryBase[] CreateCopies(IReadOnlyList<GeometryBase> prototypes, IReadOnlyList<Transform> placements,
+            CancellationToken cancellationToken = default)
+        {
+            if (prototypes == null) throw new ArgumentNullException(nameof(prototypes));
+            if (placements == null) throw new ArgumentNullException(nameof(placements));
+
+            var copies = new GeometryBase[prototypes.Count * placements.Count];
+
+            void CreateCopy(int index)
+            {
+                var copy = prototypes[index % prototypes.Count].Duplicate();
+                if (copy != null && copy.Transform(placements[index / prototypes.Count]))
+                {
+                    copies[index] = copy;
+                }
+            }
+
+            if (copies.Length < ParallelThreshold)
+            {
+                for (int i = 0; i < copies.Length; i++)
+                {
+                    cancellationToken.ThrowIfCancellationRequested();
+                    CreateCopy(i);
+                }
+            }
+            else
+            {
+                var options = new ParallelOptions { CancellationToken = cancellationToken };
+                Parallel.For(0, copies.Length, options, CreateCopy);
+            }
+
+            return copies;
+        }
+
+        /// <summary>
+        /// Create the copies on the thread pool, then add them to <paramref name="doc"/> as one batch
+        /// </summary>
+        public static async Task<ArrayResult> AddAsync(RhinoDoc doc, ArrayRequest request, CancellationToken cancellationToken = default)
+        {
+            if (doc == null) throw new ArgumentNullException(nameof(doc));
+            if (request == null) throw new ArgumentNullException(nameof(request));
+
+            using var span = PipelineTelemetry.StartSpan("Array.Generate", "Rhino");
+            span?.SetTag("rhinoai.array_copies", request.Prototypes.Count * request.Placements.Count);
+            span?.SetTag("rhinoai.array_instances", request.UseInstances);
+
+            if (request.UseInstances)
+            {
+                using (PipelineTelemetry.StartSpan("Array.Commit", "Rhino"))
+                {
+                    return CommitInstances(doc, request);
+                }
+            }
+
+            GeometryBase[] copies;
+            using (PipelineTelemetry.StartSpan("Array.CreateGeometry", "Rhino"))
+            {
+                copies = await Task.Run(() => CreateCopies(request.Prototypes, request.Placements, cancellationToken), cancellationToken);
+            }
+
+            using (PipelineTelemetry.StartSpan("Array.Commit", "Rhino"))
+            {
+                return Commit(doc, request, copies);
+            }
+        }
+
+        /// <summary>
+        /// Add copies made by CreateCopies under one undo record, with redraws suppressed until all are added
+        /// </summary>
+        public static ArrayResult Commit(RhinoDoc doc, ArrayRequest request, GeometryBase[] copies)
+        {
+            var result = new ArrayResult { RequestedCount = copies.Length };
+            var prototypeCount = request.Prototypes.Count;
+
+            // Added objects get a copy of the attributes, so one instance per prototype serves every copy
+            var attributes = new ObjectAttributes[prototypeCount];
+            for (int p = 0; p < prototypeCount; p++)
+            {
+                attributes[p] = request.Attributes?[p]?.Duplicate() ?? new ObjectAttributes();
+            }
+
+            var undoRecord = doc.BeginUndoRecord(request.UndoDescription ?? $"RhinoAI array ({copies.Length} objects)");
+            var redrawEnabled = doc.Views.RedrawEnabled;
+            doc.Views.RedrawEnabled = false;
+            try
+            {
+                for (int i = 0; i < copies.Length; i++)
+                {
+                    if (copies[i] == null) continue;
+
+                    var objectAttributes = attributes[i % prototypeCount];
+                    if (request.PlacementName != null)
+                    {
+                        objectAttributes.Name = request.PlacementName(i / prototypeCount);
+                    }
+
+                    var id = AddObject(doc, copies[i], objectAttributes);
+                    if (id != Guid.Empty)
+                    {
+                        result.CreatedIds.Add(id);
+                    }
+                }
+
+                if (request.SelectCreated && result.CreatedIds.Count > 0)
+                {
+                    doc.Objects.Select(result.CreatedIds);
+                }
+            }
+            finally
+            {
+                doc.Views.RedrawEnabled = redrawEnabled;
+
+                // Zero means a record was already open, so these objects belong to it
+                if (undoRecord != 0)
+                {
+                    doc.EndUndoRecord(undoRecord);
+                }
+
+                PipelineTelemetry.RedrawViews(doc);
+            }
+
+            return result;
+        }
+
+        /// <summary>
+        /// Define each distinct prototype once as a block and add one instance per copy, under one undo record.
+        /// Prototypes that already are block instances reuse their definition.
+        /// </summary>
+        public static ArrayResult CommitInstances(RhinoDoc doc, ArrayRequest request)
+        {
+            var prototypeCount = request.Prototypes.Count;
+            var result = new ArrayResult { RequestedCount = prototypeCount * request.Placements.Count, UsedInstances = true };
+
+            var undoRecord = doc.BeginUndoRecord(request.UndoDescription ?? $"RhinoAI instance array ({result.RequestedCount} objects)");
+            var redrawEnabled = doc.Views.RedrawEnabled;
+            doc.Views.RedrawEnabled = false;
+            try
+            {
+                var definitions = new int[prototypeCount];
+                var baseTransforms = new Transform[prototypeCount];
+                var attributes = new ObjectAttributes[prototypeCount];
+                var defined = new Dictionary<GeometryBase, int>(ReferenceEqualityComparer.Instance);
+
+                for (int p = 0; p < prototypeCount; p++)
+                {
+                    var prototype = request.Prototypes[p];
+                    attributes[p] = request.Attributes?[p]?.Duplicate() ?? new ObjectAttributes();
+                    baseTransforms[p] = Transform.Identity;
+
+                    if (prototype is InstanceReferenceGeometry reference &&
+                        doc.InstanceDefinitions.FindId(reference.ParentIdefId) is InstanceDefinition existing)
+                    {
+                        definitions[p] = existing.Index;
+                        baseTransforms[p] = reference.Xform;
+                    }
+                    else if (defined.TryGetValue(prototype, out var index))
+                    {
+                        definitions[p] = index;
+                    }
+                    else
+                    {
+                        definitions[p] = DefinePrototype(doc, prototype, request.DefinitionName);
+                        defined[prototype] = definitions[p];
+                        result.DefinitionCount++;
+                    }
+                }
+
+                for (int i = 0; i < result.RequestedCount; i++)
+                {
+                    var placement = i / prototypeCount;
+                    var p = i % prototypeCount;
+                    if (request.PlacementName != null)
+                    {
+                        attributes[p].Name = request.PlacementName(placement);
+                    }
+
+                    var id = doc.Objects.AddInstanceObject(definitions[p], request.Placements[placement] * baseTransforms[p], attributes[p]);
+                    if (id != Guid.Empty)
+                    {
+                        result.CreatedIds.Add(id);
+                    }
+                }
+
+                if (request.SelectCreated && result.CreatedIds.Count > 0)
+                {
+                    doc.Objects.Select(result.CreatedIds);
+                }
+            }
+            finally
+            {
+                doc.Views.RedrawEnabled = redrawEnabled;
+
+                if (undoRecord != 0)
+                {
+                    doc.EndUndoRecord(undoRecord);
+                }
+
+                PipelineTelemetry.RedrawViews(doc);
+            }
+
+            return result;
+        }
+
+        /// <summary>
+        /// Block definition holding the prototype at its own position, so an identity instance reproduces it
+        /// </summary>
+        private static int DefinePrototype(RhinoDoc doc, GeometryBase prototype, string definitionName)
+        {
+            // Members take colour and material from each instance, so instances can be styled individually
+            var memberAttributes = new ObjectAttributes
+            {
+                ColorSource = ObjectColorSource.ColorFromParent,
+                MaterialSource = ObjectMaterialSource.MaterialFromParent
+            };
+
+            var name = doc.InstanceDefinitions.GetUnusedInstanceDefinitionName(definitionName ?? "RhinoAI Array");
+            var index = doc.InstanceDefinitions.Add(name, "Created by RhinoAI", Point3d.Origin, prototype, memberAttributes);
+            if (index < 0)
+            {
+                throw new InvalidOperationException($"Could not create block definition '{name}'");
+            }
+            return index;
+        }
+
+        /// <summary>
+        /// Add geometry as a document object; block instance geometry is added as an instance of its definition
+        /// </summary>
+        private static Guid AddObject(RhinoDoc doc, GeometryBase geometry, ObjectAttributes attributes)
+        {
+            if (geometry is InstanceReferenceGeometry reference)
+            {
+                var definition = doc.InstanceDefinitions.FindId(reference.ParentIdefId);
+                return definition != null
+                    ? doc.Objects.AddInstanceObject(definition.Index, reference.Xform, attributes)
+                    : Guid.Empty;
+            }
+
+            return doc.Objects.Add(geometry, attributes);
+        }
+    }
+
+    /// <summary>
+    /// What to array: prototypes placed at every transform
+    /// </summary>
+    public class ArrayRequest
+    {
+        /// <summary>Geometry to copy, already at its base position; never added itself</summary>
+        public IReadOnlyList<GeometryBase> Prototypes { get; set; } = Array.Empty<GeometryBase>();
+
+        /// <summary>Attributes per prototype; null entries (or a null list) use default attributes</summary>
+        public IReadOnlyList<ObjectAttributes> Attributes { get; set; }
+
+        public IReadOnlyList<Transform> Placements { get; set; } = Array.Empty<Transform>();
+
+        /// <summary>Object name for the copies at a placement index, or null to keep the prototype's name</summary>
+        public Func<int, string> PlacementName { get; set; }
+
+        public string UndoDescription { get; set; }
+
+        public bool SelectCreated { get; set; } = true;
+
+        /// <summary>Place block instances of one definition per prototype instead of full copies</summary>
+        public bool UseInstances { get; set; }
+
+        /// <summary>Base name for new block definitions; made unique in the document</summary>
+        public string DefinitionName { get; set; }
+    }
+
+    public class ArrayResult
+    {
+        public int RequestedCount { get; set; }
+        public List<Guid> CreatedIds { get; } = new List<Guid>();
+        public bool UsedInstances { get; set; }
+
+        /// <summary>Block definitions created for the array</summary>
+        public int DefinitionCount { get; set; }
+        public int CreatedCount => CreatedIds.Count;
+    }
+}
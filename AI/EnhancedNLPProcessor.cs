@@ -7,6 +7,9 @@ using Rhino;
 using Rhino.Geometry;
 using Rhino.DocObjects;
 using System.Drawing;
+using System.Text.RegularExpressions;
+using RhinoAI.Core;
+using RhinoAI.Utils;
 
 namespace RhinoAI.AI
 {
@@ -20,16 +23,27 @@ namespace RhinoAI.AI
         private readonly ContextManager _contextManager;
         private readonly ParameterExtractor _parameterExtractor;
         private readonly SemanticValidator _semanticValidator;
-        private readonly Dictionary<string, CachedResponse> _responseCache;
+        private readonly LruCache<string, CommandInterpretation> _interpretationCache;
+        private readonly int _instancingThreshold;
         private ConversationContext _currentContext;
 
-        public EnhancedNLPProcessor()
+        private static readonly Regex WhitespaceRun = new Regex(@"\s+", RegexOptions.Compiled);
+
+        public EnhancedNLPProcessor() : this(maxCacheSize: 100, cacheTimeToLive: TimeSpan.FromMinutes(5))
+        {
+        }
+
+        /// <param name="maxCacheSize">Maximum number of cached interpretations; zero disables the cache</param>
+        /// <param name="cacheTimeToLive">How long a cached interpretation stays valid</param>
+        /// <param name="instancingThreshold">Arrays and copies of at least this many objects are placed as block instances; zero disables</param>
+        public EnhancedNLPProcessor(int maxCacheSize, TimeSpan cacheTimeToLive, int instancingThreshold = ArrayGenerator.DefaultInstancingThreshold)
         {
+            _instancingThreshold = instancingThreshold;
             _intentClassifier = new IntentClassifier();
             _contextManager = new ContextManager();
             _parameterExtractor = new ParameterExtractor();
             _semanticValidator = new SemanticValidator();
-            _responseCache = new Dictionary<string, CachedResponse>();
+            _interpretationCache = new LruCache<string, CommandInterpretation>(maxCacheSize, cacheTimeToLive);
             _currentContext = new ConversationContext();
         }
 
@@ -38,61 +52,100 @@ namespace RhinoAI.AI
         /// </summary>
         public async Task<ProcessingResult> ProcessAsync(string input)
         {
+            using var span = PipelineTelemetry.StartSpan("EnhancedNLP.Process", "NLP");
             try
             {
-                // Check cache first
-                var cacheKey = GenerateCacheKey(input, _currentContext);
-                if (_responseCache.TryGetValue(cacheKey, out var cached) && !cached.IsExpired)
+                // Step 1: Enhance context with current input
+                using (PipelineTelemetry.StartSpan("EnhancedNLP.EnhanceContext", "NLP"))
                 {
-                    return cached.Result;
+                    _currentContext = await _contextManager.EnhanceContextAsync(input, _currentContext);
+                    _currentContext.SpatialIndex = RhinoAIPlugin.Instance?.AIManager?.RealTimeAssistant?.GetSpatialIndex(RhinoDoc.ActiveDoc);
                 }
 
-                // Step 1: Enhance context with current input
-                _currentContext = await _contextManager.EnhanceContextAsync(input, _currentContext);
-
-                // Step 2: Classify intent
-                var intentResult = await _intentClassifier.ClassifyIntentAsync(input, _currentContext);
-                
-                if (intentResult.Confidence < 0.3)
+                // Repeated commands reuse the interpretation (intent and extracted parameters) but are always validated and executed
+                var cacheKey = GenerateCacheKey(input, _currentContext);
+                var cacheHit = _interpretationCache.TryGet(cacheKey, out var interpretation);
+                span?.SetTag("rhinoai.cache_hit", cacheHit);
+                if (!cacheHit)
                 {
-                    return ProcessingResult.Error("I'm not sure what you want me to do. Could you be more specific?");
-                }
+                    // Step 2: Classify intent
+                    IntentResult intentResult;
+                    using (PipelineTelemetry.StartSpan("EnhancedNLP.ClassifyIntent", "NLP"))
+                    {
+                        intentResult = await _intentClassifier.ClassifyIntentAsync(input, _currentContext);
+                    }
+                
+                    if (intentResult.Confidence < 0.3)
+                    {
+                        return ProcessingResult.Error("I'm not sure what you want me to do. Could you be more specific?");
+                    }
 
-                // Step 3: Extract parameters
-                var parameters = await _parameterExtractor.ExtractParametersAsync(
-                    input, intentResult.CommandTemplate, _currentContext);
+                    // Step 3: Extract parameters
+                    Dictionary<string, object> extracted;
+                    using (PipelineTelemetry.StartSpan("EnhancedNLP.ExtractParameters", "NLP"))
+                    {
+                        extracted = await _parameterExtractor.ExtractParametersAsync(
+                            input, intentResult.CommandTemplate, _currentContext);
+                    }
 
-                // Step 4: Semantic validation
-                var validationResult = await _semanticValidator.PreExecuteValidationAsync(
-                    intentResult.CommandTemplate, parameters, _currentContext);
+                    interpretation = new CommandInterpretation(intentResult.CommandTemplate, extracted);
+                }
 
-                if (!validationResult.IsValid)
+                // Step 4: Semantic validation, against the current scene even for cached interpretations.
+                // Validation and handlers may adjust parameters, so each run gets its own copy.
+                var template = interpretation.CommandTemplate;
+                var parameters = new Dictionary<string, object>(interpretation.Parameters);
+                var warnings = new List<string>();
+                using (var validationSpan = PipelineTelemetry.StartSpan("EnhancedNLP.Validate", "NLP"))
                 {
-                    // Try to adjust parameters automatically
-                    parameters = await _parameterExtractor.AdjustParametersAsync(parameters, validationResult.ErrorMessage);
-                    
-                    // Re-validate
-                    validationResult = await _semanticValidator.ValidateParametersAsync(parameters, intentResult.CommandTemplate);
-                    
+                    var validationResult = await _semanticValidator.PreExecuteValidationAsync(
+                        template, parameters, _currentContext);
+                    warnings.AddRange(validationResult.Warnings);
+
                     if (!validationResult.IsValid)
                     {
-                        return ProcessingResult.Error($"Parameter validation failed: {validationResult.ErrorMessage}");
+                        // Try to adjust parameters automatically
+                        parameters = await _parameterExtractor.AdjustParametersAsync(parameters, validationResult.ErrorMessage);
+                    
+                        // Re-validate
+                        validationResult = await _semanticValidator.ValidateParametersAsync(parameters, template);
+                    
+                        if (!validationResult.IsValid)
+                        {
+                            validationSpan.SetError(validationResult.ErrorMessage);
+                            return ProcessingResult.Error($"Parameter validation failed: {validationResult.ErrorMessage}");
+                        }
                     }
                 }
 
                 // Step 5: Execute command
-                var result = await ExecuteCommandAsync(intentResult.CommandTemplate, parameters);
+                ProcessingResult result;
+                using (var executionSpan = PipelineTelemetry.StartSpan("EnhancedNLP.ExecuteCommand", "Rhino"))
+                {
+                    executionSpan?.SetTag("rhinoai.command", template.CommandName);
 
-                // Step 6: Cache successful results
-                if (result.IsSuccess)
+                    result = await ExecuteCommandAsync(template, parameters);
+                    if (!result.IsSuccess)
+                    {
+                        executionSpan.SetError(result.ErrorMessage);
+                    }
+                    else if (warnings.Count > 0 && result.Type == ProcessingResultType.Success)
+                    {
+                        result = ProcessingResult.Warning($"{result.Message} ({string.Join("; ", warnings)})");
+                    }
+                }
+
+                // Step 6: Cache interpretations that executed successfully
+                if (result.IsSuccess && !cacheHit)
                 {
-                    _responseCache[cacheKey] = new CachedResponse(result, DateTime.UtcNow.AddMinutes(5));
+                    _interpretationCache.Set(cacheKey, interpretation);
                 }
 
                 return result;
             }
             catch (Exception ex)
             {
+                span.SetError(ex.Message);
                 return ProcessingResult.Error($"Processing failed: {ex.Message}");
             }
         }
@@ -134,7 +187,7 @@ namespace RhinoAI.AI
 
         #region Command Implementations
 
-        private Task<ProcessingResult> CreateSphereArrayAsync(Dictionary<string, object> parameters)
+        private async Task<ProcessingResult> CreateSphereArrayAsync(Dictionary<string, object> parameters)
         {
             try
             {
@@ -146,71 +199,40 @@ namespace RhinoAI.AI
                 var name = _parameterExtractor.GetString(parameters, "name", "");
                 var color = GetColorParameter(parameters, "color");
 
-                var createdCount = 0;
-                var createdIds = new List<Guid>();
-
-                for (int row = 0; row < rows; row++)
+                var prototype = new Sphere(center, radius).ToBrep();
+                if (prototype?.IsValid != true)
                 {
-                    for (int col = 0; col < columns; col++)
-                    {
-                        var sphereCenter = new Point3d(
-                            center.X + col * spacing,
-                            center.Y + row * spacing,
-                            center.Z
-                        );
-
-                        var sphere = new Sphere(sphereCenter, radius);
-                        var brep = sphere.ToBrep();
-
-                        if (brep?.IsValid == true)
-                        {
-                            var attributes = new ObjectAttributes();
-                            
-                            if (color.HasValue)
-                            {
-                                attributes.ObjectColor = color.Value;
-                                attributes.ColorSource = ObjectColorSource.ColorFromObject;
-                            }
-
-                            if (!string.IsNullOrEmpty(name))
-                            {
-                                attributes.Name = $"{name}_sphere_{row}_{col}";
-                            }
-
-                            var id = RhinoDoc.ActiveDoc.Objects.AddBrep(brep, attributes);
-                            
-                            if (id != Guid.Empty)
-                            {
-                                createdIds.Add(id);
-                                createdCount++;
-                                _currentContext.AddCreatedObject(id, "Sphere", parameters);
-                            }
-                        }
-                    }
+                    return ProcessingResult.Error("Failed to create sphere array");
                 }
 
-                if (createdCount > 0)
+                var result = await ArrayGenerator.AddAsync(RhinoDoc.ActiveDoc, new ArrayRequest
                 {
-                    // Select all created spheres
-                    foreach (var id in createdIds)
-                    {
-                        RhinoDoc.ActiveDoc.Objects.Select(id);
-                    }
-                    RhinoDoc.ActiveDoc.Views.Redraw();
+                    Prototypes = new[] { prototype },
+                    Attributes = new[] { ArrayGenerator.CreateAttributes(color) },
+                    Placements = ArrayGenerator.ToTransforms(ArrayLayout.Grid(rows, columns, spacing, spacing)),
+                    PlacementName = string.IsNullOrEmpty(name) ? null : i => $"{name}_sphere_{i / columns}_{i % columns}",
+                    UndoDescription = $"RhinoAI sphere array ({rows}x{columns})",
+                    UseInstances = ArrayGenerator.ShouldUseInstances(rows * columns, _instancingThreshold),
+                    DefinitionName = string.IsNullOrEmpty(name) ? "RhinoAI Sphere" : name
+                });
+
+                if (result.CreatedCount > 0)
+                {
+                    _currentContext.AddCreatedObject(result.CreatedIds[^1], "Sphere", parameters);
 
                     var colorName = color.HasValue ? GetColorName(color.Value) : "default";
-                    return Task.FromResult(ProcessingResult.Success($"Created {createdCount} spheres in {colorName} in a {rows}x{columns} array with radius {radius:F2} and spacing {spacing:F2}"));
+                    return ProcessingResult.Success($"Created {result.CreatedCount} spheres{DescribePlacement(result)} in {colorName} in a {rows}x{columns} array with radius {radius:F2} and spacing {spacing:F2}");
                 }
 
-                return Task.FromResult(ProcessingResult.Error("Failed to create sphere array"));
+                return ProcessingResult.Error("Failed to create sphere array");
             }
             catch (Exception ex)
             {
-                return Task.FromResult(ProcessingResult.Error($"Error creating sphere array: {ex.Message}"));
+                return ProcessingResult.Error($"Error creating sphere array: {ex.Message}");
             }
         }
 
-        private Task<ProcessingResult> CreateBoxArrayAsync(Dictionary<string, object> parameters)
+        private async Task<ProcessingResult> CreateBoxArrayAsync(Dictionary<string, object> parameters)
         {
             try
             {
@@ -222,77 +244,49 @@ namespace RhinoAI.AI
                 var name = _parameterExtractor.GetString(parameters, "name", "");
                 var color = GetColorParameter(parameters, "color");
 
-                var createdCount = 0;
-                var createdIds = new List<Guid>();
+                var box = new Box(Plane.WorldXY, new Interval(-dimensions.X/2, dimensions.X/2),
+                                 new Interval(-dimensions.Y/2, dimensions.Y/2),
+                                 new Interval(-dimensions.Z/2, dimensions.Z/2));
+                box.Transform(Transform.Translation(center - Point3d.Origin));
 
-                for (int row = 0; row < rows; row++)
+                var prototype = box.ToBrep();
+                if (prototype?.IsValid != true)
                 {
-                    for (int col = 0; col < columns; col++)
-                    {
-                        var boxCenter = new Point3d(
-                            center.X + col * spacing,
-                            center.Y + row * spacing,
-                            center.Z
-                        );
-
-                        var box = new Box(Plane.WorldXY, new Interval(-dimensions.X/2, dimensions.X/2),
-                                         new Interval(-dimensions.Y/2, dimensions.Y/2),
-                                         new Interval(-dimensions.Z/2, dimensions.Z/2));
-                        
-                        // Translate to position
-                        var transform = Transform.Translation(boxCenter - Point3d.Origin);
-                        box.Transform(transform);
-                        
-                        var brep = box.ToBrep();
-
-                        if (brep?.IsValid == true)
-                        {
-                            var attributes = new ObjectAttributes();
-                            
-                            if (color.HasValue)
-                            {
-                                attributes.ObjectColor = color.Value;
-                                attributes.ColorSource = ObjectColorSource.ColorFromObject;
-                            }
-
-                            if (!string.IsNullOrEmpty(name))
-                            {
-                                attributes.Name = $"{name}_box_{row}_{col}";
-                            }
-
-                            var id = RhinoDoc.ActiveDoc.Objects.AddBrep(brep, attributes);
-                            
-                            if (id != Guid.Empty)
-                            {
-                                createdIds.Add(id);
-                                createdCount++;
-                                _currentContext.AddCreatedObject(id, "Box", parameters);
-                            }
-                        }
-                    }
+                    return ProcessingResult.Error("Failed to create box array");
                 }
 
-                if (createdCount > 0)
+                var result = await ArrayGenerator.AddAsync(RhinoDoc.ActiveDoc, new ArrayRequest
                 {
-                    // Select all created boxes
-                    foreach (var id in createdIds)
-                    {
-                        RhinoDoc.ActiveDoc.Objects.Select(id);
-                    }
-                    RhinoDoc.ActiveDoc.Views.Redraw();
+                    Prototypes = new[] { prototype },
+                    Attributes = new[] { ArrayGenerator.CreateAttributes(color) },
+                    Placements = ArrayGenerator.ToTransforms(ArrayLayout.Grid(rows, columns, spacing, spacing)),
+                    PlacementName = string.IsNullOrEmpty(name) ? null : i => $"{name}_box_{i / columns}_{i % columns}",
+                    UndoDescription = $"RhinoAI box array ({rows}x{columns})",
+                    UseInstances = ArrayGenerator.ShouldUseInstances(rows * columns, _instancingThreshold),
+                    DefinitionName = string.IsNullOrEmpty(name) ? "RhinoAI Box" : name
+                });
+
+                if (result.CreatedCount > 0)
+                {
+                    _currentContext.AddCreatedObject(result.CreatedIds[^1], "Box", parameters);
 
                     var colorName = color.HasValue ? GetColorName(color.Value) : "default";
-                    return Task.FromResult(ProcessingResult.Success($"Created {createdCount} boxes in {colorName} in a {rows}x{columns} array with dimensions {dimensions.X:F1}x{dimensions.Y:F1}x{dimensions.Z:F1} and spacing {spacing:F2}"));
+                    return ProcessingResult.Success($"Created {result.CreatedCount} boxes{DescribePlacement(result)} in {colorName} in a {rows}x{columns} array with dimensions {dimensions.X:F1}x{dimensions.Y:F1}x{dimensions.Z:F1} and spacing {spacing:F2}");
                 }
 
-                return Task.FromResult(ProcessingResult.Error("Failed to create box array"));
+                return ProcessingResult.Error("Failed to create box array");
             }
             catch (Exception ex)
             {
-                return Task.FromResult(ProcessingResult.Error($"Error creating box array: {ex.Message}"));
+                return ProcessingResult.Error($"Error creating box array: {ex.Message}");
             }
         }
 
+        private static string DescribePlacement(ArrayResult result)
+        {
+            return result.UsedInstances ? " as block instances" : string.Empty;
+        }
+
         private Task<ProcessingResult> CreateTorusAsync(Dictionary<string, object> parameters)
         {
             try
@@ -332,7 +326,7 @@ namespace RhinoAI.AI
                     {
                         _currentContext.AddCreatedObject(id, "Torus", parameters);
                         RhinoDoc.ActiveDoc.Objects.Select(id);
-                        RhinoDoc.ActiveDoc.Views.Redraw();
+                        PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
 
                         var colorName = color.HasValue ? GetColorName(color.Value) : "default";
                         var nameInfo = !string.IsNullOrEmpty(name) ? $" named '{name}'" : "";
@@ -384,7 +378,7 @@ namespace RhinoAI.AI
                     {
                         _currentContext.AddCreatedObject(id, "Cone", parameters);
                         RhinoDoc.ActiveDoc.Objects.Select(id);
-                        RhinoDoc.ActiveDoc.Views.Redraw();
+                        PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
 
                         var colorName = color.HasValue ? GetColorName(color.Value) : "default";
                         var nameInfo = !string.IsNullOrEmpty(name) ? $" named '{name}'" : "";
@@ -434,7 +428,7 @@ namespace RhinoAI.AI
                     {
                         _currentContext.AddCreatedObject(id, "Line", parameters);
                         RhinoDoc.ActiveDoc.Objects.Select(id);
-                        RhinoDoc.ActiveDoc.Views.Redraw();
+                        PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
 
                         var colorName = color.HasValue ? GetColorName(color.Value) : "default";
                         var nameInfo = !string.IsNullOrEmpty(name) ? $" named '{name}'" : "";
@@ -485,7 +479,7 @@ namespace RhinoAI.AI
                     {
                         _currentContext.AddCreatedObject(id, "Circle", parameters);
                         RhinoDoc.ActiveDoc.Objects.Select(id);
-                        RhinoDoc.ActiveDoc.Views.Redraw();
+                        PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
 
                         var colorName = color.HasValue ? GetColorName(color.Value) : "default";
                         var nameInfo = !string.IsNullOrEmpty(name) ? $" named '{name}'" : "";
@@ -538,7 +532,7 @@ namespace RhinoAI.AI
                     {
                         _currentContext.AddCreatedObject(id, "Arc", parameters);
                         RhinoDoc.ActiveDoc.Objects.Select(id);
-                        RhinoDoc.ActiveDoc.Views.Redraw();
+                        PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
 
                         var colorName = color.HasValue ? GetColorName(color.Value) : "default";
                         var nameInfo = !string.IsNullOrEmpty(name) ? $" named '{name}'" : "";
@@ -591,7 +585,7 @@ namespace RhinoAI.AI
                     {
                         _currentContext.AddCreatedObject(id, "Polyline", parameters);
                         RhinoDoc.ActiveDoc.Objects.Select(id);
-                        RhinoDoc.ActiveDoc.Views.Redraw();
+                        PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
 
                         var colorName = color.HasValue ? GetColorName(color.Value) : "default";
                         var nameInfo = !string.IsNullOrEmpty(name) ? $" named '{name}'" : "";
@@ -645,7 +639,7 @@ namespace RhinoAI.AI
                         
                         // Select the created object
                         RhinoDoc.ActiveDoc.Objects.Select(id);
-                        RhinoDoc.ActiveDoc.Views.Redraw();
+                        PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
 
                         var colorName = color.HasValue ? GetColorName(color.Value) : "default";
                         var nameInfo = !string.IsNullOrEmpty(name) ? $" named '{name}'" : "";
@@ -702,7 +696,7 @@ namespace RhinoAI.AI
                     {
                         _currentContext.AddCreatedObject(id, "Box", parameters);
                         RhinoDoc.ActiveDoc.Objects.Select(id);
-                        RhinoDoc.ActiveDoc.Views.Redraw();
+                        PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
 
                         var colorName = color.HasValue ? GetColorName(color.Value) : "default";
                         var nameInfo = !string.IsNullOrEmpty(name) ? $" named '{name}'" : "";
@@ -755,7 +749,7 @@ namespace RhinoAI.AI
                     {
                         _currentContext.AddCreatedObject(id, "Cylinder", parameters);
                         RhinoDoc.ActiveDoc.Objects.Select(id);
-                        RhinoDoc.ActiveDoc.Views.Redraw();
+                        PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
 
                         var colorName = color.HasValue ? GetColorName(color.Value) : "default";
                         var nameInfo = !string.IsNullOrEmpty(name) ? $" named '{name}'" : "";
@@ -795,7 +789,7 @@ namespace RhinoAI.AI
                     }
                 }
 
-                RhinoDoc.ActiveDoc.Views.Redraw();
+                PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
                 return Task.FromResult(ProcessingResult.Success($"Moved {movedCount} object(s) by {translation}"));
             }
             catch (Exception ex)
@@ -827,7 +821,7 @@ namespace RhinoAI.AI
                     }
                 }
 
-                RhinoDoc.ActiveDoc.Views.Redraw();
+                PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
                 return Task.FromResult(ProcessingResult.Success($"Scaled {scaledCount} object(s) by factor {scale:F2}"));
             }
             catch (Exception ex)
@@ -861,7 +855,7 @@ namespace RhinoAI.AI
                     // Add union result
                     var unionId = RhinoDoc.ActiveDoc.Objects.AddBrep(unionResult[0]);
                     RhinoDoc.ActiveDoc.Objects.Select(unionId);
-                    RhinoDoc.ActiveDoc.Views.Redraw();
+                    PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
 
                     return Task.FromResult(ProcessingResult.Success($"Created boolean union from {breps.Length} objects"));
                 }
@@ -902,7 +896,7 @@ namespace RhinoAI.AI
                     // Add difference result
                     var diffId = RhinoDoc.ActiveDoc.Objects.AddBrep(differenceResult[0]);
                     RhinoDoc.ActiveDoc.Objects.Select(diffId);
-                    RhinoDoc.ActiveDoc.Views.Redraw();
+                    PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
 
                     return Task.FromResult(ProcessingResult.Success($"Created boolean difference from {breps.Length} objects"));
                 }
@@ -943,7 +937,7 @@ namespace RhinoAI.AI
                     // Add intersection result
                     var intId = RhinoDoc.ActiveDoc.Objects.AddBrep(intersectionResult[0]);
                     RhinoDoc.ActiveDoc.Objects.Select(intId);
-                    RhinoDoc.ActiveDoc.Views.Redraw();
+                    PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
 
                     return Task.FromResult(ProcessingResult.Success($"Created boolean intersection from {breps.Length} objects"));
                 }
@@ -983,7 +977,7 @@ namespace RhinoAI.AI
                     }
                 }
 
-                RhinoDoc.ActiveDoc.Views.Redraw();
+                PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
                 return Task.FromResult(ProcessingResult.Success($"Exploded {selectedObjects.Count()} object(s) into {explodedCount} faces"));
             }
             catch (Exception ex)
@@ -1021,7 +1015,7 @@ namespace RhinoAI.AI
                         RhinoDoc.ActiveDoc.Objects.Select(joinId);
                     }
                     
-                    RhinoDoc.ActiveDoc.Views.Redraw();
+                    PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
                     return Task.FromResult(ProcessingResult.Success($"Joined {breps.Length} objects into {joinedBreps.Length} object(s)"));
                 }
 
@@ -1033,49 +1027,36 @@ namespace RhinoAI.AI
             }
         }
 
-        private Task<ProcessingResult> CreateCircularArrayAsync(Dictionary<string, object> parameters)
+        private async Task<ProcessingResult> CreateCircularArrayAsync(Dictionary<string, object> parameters)
         {
             try
             {
                 var center = _parameterExtractor.GetPoint3d(parameters, "center", Point3d.Origin);
                 var count = _parameterExtractor.GetInt(parameters, "count", 6);
                 var radius = _parameterExtractor.GetDouble(parameters, "radius", 5.0);
-                var selectedObjects = RhinoDoc.ActiveDoc.Objects.GetSelectedObjects(false, false);
+                var selectedObjects = RhinoDoc.ActiveDoc.Objects.GetSelectedObjects(false, false)?.ToList();
 
-                if (selectedObjects?.Count() == 0)
+                if (selectedObjects == null || selectedObjects.Count == 0)
                 {
-                    return Task.FromResult(ProcessingResult.Warning("No objects selected for circular array"));
+                    return ProcessingResult.Warning("No objects selected for circular array");
                 }
 
-                var createdCount = 0;
-                var angleStep = 2 * Math.PI / count;
-
-                for (int i = 1; i < count; i++) // Start from 1 since original is at 0
+                // Start from 1 since the original is at 0
+                var result = await ArrayGenerator.AddAsync(RhinoDoc.ActiveDoc, new ArrayRequest
                 {
-                    var angle = i * angleStep;
-                    var x = center.X + radius * Math.Cos(angle);
-                    var y = center.Y + radius * Math.Sin(angle);
-                    var arrayPoint = new Point3d(x, y, center.Z);
-                    
-                    var translation = arrayPoint - center;
-                    var transform = Transform.Translation(translation);
-
-                    foreach (var obj in selectedObjects)
-                    {
-                        var duplicate = RhinoDoc.ActiveDoc.Objects.Transform(obj.Id, transform, false);
-                        if (duplicate != Guid.Empty)
-                        {
-                            createdCount++;
-                        }
-                    }
-                }
-
-                RhinoDoc.ActiveDoc.Views.Redraw();
-                return Task.FromResult(ProcessingResult.Success($"Created circular array with {createdCount} objects around {center} with radius {radius:F2}"));
+                    Prototypes = selectedObjects.Select(obj => obj.Geometry.Duplicate()).ToList(),
+                    Attributes = selectedObjects.Select(obj => obj.Attributes).ToList(),
+                    Placements = ArrayGenerator.ToTransforms(ArrayLayout.Circular(count, radius, first: 1)),
+                    UndoDescription = $"RhinoAI circular array ({count})",
+                    SelectCreated = false,
+                    UseInstances = ArrayGenerator.ShouldUseInstances((count - 1) * selectedObjects.Count, _instancingThreshold)
+                });
+
+                return ProcessingResult.Success($"Created circular array with {result.CreatedCount} objects{DescribePlacement(result)} around {center} with radius {radius:F2}");
             }
             catch (Exception ex)
             {
-                return Task.FromResult(ProcessingResult.Error($"Error creating circular array: {ex.Message}"));
+                return ProcessingResult.Error($"Error creating circular array: {ex.Message}");
             }
         }
 
@@ -1105,7 +1086,7 @@ namespace RhinoAI.AI
                     }
                 }
 
-                RhinoDoc.ActiveDoc.Views.Redraw();
+                PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
                 return Task.FromResult(ProcessingResult.Success($"Rotated {rotatedCount} object(s) by {angle:F1}° around {axis} at {center}"));
             }
             catch (Exception ex)
@@ -1140,7 +1121,7 @@ namespace RhinoAI.AI
                     }
                 }
 
-                RhinoDoc.ActiveDoc.Views.Redraw();
+                PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
                 return Task.FromResult(ProcessingResult.Success($"Mirrored {mirroredCount} object(s) across plane at {planeOrigin} with normal {planeNormal}"));
             }
             catch (Exception ex)
@@ -1149,41 +1130,34 @@ namespace RhinoAI.AI
             }
         }
 
-        private Task<ProcessingResult> CopyObjectsAsync(Dictionary<string, object> parameters)
+        private async Task<ProcessingResult> CopyObjectsAsync(Dictionary<string, object> parameters)
         {
             try
             {
                 var translation = GetVector3dParameter(parameters, "translation", new Vector3d(5, 0, 0));
                 var copies = _parameterExtractor.GetInt(parameters, "copies", 1);
-                var selectedObjects = RhinoDoc.ActiveDoc.Objects.GetSelectedObjects(false, false);
+                var selectedObjects = RhinoDoc.ActiveDoc.Objects.GetSelectedObjects(false, false)?.ToList();
 
-                if (selectedObjects?.Count() == 0)
+                if (selectedObjects == null || selectedObjects.Count == 0)
                 {
-                    return Task.FromResult(ProcessingResult.Warning("No objects selected to copy"));
+                    return ProcessingResult.Warning("No objects selected to copy");
                 }
 
-                var copiedCount = 0;
-
-                for (int i = 1; i <= copies; i++)
+                var result = await ArrayGenerator.AddAsync(RhinoDoc.ActiveDoc, new ArrayRequest
                 {
-                    var transform = Transform.Translation(translation * i);
-                    
-                    foreach (var obj in selectedObjects)
-                    {
-                        var copy = RhinoDoc.ActiveDoc.Objects.Transform(obj.Id, transform, false);
-                        if (copy != Guid.Empty)
-                        {
-                            copiedCount++;
-                        }
-                    }
-                }
-
-                RhinoDoc.ActiveDoc.Views.Redraw();
-                return Task.FromResult(ProcessingResult.Success($"Created {copiedCount} copies with translation {translation}"));
+                    Prototypes = selectedObjects.Select(obj => obj.Geometry.Duplicate()).ToList(),
+                    Attributes = selectedObjects.Select(obj => obj.Attributes).ToList(),
+                    Placements = ArrayGenerator.ToTransforms(ArrayLayout.Linear(copies, translation.X, translation.Y, translation.Z, first: 1)),
+                    UndoDescription = $"RhinoAI copy ({copies})",
+                    SelectCreated = false,
+                    UseInstances = ArrayGenerator.ShouldUseInstances(copies * selectedObjects.Count, _instancingThreshold)
+                });
+
+                return ProcessingResult.Success($"Created {result.CreatedCount} copies{DescribePlacement(result)} with translation {translation}");
             }
             catch (Exception ex)
             {
-                return Task.FromResult(ProcessingResult.Error($"Error copying objects: {ex.Message}"));
+                return ProcessingResult.Error($"Error copying objects: {ex.Message}");
             }
         }
 
@@ -1232,7 +1206,7 @@ namespace RhinoAI.AI
                     }
                 }
 
-                RhinoDoc.ActiveDoc.Views.Redraw();
+                PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
                 return Task.FromResult(ProcessingResult.Success($"Applied fillet with radius {radius:F2} to {filletedCount} object(s)"));
             }
             catch (Exception ex)
@@ -1286,7 +1260,7 @@ namespace RhinoAI.AI
                     }
                 }
 
-                RhinoDoc.ActiveDoc.Views.Redraw();
+                PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
                 return Task.FromResult(ProcessingResult.Success($"Applied chamfer with distance {distance:F2} to {chamferedCount} object(s)"));
             }
             catch (Exception ex)
@@ -1342,10 +1316,43 @@ namespace RhinoAI.AI
             return colorNames.TryGetValue(color, out var name) ? name : "custom color";
         }
 
-        private string GenerateCacheKey(string input, ConversationContext context)
+        /// <summary>
+        /// Builds a key from stable content hashes of the normalized input and the context fields that
+        /// change what it means: the active layer, the selection, and the last created object when the
+        /// input places relative to it. History and the scene description change with every command,
+        /// so they are left out; scene-dependent checks are re-run by validation instead.
+        /// </summary>
+        private static string GenerateCacheKey(string input, ConversationContext context)
         {
-            var contextHash = context?.GetHashCode().ToString() ?? "0";
-            return $"{input.GetHashCode()}_{contextHash}";
+            var normalizedInput = WhitespaceRun.Replace(input?.Trim() ?? string.Empty, " ");
+            var inputHash = new StableHash().Add(normalizedInput);
+
+            var contextHash = new StableHash();
+            if (context != null)
+            {
+                contextHash.Add(context.ActiveLayer);
+
+                var selected = context.SelectedObjects;
+                contextHash.Add(selected?.Count ?? -1);
+                if (selected != null)
+                {
+                    foreach (var id in selected)
+                    {
+                        contextHash.Add(id);
+                    }
+                }
+
+                var lastCreated = context.LastCreatedObject;
+                if (lastCreated != null && ParameterExtractor.ReferencesLastCreatedObject(normalizedInput))
+                {
+                    contextHash.Add(lastCreated.Id)
+                        .Add(lastCreated.Position.X)
+                        .Add(lastCreated.Position.Y)
+                        .Add(lastCreated.Position.Z);
+                }
+            }
+
+            return $"{inputHash}_{contextHash}";
         }
 
         /// <summary>
@@ -1353,20 +1360,27 @@ namespace RhinoAI.AI
         /// </summary>
         public ProcessingStats GetProcessingStats()
         {
+            var cacheStats = _interpretationCache.GetStatistics();
+
             return new ProcessingStats
             {
-                CacheHitCount = _responseCache.Count,
+                CacheHitCount = cacheStats.Hits,
+                CacheMissCount = cacheStats.Misses,
+                CacheEvictionCount = cacheStats.Evictions,
+                CacheExpirationCount = cacheStats.Expirations,
+                CacheSize = cacheStats.Count,
+                CacheHitRatio = cacheStats.HitRatio,
                 ContextOperationsCount = _currentContext?.RecentOperations?.Count ?? 0,
                 LastProcessingTime = DateTime.UtcNow
             };
         }
 
         /// <summary>
-        /// Clears the response cache
+        /// Clears the interpretation cache
         /// </summary>
         public void ClearCache()
         {
-            _responseCache.Clear();
+            _interpretationCache.Clear();
         }
 
         /// <summary>
@@ -1385,7 +1399,16 @@ namespace RhinoAI.AI
     /// </summary>
     public class ProcessingStats
     {
-        public int CacheHitCount { get; set; }
+        public long CacheHitCount { get; set; }
+        public long CacheMissCount { get; set; }
+        public long CacheEvictionCount { get; set; }
+        public long CacheExpirationCount { get; set; }
+        public int CacheSize { get; set; }
+        public double CacheHitRatio { get; set; }
+        public long SemanticCacheHitCount { get; set; }
+        public long SemanticCacheMissCount { get; set; }
+        public long SemanticCacheEvictionCount { get; set; }
+        public double SemanticCacheHitRate { get; set; }
         public int ContextOperationsCount { get; set; }
         public DateTime LastProcessingTime { get; set; }
     }
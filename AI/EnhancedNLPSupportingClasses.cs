@@ -5,6 +5,7 @@ using System.Text.RegularExpressions;
 using System.Threading.Tasks;
 using Rhino.Geometry;
 using System.Drawing;
+using RhinoAI.Core;
 
 namespace RhinoAI.AI
 {
@@ -14,13 +15,80 @@ namespace RhinoAI.AI
     public class IntentClassifier
     {
         private readonly Dictionary<string, IntentPattern> _patterns;
+        private readonly IntentKeywordIndex _keywordIndex;
+        private readonly bool _useKeywordIndex;
 
-        public IntentClassifier()
+        public IntentClassifier() : this(useKeywordIndex: true)
+        {
+        }
+
+        /// <summary>
+        /// Creates a classifier; <paramref name="useKeywordIndex"/> = false keeps the
+        /// per-keyword Contains/Regex scoring (used as the benchmark baseline)
+        /// </summary>
+        public IntentClassifier(bool useKeywordIndex)
         {
             _patterns = InitializeIntentPatterns();
+            _keywordIndex = new IntentKeywordIndex(_patterns.Values);
+            _useKeywordIndex = useKeywordIndex;
         }
 
         public async Task<IntentResult> ClassifyIntentAsync(string input, ConversationContext context)
+        {
+            var bestMatch = _useKeywordIndex
+                ? ClassifyWithKeywordIndex(input, context)
+                : ClassifyPerKeyword(input, context);
+
+            // Enhance with context-based adjustments
+            if (context?.RecentOperations?.Any() == true)
+            {
+                bestMatch.Confidence += context.GetRelevanceScore(bestMatch.Category) * 0.1;
+            }
+
+            return bestMatch;
+        }
+
+        private IntentResult ClassifyWithKeywordIndex(string input, ConversationContext context)
+        {
+            var confidences = new double[_keywordIndex.Patterns.Count];
+            var containedKeywords = new bool[_keywordIndex.KeywordCount];
+
+            if (!_keywordIndex.TryScore(input, confidences, containedKeywords))
+            {
+                return ClassifyPerKeyword(input, context);
+            }
+
+            var bestIndex = -1;
+            var bestConfidence = 0.0;
+            for (int i = 0; i < confidences.Length; i++)
+            {
+                if (confidences[i] > bestConfidence)
+                {
+                    bestIndex = i;
+                    bestConfidence = confidences[i];
+                }
+            }
+
+            if (bestIndex < 0)
+            {
+                return new IntentResult
+                {
+                    Category = IntentCategory.Unknown,
+                    Confidence = 0.0
+                };
+            }
+
+            var pattern = _keywordIndex.Patterns[bestIndex];
+            return new IntentResult
+            {
+                Category = pattern.Category,
+                CommandTemplate = pattern.Template,
+                Confidence = bestConfidence,
+                Keywords = _keywordIndex.GetMatchedKeywords(bestIndex, containedKeywords)
+            };
+        }
+
+        private IntentResult ClassifyPerKeyword(string input, ConversationContext context)
         {
             var bestMatch = new IntentResult
             {
@@ -43,12 +111,6 @@ namespace RhinoAI.AI
                 }
             }
 
-            // Enhance with context-based adjustments
-            if (context?.RecentOperations?.Any() == true)
-            {
-                bestMatch.Confidence += context.GetRelevanceScore(bestMatch.Category) * 0.1;
-            }
-
             return bestMatch;
         }
 
@@ -460,6 +522,12 @@ namespace RhinoAI.AI
     /// </summary>
     public class ParameterExtractor
     {
+        /// <summary>Clearance between an object and one placed "next to", "above" or "below" it</summary>
+        private const double RelativePlacementGap = 1.0;
+
+        /// <summary>Phrases that place a new object relative to the last created one</summary>
+        private static readonly string[] RelativePlacementPhrases = { "next to", "above", "below" };
+
         private readonly Dictionary<string, Func<string, object>> _extractors;
 
         public ParameterExtractor()
@@ -467,6 +535,14 @@ namespace RhinoAI.AI
             _extractors = InitializeExtractors();
         }
 
+        /// <summary>
+        /// Whether the parameters extracted from <paramref name="input"/> depend on the last created object
+        /// </summary>
+        public static bool ReferencesLastCreatedObject(string input)
+        {
+            return input != null && RelativePlacementPhrases.Any(phrase => input.Contains(phrase, StringComparison.OrdinalIgnoreCase));
+        }
+
         public async Task<Dictionary<string, object>> ExtractParametersAsync(
             string input, 
             CommandTemplate template, 
@@ -523,7 +599,7 @@ namespace RhinoAI.AI
             }
 
             // Try relative positions
-            var relativePos = ExtractRelativePosition(input);
+            var relativePos = ExtractRelativePosition(input, context);
             if (relativePos.HasValue && context?.LastCreatedObject != null)
             {
                 return context.LastCreatedObject.Position + relativePos.Value;
@@ -659,16 +735,28 @@ namespace RhinoAI.AI
             return layerMatch.Success ? layerMatch.Groups[1].Value : null;
         }
 
-        private Vector3d? ExtractRelativePosition(string input)
+        private Vector3d? ExtractRelativePosition(string input, ConversationContext context)
         {
+            Vector3d direction;
             if (input.Contains("next to", StringComparison.OrdinalIgnoreCase))
-                return new Vector3d(5, 0, 0);
-            if (input.Contains("above", StringComparison.OrdinalIgnoreCase))
-                return new Vector3d(0, 0, 5);
-            if (input.Contains("below", StringComparison.OrdinalIgnoreCase))
-                return new Vector3d(0, 0, -5);
+                direction = Vector3d.XAxis;
+            else if (input.Contains("above", StringComparison.OrdinalIgnoreCase))
+                direction = Vector3d.ZAxis;
+            else if (input.Contains("below", StringComparison.OrdinalIgnoreCase))
+                direction = -Vector3d.ZAxis;
+            else
+                return null;
+
+            // Step over the last object's actual extent when the scene is indexed, otherwise a fixed distance
+            var distance = 5.0;
+            if (context?.LastCreatedObject != null &&
+                context.SpatialIndex?.TryGetBounds(context.LastCreatedObject.Id, out var bounds) == true)
+            {
+                var extent = direction.X != 0 ? bounds.MaxX - bounds.MinX : bounds.MaxZ - bounds.MinZ;
+                distance = extent + RelativePlacementGap;
+            }
 
-            return null;
+            return direction * distance;
         }
 
         private int? ExtractRows(string input)
@@ -796,6 +884,9 @@ namespace RhinoAI.AI
     /// </summary>
     public class SemanticValidator
     {
+        /// <summary>How close to an existing object's bounding box a position counts as occupied</summary>
+        private const double OccupiedTolerance = 0.001;
+
         public Task<ValidationResult> ValidateParametersAsync(
             Dictionary<string, object> parameters, 
             CommandTemplate template)
@@ -877,8 +968,33 @@ namespace RhinoAI.AI
             Dictionary<string, object> parameters, 
             ConversationContext context)
         {
-            // Check layer existence, object conflicts, etc.
-            return Task.FromResult(ValidationResult.Valid());
+            var result = ValidationResult.Valid();
+
+            // Placing geometry inside existing objects is legitimate, but worth telling the user about
+            var spatialIndex = context?.SpatialIndex;
+            if (spatialIndex != null && TryGetPosition(parameters, out var position))
+            {
+                var occupying = spatialIndex.QueryRange(position.X, position.Y, position.Z, OccupiedTolerance);
+                if (occupying.Count > 0)
+                {
+                    result.Warnings.Add($"Position {position.X:0.###},{position.Y:0.###},{position.Z:0.###} is already occupied by {occupying.Count} object(s)");
+                }
+            }
+
+            return Task.FromResult(result);
+        }
+
+        private static bool TryGetPosition(Dictionary<string, object> parameters, out Point3d position)
+        {
+            if ((parameters.TryGetValue("center", out var value) || parameters.TryGetValue("position", out value)) &&
+                value is Point3d point)
+            {
+                position = point;
+                return true;
+            }
+
+            position = Point3d.Unset;
+            return false;
         }
     }
 
@@ -917,6 +1033,11 @@ namespace RhinoAI.AI
         public string SceneDescription { get; set; }
         public CreatedObject LastCreatedObject { get; set; }
 
+        /// <summary>
+        /// Bounding boxes of the document's objects, when real-time monitoring maintains them
+        /// </summary>
+        public SpatialIndex SpatialIndex { get; set; }
+
         public double GetRelevanceScore(IntentCategory category)
         {
             // Calculate relevance based on recent operations
@@ -966,6 +1087,7 @@ namespace RhinoAI.AI
     {
         public bool IsValid { get; set; }
         public string ErrorMessage { get; set; }
+        public List<string> Warnings { get; set; } = new List<string>();
 
         public static ValidationResult Valid() => new ValidationResult { IsValid = true };
         public static ValidationResult Invalid(string message) => new ValidationResult { IsValid = false, ErrorMessage = message };
@@ -991,6 +1113,21 @@ namespace RhinoAI.AI
             new ProcessingResult { IsSuccess = true, Message = message, Type = ProcessingResultType.Partial };
     }
 
+    /// <summary>
+    /// A reading of an input: the command to run and its extracted parameters, before validation against the scene
+    /// </summary>
+    public class CommandInterpretation
+    {
+        public CommandInterpretation(CommandTemplate commandTemplate, Dictionary<string, object> parameters)
+        {
+            CommandTemplate = commandTemplate ?? throw new ArgumentNullException(nameof(commandTemplate));
+            Parameters = parameters ?? new Dictionary<string, object>();
+        }
+
+        public CommandTemplate CommandTemplate { get; }
+        public IReadOnlyDictionary<string, object> Parameters { get; }
+    }
+
     public enum ProcessingResultType
     {
         Success,
@@ -1014,17 +1151,4 @@ namespace RhinoAI.AI
         public List<CommandTemplate> AvailableCommands { get; set; }
         public string SceneInfo { get; set; }
     }
-
-    public class CachedResponse
-    {
-        public ProcessingResult Result { get; set; }
-        public DateTime ExpiryTime { get; set; }
-        public bool IsExpired => DateTime.UtcNow > ExpiryTime;
-
-        public CachedResponse(ProcessingResult result, DateTime expiryTime)
-        {
-            Result = result;
-            ExpiryTime = expiryTime;
-        }
-    }
 } 
\ No newline at end of file
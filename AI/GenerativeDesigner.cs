@@ -1,6 +1,9 @@
 using System;
 using System.Collections.Generic;
 using System.Linq;
+using System.Runtime.CompilerServices;
+using System.Threading;
+using System.Threading.Channels;
 using System.Threading.Tasks;
 
 using Rhino.Geometry;
@@ -16,38 +19,48 @@ namespace RhinoAI.AI
     {
         private readonly ConfigurationManager _config;
         private readonly SimpleLogger _logger;
+        private readonly int _maxParallelism;
+        private readonly LruCache<VariantSpec, GeometryBase> _variantCache;
+        private readonly ParameterOptimizerOptions _optimizerOptions;
         private bool _disposed = false;
 
         public GenerativeDesigner(ConfigurationManager config, SimpleLogger logger)
         {
             _config = config ?? throw new ArgumentNullException(nameof(config));
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
+
+            var maxParallelism = config.GetSetting("Generative:MaxParallelism", 0);
+            _maxParallelism = maxParallelism > 0 ? maxParallelism : Environment.ProcessorCount;
+            _variantCache = new LruCache<VariantSpec, GeometryBase>(
+                Math.Max(0, config.GetSetting("Generative:VariantCacheSize", 256)), TimeSpan.FromMinutes(30));
+            _optimizerOptions = ParameterOptimizerOptions.FromConfiguration(config);
         }
 
         /// <summary>
-        /// Generate design variants based on a prompt
+        /// Generate design variants based on a prompt, in variant index order
         /// </summary>
         public async Task<IEnumerable<GeometryBase>> GenerateVariantsAsync(
             DesignPrompt prompt, 
-            int variantCount = 5)
+            int variantCount = 5,
+            CancellationToken cancellationToken = default)
         {
             try
             {
                 _logger?.LogInformation($"Generating {variantCount} design variants for prompt: {prompt.Text}");
 
-                var variants = new List<GeometryBase>();
-
-                for (int i = 0; i < variantCount; i++)
+                var variants = new GeometryBase[variantCount];
+                await foreach (var (index, geometry) in RunVariantsAsync(prompt, variantCount, cancellationToken))
                 {
-                    var variant = await GenerateSingleVariantAsync(prompt, i);
-                    if (variant != null)
-                    {
-                        variants.Add(variant);
-                    }
+                    variants[index] = geometry;
                 }
 
-                _logger?.LogInformation($"Generated {variants.Count} design variants");
-                return variants;
+                var generated = variants.Where(v => v != null).ToList();
+                _logger?.LogInformation($"Generated {generated.Count} design variants");
+                return generated;
+            }
+            catch (OperationCanceledException)
+            {
+                throw;
             }
             catch (Exception ex)
             {
@@ -57,63 +70,146 @@ namespace RhinoAI.AI
         }
 
         /// <summary>
-        /// Generate a single design variant
+        /// Generate design variants and yield each one as soon as it is built, in completion order
+        /// </summary>
+        public async IAsyncEnumerable<GeometryBase> StreamVariantsAsync(
+            DesignPrompt prompt,
+            int variantCount = 5,
+            [EnumeratorCancellation] CancellationToken cancellationToken = default)
+        {
+            await foreach (var (_, geometry) in RunVariantsAsync(prompt, variantCount, cancellationToken))
+            {
+                yield return geometry;
+            }
+        }
+
+        /// <summary>
+        /// Build variants on up to Generative:MaxParallelism threads. Variants with identical
+        /// parameters are built once and duplicated; built geometry is also kept across calls.
+        /// Stopping the enumeration early cancels the variants still being built.
         /// </summary>
-        private async Task<GeometryBase?> GenerateSingleVariantAsync(DesignPrompt prompt, int index)
+        private async IAsyncEnumerable<(int Index, GeometryBase Geometry)> RunVariantsAsync(
+            DesignPrompt prompt,
+            int variantCount,
+            [EnumeratorCancellation] CancellationToken cancellationToken)
         {
-            return await Task.Run(() =>
+            if (prompt == null) throw new ArgumentNullException(nameof(prompt));
+
+            var groups = VariantPlanner.GroupIdentical(VariantPlanner.Plan(CreateVariantInputs(prompt), variantCount));
+            var channel = Channel.CreateUnbounded<(int, GeometryBase)>(new UnboundedChannelOptions { SingleReader = true });
+            var producerCancellation = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+
+            var producer = Task.Run(() =>
             {
                 try
                 {
-                    // This is a placeholder implementation
-                    // In real implementation, would use AI to generate actual geometry
-                    var type = prompt.Parameters.GetValueOrDefault("type", "sphere").ToString().ToLower();
+                    var options = new ParallelOptions
+                    {
+                        MaxDegreeOfParallelism = _maxParallelism,
+                        CancellationToken = producerCancellation.Token
+                    };
 
-                    switch (type)
+                    Parallel.ForEach(groups, options, group =>
                     {
-                        case "sphere":
-                            return CreateSphereVariant(prompt, index);
-                        case "box":
-                            return CreateBoxVariant(prompt, index);
-                        case "cylinder":
-                            return CreateCylinderVariant(prompt, index);
-                        default:
-                            return CreateDefaultVariant(prompt, index);
-                    }
+                        var geometry = GetOrCreateVariant(group.Spec);
+                        if (geometry == null) return;
+
+                        // The cached geometry is never handed out, so callers may modify what they get
+                        foreach (var index in group.Indices)
+                        {
+                            channel.Writer.TryWrite((index, geometry.Duplicate()));
+                        }
+                    });
+                    channel.Writer.TryComplete();
                 }
                 catch (Exception ex)
                 {
-                    _logger?.LogError(ex, $"Failed to generate variant {index}");
-                    return null;
+                    channel.Writer.TryComplete(ex);
                 }
             });
+
+            try
+            {
+                await foreach (var item in channel.Reader.ReadAllAsync(cancellationToken))
+                {
+                    yield return item;
+                }
+                await producer;
+            }
+            finally
+            {
+                producerCancellation.Cancel();
+                _ = producer.ContinueWith(_ => producerCancellation.Dispose(), TaskScheduler.Default);
+            }
+        }
+
+        private GeometryBase? GetOrCreateVariant(VariantSpec spec)
+        {
+            if (_variantCache.TryGet(spec, out var cached))
+            {
+                return cached;
+            }
+
+            try
+            {
+                // This is a placeholder implementation
+                // In real implementation, would use AI to generate actual geometry
+                var geometry = spec.Kind switch
+                {
+                    "box" => CreateBoxVariant(spec),
+                    "cylinder" => CreateCylinderVariant(spec),
+                    _ => CreateSphereVariant(spec)
+                };
+
+                if (geometry != null)
+                {
+                    _variantCache.Set(spec, geometry);
+                }
+                return geometry;
+            }
+            catch (Exception ex)
+            {
+                _logger?.LogError(ex, $"Failed to generate {spec.Kind} variant");
+                return null;
+            }
+        }
+
+        private static VariantInputs CreateVariantInputs(DesignPrompt prompt)
+        {
+            var center = prompt.ContextGeometry.OfType<Rhino.Geometry.Point>().FirstOrDefault()?.Location ?? Point3d.Origin;
+
+            return new VariantInputs
+            {
+                Kind = prompt.Parameters.GetValueOrDefault("type", "sphere").ToString().ToLower(),
+                CenterX = center.X,
+                CenterY = center.Y,
+                CenterZ = center.Z,
+                Radius = Convert.ToDouble(prompt.Parameters.GetValueOrDefault("radius", 1.0)),
+                Size = Convert.ToDouble(prompt.Parameters.GetValueOrDefault("size", 1.0)),
+                Height = Convert.ToDouble(prompt.Parameters.GetValueOrDefault("height", 2.0)),
+                Variation = prompt.Parameters.TryGetValue("variation", out var variation) ? Convert.ToDouble(variation) : null,
+                Jitter = Convert.ToDouble(prompt.Parameters.GetValueOrDefault("jitter", 0.0)),
+                Seed = Convert.ToInt32(prompt.Parameters.GetValueOrDefault("seed", 0))
+            };
         }
 
         /// <summary>
         /// Create a sphere variant
         /// </summary>
-        private GeometryBase CreateSphereVariant(DesignPrompt prompt, int index)
+        private static GeometryBase CreateSphereVariant(VariantSpec spec)
         {
-            var center = prompt.ContextGeometry.OfType<Rhino.Geometry.Point>().FirstOrDefault()?.Location ?? Point3d.Origin;
-            var baseRadius = Convert.ToDouble(prompt.Parameters.GetValueOrDefault("radius", 1.0));
-            var variation = 1.0 + (index * 0.2); // Vary size by 20% per variant
-            
-            var sphere = new Sphere(center, baseRadius * variation);
+            var sphere = new Sphere(new Point3d(spec.CenterX, spec.CenterY, spec.CenterZ), spec.Radius);
             return sphere.ToBrep();
         }
 
         /// <summary>
         /// Create a box variant
         /// </summary>
-        private GeometryBase CreateBoxVariant(DesignPrompt prompt, int index)
+        private static GeometryBase CreateBoxVariant(VariantSpec spec)
         {
-            var center = prompt.ContextGeometry.OfType<Rhino.Geometry.Point>().FirstOrDefault()?.Location ?? Point3d.Origin;
-            var baseSize = Convert.ToDouble(prompt.Parameters.GetValueOrDefault("size", 1.0));
-            var variation = 1.0 + (index * 0.15);
-
-            var size = baseSize * variation;
+            var size = spec.Size;
             var box = new Box(
-                new Plane(center, Vector3d.ZAxis),
+                new Plane(new Point3d(spec.CenterX, spec.CenterY, spec.CenterZ), Vector3d.ZAxis),
                 new Interval(-size/2, size/2),
                 new Interval(-size/2, size/2),
                 new Interval(0, size)
@@ -125,34 +221,76 @@ namespace RhinoAI.AI
         /// <summary>
         /// Create a cylinder variant
         /// </summary>
-        private GeometryBase CreateCylinderVariant(DesignPrompt prompt, int index)
+        private static GeometryBase CreateCylinderVariant(VariantSpec spec)
         {
-            var center = prompt.ContextGeometry.OfType<Rhino.Geometry.Point>().FirstOrDefault()?.Location ?? Point3d.Origin;
-            var baseRadius = Convert.ToDouble(prompt.Parameters.GetValueOrDefault("radius", 1.0));
-            var baseHeight = Convert.ToDouble(prompt.Parameters.GetValueOrDefault("height", 2.0));
-            var variation = 1.0 + (index * 0.25);
-
             var cylinder = new Cylinder(
-                new Circle(new Plane(center, Vector3d.ZAxis), baseRadius * variation),
-                baseHeight * variation
+                new Circle(new Plane(new Point3d(spec.CenterX, spec.CenterY, spec.CenterZ), Vector3d.ZAxis), spec.Radius),
+                spec.Height
             );
 
             return cylinder.ToBrep(true, true);
         }
 
         /// <summary>
-        /// Create a default variant
+        /// Search the prompt's size parameters (radius, size, height, depending on type) for the design
+        /// that best meets the goals, e.g. "volume" with a targetVolume parameter plus "minimize surface area".
+        /// Parameter ranges default to a tenth to ten times the prompt's value and can be set with
+        /// &lt;name&gt;Min and &lt;name&gt;Max parameters.
         /// </summary>
-        private GeometryBase CreateDefaultVariant(DesignPrompt prompt, int index)
+        public async Task<DesignOptimization> OptimizeDesignAsync(DesignPrompt prompt, OptimizationGoals goals,
+            CancellationToken cancellationToken = default)
         {
-            // Default to sphere if type not recognized
-            return CreateSphereVariant(prompt, index);
+            if (prompt == null) throw new ArgumentNullException(nameof(prompt));
+            if (goals == null) throw new ArgumentNullException(nameof(goals));
+
+            var inputs = CreateVariantInputs(prompt);
+            var start = VariantPlanner.Plan(inputs, 1)[0];
+            var ranges = start.Kind switch
+            {
+                "box" => new[] { CreateRange(prompt, "size", inputs.Size) },
+                "cylinder" => new[] { CreateRange(prompt, "radius", inputs.Radius), CreateRange(prompt, "height", inputs.Height) },
+                _ => new[] { CreateRange(prompt, "radius", inputs.Radius) }
+            };
+
+            var objective = DesignObjective.FromGoals(goals.Goals, prompt.Parameters, DesignMeasures.FromSpec(start));
+            if (objective.IsEmpty)
+            {
+                throw new ArgumentException($"None of the goals can be optimized: {string.Join(", ", goals.Goals)}", nameof(goals));
+            }
+
+            _logger?.LogInformation($"Optimizing {start.Kind} over {string.Join(", ", ranges.Select(r => r.Name))} for {string.Join(", ", objective.Terms)}");
+
+            // Primitive measures are exact closed forms, so candidates are scored without building geometry
+            var optimization = await Task.Run(() => new ParameterOptimizer(_optimizerOptions).Minimize(
+                ranges,
+                values => objective.Evaluate(DesignMeasures.FromSpec(CreateSpec(start, ranges, values))),
+                cancellationToken), cancellationToken);
+            if (optimization.Evaluations == 0)
+            {
+                throw new InvalidOperationException($"No {start.Kind} designs were evaluated");
+            }
+
+            var best = CreateSpec(start, ranges, optimization.BestParameters);
+            _logger?.LogInformation($"Design optimization stopped ({optimization.StopReason}) after {optimization.Generations} generations, " +
+                $"{optimization.Evaluations} evaluations, {optimization.CacheHits} cache hits; best objective {optimization.BestValue:G6}");
+
+            return new DesignOptimization
+            {
+                Geometry = GetOrCreateVariant(best)?.Duplicate(),
+                Parameters = ranges.Select((r, i) => (r.Name, optimization.BestParameters[i])).ToDictionary(p => p.Name, p => p.Item2),
+                Goals = objective.Terms,
+                Optimization = optimization
+            };
         }
 
         /// <summary>
-        /// Optimize existing geometry using AI
+        /// Scale geometry independently along X, Y and Z about its bounding box center to best meet the goals.
+        /// Volume, weight and bounding box terms follow from the scale factors; surface area goals measure
+        /// each scaled candidate. Geometry without goals, or that cannot be measured, is returned as a copy;
+        /// goals that cannot be interpreted are logged and give null.
         /// </summary>
-        public async Task<GeometryBase?> OptimizeGeometryAsync(GeometryBase geometry, OptimizationGoals goals)
+        public async Task<GeometryBase?> OptimizeGeometryAsync(GeometryBase geometry, OptimizationGoals goals,
+            IReadOnlyDictionary<string, object>? targets = null, CancellationToken cancellationToken = default)
         {
             try
             {
@@ -160,24 +298,55 @@ namespace RhinoAI.AI
 
                 return await Task.Run(() =>
                 {
-                    // Placeholder optimization logic
-                    // In real implementation, would use AI to optimize geometry
-                    
-                    if (geometry is Brep brep)
+                    var solid = geometry is Extrusion extrusion ? extrusion.ToBrep() : geometry;
+                    var initial = MeasureGeometry(solid, includeArea: true);
+                    var objective = initial.HasValue ? DesignObjective.FromGoals(goals.Goals, targets, initial.Value) : null;
+                    if (objective == null || objective.IsEmpty)
                     {
-                        // Simple optimization: rebuild surfaces
-                        return brep.DuplicateBrep();
+                        return geometry.Duplicate();
                     }
-                    else if (geometry is Mesh mesh)
+
+                    var bounds = solid.GetBoundingBox(true);
+                    var scalePlane = Plane.WorldXY;
+                    scalePlane.Origin = bounds.Center;
+                    var ranges = new[]
                     {
-                        // Simple optimization: reduce mesh
-                        var optimized = mesh.DuplicateMesh();
-                        optimized.Reduce(mesh.Faces.Count / 2, false, 10, false);
-                        return optimized;
+                        new ParameterRange("scaleX", 0.1, 10, 1),
+                        new ParameterRange("scaleY", 0.1, 10, 1),
+                        new ParameterRange("scaleZ", 0.1, 10, 1)
+                    };
+
+                    var optimization = new ParameterOptimizer(_optimizerOptions).Minimize(ranges, scale =>
+                    {
+                        var area = 0.0;
+                        if (objective.NeedsSurfaceArea)
+                        {
+                            var candidate = solid.Duplicate();
+                            candidate.Transform(Transform.Scale(scalePlane, scale[0], scale[1], scale[2]));
+                            area = MeasureGeometry(candidate, includeArea: true)?.SurfaceArea ?? double.PositiveInfinity;
+                        }
+
+                        var measures = initial.Value;
+                        return objective.Evaluate(new DesignMeasures(
+                            measures.Volume * scale[0] * scale[1] * scale[2], area,
+                            measures.SizeX * scale[0], measures.SizeY * scale[1], measures.SizeZ * scale[2]));
+                    }, cancellationToken);
+
+                    _logger?.LogInformation($"Geometry optimization stopped ({optimization.StopReason}) after {optimization.Evaluations} evaluations");
+                    if (optimization.Evaluations == 0)
+                    {
+                        return geometry.Duplicate();
                     }
 
-                    return geometry.Duplicate();
-                });
+                    var best = optimization.BestParameters;
+                    var optimized = solid.Duplicate();
+                    optimized.Transform(Transform.Scale(scalePlane, best[0], best[1], best[2]));
+                    return optimized;
+                }, cancellationToken);
+            }
+            catch (OperationCanceledException)
+            {
+                throw;
             }
             catch (Exception ex)
             {
@@ -186,6 +355,50 @@ namespace RhinoAI.AI
             }
         }
 
+        /// <summary>
+        /// Volume (zero unless closed), optionally surface area, and bounding box size; null for unsupported geometry
+        /// </summary>
+        private static DesignMeasures? MeasureGeometry(GeometryBase geometry, bool includeArea)
+        {
+            double volume;
+            double area = 0;
+            switch (geometry)
+            {
+                case Brep brep:
+                    volume = brep.IsSolid ? VolumeMassProperties.Compute(brep)?.Volume ?? 0 : 0;
+                    if (includeArea) area = AreaMassProperties.Compute(brep)?.Area ?? 0;
+                    break;
+                case Mesh mesh:
+                    volume = mesh.IsClosed ? VolumeMassProperties.Compute(mesh)?.Volume ?? 0 : 0;
+                    if (includeArea) area = AreaMassProperties.Compute(mesh)?.Area ?? 0;
+                    break;
+                default:
+                    return null;
+            }
+
+            var size = geometry.GetBoundingBox(true).Diagonal;
+            return new DesignMeasures(Math.Abs(volume), area, size.X, size.Y, size.Z);
+        }
+
+        private static ParameterRange CreateRange(DesignPrompt prompt, string name, double initial)
+        {
+            var min = prompt.Parameters.TryGetValue(name + "Min", out var minValue) ? Convert.ToDouble(minValue) : initial / 10;
+            var max = prompt.Parameters.TryGetValue(name + "Max", out var maxValue) ? Convert.ToDouble(maxValue) : initial * 10;
+            return new ParameterRange(name, min, max, Math.Clamp(initial, min, max));
+        }
+
+        private static VariantSpec CreateSpec(VariantSpec start, ParameterRange[] ranges, double[] values)
+        {
+            double Get(string name, double fallback)
+            {
+                var index = Array.FindIndex(ranges, r => r.Name == name);
+                return index >= 0 ? values[index] : fallback;
+            }
+
+            return new VariantSpec(start.Kind, start.CenterX, start.CenterY, start.CenterZ,
+                Get("radius", start.Radius), Get("size", start.Size), Get("height", start.Height));
+        }
+
         public void Dispose()
         {
             Dispose(true);
@@ -196,9 +409,26 @@ namespace RhinoAI.AI
         {
             if (!_disposed && disposing)
             {
-                // Cleanup resources
+                _variantCache.Clear();
                 _disposed = true;
             }
         }
     }
-} 
\ No newline at end of file
+
+    /// <summary>
+    /// Outcome of GenerativeDesigner.OptimizeDesignAsync
+    /// </summary>
+    public class DesignOptimization
+    {
+        /// <summary>The best design, or null if it could not be built</summary>
+        public GeometryBase? Geometry { get; set; }
+
+        /// <summary>Optimized parameter values by prompt parameter name</summary>
+        public Dictionary<string, double> Parameters { get; set; } = new Dictionary<string, double>();
+
+        /// <summary>Goals that were recognized and optimized</summary>
+        public IReadOnlyList<string> Goals { get; set; } = Array.Empty<string>();
+
+        public OptimizationResult Optimization { get; set; }
+    }
+}
@@ -0,0 +1,293 @@
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+using System.Linq;
+
+namespace RhinoAI.AI
+{
+    /// <summary>
+    /// Precompiled Aho-Corasick automaton over the keywords of every intent pattern.
+    /// Scores all patterns in a single pass over the input and reproduces the
+    /// confidences of the per-keyword Contains/Regex scoring exactly.
+    /// </summary>
+    public class IntentKeywordIndex
+    {
+        private const int AlphabetSize = 128;
+
+        private readonly IntentPattern[] _patterns;
+        private readonly string[] _keywords;
+        private readonly int[][] _patternKeywordIds;
+        private readonly int[] _transitions;
+        private readonly int[][] _outputs;
+
+        public IntentKeywordIndex(IEnumerable<IntentPattern> patterns)
+        {
+            _patterns = patterns?.ToArray() ?? throw new ArgumentNullException(nameof(patterns));
+
+            // Deduplicate keywords across patterns ("create", "array", ... are shared)
+            var keywordIds = new Dictionary<string, int>(StringComparer.Ordinal);
+            var keywords = new List<string>();
+            _patternKeywordIds = new int[_patterns.Length][];
+
+            for (int p = 0; p < _patterns.Length; p++)
+            {
+                var patternKeywords = _patterns[p].Keywords;
+                var ids = new int[patternKeywords.Length];
+
+                for (int k = 0; k < patternKeywords.Length; k++)
+                {
+                    var folded = Fold(patternKeywords[k]);
+                    if (!keywordIds.TryGetValue(folded, out var id))
+                    {
+                        id = keywords.Count;
+                        keywordIds[folded] = id;
+                        keywords.Add(folded);
+                    }
+                    ids[k] = id;
+                }
+
+                _patternKeywordIds[p] = ids;
+            }
+
+            _keywords = keywords.ToArray();
+            (_transitions, _outputs) = BuildAutomaton(_keywords);
+        }
+
+        /// <summary>
+        /// Patterns in the order their scores are returned
+        /// </summary>
+        public IReadOnlyList<IntentPattern> Patterns => _patterns;
+
+        /// <summary>
+        /// Number of distinct keywords compiled into the automaton
+        /// </summary>
+        public int KeywordCount => _keywords.Length;
+
+        /// <summary>
+        /// Scores every pattern against the input. Returns false when the input contains
+        /// characters whose case-insensitive matching differs between ordinal comparison and
+        /// Regex; callers must fall back to the per-keyword scorer in that case.
+        /// </summary>
+        public bool TryScore(string input, double[] confidences, bool[] containedKeywords)
+        {
+            if (confidences == null || confidences.Length < _patterns.Length)
+                throw new ArgumentException("Confidence buffer is smaller than the pattern count", nameof(confidences));
+            if (containedKeywords == null || containedKeywords.Length < _keywords.Length)
+                throw new ArgumentException("Keyword buffer is smaller than the keyword count", nameof(containedKeywords));
+
+            input ??= string.Empty;
+            if (RequiresPerKeywordScoring(input))
+            {
+                return false;
+            }
+
+            Span<bool> exact = _keywords.Length <= 256 ? stackalloc bool[_keywords.Length] : new bool[_keywords.Length];
+            Array.Clear(containedKeywords, 0, _keywords.Length);
+
+            var state = 0;
+            for (int i = 0; i < input.Length; i++)
+            {
+                var c = input[i];
+                if (c >= AlphabetSize)
+                {
+                    // Keywords are ASCII, so a non-ASCII character can never be part of a match
+                    state = 0;
+                    continue;
+                }
+
+                state = _transitions[state * AlphabetSize + char.ToUpperInvariant(c)];
+                var outputs = _outputs[state];
+                for (int o = 0; o < outputs.Length; o++)
+                {
+                    var id = outputs[o];
+                    containedKeywords[id] = true;
+
+                    if (!exact[id] && IsBounded(input, i - _keywords[id].Length + 1, i, _keywords[id]))
+                    {
+                        exact[id] = true;
+                    }
+                }
+            }
+
+            for (int p = 0; p < _patterns.Length; p++)
+            {
+                var ids = _patternKeywordIds[p];
+                var keywordMatches = 0;
+                var exactMatches = 0;
+
+                for (int k = 0; k < ids.Length; k++)
+                {
+                    if (containedKeywords[ids[k]]) keywordMatches++;
+                    if (exact[ids[k]]) exactMatches++;
+                }
+
+                var keywordScore = (double)keywordMatches / ids.Length;
+                var exactScore = (double)exactMatches / ids.Length * 0.3;
+                confidences[p] = Math.Min(1.0, keywordScore + exactScore);
+            }
+
+            return true;
+        }
+
+        /// <summary>
+        /// Returns the keywords of a pattern that were found by the last TryScore call,
+        /// in the pattern's declaration order
+        /// </summary>
+        public List<string> GetMatchedKeywords(int patternIndex, bool[] containedKeywords)
+        {
+            var pattern = _patterns[patternIndex];
+            var ids = _patternKeywordIds[patternIndex];
+            var matched = new List<string>();
+
+            for (int k = 0; k < ids.Length; k++)
+            {
+                if (containedKeywords[ids[k]])
+                {
+                    matched.Add(pattern.Keywords[k]);
+                }
+            }
+
+            return matched;
+        }
+
+        private static string Fold(string keyword)
+        {
+            if (string.IsNullOrEmpty(keyword))
+                throw new ArgumentException("Intent keywords cannot be empty");
+
+            var folded = keyword.ToUpperInvariant();
+            foreach (var c in folded)
+            {
+                if (c >= AlphabetSize)
+                    throw new ArgumentException($"Intent keyword '{keyword}' must be ASCII to be indexed");
+            }
+
+            return folded;
+        }
+
+        /// <summary>
+        /// Builds a dense DFA (goto + failure transitions folded together) over the ASCII alphabet
+        /// </summary>
+        private static (int[] transitions, int[][] outputs) BuildAutomaton(string[] keywords)
+        {
+            var gotoTable = new List<int[]> { NewRow() };
+            var stateOutputs = new List<List<int>> { new List<int>() };
+
+            for (int id = 0; id < keywords.Length; id++)
+            {
+                var state = 0;
+                foreach (var c in keywords[id])
+                {
+                    if (gotoTable[state][c] <= 0)
+                    {
+                        gotoTable.Add(NewRow());
+                        stateOutputs.Add(new List<int>());
+                        gotoTable[state][c] = gotoTable.Count - 1;
+                    }
+                    state = gotoTable[state][c];
+                }
+                stateOutputs[state].Add(id);
+            }
+
+            var stateCount = gotoTable.Count;
+            var transitions = new int[stateCount * AlphabetSize];
+            var failure = new int[stateCount];
+            var queue = new Queue<int>();
+
+            for (int c = 0; c < AlphabetSize; c++)
+            {
+                var next = gotoTable[0][c];
+                if (next > 0)
+                {
+                    transitions[c] = next;
+                    failure[next] = 0;
+                    queue.Enqueue(next);
+                }
+            }
+
+            while (queue.Count > 0)
+            {
+                var state = queue.Dequeue();
+                stateOutputs[state].AddRange(stateOutputs[failure[state]]);
+
+                for (int c = 0; c < AlphabetSize; c++)
+                {
+                    var next = gotoTable[state][c];
+                    if (next > 0)
+                    {
+                        failure[next] = transitions[failure[state] * AlphabetSize + c];
+                        transitions[state * AlphabetSize + c] = next;
+                        queue.Enqueue(next);
+                    }
+                    else
+                    {
+                        transitions[state * AlphabetSize + c] = transitions[failure[state] * AlphabetSize + c];
+                    }
+                }
+            }
+
+            return (transitions, stateOutputs.Select(o => o.Distinct().ToArray()).ToArray());
+
+            static int[] NewRow() => new int[AlphabetSize];
+        }
+
+        /// <summary>
+        /// Mirrors Regex <c>\b{keyword}\b</c> for a match spanning [start, end]
+        /// </summary>
+        private static bool IsBounded(string input, int start, int end, string keyword)
+        {
+            var before = start > 0 && IsBoundaryWordChar(input[start - 1]);
+            var after = end + 1 < input.Length && IsBoundaryWordChar(input[end + 1]);
+
+            return before != IsBoundaryWordChar(keyword[0]) &&
+                   after != IsBoundaryWordChar(keyword[keyword.Length - 1]);
+        }
+
+        /// <summary>
+        /// Regex word characters: [\p{L}\p{Mn}\p{Nd}\p{Pc}] plus the zero-width joiners used by \b
+        /// </summary>
+        private static bool IsBoundaryWordChar(char c)
+        {
+            if (c < AlphabetSize)
+            {
+                return (c >= 'a' && c <= 'z') || (c >= 'A' && c <= 'Z') || (c >= '0' && c <= '9') || c == '_';
+            }
+
+            if (c == '\u200C' || c == '\u200D')
+                return true;
+
+            switch (CharUnicodeInfo.GetUnicodeCategory(c))
+            {
+                case UnicodeCategory.UppercaseLetter:
+                case UnicodeCategory.LowercaseLetter:
+                case UnicodeCategory.TitlecaseLetter:
+                case UnicodeCategory.ModifierLetter:
+                case UnicodeCategory.OtherLetter:
+                case UnicodeCategory.NonSpacingMark:
+                case UnicodeCategory.DecimalDigitNumber:
+                case UnicodeCategory.ConnectorPunctuation:
+                    return true;
+                default:
+                    return false;
+            }
+        }
+
+        /// <summary>
+        /// Detects inputs where OrdinalIgnoreCase and Regex IgnoreCase disagree on ASCII keywords
+        /// (Kelvin sign, long s, Turkish dotted/dotless i, or a Turkic UI culture)
+        /// </summary>
+        private static bool RequiresPerKeywordScoring(string input)
+        {
+            foreach (var c in input)
+            {
+                if (c < AlphabetSize) continue;
+
+                if (c == '\u212A' || c == '\u0130' || c == '\u0131' || char.ToUpperInvariant(c) < AlphabetSize)
+                    return true;
+            }
+
+            var language = CultureInfo.CurrentCulture.TwoLetterISOLanguageName;
+            return language == "tr" || language == "az";
+        }
+    }
+}
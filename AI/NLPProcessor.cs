@@ -1,8 +1,10 @@
 using System;
 using System.Collections.Generic;
+using System.Diagnostics;
 using System.Drawing;
 using System.Linq;
 using System.Text.Json;
+using System.Threading;
 using System.Threading.Tasks;
 using System.Text.Json.Serialization;
 
@@ -28,25 +30,50 @@ namespace RhinoAI.AI
         private readonly SimpleLogger _logger;
         private readonly ConfigurationManager _configManager;
         private readonly Dictionary<string, CommandTemplate> _commandTemplates;
+
+        private readonly SemanticResponseCache _semanticCache;
+        private readonly ProviderScheduler _providerScheduler;
+
+        // Batches share the document's undo stack and redraw flag, so only one may run at a time
+        private static readonly SemaphoreSlim BatchLock = new SemaphoreSlim(1, 1);
         
         // Enhanced NLP components
         private readonly EnhancedNLPProcessor _enhancedProcessor;
         private readonly bool _useEnhancedProcessing;
+        private readonly int _instancingThreshold;
 
-        public NLPProcessor(ConfigurationManager configManager, SimpleLogger logger)
+        public NLPProcessor(ConfigurationManager configManager, SimpleLogger logger,
+            OpenAIClient openAIClient, ClaudeClient claudeClient, OllamaClient ollamaClient)
         {
             _configManager = configManager ?? throw new ArgumentNullException(nameof(configManager));
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
             
-            // Initialize AI clients based on configuration
-            _openAIClient = new OpenAIClient(_configManager, _logger);
-            _claudeClient = new ClaudeClient(_configManager, _logger);
-            _ollamaClient = new OllamaClient(_configManager, _logger);
+            // AI clients are owned by AIManager and shared with the other components
+            _openAIClient = openAIClient;
+            _claudeClient = claudeClient;
+            _ollamaClient = ollamaClient;
             
             _commandTemplates = InitializeCommandTemplates();
+            _semanticCache = new SemanticResponseCache(_configManager, _logger, _commandTemplates.Values);
+            _providerScheduler = new ProviderScheduler(_configManager, _logger, new[]
+            {
+                new AIProviderEndpoint("OpenAI", () => _openAIClient?.IsConfigured == true,
+                    (system, user, token) => _openAIClient.ProcessTextAsync(system, user, cancellationToken: token),
+                    (system, user, token) => _openAIClient.StreamTextAsync(system, user, cancellationToken: token)),
+                new AIProviderEndpoint("Claude", () => _claudeClient?.IsConfigured == true,
+                    (system, user, token) => _claudeClient.ProcessTextAsync(system, user, cancellationToken: token),
+                    (system, user, token) => _claudeClient.StreamTextAsync(system, user, cancellationToken: token)),
+                new AIProviderEndpoint("Ollama", () => _ollamaClient?.IsConfigured == true,
+                    (system, user, token) => _ollamaClient.ProcessTextAsync(system, user, cancellationToken: token),
+                    (system, user, token) => _ollamaClient.StreamTextAsync(system, user, cancellationToken: token))
+            });
             
             // Initialize enhanced processor
-            _enhancedProcessor = new EnhancedNLPProcessor();
+            var maxCacheSize = _configManager.GetSetting("Processing:CacheResults", true)
+                ? _configManager.GetSetting("Processing:MaxCacheSize", 100)
+                : 0;
+            _instancingThreshold = _configManager.GetSetting("Geometry:InstancingThreshold", ArrayGenerator.DefaultInstancingThreshold);
+            _enhancedProcessor = new EnhancedNLPProcessor(maxCacheSize, TimeSpan.FromMinutes(5), _instancingThreshold);
             _useEnhancedProcessing = true; // Enable enhanced processing by default
         }
 
@@ -56,12 +83,33 @@ namespace RhinoAI.AI
         /// </summary>
         /// <param name="input">Natural language input</param>
         /// <returns>AI response or command execution result</returns>
-        public async Task<string> ProcessNaturalLanguageAsync(string input)
+        public Task<string> ProcessNaturalLanguageAsync(string input)
         {
+            return ProcessNaturalLanguageAsync(input, onToken: null);
+        }
+
+        /// <summary>
+        /// Process natural language input, streaming AI tokens to <paramref name="onToken"/> as they arrive
+        /// </summary>
+        /// <param name="input">Natural language input</param>
+        /// <param name="onToken">Receives partial AI output when an AI service is consulted; may be null</param>
+        /// <param name="cancellationToken">Cancels the request; provider calls in flight are aborted</param>
+        /// <returns>AI response or command execution result</returns>
+        public async Task<string> ProcessNaturalLanguageAsync(string input, Action<string> onToken, CancellationToken cancellationToken = default)
+        {
+            return ToMessage(await ProcessInputAsync(input, onToken, cancellationToken));
+        }
+
+        /// <summary>
+        /// Process natural language input, reporting whether the command it resolved to succeeded
+        /// </summary>
+        private async Task<ProcessingResult> ProcessInputAsync(string input, Action<string> onToken, CancellationToken cancellationToken)
+        {
+            using var span = PipelineTelemetry.StartSpan("NLP.ProcessNaturalLanguage", "NLP");
             try
             {
                 if (string.IsNullOrWhiteSpace(input))
-                    return "Please provide a valid input.";
+                    return ProcessingResult.Error("Please provide a valid input.");
 
                 _logger.LogInformation("Processing natural language input: {0}", input);
 
@@ -74,12 +122,12 @@ namespace RhinoAI.AI
                         if (enhancedResult.IsSuccess)
                         {
                             _logger.LogInformation("Enhanced processing successful: {0}", enhancedResult.Message);
-                            return enhancedResult.Message;
+                            return enhancedResult;
                         }
                         else if (enhancedResult.Type == ProcessingResultType.Warning)
                         {
                             _logger.LogWarning("Enhanced processing warning: {0}", enhancedResult.Message);
-                            return enhancedResult.Message;
+                            return enhancedResult;
                         }
                         else
                         {
@@ -95,22 +143,133 @@ namespace RhinoAI.AI
                 }
 
                 // Fallback to original processing
-                return await ProcessWithOriginalMethod(input);
+                cancellationToken.ThrowIfCancellationRequested();
+                return await ProcessWithOriginalMethod(input, onToken, cancellationToken);
+            }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                span.SetError("Cancelled");
+                throw;
             }
             catch (Exception ex)
             {
+                span.SetError(ex.Message);
                 _logger.LogError(ex, "Error processing natural language input");
-                return $"Error processing request: {ex.Message}";
+                return ProcessingResult.Error($"Error processing request: {ex.Message}");
             }
         }
 
+        private static string ToMessage(ProcessingResult result) => result.IsSuccess ? result.Message : result.ErrorMessage;
+
+        /// <summary>
+        /// Execute commands in order as a single undo record, with view redraws suppressed until
+        /// the whole batch has run. Each command is either natural language or a command name
+        /// with pre-parsed parameters. Concurrent batches wait for each other, so their undo
+        /// records never interleave and each restores the redraw state it found.
+        /// </summary>
+        /// <param name="commands">Commands in execution order</param>
+        /// <param name="stopOnError">Skip the remaining commands after the first failure</param>
+        /// <param name="cancellationToken">Cancels the batch between commands</param>
+        /// <returns>One result per executed command</returns>
+        public async Task<List<BatchCommandResult>> ExecuteBatchAsync(IReadOnlyList<BatchCommand> commands, bool stopOnError = false,
+            CancellationToken cancellationToken = default)
+        {
+            if (commands == null) throw new ArgumentNullException(nameof(commands));
+
+            var doc = RhinoDoc.ActiveDoc ?? throw new InvalidOperationException("No active Rhino document");
+            using var span = PipelineTelemetry.StartSpan("NLP.ExecuteBatch", "NLP");
+            span?.SetTag("rhinoai.batch_size", commands.Count);
+
+            var results = new List<BatchCommandResult>(commands.Count);
+            await BatchLock.WaitAsync(cancellationToken);
+            try
+            {
+                var undoRecord = doc.BeginUndoRecord($"RhinoAI batch ({commands.Count} commands)");
+                var redrawEnabled = doc.Views.RedrawEnabled;
+                doc.Views.RedrawEnabled = false;
+                try
+                {
+                    for (int i = 0; i < commands.Count; i++)
+                    {
+                        cancellationToken.ThrowIfCancellationRequested();
+
+                        var result = await ExecuteBatchCommandAsync(commands[i], i, cancellationToken);
+                        results.Add(result);
+                        if (!result.Success && stopOnError)
+                        {
+                            span.SetError($"Command {i} failed: {result.Message}");
+                            break;
+                        }
+                    }
+                }
+                finally
+                {
+                    doc.Views.RedrawEnabled = redrawEnabled;
+
+                    // Zero means a record was already open, so these changes belong to it
+                    if (undoRecord != 0)
+                    {
+                        doc.EndUndoRecord(undoRecord);
+                    }
+
+                    PipelineTelemetry.RedrawViews(doc);
+                }
+            }
+            finally
+            {
+                BatchLock.Release();
+            }
+
+            _logger.LogInformation("Executed batch of {0} commands, {1} succeeded", results.Count, results.Count(r => r.Success));
+            return results;
+        }
+
+        private async Task<BatchCommandResult> ExecuteBatchCommandAsync(BatchCommand command, int index, CancellationToken cancellationToken)
+        {
+            var started = Stopwatch.GetTimestamp();
+            var result = new BatchCommandResult { Index = index };
+
+            if (!string.IsNullOrWhiteSpace(command?.CommandName))
+            {
+                result.Command = command.CommandName;
+                if (_commandTemplates.TryGetValue(command.CommandName, out var template))
+                {
+                    var execution = await ExecuteRhinoCommand(template, ParameterExtractor.FromJson(command.Parameters));
+                    result.Message = ToMessage(execution);
+                    result.Success = execution.IsSuccess;
+                }
+                else
+                {
+                    result.Message = $"Unknown command '{command.CommandName}'";
+                }
+            }
+            else if (!string.IsNullOrWhiteSpace(command?.Text))
+            {
+                result.Command = command.Text;
+                var execution = await ProcessInputAsync(command.Text, onToken: null, cancellationToken);
+                result.Message = ToMessage(execution);
+                result.Success = execution.IsSuccess;
+            }
+            else
+            {
+                result.Message = "Command needs either Text or CommandName";
+            }
+
+            result.DurationMs = Stopwatch.GetElapsedTime(started).TotalMilliseconds;
+            return result;
+        }
+
         /// <summary>
         /// Original processing method maintained for fallback compatibility
         /// </summary>
-        private async Task<string> ProcessWithOriginalMethod(string input)
+        private async Task<ProcessingResult> ProcessWithOriginalMethod(string input, Action<string> onToken, CancellationToken cancellationToken)
         {
             // First try to match with command templates
-            var commandResult = TryMatchCommand(input);
+            CommandTemplate commandResult;
+            using (PipelineTelemetry.StartSpan("NLP.MatchCommand", "NLP"))
+            {
+                commandResult = TryMatchCommand(input);
+            }
             if (commandResult != null)
             {
                 _logger.LogInformation("Matched command template, executing: {0}", commandResult.CommandName);
@@ -118,14 +277,33 @@ namespace RhinoAI.AI
             }
 
             // If no direct command match, use AI to interpret
-            return await ProcessWithAI(input);
+            return await ProcessWithAI(input, onToken, cancellationToken);
         }
 
         /// <summary>
         /// Process input using AI models
         /// </summary>
-        private async Task<string> ProcessWithAI(string input)
+        private async Task<ProcessingResult> ProcessWithAI(string input, Action<string> onToken, CancellationToken cancellationToken)
         {
+            // Repeat intents skip the LLM round-trip; parameters are still extracted from this input
+            bool cacheHit;
+            AICommandResponse cachedResponse;
+            using (PipelineTelemetry.StartSpan("NLP.SemanticCacheLookup", "NLP"))
+            {
+                cacheHit = _semanticCache.TryGet(input, out cachedResponse);
+            }
+            if (cacheHit)
+            {
+                _logger.LogInformation("Semantic cache hit for: {0}", input);
+                var cachedResult = await ExecuteAIActions(cachedResponse, input);
+                if (!cachedResult.IsSuccess)
+                {
+                    // Don't keep replaying a failure for this prompt and its paraphrases
+                    _semanticCache.Invalidate(input);
+                }
+                return cachedResult;
+            }
+
             var systemPrompt = CreateSystemPrompt();
             var userRequest = new AICommandRequest
             {
@@ -133,49 +311,66 @@ namespace RhinoAI.AI
                 AvailableCommands = new List<CommandTemplate>(_commandTemplates.Values)
             };
 
-            var requestJson = JsonSerializer.Serialize(userRequest);
-            var aiResponseJson = "";
+            var requestJson = JsonSerializer.Serialize(userRequest, RhinoAIJsonContext.Default.AICommandRequest);
 
-            // Try AI services in order: OpenAI, Claude, then Ollama
-            if (_openAIClient?.IsConfigured == true)
-            {
-                aiResponseJson = await _openAIClient.ProcessTextAsync(systemPrompt, requestJson);
-            }
-            else if (_claudeClient?.IsConfigured == true)
-            {
-                aiResponseJson = await _claudeClient.ProcessTextAsync(systemPrompt, requestJson);
-            }
-            else if (_ollamaClient?.IsConfigured == true)
+            if (!_providerScheduler.HasConfiguredProvider)
             {
-                aiResponseJson = await _ollamaClient.ProcessTextAsync(systemPrompt, requestJson);
-            }
-            else
-            {
-                return "No AI service is configured. Please configure OpenAI, Claude API keys, or Ollama.";
+                return ProcessingResult.Error("No AI service is configured. Please configure OpenAI, Claude API keys, or Ollama.");
             }
 
+            // Stream tokens when a listener wants partial output; otherwise race or hedge across providers
+            var providerResult = onToken != null
+                ? await _providerScheduler.StreamAsync(systemPrompt, requestJson, onToken, cancellationToken)
+                : await _providerScheduler.ExecuteAsync(systemPrompt, requestJson, IsValidAIResponse, cancellationToken);
+            _logger.LogInformation("AI response from {0} in {1:F0}ms", providerResult.Provider, providerResult.Latency.TotalMilliseconds);
+            var aiResponseJson = providerResult.Response;
+
             // Parse AI response for commands
             var aiResponse = ParseAIResponse(aiResponseJson);
-            if (aiResponse?.Actions?.Count > 0)
+            var result = await ExecuteAIActions(aiResponse, input);
+
+            // Only interpretations that executed are worth replaying
+            if (result.IsSuccess)
+            {
+                _semanticCache.Store(input, aiResponse);
+            }
+            return result;
+        }
+
+        /// <summary>
+        /// Execute the commands suggested by an AI response, extracting parameters from the input.
+        /// Fails if any of the commands failed.
+        /// </summary>
+        private async Task<ProcessingResult> ExecuteAIActions(AICommandResponse aiResponse, string input)
+        {
+            var results = new List<ProcessingResult>();
+            foreach (var action in aiResponse?.Actions ?? Enumerable.Empty<AIAction>())
             {
-                var results = new List<string>();
-                foreach (var action in aiResponse.Actions)
+                if (!string.IsNullOrEmpty(action.CommandName))
                 {
-                    if (!string.IsNullOrEmpty(action.CommandName))
+                    _logger.LogInformation("AI suggested command: {0}", action.CommandName);
+                    var commandTemplate = _commandTemplates.GetValueOrDefault(action.CommandName);
+                    if (commandTemplate != null)
                     {
-                        _logger.LogInformation("AI suggested command: {0}", action.CommandName);
-                        var commandTemplate = _commandTemplates.GetValueOrDefault(action.CommandName);
-                        if (commandTemplate != null)
+                        Dictionary<string, object> parameters;
+                        using (PipelineTelemetry.StartSpan("NLP.ExtractParameters", "NLP"))
                         {
-                            var parameters = Utils.ParameterExtractor.Extract(input, commandTemplate.Parameters.ToList());
-                            results.Add(await ExecuteRhinoCommand(commandTemplate, parameters));
+                            parameters = Utils.ParameterExtractor.Extract(input, commandTemplate.Parameters.ToList());
                         }
+                        results.Add(await ExecuteRhinoCommand(commandTemplate, parameters));
                     }
                 }
-                return string.Join(System.Environment.NewLine, results);
             }
 
-            return !string.IsNullOrEmpty(aiResponse?.ResponseText) ? aiResponse.ResponseText : "Sorry, I could not understand the request.";
+            if (results.Count > 0)
+            {
+                var message = string.Join(System.Environment.NewLine, results.Select(ToMessage));
+                return results.All(r => r.IsSuccess) ? ProcessingResult.Success(message) : ProcessingResult.Error(message);
+            }
+
+            return !string.IsNullOrEmpty(aiResponse?.ResponseText)
+                ? ProcessingResult.Success(aiResponse.ResponseText)
+                : ProcessingResult.Error("Sorry, I could not understand the request.");
         }
 
         /// <summary>
@@ -227,42 +422,67 @@ Example Response:
         /// </summary>
         private AICommandResponse ParseAIResponse(string aiResponseJson)
         {
+            using var span = PipelineTelemetry.StartSpan("NLP.ParseAIResponse", "NLP");
             try
             {
                 if (string.IsNullOrWhiteSpace(aiResponseJson)) return null;
 
-                // The AI might return JSON within a code block, so we need to extract it.
-                var json = aiResponseJson.Trim();
-                if (json.StartsWith("```json"))
-                {
-                    json = json.Substring(7);
-                }
-                if (json.StartsWith("```"))
-                {
-                    json = json.Substring(3);
-                }
-                if (json.EndsWith("```"))
-                {
-                    json = json.Substring(0, json.Length - 3);
-                }
-                
-                return JsonSerializer.Deserialize<AICommandResponse>(json.Trim(), new JsonSerializerOptions
-                {
-                    PropertyNameCaseInsensitive = true
-                });
+                return JsonSerializer.Deserialize(ExtractJson(aiResponseJson), RhinoAIJsonContext.CaseInsensitive.AICommandResponse);
             }
             catch (JsonException ex)
             {
+                span.SetError(ex.Message);
                 _logger.LogError(ex, "Failed to deserialize AI response JSON.");
                 return new AICommandResponse { ResponseText = aiResponseJson }; // Return the raw text if parsing fails
             }
         }
 
+        /// <summary>
+        /// The AI might return JSON within a code block, so strip the fence before parsing
+        /// </summary>
+        private static string ExtractJson(string aiResponseJson)
+        {
+            var json = aiResponseJson.Trim();
+            if (json.StartsWith("```json"))
+            {
+                json = json.Substring(7);
+            }
+            if (json.StartsWith("```"))
+            {
+                json = json.Substring(3);
+            }
+            if (json.EndsWith("```"))
+            {
+                json = json.Substring(0, json.Length - 3);
+            }
+            return json.Trim();
+        }
+
+        /// <summary>
+        /// The scheduler only accepts provider responses that parse as a JSON object
+        /// </summary>
+        private static bool IsValidAIResponse(string aiResponseJson)
+        {
+            if (string.IsNullOrWhiteSpace(aiResponseJson)) return false;
+
+            try
+            {
+                using var document = JsonDocument.Parse(ExtractJson(aiResponseJson));
+                return document.RootElement.ValueKind == JsonValueKind.Object;
+            }
+            catch (JsonException)
+            {
+                return false;
+            }
+        }
+
         /// <summary>
         /// Execute a Rhino command based on the template and input
         /// </summary>
-        private async Task<string> ExecuteRhinoCommand(CommandTemplate template, Dictionary<string, object> parameters)
+        private async Task<ProcessingResult> ExecuteRhinoCommand(CommandTemplate template, Dictionary<string, object> parameters)
         {
+            using var span = PipelineTelemetry.StartSpan("NLP.ExecuteCommand", "Rhino");
+            span?.SetTag("rhinoai.command", template.CommandName);
             try
             {
                 // Ensure parameters are not null
@@ -280,10 +500,10 @@ Example Response:
                         return CreateCylinder(parameters);
                     
                     case "CreateSphereArray":
-                        return CreateSphereArray(parameters);
+                        return await CreateSphereArrayAsync(parameters);
                     
                     case "CreateBoxArray":
-                        return CreateBoxArray(parameters);
+                        return await CreateBoxArrayAsync(parameters);
                     
                     case "SelectAll":
                         return SelectAllObjects();
@@ -316,29 +536,34 @@ Example Response:
                         return JoinObjects();
                     
                     default:
-                        return $"Command '{template.CommandName}' is not yet implemented.";
+                        return ProcessingResult.Error($"Command '{template.CommandName}' is not yet implemented.");
                 }
             }
             catch (Exception ex)
             {
+                span.SetError(ex.Message);
                 _logger.LogError(ex, $"Error executing Rhino command: {template.CommandName}");
-                return $"Error executing command: {ex.Message}";
+                return ProcessingResult.Error($"Error executing command: {ex.Message}");
             }
         }
 
         /// <summary>
         /// Execute a Rhino command based on the template and input
         /// </summary>
-        private async Task<string> ExecuteRhinoCommand(CommandTemplate template, string originalInput)
+        private async Task<ProcessingResult> ExecuteRhinoCommand(CommandTemplate template, string originalInput)
         {
-            var parameters = Utils.ParameterExtractor.Extract(originalInput, template.Parameters.ToList());
+            Dictionary<string, object> parameters;
+            using (PipelineTelemetry.StartSpan("NLP.ExtractParameters", "NLP"))
+            {
+                parameters = Utils.ParameterExtractor.Extract(originalInput, template.Parameters.ToList());
+            }
             return await ExecuteRhinoCommand(template, parameters);
         }
 
         /// <summary>
         /// Create a sphere based on parameters
         /// </summary>
-        private string CreateSphere(Dictionary<string, object> parameters)
+        private ProcessingResult CreateSphere(Dictionary<string, object> parameters)
         {
             var center = GetPointParameter(parameters, "center", Point3d.Origin);
             var radius = GetDoubleParameter(parameters, "radius", 1.0);
@@ -373,20 +598,20 @@ Example Response:
                     // Auto-select the newly created object
                     RhinoDoc.ActiveDoc.Objects.Select(id);
 
-                    RhinoDoc.ActiveDoc.Views.Redraw();
+                    PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
                     var colorText = color.HasValue ? $" in {GetColorName(color.Value)}" : "";
                     var nameText = !string.IsNullOrEmpty(name) ? $" named '{name}'" : "";
-                    return $"Created sphere{colorText}{nameText} at {center} with radius {radius:F2}";
+                    return ProcessingResult.Success($"Created sphere{colorText}{nameText} at {center} with radius {radius:F2}");
                 }
             }
 
-            return "Failed to create sphere";
+            return ProcessingResult.Error("Failed to create sphere");
         }
 
         /// <summary>
         /// Create a box based on parameters
         /// </summary>
-        private string CreateBox(Dictionary<string, object> parameters)
+        private ProcessingResult CreateBox(Dictionary<string, object> parameters)
         {
             var center = GetPointParameter(parameters, "center", Point3d.Origin);
             var color = GetColorParameter(parameters, "color");
@@ -442,20 +667,20 @@ Example Response:
                     // Auto-select the newly created object
                     RhinoDoc.ActiveDoc.Objects.Select(id);
 
-                    RhinoDoc.ActiveDoc.Views.Redraw();
+                    PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
                     var colorText = color.HasValue ? $" in {GetColorName(color.Value)}" : "";
                     var nameText = !string.IsNullOrEmpty(name) ? $" named '{name}'" : "";
-                    return $"Created box{colorText}{nameText} at {center} with size {width:F1}×{length:F1}×{height:F1}";
+                    return ProcessingResult.Success($"Created box{colorText}{nameText} at {center} with size {width:F1}×{length:F1}×{height:F1}");
                 }
             }
 
-            return "Failed to create box";
+            return ProcessingResult.Error("Failed to create box");
         }
 
         /// <summary>
         /// Create a cylinder based on parameters
         /// </summary>
-        private string CreateCylinder(Dictionary<string, object> parameters)
+        private ProcessingResult CreateCylinder(Dictionary<string, object> parameters)
         {
             var center = GetPointParameter(parameters, "center", Point3d.Origin);
             var radius = GetDoubleParameter(parameters, "radius", 1.0);
@@ -489,20 +714,20 @@ Example Response:
                         }
                     }
 
-                    RhinoDoc.ActiveDoc.Views.Redraw();
+                    PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
                     var colorText = color.HasValue ? $" in {GetColorName(color.Value)}" : "";
                     var nameText = !string.IsNullOrEmpty(name) ? $" named '{name}'" : "";
-                    return $"Created cylinder{colorText}{nameText} at {center} with radius {radius:F2} and height {height:F2}";
+                    return ProcessingResult.Success($"Created cylinder{colorText}{nameText} at {center} with radius {radius:F2} and height {height:F2}");
                 }
             }
 
-            return "Failed to create cylinder";
+            return ProcessingResult.Error("Failed to create cylinder");
         }
 
         /// <summary>
         /// Create an array of spheres based on parameters
         /// </summary>
-        private string CreateSphereArray(Dictionary<string, object> parameters)
+        private async Task<ProcessingResult> CreateSphereArrayAsync(Dictionary<string, object> parameters)
         {
             var center = GetPointParameter(parameters, "center", Point3d.Origin);
             var radius = GetDoubleParameter(parameters, "radius", 1.0);
@@ -512,52 +737,36 @@ Example Response:
             var color = GetColorParameter(parameters, "color");
             var name = GetStringParameter(parameters, "name", "");
 
+            var prototype = new Sphere(center, radius).ToBrep();
             var createdCount = 0;
-
-            for (int i = 0; i < rows; i++)
+            if (prototype?.IsValid == true)
             {
-                for (int j = 0; j < columns; j++)
+                var result = await ArrayGenerator.AddAsync(RhinoDoc.ActiveDoc, new ArrayRequest
                 {
-                    var sphereCenter = new Point3d(
-                        center.X + j * spacing,
-                        center.Y + i * spacing,
-                        center.Z
-                    );
-
-                    var sphere = new Sphere(sphereCenter, radius);
-                    var brep = sphere.ToBrep();
-
-                    if (brep?.IsValid == true)
-                    {
-                        var attributes = new ObjectAttributes();
-                        if (color.HasValue)
-                        {
-                            attributes.ObjectColor = color.Value;
-                            attributes.ColorSource = ObjectColorSource.ColorFromObject;
-                        }
-
-                        if (!string.IsNullOrEmpty(name))
-                        {
-                            attributes.Name = $"{name}_sphere_{i}_{j}";
-                        }
+                    Prototypes = new[] { prototype },
+                    Attributes = new[] { ArrayGenerator.CreateAttributes(color) },
+                    Placements = ArrayGenerator.ToTransforms(ArrayLayout.Grid(rows, columns, spacing, spacing)),
+                    PlacementName = string.IsNullOrEmpty(name) ? null : i => $"{name}_sphere_{i / columns}_{i % columns}",
+                    UndoDescription = $"RhinoAI sphere array ({rows}x{columns})",
+                    SelectCreated = false,
+                    UseInstances = ArrayGenerator.ShouldUseInstances(rows * columns, _instancingThreshold),
+                    DefinitionName = string.IsNullOrEmpty(name) ? "RhinoAI Sphere" : name
+                });
+                createdCount = result.CreatedCount;
+            }
 
-                        var id = RhinoDoc.ActiveDoc.Objects.AddBrep(brep, attributes);
-                        if (id != Guid.Empty)
-                        {
-                            createdCount++;
-                        }
-                    }
-                }
+            if (createdCount == 0)
+            {
+                return ProcessingResult.Error("Failed to create sphere array");
             }
 
-            RhinoDoc.ActiveDoc.Views.Redraw();
-            return $"Created {createdCount} spheres in a {rows}x{columns} array with radius {radius:F2} and spacing {spacing:F2}";
+            return ProcessingResult.Success($"Created {createdCount} spheres in a {rows}x{columns} array with radius {radius:F2} and spacing {spacing:F2}");
         }
 
         /// <summary>
         /// Create an array of boxes based on parameters
         /// </summary>
-        private string CreateBoxArray(Dictionary<string, object> parameters)
+        private async Task<ProcessingResult> CreateBoxArrayAsync(Dictionary<string, object> parameters)
         {
             var center = GetPointParameter(parameters, "center", Point3d.Origin);
             var size = GetDoubleParameter(parameters, "size", 2.0);
@@ -567,51 +776,31 @@ Example Response:
             var color = GetColorParameter(parameters, "color");
             var name = GetStringParameter(parameters, "name", "");
 
+            var interval = new Interval(-size / 2, size / 2);
+            var prototype = new Box(new Plane(center, Vector3d.ZAxis), interval, interval, interval).ToBrep();
             var createdCount = 0;
-
-            for (int i = 0; i < rows; i++)
+            if (prototype?.IsValid == true)
             {
-                for (int j = 0; j < columns; j++)
+                var result = await ArrayGenerator.AddAsync(RhinoDoc.ActiveDoc, new ArrayRequest
                 {
-                    var boxCenter = new Point3d(
-                        center.X + j * spacing,
-                        center.Y + i * spacing,
-                        center.Z
-                    );
-
-                    var interval = new Interval(-size / 2, size / 2);
-                    var box = new Box(
-                        new Plane(boxCenter, Vector3d.ZAxis),
-                        interval, interval, interval
-                    );
-
-                    var brep = box.ToBrep();
-
-                    if (brep?.IsValid == true)
-                    {
-                        var attributes = new ObjectAttributes();
-                        if (color.HasValue)
-                        {
-                            attributes.ObjectColor = color.Value;
-                            attributes.ColorSource = ObjectColorSource.ColorFromObject;
-                        }
-
-                        if (!string.IsNullOrEmpty(name))
-                        {
-                            attributes.Name = $"{name}_box_{i}_{j}";
-                        }
+                    Prototypes = new[] { prototype },
+                    Attributes = new[] { ArrayGenerator.CreateAttributes(color) },
+                    Placements = ArrayGenerator.ToTransforms(ArrayLayout.Grid(rows, columns, spacing, spacing)),
+                    PlacementName = string.IsNullOrEmpty(name) ? null : i => $"{name}_box_{i / columns}_{i % columns}",
+                    UndoDescription = $"RhinoAI box array ({rows}x{columns})",
+                    SelectCreated = false,
+                    UseInstances = ArrayGenerator.ShouldUseInstances(rows * columns, _instancingThreshold),
+                    DefinitionName = string.IsNullOrEmpty(name) ? "RhinoAI Box" : name
+                });
+                createdCount = result.CreatedCount;
+            }
 
-                        var id = RhinoDoc.ActiveDoc.Objects.AddBrep(brep, attributes);
-                        if (id != Guid.Empty)
-                        {
-                            createdCount++;
-                        }
-                    }
-                }
+            if (createdCount == 0)
+            {
+                return ProcessingResult.Error("Failed to create box array");
             }
 
-            RhinoDoc.ActiveDoc.Views.Redraw();
-            return $"Created {createdCount} boxes in a {rows}x{columns} array with size {size:F2} and spacing {spacing:F2}";
+            return ProcessingResult.Success($"Created {createdCount} boxes in a {rows}x{columns} array with size {size:F2} and spacing {spacing:F2}");
         }
 
         /// <summary>
@@ -686,19 +875,19 @@ Example Response:
         /// <summary>
         /// Move selected objects
         /// </summary>
-        private string MoveObjects(Dictionary<string, object> parameters)
+        private ProcessingResult MoveObjects(Dictionary<string, object> parameters)
         {
             var translation = GetVectorParameter(parameters, "translation", Vector3d.Zero);
             
             if (translation == Vector3d.Zero)
             {
-                return "No translation vector specified";
+                return ProcessingResult.Error("No translation vector specified");
             }
 
             var selectedObjects = RhinoDoc.ActiveDoc.Objects.GetSelectedObjects(false, false)?.ToArray();
             if (selectedObjects == null || selectedObjects.Length == 0)
             {
-                return "No objects selected for moving";
+                return ProcessingResult.Error("No objects selected for moving");
             }
 
             var transform = Transform.Translation(translation);
@@ -713,26 +902,26 @@ Example Response:
                 }
             }
 
-            RhinoDoc.ActiveDoc.Views.Redraw();
-            return $"Moved {movedCount} object(s) by {translation}";
+            PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
+            return ProcessingResult.Success($"Moved {movedCount} object(s) by {translation}");
         }
 
         /// <summary>
         /// Scale selected objects
         /// </summary>
-        private string ScaleObjects(Dictionary<string, object> parameters)
+        private ProcessingResult ScaleObjects(Dictionary<string, object> parameters)
         {
             var scale = GetVectorParameter(parameters, "scale", Vector3d.Unset);
             
             if (scale == Vector3d.Unset)
             {
-                return "No scale factor specified";
+                return ProcessingResult.Error("No scale factor specified");
             }
 
             var selectedObjects = RhinoDoc.ActiveDoc.Objects.GetSelectedObjects(false, false)?.ToArray();
             if (selectedObjects == null || selectedObjects.Length == 0)
             {
-                return "No objects selected for scaling";
+                return ProcessingResult.Error("No objects selected for scaling");
             }
 
             var transform = Transform.Scale(Point3d.Origin, scale.X);
@@ -747,19 +936,19 @@ Example Response:
                 }
             }
 
-            RhinoDoc.ActiveDoc.Views.Redraw();
-            return $"Scaled {scaledCount} object(s) by factor {scale.X:F2}";
+            PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
+            return ProcessingResult.Success($"Scaled {scaledCount} object(s) by factor {scale.X:F2}");
         }
 
         /// <summary>
         /// Perform boolean union on selected objects
         /// </summary>
-        private string BooleanUnion()
+        private ProcessingResult BooleanUnion()
         {
             var selectedObjects = RhinoDoc.ActiveDoc.Objects.GetSelectedObjects(false, false)?.ToArray();
             if (selectedObjects == null || selectedObjects.Length < 2)
             {
-                return "At least 2 objects must be selected for boolean union";
+                return ProcessingResult.Error("At least 2 objects must be selected for boolean union");
             }
 
             var breps = new List<Brep>();
@@ -773,7 +962,7 @@ Example Response:
 
             if (breps.Count < 2)
             {
-                return "At least 2 solid objects must be selected";
+                return ProcessingResult.Error("At least 2 solid objects must be selected");
             }
 
             try
@@ -793,27 +982,27 @@ Example Response:
                         RhinoDoc.ActiveDoc.Objects.AddBrep(result);
                     }
 
-                    RhinoDoc.ActiveDoc.Views.Redraw();
-                    return $"Boolean union completed. Created {unionResults.Length} object(s)";
+                    PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
+                    return ProcessingResult.Success($"Boolean union completed. Created {unionResults.Length} object(s)");
                 }
             }
             catch (Exception ex)
             {
-                return $"Boolean union failed: {ex.Message}";
+                return ProcessingResult.Error($"Boolean union failed: {ex.Message}");
             }
 
-            return "Boolean union failed";
+            return ProcessingResult.Error("Boolean union failed");
         }
 
         /// <summary>
         /// Perform boolean difference on selected objects
         /// </summary>
-        private string BooleanDifference()
+        private ProcessingResult BooleanDifference()
         {
             var selectedObjects = RhinoDoc.ActiveDoc.Objects.GetSelectedObjects(false, false)?.ToArray();
             if (selectedObjects == null || selectedObjects.Length < 2)
             {
-                return "At least 2 objects must be selected for boolean difference";
+                return ProcessingResult.Error("At least 2 objects must be selected for boolean difference");
             }
 
             var breps = new List<Brep>();
@@ -827,7 +1016,7 @@ Example Response:
 
             if (breps.Count < 2)
             {
-                return "At least 2 solid objects must be selected";
+                return ProcessingResult.Error("At least 2 solid objects must be selected");
             }
 
             try
@@ -850,27 +1039,27 @@ Example Response:
                         RhinoDoc.ActiveDoc.Objects.AddBrep(result);
                     }
 
-                    RhinoDoc.ActiveDoc.Views.Redraw();
-                    return $"Boolean difference completed. Created {differenceResults.Length} object(s)";
+                    PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
+                    return ProcessingResult.Success($"Boolean difference completed. Created {differenceResults.Length} object(s)");
                 }
             }
             catch (Exception ex)
             {
-                return $"Boolean difference failed: {ex.Message}";
+                return ProcessingResult.Error($"Boolean difference failed: {ex.Message}");
             }
 
-            return "Boolean difference failed";
+            return ProcessingResult.Error("Boolean difference failed");
         }
 
         /// <summary>
         /// Perform boolean intersection on selected objects
         /// </summary>
-        private string BooleanIntersection()
+        private ProcessingResult BooleanIntersection()
         {
             var selectedObjects = RhinoDoc.ActiveDoc.Objects.GetSelectedObjects(false, false)?.ToArray();
             if (selectedObjects == null || selectedObjects.Length < 2)
             {
-                return "At least 2 objects must be selected for boolean intersection";
+                return ProcessingResult.Error("At least 2 objects must be selected for boolean intersection");
             }
 
             var breps = new List<Brep>();
@@ -884,7 +1073,7 @@ Example Response:
 
             if (breps.Count < 2)
             {
-                return "At least 2 solid objects must be selected";
+                return ProcessingResult.Error("At least 2 solid objects must be selected");
             }
 
             try
@@ -907,27 +1096,27 @@ Example Response:
                         RhinoDoc.ActiveDoc.Objects.AddBrep(result);
                     }
 
-                    RhinoDoc.ActiveDoc.Views.Redraw();
-                    return $"Boolean intersection completed. Created {intersectionResults.Length} object(s)";
+                    PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
+                    return ProcessingResult.Success($"Boolean intersection completed. Created {intersectionResults.Length} object(s)");
                 }
             }
             catch (Exception ex)
             {
-                return $"Boolean intersection failed: {ex.Message}";
+                return ProcessingResult.Error($"Boolean intersection failed: {ex.Message}");
             }
 
-            return "Boolean intersection failed";
+            return ProcessingResult.Error("Boolean intersection failed");
         }
 
         /// <summary>
         /// Explode selected objects
         /// </summary>
-        private string ExplodeObjects()
+        private ProcessingResult ExplodeObjects()
         {
             var selectedObjects = RhinoDoc.ActiveDoc.Objects.GetSelectedObjects(false, false)?.ToArray();
             if (selectedObjects == null || selectedObjects.Length == 0)
             {
-                return "No objects selected for exploding";
+                return ProcessingResult.Error("No objects selected for exploding");
             }
 
             int explodedCount = 0;
@@ -958,19 +1147,19 @@ Example Response:
                 }
             }
 
-            RhinoDoc.ActiveDoc.Views.Redraw();
-            return $"Exploded {explodedCount} object(s) into {newObjectsCount} new object(s)";
+            PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
+            return ProcessingResult.Success($"Exploded {explodedCount} object(s) into {newObjectsCount} new object(s)");
         }
 
         /// <summary>
         /// Join selected objects
         /// </summary>
-        private string JoinObjects()
+        private ProcessingResult JoinObjects()
         {
             var selectedObjects = RhinoDoc.ActiveDoc.Objects.GetSelectedObjects(false, false)?.ToArray();
             if (selectedObjects == null || selectedObjects.Length < 2)
             {
-                return "At least 2 objects must be selected for joining";
+                return ProcessingResult.Error("At least 2 objects must be selected for joining");
             }
 
             var breps = new List<Brep>();
@@ -984,7 +1173,7 @@ Example Response:
 
             if (breps.Count < 2)
             {
-                return "At least 2 solid objects must be selected";
+                return ProcessingResult.Error("At least 2 solid objects must be selected");
             }
 
             try
@@ -1004,22 +1193,22 @@ Example Response:
                         RhinoDoc.ActiveDoc.Objects.AddBrep(result);
                     }
 
-                    RhinoDoc.ActiveDoc.Views.Redraw();
-                    return $"Joined {breps.Count} object(s) into {joinedBreps.Length} object(s)";
+                    PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
+                    return ProcessingResult.Success($"Joined {breps.Count} object(s) into {joinedBreps.Length} object(s)");
                 }
             }
             catch (Exception ex)
             {
-                return $"Join operation failed: {ex.Message}";
+                return ProcessingResult.Error($"Join operation failed: {ex.Message}");
             }
 
-            return "Join operation failed";
+            return ProcessingResult.Error("Join operation failed");
         }
 
         /// <summary>
         /// Select all objects in the document
         /// </summary>
-        private string SelectAllObjects()
+        private ProcessingResult SelectAllObjects()
         {
             var allObjects = RhinoDoc.ActiveDoc.Objects.GetObjectList(ObjectType.AnyObject);
             int selectedCount = 0;
@@ -1032,19 +1221,19 @@ Example Response:
                 }
             }
 
-            RhinoDoc.ActiveDoc.Views.Redraw();
-            return $"Selected {selectedCount} object(s)";
+            PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
+            return ProcessingResult.Success($"Selected {selectedCount} object(s)");
         }
 
         /// <summary>
         /// Select objects by name
         /// </summary>
-        private string SelectObjectsByName(Dictionary<string, object> parameters)
+        private ProcessingResult SelectObjectsByName(Dictionary<string, object> parameters)
         {
             var name = GetStringParameter(parameters, "name", "");
             if (string.IsNullOrEmpty(name))
             {
-                return "No object name specified";
+                return ProcessingResult.Error("No object name specified");
             }
 
             var allObjects = RhinoDoc.ActiveDoc.Objects.GetObjectList(ObjectType.AnyObject);
@@ -1061,18 +1250,18 @@ Example Response:
                 }
             }
 
-            RhinoDoc.ActiveDoc.Views.Redraw();
-            return $"Selected {selectedCount} object(s) named '{name}'";
+            PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
+            return ProcessingResult.Success($"Selected {selectedCount} object(s) named '{name}'");
         }
 
         /// <summary>
         /// Deselect all objects
         /// </summary>
-        private string DeselectAllObjects()
+        private ProcessingResult DeselectAllObjects()
         {
             RhinoDoc.ActiveDoc.Objects.UnselectAll();
-            RhinoDoc.ActiveDoc.Views.Redraw();
-            return "Deselected all objects";
+            PipelineTelemetry.RedrawViews(RhinoDoc.ActiveDoc);
+            return ProcessingResult.Success("Deselected all objects");
         }
 
         /// <summary>
@@ -1234,7 +1423,30 @@ Example Response:
         /// </summary>
         public ProcessingStats GetProcessingStats()
         {
-            return _enhancedProcessor?.GetProcessingStats() ?? new ProcessingStats();
+            var stats = _enhancedProcessor?.GetProcessingStats() ?? new ProcessingStats();
+            var semanticStats = _semanticCache.GetStatistics();
+
+            stats.SemanticCacheHitCount = semanticStats.ExactHits + semanticStats.SimilarHits;
+            stats.SemanticCacheMissCount = semanticStats.Misses;
+            stats.SemanticCacheEvictionCount = semanticStats.Evictions;
+            stats.SemanticCacheHitRate = semanticStats.HitRate;
+            return stats;
+        }
+
+        /// <summary>
+        /// Get observed latency percentiles for each AI provider
+        /// </summary>
+        public List<ProviderLatencyStats> GetProviderLatencyStats()
+        {
+            return _providerScheduler.GetLatencyStats();
+        }
+
+        /// <summary>
+        /// Get detailed statistics for the LLM semantic cache
+        /// </summary>
+        public SemanticCacheStatistics GetSemanticCacheStatistics()
+        {
+            return _semanticCache.GetStatistics();
         }
 
         /// <summary>
@@ -1251,6 +1463,7 @@ Example Response:
         public void ClearCache()
         {
             _enhancedProcessor?.ClearCache();
+            _semanticCache.Clear();
         }
 
         /// <summary>
@@ -0,0 +1,304 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using RhinoAI.Core;
+
+namespace RhinoAI.AI
+{
+    /// <summary>
+    /// How requests are distributed across the configured AI providers
+    /// </summary>
+    public enum ProviderSchedulingMode
+    {
+        /// <summary>Providers in declaration order, falling back on failure; the default</summary>
+        Sequential,
+        /// <summary>All providers at once; the first valid response wins</summary>
+        Race,
+        /// <summary>Fastest provider first, a second one after its tail latency has elapsed</summary>
+        Hedge,
+        /// <summary>Providers ordered by observed median latency, falling back on failure</summary>
+        FastestMedian
+    }
+
+    /// <summary>
+    /// Routes AI text requests across providers by racing, hedging or latency-ordered fallback.
+    /// Requests that lose are cancelled, and every successful response feeds the provider's
+    /// latency histogram used for ordering and hedge delays.
+    /// </summary>
+    public class ProviderScheduler
+    {
+        private readonly SimpleLogger _logger;
+        private readonly List<AIProviderEndpoint> _providers;
+        private readonly double _hedgePercentile;
+        private readonly TimeSpan _defaultHedgeDelay;
+        private readonly int _minimumSamples;
+
+        public ProviderScheduler(ConfigurationManager configManager, SimpleLogger logger, IEnumerable<AIProviderEndpoint> providers)
+        {
+            if (configManager == null) throw new ArgumentNullException(nameof(configManager));
+            _logger = logger ?? throw new ArgumentNullException(nameof(logger));
+            _providers = providers?.ToList() ?? throw new ArgumentNullException(nameof(providers));
+
+            // Race and Hedge can pay for a second provider's call, so they are opt-in
+            Mode = Enum.TryParse<ProviderSchedulingMode>(configManager.GetSetting("Processing:ProviderScheduling", "Sequential"), true, out var mode)
+                ? mode
+                : ProviderSchedulingMode.Sequential;
+            _hedgePercentile = configManager.GetSetting("Processing:HedgePercentile", 95.0);
+            _defaultHedgeDelay = TimeSpan.FromMilliseconds(configManager.GetSetting("Processing:HedgeDelayMs", 2000));
+            _minimumSamples = configManager.GetSetting("Processing:LatencyMinSamples", 5);
+        }
+
+        public ProviderSchedulingMode Mode { get; }
+
+        public bool HasConfiguredProvider => _providers.Any(p => p.IsConfigured());
+
+        /// <summary>
+        /// Sends the request according to the scheduling mode and returns the first valid response.
+        /// If no provider returns a valid response, the last non-empty response is returned instead.
+        /// </summary>
+        public async Task<ProviderResult> ExecuteAsync(string systemPrompt, string userInput,
+            Func<string, bool> isValidResponse, CancellationToken cancellationToken = default)
+        {
+            var ordered = GetOrderedProviders();
+            if (ordered.Count == 0)
+                throw new InvalidOperationException("No AI provider is configured");
+
+            using var span = PipelineTelemetry.StartSpan("AI.ProviderRequest", "AI");
+            span?.SetTag("rhinoai.scheduling", Mode.ToString());
+            using var cancellation = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+            var attempts = new List<Task<ProviderAttempt>>();
+            ProviderAttempt fallback = null;
+            Task hedgeTimer = null;
+            var next = 0;
+
+            void Launch()
+            {
+                var provider = ordered[next++];
+                attempts.Add(AttemptAsync(provider, systemPrompt, userInput, isValidResponse, cancellation.Token));
+
+                hedgeTimer = Mode == ProviderSchedulingMode.Hedge && next < ordered.Count
+                    ? Task.Delay(GetHedgeDelay(provider), cancellation.Token)
+                    : null;
+            }
+
+            Launch();
+            while (Mode == ProviderSchedulingMode.Race && next < ordered.Count)
+            {
+                Launch();
+            }
+
+            while (attempts.Count > 0)
+            {
+                var waitingOn = hedgeTimer != null ? attempts.Cast<Task>().Append(hedgeTimer) : attempts;
+                var completed = await Task.WhenAny(waitingOn);
+
+                if (completed == hedgeTimer)
+                {
+                    if (cancellation.IsCancellationRequested)
+                    {
+                        hedgeTimer = null;
+                        continue;
+                    }
+
+                    _logger.LogInformation("Hedging AI request to {0}", ordered[next].Name);
+                    Launch();
+                    continue;
+                }
+
+                var attempt = await (Task<ProviderAttempt>)completed;
+                attempts.Remove((Task<ProviderAttempt>)completed);
+
+                if (attempt.IsValid)
+                {
+                    // Cancel the losing requests and any pending hedge
+                    cancellation.Cancel();
+                    span?.SetTag("rhinoai.provider", attempt.Result.Provider);
+                    return attempt.Result;
+                }
+
+                if (!string.IsNullOrWhiteSpace(attempt.Result?.Response))
+                {
+                    fallback = attempt;
+                }
+
+                if (attempts.Count == 0 && next < ordered.Count)
+                {
+                    Launch();
+                }
+            }
+
+            cancellationToken.ThrowIfCancellationRequested();
+            span.SetError("No provider returned a valid response");
+            return fallback?.Result ?? throw new InvalidOperationException("All configured AI providers failed");
+        }
+
+        /// <summary>
+        /// Streams the response from the preferred provider, reporting each token as it arrives.
+        /// Streams are not raced, because tokens from different providers cannot be interleaved.
+        /// </summary>
+        public async Task<ProviderResult> StreamAsync(string systemPrompt, string userInput, Action<string> onToken,
+            CancellationToken cancellationToken = default)
+        {
+            var provider = GetOrderedProviders().FirstOrDefault()
+                ?? throw new InvalidOperationException("No AI provider is configured");
+
+            using var span = PipelineTelemetry.StartSpan(provider.StreamSpanName, "AI");
+            var stopwatch = Stopwatch.StartNew();
+            var builder = new StringBuilder();
+
+            await foreach (var token in provider.StreamTextAsync(systemPrompt, userInput, cancellationToken))
+            {
+                builder.Append(token);
+                onToken?.Invoke(token);
+            }
+
+            stopwatch.Stop();
+            provider.Latency.Record(stopwatch.Elapsed);
+
+            return new ProviderResult
+            {
+                Provider = provider.Name,
+                Response = builder.ToString(),
+                Latency = stopwatch.Elapsed
+            };
+        }
+
+        /// <summary>
+        /// Configured providers in the order the current mode would try them
+        /// </summary>
+        public List<AIProviderEndpoint> GetOrderedProviders()
+        {
+            var configured = _providers.Where(p => p.IsConfigured()).ToList();
+            if (Mode == ProviderSchedulingMode.Sequential)
+            {
+                return configured;
+            }
+
+            // Providers without enough samples keep their declaration order after the measured ones
+            return configured
+                .Select((provider, index) => (provider, index))
+                .OrderBy(p => p.provider.Latency.Count >= _minimumSamples ? p.provider.Latency.GetPercentile(50) : TimeSpan.MaxValue)
+                .ThenBy(p => p.index)
+                .Select(p => p.provider)
+                .ToList();
+        }
+
+        public List<ProviderLatencyStats> GetLatencyStats()
+        {
+            return _providers.Select(p => new ProviderLatencyStats
+            {
+                Provider = p.Name,
+                IsConfigured = p.IsConfigured(),
+                SampleCount = p.Latency.Count,
+                P50 = p.Latency.GetPercentile(50),
+                P95 = p.Latency.GetPercentile(95),
+                P99 = p.Latency.GetPercentile(99)
+            }).ToList();
+        }
+
+        private TimeSpan GetHedgeDelay(AIProviderEndpoint provider)
+        {
+            return provider.Latency.Count >= _minimumSamples
+                ? provider.Latency.GetPercentile(_hedgePercentile)
+                : _defaultHedgeDelay;
+        }
+
+        private async Task<ProviderAttempt> AttemptAsync(AIProviderEndpoint provider, string systemPrompt, string userInput,
+            Func<string, bool> isValidResponse, CancellationToken cancellationToken)
+        {
+            using var span = PipelineTelemetry.StartSpan(provider.SpanName, "AI");
+            var stopwatch = Stopwatch.StartNew();
+            try
+            {
+                var response = await provider.ProcessTextAsync(systemPrompt, userInput, cancellationToken);
+                stopwatch.Stop();
+
+                var result = new ProviderResult { Provider = provider.Name, Response = response, Latency = stopwatch.Elapsed };
+                if (isValidResponse != null && !isValidResponse(response))
+                {
+                    _logger.LogWarning("{0} returned an invalid response after {1:F0}ms", provider.Name, stopwatch.Elapsed.TotalMilliseconds);
+                    span.SetError("Invalid response");
+                    return new ProviderAttempt(result, isValid: false);
+                }
+
+                provider.Latency.Record(stopwatch.Elapsed);
+                return new ProviderAttempt(result, isValid: true);
+            }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                span?.SetTag("rhinoai.cancelled", true);
+                return new ProviderAttempt(null, isValid: false);
+            }
+            catch (Exception ex)
+            {
+                span.SetError(ex.Message);
+                _logger.LogWarning("{0} request failed: {1}", provider.Name, ex.Message);
+                return new ProviderAttempt(null, isValid: false);
+            }
+        }
+
+        private class ProviderAttempt
+        {
+            public ProviderAttempt(ProviderResult result, bool isValid)
+            {
+                Result = result;
+                IsValid = isValid;
+            }
+
+            public ProviderResult Result { get; }
+            public bool IsValid { get; }
+        }
+    }
+
+    #region Provider Scheduling Models
+
+    /// <summary>
+    /// An AI provider as seen by the scheduler
+    /// </summary>
+    public class AIProviderEndpoint
+    {
+        public AIProviderEndpoint(string name, Func<bool> isConfigured,
+            Func<string, string, CancellationToken, Task<string>> processTextAsync,
+            Func<string, string, CancellationToken, IAsyncEnumerable<string>> streamTextAsync)
+        {
+            Name = name ?? throw new ArgumentNullException(nameof(name));
+            IsConfigured = isConfigured ?? throw new ArgumentNullException(nameof(isConfigured));
+            ProcessTextAsync = processTextAsync ?? throw new ArgumentNullException(nameof(processTextAsync));
+            StreamTextAsync = streamTextAsync ?? throw new ArgumentNullException(nameof(streamTextAsync));
+            SpanName = $"AI.{name}";
+            StreamSpanName = $"AI.{name}.Stream";
+        }
+
+        public string Name { get; }
+        public Func<bool> IsConfigured { get; }
+        public Func<string, string, CancellationToken, Task<string>> ProcessTextAsync { get; }
+        public Func<string, string, CancellationToken, IAsyncEnumerable<string>> StreamTextAsync { get; }
+        public LatencyHistogram Latency { get; } = new LatencyHistogram();
+
+        internal string SpanName { get; }
+        internal string StreamSpanName { get; }
+    }
+
+    public class ProviderResult
+    {
+        public string Provider { get; set; }
+        public string Response { get; set; }
+        public TimeSpan Latency { get; set; }
+    }
+
+    public class ProviderLatencyStats
+    {
+        public string Provider { get; set; }
+        public bool IsConfigured { get; set; }
+        public long SampleCount { get; set; }
+        public TimeSpan P50 { get; set; }
+        public TimeSpan P95 { get; set; }
+        public TimeSpan P99 { get; set; }
+    }
+
+    #endregion
+}
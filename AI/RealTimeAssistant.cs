@@ -1,13 +1,14 @@
 using System;
 using System.Collections.Generic;
+using System.Linq;
+using System.Threading;
 using System.Threading.Tasks;
-using System.Timers;
 
 using Rhino;
 using Rhino.DocObjects;
+using Rhino.Geometry;
 using RhinoAI.Core;
 using RhinoAI.Integration;
-using Timer = System.Timers.Timer;
 
 namespace RhinoAI.AI
 {
@@ -19,7 +20,15 @@ namespace RhinoAI.AI
         private readonly ConfigurationManager _config;
         private readonly SimpleLogger _logger;
         private readonly MCPClient _mcpClient;
-        private readonly Timer _monitoringTimer;
+        private readonly AdaptiveSchedulerOptions _schedulerOptions;
+        private AdaptiveScheduler? _monitoringScheduler;
+        private long _lastAnalyzedSceneVersion = -1;
+        private readonly SceneContextIndex _sceneIndex = new SceneContextIndex();
+        private readonly SpatialIndex _spatialIndex = new SpatialIndex();
+        private readonly EventCoalescerOptions _coalescerOptions;
+        private readonly int _maxAnalysisConcurrency;
+        private EventCoalescer<Guid>? _analysisQueue;
+        private uint _trackedDocumentSerial;
         private bool _disposed = false;
         private bool _isMonitoring = false;
 
@@ -31,8 +40,52 @@ namespace RhinoAI.AI
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
             _mcpClient = mcpClient ?? throw new ArgumentNullException(nameof(mcpClient));
             
-            _monitoringTimer = new Timer(5000); // Check every 5 seconds
-            _monitoringTimer.Elapsed += OnMonitoringTimerElapsed;
+            _schedulerOptions = AdaptiveSchedulerOptions.FromConfiguration(config);
+
+            _coalescerOptions = EventCoalescerOptions.FromConfiguration(config);
+            _maxAnalysisConcurrency = Math.Max(1, config.GetSetting("RealTime:MaxAnalysisConcurrency", 4));
+        }
+
+        /// <summary>
+        /// Object events received and distinct objects analyzed since monitoring started
+        /// </summary>
+        public (long Events, long AnalyzedObjects) AnalysisStatistics =>
+            (_analysisQueue?.PostedEvents ?? 0, _analysisQueue?.ProcessedKeys ?? 0);
+
+        /// <summary>
+        /// Fraction of time spent in periodic analysis since monitoring started
+        /// </summary>
+        public double MonitoringDutyCycle => _monitoringScheduler?.DutyCycle ?? 0;
+
+        /// <summary>
+        /// Current wait between periodic analyses; grows while the document is idle
+        /// </summary>
+        public TimeSpan MonitoringInterval => _monitoringScheduler?.CurrentInterval ?? TimeSpan.Zero;
+
+        /// <summary>
+        /// Scene summary maintained from object events, or null when <paramref name="doc"/> is not being monitored
+        /// </summary>
+        public SceneContext? GetSceneContext(RhinoDoc doc)
+        {
+            if (!_isMonitoring || doc == null || doc.RuntimeSerialNumber != _trackedDocumentSerial)
+            {
+                return null;
+            }
+
+            return _sceneIndex.CreateSnapshot();
+        }
+
+        /// <summary>
+        /// Object bounding boxes maintained from object events, or null when <paramref name="doc"/> is not being monitored
+        /// </summary>
+        public SpatialIndex? GetSpatialIndex(RhinoDoc doc)
+        {
+            if (!_isMonitoring || doc == null || doc.RuntimeSerialNumber != _trackedDocumentSerial)
+            {
+                return null;
+            }
+
+            return _spatialIndex;
         }
 
         /// <summary>
@@ -46,6 +99,9 @@ namespace RhinoAI.AI
             {
                 _logger?.LogInformation("Starting real-time assistance monitoring...");
 
+                // Object events only queue ids; analysis runs in debounced, de-duplicated batches
+                _analysisQueue = new EventCoalescer<Guid>(AnalyzeChangedObjectsAsync, _logger, _coalescerOptions);
+
                 // Subscribe to Rhino document events
                 RhinoDoc.NewDocument += OnNewDocument;
                 RhinoDoc.BeginOpenDocument += OnBeginOpenDocument;
@@ -58,7 +114,9 @@ namespace RhinoAI.AI
                     SubscribeToDocumentEvents(doc);
                 }
 
-                _monitoringTimer.Start();
+                // Periodic analysis never overlaps and backs off while the document is idle
+                _monitoringScheduler = new AdaptiveScheduler(PerformPeriodicAnalysisAsync, _logger, _schedulerOptions);
+                _monitoringScheduler.Start();
                 _isMonitoring = true;
 
                 _logger?.LogInformation("Real-time assistance monitoring started");
@@ -81,7 +139,8 @@ namespace RhinoAI.AI
             {
                 _logger?.LogInformation("Stopping real-time assistance monitoring...");
 
-                _monitoringTimer.Stop();
+                _monitoringScheduler?.Dispose();
+                _monitoringScheduler = null;
 
                 // Unsubscribe from Rhino document events
                 RhinoDoc.NewDocument -= OnNewDocument;
@@ -95,6 +154,9 @@ namespace RhinoAI.AI
                     UnsubscribeFromDocumentEvents(doc);
                 }
 
+                _analysisQueue?.Dispose();
+                _analysisQueue = null;
+
                 _isMonitoring = false;
 
                 _logger?.LogInformation("Real-time assistance monitoring stopped");
@@ -106,14 +168,23 @@ namespace RhinoAI.AI
         }
 
         /// <summary>
-        /// Subscribe to document-specific events
+        /// Subscribe to document-specific events and index the document's current objects
         /// </summary>
         private void SubscribeToDocumentEvents(RhinoDoc doc)
         {
+            // New and opened documents call this again; never hold more than one subscription
+            UnsubscribeFromDocumentEvents(doc);
+
             RhinoDoc.AddRhinoObject += OnObjectAdded;
             RhinoDoc.DeleteRhinoObject += OnObjectDeleted;
             RhinoDoc.ReplaceRhinoObject += OnObjectReplaced;
             RhinoDoc.UndeleteRhinoObject += OnObjectUndeleted;
+            RhinoDoc.ModifyObjectAttributes += OnObjectAttributesModified;
+
+            _trackedDocumentSerial = doc.RuntimeSerialNumber;
+            var objects = RhinoSceneContext.DescribeDocument(doc).ToList();
+            _sceneIndex.Reset(objects);
+            _spatialIndex.Reset(objects);
         }
 
         /// <summary>
@@ -125,6 +196,24 @@ namespace RhinoAI.AI
             RhinoDoc.DeleteRhinoObject -= OnObjectDeleted;
             RhinoDoc.ReplaceRhinoObject -= OnObjectReplaced;
             RhinoDoc.UndeleteRhinoObject -= OnObjectUndeleted;
+            RhinoDoc.ModifyObjectAttributes -= OnObjectAttributesModified;
+        }
+
+        /// <summary>
+        /// Only objects of the monitored document, and not block definition geometry, are indexed
+        /// </summary>
+        private bool IsIndexed(RhinoObject rhinoObject)
+        {
+            return rhinoObject?.Document?.RuntimeSerialNumber == _trackedDocumentSerial && RhinoSceneContext.IsTracked(rhinoObject);
+        }
+
+        /// <summary>
+        /// Record an object in both the scene summary and the spatial index
+        /// </summary>
+        private void Index(SceneObjectInfo info)
+        {
+            _sceneIndex.Upsert(info);
+            _spatialIndex.Upsert(info);
         }
 
         /// <summary>
@@ -162,24 +251,14 @@ namespace RhinoAI.AI
         /// <summary>
         /// Handle object added event
         /// </summary>
-        private async void OnObjectAdded(object? sender, RhinoObjectEventArgs e)
+        private void OnObjectAdded(object? sender, RhinoObjectEventArgs e)
         {
-            try
-            {
-                _logger?.LogDebug($"Object added: {e.TheObject.Id}");
-                
-                await UpdateSceneContextAsync();
+            _logger?.LogDebug($"Object added: {e.TheObject.Id}");
 
-                var analysis = await AnalyzeObjectAsync(e.TheObject);
-                if (analysis.HasIssues)
-                {
-                    ShowSuggestions(analysis.Suggestions);
-                }
-            }
-            catch (Exception ex)
-            {
-                _logger?.LogError(ex, "Error analyzing added object");
-            }
+            if (!IsIndexed(e.TheObject)) return;
+            Index(RhinoSceneContext.Describe(e.TheObject));
+            _analysisQueue?.Post(e.TheObject.Id);
+            _monitoringScheduler?.NotifyActivity();
         }
 
         /// <summary>
@@ -188,29 +267,26 @@ namespace RhinoAI.AI
         private void OnObjectDeleted(object? sender, RhinoObjectEventArgs e)
         {
             _logger?.LogDebug($"Object deleted: {e.TheObject.Id}");
+
+            if (e.TheObject?.Document?.RuntimeSerialNumber == _trackedDocumentSerial)
+            {
+                _sceneIndex.Remove(e.TheObject.Id);
+                _spatialIndex.Remove(e.TheObject.Id);
+                _monitoringScheduler?.NotifyActivity();
+            }
         }
 
         /// <summary>
         /// Handle object replaced event
         /// </summary>
-        private async void OnObjectReplaced(object? sender, RhinoReplaceObjectEventArgs e)
+        private void OnObjectReplaced(object? sender, RhinoReplaceObjectEventArgs e)
         {
-            try
-            {
-                _logger?.LogDebug($"Object replaced: {e.NewRhinoObject.Id}");
+            _logger?.LogDebug($"Object replaced: {e.NewRhinoObject.Id}");
 
-                await UpdateSceneContextAsync();
-                
-                var analysis = await AnalyzeObjectAsync(e.NewRhinoObject);
-                if (analysis.HasIssues)
-                {
-                    ShowSuggestions(analysis.Suggestions);
-                }
-            }
-            catch (Exception ex)
-            {
-                _logger?.LogError(ex, "Error analyzing replaced object");
-            }
+            if (!IsIndexed(e.NewRhinoObject)) return;
+            Index(RhinoSceneContext.Describe(e.NewRhinoObject));
+            _analysisQueue?.Post(e.NewRhinoObject.Id);
+            _monitoringScheduler?.NotifyActivity();
         }
 
         /// <summary>
@@ -219,107 +295,172 @@ namespace RhinoAI.AI
         private void OnObjectUndeleted(object? sender, RhinoObjectEventArgs e)
         {
             _logger?.LogDebug($"Object undeleted: {e.TheObject.Id}");
+
+            if (IsIndexed(e.TheObject))
+            {
+                Index(RhinoSceneContext.Describe(e.TheObject));
+                _monitoringScheduler?.NotifyActivity();
+            }
         }
 
         /// <summary>
-        /// Handle monitoring timer elapsed
+        /// Handle object attribute changes, which can move an object to another layer
         /// </summary>
-        private async void OnMonitoringTimerElapsed(object? sender, ElapsedEventArgs e)
+        private void OnObjectAttributesModified(object? sender, RhinoModifyObjectAttributesEventArgs e)
         {
-            try
+            if (IsIndexed(e.RhinoObject))
             {
-                await PerformPeriodicAnalysisAsync();
+                Index(RhinoSceneContext.Describe(e.RhinoObject, e.NewAttributes));
+                _monitoringScheduler?.NotifyActivity();
             }
-            catch (Exception ex)
+        }
+
+        /// <summary>
+        /// Perform periodic analysis of the scene; skipped when nothing changed since the last run
+        /// </summary>
+        private async Task PerformPeriodicAnalysisAsync(CancellationToken cancellationToken)
+        {
+            var doc = RhinoDoc.ActiveDoc;
+            if (doc?.Objects == null) return;
+
+            // An unchanged scene has no new context to send and no new findings
+            var sceneVersion = _sceneIndex.Version;
+            if (sceneVersion == _lastAnalyzedSceneVersion) return;
+            _lastAnalyzedSceneVersion = sceneVersion;
+
+            await UpdateSceneContextAsync();
+
+            var objectCount = _sceneIndex.Count;
+
+            // Check for performance issues
+            if (objectCount > 10000)
             {
-                _logger?.LogError(ex, "Error during periodic analysis");
+                ShowSuggestion("Large number of objects detected. Consider using layers or blocks to organize your model.");
             }
+
+            // Check for memory usage (placeholder)
+            var memoryUsage = GC.GetTotalMemory(false);
+            if (memoryUsage > 1024 * 1024 * 1024) // 1GB
+            {
+                ShowSuggestion("High memory usage detected. Consider simplifying your geometry or closing other applications.");
+            }
+        }
+
+        private async Task UpdateSceneContextAsync()
+        {
+            var context = GetSceneContext(RhinoDoc.ActiveDoc);
+            if (context == null) return;
+
+            await _mcpClient.SendSceneContextAsync(context);
         }
 
         /// <summary>
-        /// Perform periodic analysis of the scene
+        /// Analyze one coalesced batch of added or replaced objects. Objects deleted since their
+        /// event was queued are skipped, and the scene context is sent once for the whole batch.
         /// </summary>
-        private async Task PerformPeriodicAnalysisAsync()
+        private async Task AnalyzeChangedObjectsAsync(IReadOnlyCollection<Guid> objectIds, CancellationToken cancellationToken)
         {
             var doc = RhinoDoc.ActiveDoc;
-            if (doc?.Objects == null) return;
+            if (doc == null || doc.RuntimeSerialNumber != _trackedDocumentSerial) return;
+
+            using var span = PipelineTelemetry.StartSpan("RealTime.AnalyzeObjects", "RealTime");
+            span?.SetTag("rhinoai.object_count", objectIds.Count);
 
             await UpdateSceneContextAsync();
 
-            await Task.Run(() =>
+            var objects = await ResolveObjectsAsync(doc, objectIds);
+            cancellationToken.ThrowIfCancellationRequested();
+
+            var analyses = await AnalyzeObjectsAsync(objects, cancellationToken);
+            ReportIssues(analyses);
+        }
+
+        /// <summary>
+        /// Look up the batch's objects on the UI thread, since the document is not safe to read from the
+        /// thread pool, and keep only what AnalyzeObject needs
+        /// </summary>
+        private static Task<List<ObjectSnapshot>> ResolveObjectsAsync(RhinoDoc doc, IReadOnlyCollection<Guid> objectIds)
+        {
+            var resolved = new TaskCompletionSource<List<ObjectSnapshot>>(TaskCreationOptions.RunContinuationsAsynchronously);
+            RhinoApp.InvokeOnUiThread(new Action(() =>
             {
                 try
                 {
-                    var objectCount = doc.Objects.Count;
-                    
-                    // Check for performance issues
-                    if (objectCount > 10000)
-                    {
-                        ShowSuggestion("Large number of objects detected. Consider using layers or blocks to organize your model.");
-                    }
-
-                    // Check for memory usage (placeholder)
-                    var memoryUsage = GC.GetTotalMemory(false);
-                    if (memoryUsage > 1024 * 1024 * 1024) // 1GB
-                    {
-                        ShowSuggestion("High memory usage detected. Consider simplifying your geometry or closing other applications.");
-                    }
+                    resolved.TrySetResult(objectIds
+                        .Select(id => doc.Objects.FindId(id))
+                        .Where(RhinoSceneContext.IsTracked)
+                        .Select(rhinoObject => new ObjectSnapshot(rhinoObject))
+                        .ToList());
                 }
                 catch (Exception ex)
                 {
-                    _logger?.LogError(ex, "Error during periodic analysis task.");
+                    resolved.TrySetException(ex);
                 }
-            });
+            }));
+            return resolved.Task;
         }
 
-        private async Task UpdateSceneContextAsync()
+        /// <summary>
+        /// Analyze objects on the thread pool, at most RealTime:MaxAnalysisConcurrency at a time
+        /// </summary>
+        private Task<ObjectAnalysis[]> AnalyzeObjectsAsync(IReadOnlyList<ObjectSnapshot> objects, CancellationToken cancellationToken)
         {
-            var doc = RhinoDoc.ActiveDoc;
-            if (doc == null) return;
-
-            var context = new SceneContext
+            return Task.Run(() =>
             {
-                ObjectCount = doc.Objects.Count,
-                // In a real implementation, we would populate these fields with more detail
-                ObjectTypes = new string[0],
-                BoundingBox = new double[0],
-                ActiveLayers = new string[0],
-                CustomProperties = new Dictionary<string, object>()
-            };
+                var analyses = new ObjectAnalysis[objects.Count];
+                var options = new ParallelOptions
+                {
+                    MaxDegreeOfParallelism = _maxAnalysisConcurrency,
+                    CancellationToken = cancellationToken
+                };
 
-            await _mcpClient.SendSceneContextAsync(context);
+                Parallel.For(0, objects.Count, options, i => analyses[i] = AnalyzeObject(objects[i]));
+                return analyses;
+            }, cancellationToken);
         }
 
         /// <summary>
         /// Analyze a single Rhino object for potential issues
         /// </summary>
-        private async Task<ObjectAnalysis> AnalyzeObjectAsync(RhinoObject rhinoObject)
+        private static ObjectAnalysis AnalyzeObject(ObjectSnapshot snapshot)
         {
-            return await Task.Run(() =>
+            var analysis = new ObjectAnalysis { ObjectId = snapshot.Id };
+            var issues = new List<string>();
+
+            if (snapshot.Geometry == null || !snapshot.Geometry.IsValid)
             {
-                var analysis = new ObjectAnalysis { ObjectId = rhinoObject.Id };
-                var issues = new List<string>();
+                issues.Add("Object has invalid geometry");
+            }
 
-                if (rhinoObject.Geometry == null || !rhinoObject.Geometry.IsValid)
-                {
-                    issues.Add("Object has invalid geometry");
-                }
+            if (string.IsNullOrEmpty(snapshot.Name))
+            {
+                issues.Add("Object is unnamed");
+            }
 
-                if (string.IsNullOrEmpty(rhinoObject.Name))
-                {
-                    issues.Add("Object is unnamed");
-                }
+            if (snapshot.LayerIndex == -1)
+            {
+                issues.Add("Object is not on a valid layer");
+            }
 
-                if (rhinoObject.Attributes.LayerIndex == -1)
-                {
-                    issues.Add("Object is not on a valid layer");
-                }
+            analysis.HasIssues = issues.Count > 0;
+            analysis.Suggestions = issues;
 
-                analysis.HasIssues = issues.Count > 0;
-                analysis.Suggestions = issues;
+            return analysis;
+        }
 
-                return analysis;
-            });
+        /// <summary>
+        /// Show each distinct issue once per batch, with the number of objects it applies to
+        /// </summary>
+        private void ReportIssues(IEnumerable<ObjectAnalysis> analyses)
+        {
+            var issues = analyses
+                .Where(a => a.HasIssues)
+                .SelectMany(a => a.Suggestions)
+                .GroupBy(issue => issue)
+                .Select(group => group.Count() == 1 ? group.Key : $"{group.Key} ({group.Count()} objects)")
+                .ToList();
+
+            ShowSuggestions(issues);
         }
 
         /// <summary>
@@ -342,6 +483,26 @@ namespace RhinoAI.AI
             _logger?.LogInformation($"Suggestion: {suggestion}");
         }
 
+        /// <summary>
+        /// What AnalyzeObject reads from a document object, captured on the UI thread. The geometry is a
+        /// shallow duplicate, so it stays readable if the document object is later deleted or replaced.
+        /// </summary>
+        private readonly struct ObjectSnapshot
+        {
+            public ObjectSnapshot(RhinoObject rhinoObject)
+            {
+                Id = rhinoObject.Id;
+                Geometry = rhinoObject.Geometry?.DuplicateShallow();
+                Name = rhinoObject.Name;
+                LayerIndex = rhinoObject.Attributes.LayerIndex;
+            }
+
+            public Guid Id { get; }
+            public GeometryBase? Geometry { get; }
+            public string? Name { get; }
+            public int LayerIndex { get; }
+        }
+
         public void Dispose()
         {
             Dispose(true);
@@ -353,7 +514,6 @@ namespace RhinoAI.AI
             if (!_disposed && disposing)
             {
                 StopMonitoring();
-                _monitoringTimer?.Dispose();
                 _disposed = true;
             }
         }
@@ -0,0 +1,58 @@
+using System.Collections.Generic;
+using System.Linq;
+
+using Rhino;
+using Rhino.DocObjects;
+using RhinoAI.Core;
+using RhinoAI.Integration;
+
+namespace RhinoAI.AI
+{
+    /// <summary>
+    /// Converts Rhino document objects into the geometry-agnostic entries kept by SceneContextIndex
+    /// </summary>
+    public static class RhinoSceneContext
+    {
+        /// <summary>
+        /// Objects that belong in the scene summary: live model geometry, not block definition contents
+        /// </summary>
+        public static bool IsTracked(RhinoObject rhinoObject)
+        {
+            return rhinoObject?.Geometry != null && !rhinoObject.IsDeleted && !rhinoObject.IsInstanceDefinitionGeometry;
+        }
+
+        /// <summary>
+        /// Describe an object; pass <paramref name="attributes"/> when they are about to replace the object's own
+        /// </summary>
+        public static SceneObjectInfo Describe(RhinoObject rhinoObject, ObjectAttributes attributes = null)
+        {
+            var layerIndex = (attributes ?? rhinoObject.Attributes).LayerIndex;
+            var layer = rhinoObject.Document?.Layers.FindIndex(layerIndex);
+
+            var bbox = rhinoObject.Geometry.GetBoundingBox(true);
+            var bounds = bbox.IsValid
+                ? new SceneBounds(bbox.Min.X, bbox.Min.Y, bbox.Min.Z, bbox.Max.X, bbox.Max.Y, bbox.Max.Z)
+                : SceneBounds.Empty;
+
+            return new SceneObjectInfo(rhinoObject.Id, rhinoObject.Geometry.ObjectType.ToString(), layer?.Name, bounds);
+        }
+
+        /// <summary>
+        /// Every tracked object in the document; a full scan, meant for (re)building an index
+        /// </summary>
+        public static IEnumerable<SceneObjectInfo> DescribeDocument(RhinoDoc doc)
+        {
+            return doc.Objects.Where(IsTracked).Select(obj => Describe(obj));
+        }
+
+        /// <summary>
+        /// One-off scene summary for when no incrementally maintained index is available
+        /// </summary>
+        public static SceneContext Capture(RhinoDoc doc)
+        {
+            var index = new SceneContextIndex();
+            index.Reset(DescribeDocument(doc));
+            return index.CreateSnapshot();
+        }
+    }
+}
@@ -0,0 +1,569 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Text.Json;
+using System.Text.RegularExpressions;
+using RhinoAI.Core;
+using RhinoAI.Utils;
+
+namespace RhinoAI.AI
+{
+    /// <summary>
+    /// Persistent cache of LLM command interpretations keyed by a normalized prompt template.
+    /// Numbers, colors and quoted names are replaced with placeholders, so prompts that only
+    /// differ in their parameters share an entry; parameters are re-extracted from the live input.
+    /// Entries are also keyed by the operation the prompt asks for (its verbs and negations), and the
+    /// optional similarity tier only matches rephrased prompts with exactly the same operation, so
+    /// "delete the red boxes" can never reuse the interpretation of "copy the red boxes".
+    /// </summary>
+    public class SemanticResponseCache
+    {
+        private const int EmbeddingDimensions = 256;
+
+        /// <summary>Bump when the key or template format changes so persisted entries are discarded</summary>
+        private const string KeyFormatVersion = "operation-signature-v2";
+
+        private static readonly Regex QuotedText = new Regex("\"[^\"]*\"|'[^']*'", RegexOptions.Compiled);
+        private static readonly Regex Number = new Regex(@"[-+]?\d+(?:\.\d+)?", RegexOptions.Compiled);
+        private static readonly Regex TokenSeparator = new Regex(@"[^a-z#{}]+", RegexOptions.Compiled);
+
+        private static readonly HashSet<string> Colors = new HashSet<string>
+        {
+            "red", "green", "blue", "yellow", "orange", "purple", "pink", "cyan",
+            "magenta", "white", "black", "gray", "grey", "brown"
+        };
+
+        private static readonly HashSet<string> StopWords = new HashSet<string>
+        {
+            "a", "an", "the", "of", "please", "some", "me", "with", "for", "can", "you", "i", "want", "would", "like"
+        };
+
+        private static readonly Dictionary<string, string> VerbSynonyms = new Dictionary<string, string>
+        {
+            ["make"] = "create",
+            ["add"] = "create",
+            ["draw"] = "create",
+            ["generate"] = "create",
+            ["build"] = "create",
+            ["place"] = "create",
+            ["put"] = "create",
+            ["insert"] = "create",
+            ["remove"] = "delete",
+            ["erase"] = "delete",
+            ["duplicate"] = "copy"
+        };
+
+        /// <summary>
+        /// Verbs that name an operation; un-/de-/dis- forms of these (unlock, deselect) are distinct operations
+        /// </summary>
+        private static readonly HashSet<string> OperationVerbs = new HashSet<string>
+        {
+            "create", "delete", "copy", "move", "rotate", "scale", "mirror", "array", "lock", "hide", "show",
+            "select", "join", "explode", "split", "trim", "extend", "offset", "fillet", "chamfer", "group",
+            "union", "difference", "intersect", "subtract", "loft", "sweep", "extrude", "revolve", "rename",
+            "color", "measure", "analyze", "export", "import", "save", "undo", "redo", "zoom", "align",
+            "flip", "reverse", "rebuild", "project", "cut", "merge", "cap", "isolate", "freeze", "enable",
+            "activate", "disable", "attach", "link", "clear"
+        };
+
+        private static readonly string[] NegatingPrefixes = { "un", "de", "dis" };
+
+        private static readonly HashSet<string> NegationWords = new HashSet<string>
+        {
+            "not", "no", "never", "don", "dont", "without"
+        };
+
+        private readonly SimpleLogger _logger;
+        private readonly string _cacheFilePath;
+        private readonly Dictionary<string, SemanticCacheEntry> _entries;
+        private readonly List<KeyValuePair<string, string[]>> _catalogKeywords;
+        private readonly string _catalogVersion;
+        private readonly object _lockObject = new object();
+        private readonly object _saveLock = new object();
+
+        private readonly bool _enabled;
+        private readonly int _maxEntries;
+        private readonly TimeSpan _timeToLive;
+        private readonly bool _useSimilarity;
+        private readonly double _similarityThreshold;
+
+        private long _exactHits;
+        private long _similarHits;
+        private long _misses;
+        private long _evictions;
+
+        public SemanticResponseCache(ConfigurationManager configManager, SimpleLogger logger,
+            IEnumerable<CommandTemplate> commandCatalog, string cacheFilePath = null)
+        {
+            if (configManager == null) throw new ArgumentNullException(nameof(configManager));
+            _logger = logger ?? throw new ArgumentNullException(nameof(logger));
+            if (commandCatalog == null) throw new ArgumentNullException(nameof(commandCatalog));
+
+            _enabled = configManager.GetSetting("Processing:SemanticCache", true);
+            _maxEntries = Math.Max(1, configManager.GetSetting("Processing:SemanticCacheMaxEntries", 500));
+            _timeToLive = TimeSpan.FromHours(configManager.GetSetting("Processing:SemanticCacheTtlHours", 168.0));
+            _useSimilarity = configManager.GetSetting("Processing:SemanticCacheEmbeddings", false);
+            _similarityThreshold = Math.Clamp(configManager.GetSetting("Processing:SemanticCacheSimilarity", 0.92), 0, 1);
+
+            _catalogKeywords = commandCatalog
+                .Select(t => new KeyValuePair<string, string[]>(t.CommandName, (t.Keywords ?? Array.Empty<string>()).Select(k => k.ToLowerInvariant()).ToArray()))
+                .ToList();
+            _catalogVersion = ComputeCatalogVersion(_catalogKeywords);
+
+            _cacheFilePath = cacheFilePath ?? Path.Combine(
+                Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData),
+                "RhinoAI", "Cache", "llm-responses.json");
+            _entries = new Dictionary<string, SemanticCacheEntry>();
+
+            if (_enabled)
+            {
+                Load();
+            }
+        }
+
+        /// <summary>
+        /// Looks up a cached interpretation, first by exact template and then by similarity
+        /// </summary>
+        public bool TryGet(string input, out AICommandResponse response)
+        {
+            response = null;
+            if (!_enabled || string.IsNullOrWhiteSpace(input)) return false;
+
+            var template = NormalizePrompt(input);
+            var signature = GetSignature(input, template);
+            var now = DateTime.UtcNow;
+
+            lock (_lockObject)
+            {
+                if (_entries.TryGetValue(BuildKey(signature, template), out var entry) && !IsExpired(entry, now))
+                {
+                    _exactHits++;
+                    response = Touch(entry, now);
+                    return true;
+                }
+
+                if (_useSimilarity)
+                {
+                    var embedding = Embed(template);
+                    SemanticCacheEntry best = null;
+                    var bestScore = _similarityThreshold;
+
+                    foreach (var candidate in _entries.Values)
+                    {
+                        // Only compare prompts with the same catalog commands and the same operation
+                        if (candidate.Signature != signature || IsExpired(candidate, now)) continue;
+
+                        var score = CosineSimilarity(embedding, candidate.Embedding ??= Embed(candidate.Template));
+                        if (score >= bestScore)
+                        {
+                            best = candidate;
+                            bestScore = score;
+                        }
+                    }
+
+                    if (best != null)
+                    {
+                        _similarHits++;
+                        _logger.LogInformation("Semantic cache matched '{0}' to '{1}' ({2:F2})", template, best.Template, bestScore);
+                        response = Touch(best, now);
+                        return true;
+                    }
+                }
+
+                _misses++;
+                return false;
+            }
+        }
+
+        /// <summary>
+        /// Stores the catalog commands of an AI response; conversational responses without actions are not cached
+        /// </summary>
+        public void Store(string input, AICommandResponse response)
+        {
+            if (!_enabled || string.IsNullOrWhiteSpace(input)) return;
+
+            var commandNames = response?.Actions?
+                .Where(a => !string.IsNullOrEmpty(a.CommandName))
+                .Select(a => a.CommandName)
+                .Where(name => _catalogKeywords.Any(c => c.Key == name))
+                .ToList();
+            if (commandNames == null || commandNames.Count == 0) return;
+
+            var template = NormalizePrompt(input);
+            var signature = GetSignature(input, template);
+            var now = DateTime.UtcNow;
+
+            lock (_lockObject)
+            {
+                var key = BuildKey(signature, template);
+                if (!_entries.ContainsKey(key))
+                {
+                    EvictIfFull(now);
+                }
+
+                _entries[key] = new SemanticCacheEntry
+                {
+                    Signature = signature,
+                    Template = template,
+                    CommandNames = commandNames,
+                    CreatedUtc = now,
+                    LastAccessedUtc = now,
+                    Embedding = _useSimilarity ? Embed(template) : null
+                };
+            }
+
+            Save();
+        }
+
+        /// <summary>
+        /// Removes the entries TryGet would match for <paramref name="input"/>, e.g. after replaying one failed
+        /// </summary>
+        public void Invalidate(string input)
+        {
+            if (!_enabled || string.IsNullOrWhiteSpace(input)) return;
+
+            var template = NormalizePrompt(input);
+            var signature = GetSignature(input, template);
+
+            lock (_lockObject)
+            {
+                var removed = _entries.Remove(BuildKey(signature, template)) ? 1 : 0;
+
+                if (_useSimilarity)
+                {
+                    var embedding = Embed(template);
+                    var similarKeys = _entries
+                        .Where(pair => pair.Value.Signature == signature &&
+                            CosineSimilarity(embedding, pair.Value.Embedding ??= Embed(pair.Value.Template)) >= _similarityThreshold)
+                        .Select(pair => pair.Key)
+                        .ToList();
+
+                    foreach (var key in similarKeys)
+                    {
+                        _entries.Remove(key);
+                    }
+                    removed += similarKeys.Count;
+                }
+
+                if (removed == 0) return;
+                _logger.LogInformation("Semantic cache dropped {0} entries for '{1}'", removed, template);
+            }
+
+            Save();
+        }
+
+        public SemanticCacheStatistics GetStatistics()
+        {
+            lock (_lockObject)
+            {
+                return new SemanticCacheStatistics
+                {
+                    ExactHits = _exactHits,
+                    SimilarHits = _similarHits,
+                    Misses = _misses,
+                    Evictions = _evictions,
+                    Count = _entries.Count,
+                    MaxEntries = _maxEntries
+                };
+            }
+        }
+
+        public void Clear()
+        {
+            lock (_lockObject)
+            {
+                _entries.Clear();
+            }
+
+            Save();
+        }
+
+        /// <summary>
+        /// Reduces a prompt to its parameter-free template, e.g.
+        /// "Make a red sphere of radius 5" becomes "create {color} sphere radius #"
+        /// </summary>
+        public static string NormalizePrompt(string input)
+        {
+            var text = (input ?? string.Empty).ToLowerInvariant();
+            text = QuotedText.Replace(text, " {text} ");
+            text = Number.Replace(text, " # ");
+
+            var tokens = new List<string>();
+            foreach (var raw in TokenSeparator.Split(text))
+            {
+                if (raw.Length == 0 || StopWords.Contains(raw)) continue;
+
+                var token = Colors.Contains(raw) ? "{color}"
+                    : VerbSynonyms.TryGetValue(raw, out var verb) ? verb
+                    : raw;
+
+                // Collapse coordinate lists like "#,#,#" into a single placeholder
+                if (token == "#" && tokens.Count > 0 && tokens[tokens.Count - 1] == "#") continue;
+
+                tokens.Add(token);
+            }
+
+            return string.Join(" ", tokens);
+        }
+
+        /// <summary>
+        /// Catalog commands the input mentions plus the operation it asks for; cached
+        /// interpretations are only reused between prompts with equal signatures
+        /// </summary>
+        private string GetSignature(string input, string template)
+        {
+            var lowerInput = input.ToLowerInvariant();
+            var commands = _catalogKeywords
+                .Where(c => c.Value.Any(k => lowerInput.Contains(k)))
+                .Select(c => c.Key)
+                .OrderBy(n => n, StringComparer.Ordinal);
+
+            return $"{string.Join(",", commands)}:{GetOperationSignature(template)}";
+        }
+
+        /// <summary>
+        /// Operation verbs of a normalized prompt in order, with "not" for negations, e.g.
+        /// "unlock all" gives "unlock" and "don't delete boxes" gives "not+delete".
+        /// Prompts without a known verb fall back to their first word.
+        /// </summary>
+        public static string GetOperationSignature(string template)
+        {
+            var words = (template ?? string.Empty).Split(' ', StringSplitOptions.RemoveEmptyEntries);
+            var operations = new List<string>();
+
+            foreach (var word in words)
+            {
+                var operation = NegationWords.Contains(word) ? "not"
+                    : IsOperationVerb(word) ? word
+                    : null;
+                if (operation != null && !operations.Contains(operation))
+                {
+                    operations.Add(operation);
+                }
+            }
+
+            if (operations.Count == 0 && words.Length > 0)
+            {
+                operations.Add(words[0]);
+            }
+
+            return string.Join("+", operations);
+        }
+
+        private static bool IsOperationVerb(string word)
+        {
+            if (OperationVerbs.Contains(word)) return true;
+
+            foreach (var prefix in NegatingPrefixes)
+            {
+                if (word.Length > prefix.Length && word.StartsWith(prefix, StringComparison.Ordinal) &&
+                    OperationVerbs.Contains(word.Substring(prefix.Length)))
+                {
+                    return true;
+                }
+            }
+            return false;
+        }
+
+        private static string BuildKey(string signature, string template) => $"{signature}|{template}";
+
+        private bool IsExpired(SemanticCacheEntry entry, DateTime now) => now - entry.CreatedUtc > _timeToLive;
+
+        private static AICommandResponse Touch(SemanticCacheEntry entry, DateTime now)
+        {
+            entry.LastAccessedUtc = now;
+            entry.HitCount++;
+
+            return new AICommandResponse
+            {
+                Actions = entry.CommandNames.Select(n => new AIAction { CommandName = n }).ToList()
+            };
+        }
+
+        private void EvictIfFull(DateTime now)
+        {
+            if (_entries.Count < _maxEntries) return;
+
+            foreach (var expired in _entries.Where(e => IsExpired(e.Value, now)).Select(e => e.Key).ToList())
+            {
+                _entries.Remove(expired);
+                _evictions++;
+            }
+
+            while (_entries.Count >= _maxEntries)
+            {
+                var leastRecent = _entries.OrderBy(e => e.Value.LastAccessedUtc).First().Key;
+                _entries.Remove(leastRecent);
+                _evictions++;
+            }
+        }
+
+        /// <summary>
+        /// Feature-hashed bag of word unigrams, bigrams and character trigrams, L2-normalized
+        /// </summary>
+        private static float[] Embed(string template)
+        {
+            var vector = new float[EmbeddingDimensions];
+            var words = template.Split(' ', StringSplitOptions.RemoveEmptyEntries);
+
+            for (int i = 0; i < words.Length; i++)
+            {
+                AddFeature(vector, "w:" + words[i], 1.0f);
+                if (i > 0)
+                {
+                    AddFeature(vector, "b:" + words[i - 1] + " " + words[i], 1.0f);
+                }
+
+                var padded = $" {words[i]} ";
+                for (int j = 0; j + 3 <= padded.Length; j++)
+                {
+                    AddFeature(vector, "c:" + padded.Substring(j, 3), 0.5f);
+                }
+            }
+
+            var norm = Math.Sqrt(vector.Sum(v => (double)v * v));
+            if (norm > 0)
+            {
+                for (int i = 0; i < vector.Length; i++)
+                {
+                    vector[i] = (float)(vector[i] / norm);
+                }
+            }
+
+            return vector;
+        }
+
+        private static void AddFeature(float[] vector, string feature, float weight)
+        {
+            var hash = StableHash.Of(feature);
+            var index = (int)(hash % EmbeddingDimensions);
+            var sign = (hash >> 63) == 0 ? 1.0f : -1.0f;
+            vector[index] += sign * weight;
+        }
+
+        private static double CosineSimilarity(float[] a, float[] b)
+        {
+            double dot = 0;
+            for (int i = 0; i < a.Length; i++)
+            {
+                dot += a[i] * b[i];
+            }
+            return dot;
+        }
+
+        private static string ComputeCatalogVersion(IEnumerable<KeyValuePair<string, string[]>> catalog)
+        {
+            var hash = new StableHash().Add(KeyFormatVersion);
+            foreach (var command in catalog.OrderBy(c => c.Key, StringComparer.Ordinal))
+            {
+                hash.Add(command.Key);
+                foreach (var keyword in command.Value)
+                {
+                    hash.Add(keyword);
+                }
+            }
+            return hash.ToString();
+        }
+
+        private void Load()
+        {
+            try
+            {
+                if (!File.Exists(_cacheFilePath)) return;
+
+                var file = JsonSerializer.Deserialize(File.ReadAllText(_cacheFilePath), RhinoAIJsonContext.Default.SemanticCacheFile);
+                if (file?.Entries == null || file.CatalogVersion != _catalogVersion)
+                {
+                    _logger.LogInformation("Discarding semantic cache built for a different command catalog");
+                    return;
+                }
+
+                var now = DateTime.UtcNow;
+                foreach (var entry in file.Entries
+                    .Where(e => !IsExpired(e, now))
+                    .OrderByDescending(e => e.LastAccessedUtc)
+                    .Take(_maxEntries))
+                {
+                    _entries[BuildKey(entry.Signature, entry.Template)] = entry;
+                }
+
+                _logger.LogInformation("Loaded {0} semantic cache entries", _entries.Count);
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Failed to load semantic cache");
+            }
+        }
+
+        private void Save()
+        {
+            try
+            {
+                string json;
+                lock (_lockObject)
+                {
+                    json = JsonSerializer.Serialize(new SemanticCacheFile
+                    {
+                        CatalogVersion = _catalogVersion,
+                        Entries = _entries.Values.ToList()
+                    }, RhinoAIJsonContext.Default.SemanticCacheFile);
+                }
+
+                lock (_saveLock)
+                {
+                    Directory.CreateDirectory(Path.GetDirectoryName(_cacheFilePath));
+
+                    // Write to a temporary file first so a crash never leaves a truncated cache
+                    var tempPath = _cacheFilePath + ".tmp";
+                    File.WriteAllText(tempPath, json);
+                    File.Move(tempPath, _cacheFilePath, overwrite: true);
+                }
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Failed to save semantic cache");
+            }
+        }
+    }
+
+    #region Semantic Cache Models
+
+    public class SemanticCacheEntry
+    {
+        public string Signature { get; set; }
+        public string Template { get; set; }
+        public List<string> CommandNames { get; set; }
+        public DateTime CreatedUtc { get; set; }
+        public DateTime LastAccessedUtc { get; set; }
+        public int HitCount { get; set; }
+
+        /// <summary>
+        /// Recomputed from the template after loading rather than persisted
+        /// </summary>
+        [System.Text.Json.Serialization.JsonIgnore]
+        public float[] Embedding { get; set; }
+    }
+
+    public class SemanticCacheFile
+    {
+        public string CatalogVersion { get; set; }
+        public List<SemanticCacheEntry> Entries { get; set; }
+    }
+
+    public class SemanticCacheStatistics
+    {
+        public long ExactHits { get; set; }
+        public long SimilarHits { get; set; }
+        public long Misses { get; set; }
+        public long Evictions { get; set; }
+        public int Count { get; set; }
+        public int MaxEntries { get; set; }
+
+        public double HitRate => ExactHits + SimilarHits + Misses > 0
+            ? (double)(ExactHits + SimilarHits) / (ExactHits + SimilarHits + Misses)
+            : 0.0;
+    }
+
+    #endregion
+}
@@ -0,0 +1,277 @@
+using System;
+using System.Buffers;
+using System.Drawing;
+using System.Drawing.Drawing2D;
+using System.Drawing.Imaging;
+using System.IO;
+using System.Linq;
+using System.Runtime.InteropServices;
+
+using Rhino.Display;
+using RhinoAI.Core;
+
+namespace RhinoAI.AI
+{
+    /// <summary>
+    /// Turns viewport captures into images for vision requests. Views are rendered directly at
+    /// the configured maximum size, then compared with the last analyzed frame by perceptual
+    /// hash; frames that have not visibly changed are not encoded at all. Changed frames are
+    /// JPEG-encoded into a reused stream and handed out in pooled buffers.
+    /// </summary>
+    public class ViewportCapturePipeline : IDisposable
+    {
+        private static readonly ImageCodecInfo JpegEncoder = ImageCodecInfo.GetImageEncoders()
+            .First(codec => codec.FormatID == ImageFormat.Jpeg.Guid);
+
+        private readonly ViewportCaptureOptions _options;
+        private readonly MemoryStream _encodeBuffer = new MemoryStream();
+        private readonly object _lockObject = new object();
+        private ulong? _lastHash;
+        private bool _disposed;
+
+        public ViewportCapturePipeline(ViewportCaptureOptions? options = null)
+        {
+            _options = options ?? new ViewportCaptureOptions();
+        }
+
+        /// <summary>
+        /// Capture <paramref name="view"/> no larger than the maximum dimension; null if the view could not be captured
+        /// </summary>
+        /// <param name="force">Encode the frame even if it matches the last one</param>
+        public ViewportImage? Capture(RhinoView view, bool force = false)
+        {
+            if (view == null) throw new ArgumentNullException(nameof(view));
+
+            var size = FitWithin(view.ActiveViewport.Size, _options.MaxDimension);
+            using var bitmap = view.CaptureToBitmap(size);
+            return bitmap == null ? null : Process(bitmap, force);
+        }
+
+        /// <summary>
+        /// Downscale, hash and encode an already captured frame
+        /// </summary>
+        public ViewportImage Process(Bitmap bitmap, bool force = false)
+        {
+            if (bitmap == null) throw new ArgumentNullException(nameof(bitmap));
+
+            var size = FitWithin(bitmap.Size, _options.MaxDimension);
+            var scaled = size == bitmap.Size ? bitmap : Resize(bitmap, size);
+            try
+            {
+                var hash = ComputeHash(scaled);
+
+                lock (_lockObject)
+                {
+                    // Compare against the last frame that was encoded, so slow drift still adds up to a change
+                    var distance = _lastHash.HasValue ? PerceptualHash.Distance(_lastHash.Value, hash) : int.MaxValue;
+                    if (!force && distance <= _options.ChangeThreshold)
+                    {
+                        return ViewportImage.Unchanged(scaled.Width, scaled.Height, hash, distance);
+                    }
+
+                    _encodeBuffer.SetLength(0);
+                    Encode(scaled, _encodeBuffer);
+                    _lastHash = hash;
+
+                    var length = (int)_encodeBuffer.Length;
+                    var buffer = ArrayPool<byte>.Shared.Rent(length);
+                    _encodeBuffer.GetBuffer().AsSpan(0, length).CopyTo(buffer);
+                    return new ViewportImage(buffer, length, MediaType, scaled.Width, scaled.Height, hash, distance);
+                }
+            }
+            finally
+            {
+                if (!ReferenceEquals(scaled, bitmap))
+                {
+                    scaled.Dispose();
+                }
+            }
+        }
+
+        /// <summary>
+        /// Forget the last frame, e.g. after its analysis failed, so the next capture is always encoded
+        /// </summary>
+        public void ResetChangeDetection()
+        {
+            lock (_lockObject)
+            {
+                _lastHash = null;
+            }
+        }
+
+        private string MediaType => _options.Quality == ViewportImageQuality.Lossless ? "image/png" : "image/jpeg";
+
+        /// <summary>
+        /// Largest size with the same aspect ratio whose longer side is at most <paramref name="maxDimension"/>
+        /// </summary>
+        public static Size FitWithin(Size size, int maxDimension)
+        {
+            var longer = Math.Max(size.Width, size.Height);
+            if (maxDimension <= 0 || longer <= maxDimension) return size;
+
+            var scale = (double)maxDimension / longer;
+            return new Size(Math.Max(1, (int)Math.Round(size.Width * scale)), Math.Max(1, (int)Math.Round(size.Height * scale)));
+        }
+
+        private void Encode(Bitmap bitmap, Stream stream)
+        {
+            if (_options.Quality == ViewportImageQuality.Lossless)
+            {
+                bitmap.Save(stream, ImageFormat.Png);
+                return;
+            }
+
+            using var parameters = new EncoderParameters(1);
+            parameters.Param[0] = new EncoderParameter(Encoder.Quality, (long)_options.JpegQuality);
+            bitmap.Save(stream, JpegEncoder, parameters);
+        }
+
+        private static Bitmap Resize(Bitmap source, Size size)
+        {
+            var resized = new Bitmap(size.Width, size.Height, PixelFormat.Format24bppRgb);
+            using var graphics = Graphics.FromImage(resized);
+            graphics.InterpolationMode = InterpolationMode.HighQualityBilinear;
+            graphics.PixelOffsetMode = PixelOffsetMode.HighQuality;
+            graphics.DrawImage(source, new Rectangle(Point.Empty, size));
+            return resized;
+        }
+
+        private static ulong ComputeHash(Bitmap bitmap)
+        {
+            using var thumbnail = Resize(bitmap, new Size(PerceptualHash.ThumbnailWidth, PerceptualHash.ThumbnailHeight));
+            var data = thumbnail.LockBits(new Rectangle(0, 0, thumbnail.Width, thumbnail.Height), ImageLockMode.ReadOnly, PixelFormat.Format24bppRgb);
+            try
+            {
+                var pixels = new byte[data.Stride * data.Height];
+                Marshal.Copy(data.Scan0, pixels, 0, pixels.Length);
+
+                // Format24bppRgb stores each pixel as blue, green, red
+                Span<byte> luminance = stackalloc byte[PerceptualHash.ThumbnailWidth * PerceptualHash.ThumbnailHeight];
+                for (int y = 0; y < data.Height; y++)
+                {
+                    for (int x = 0; x < data.Width; x++)
+                    {
+                        var offset = y * data.Stride + x * 3;
+                        luminance[y * data.Width + x] = PerceptualHash.Luminance(pixels[offset + 2], pixels[offset + 1], pixels[offset]);
+                    }
+                }
+                return PerceptualHash.FromThumbnail(luminance);
+            }
+            finally
+            {
+                thumbnail.UnlockBits(data);
+            }
+        }
+
+        public void Dispose()
+        {
+            if (_disposed) return;
+            _disposed = true;
+
+            _encodeBuffer.Dispose();
+        }
+    }
+
+    /// <summary>
+    /// Quality presets for viewport images sent to vision models
+    /// </summary>
+    public enum ViewportImageQuality
+    {
+        /// <summary>JPEG quality 50; enough to recognize shapes</summary>
+        Low,
+
+        /// <summary>JPEG quality 75</summary>
+        Medium,
+
+        /// <summary>JPEG quality 90; for fine linework and annotations</summary>
+        High,
+
+        /// <summary>PNG, as captured</summary>
+        Lossless
+    }
+
+    /// <summary>
+    /// Size, quality and change detection settings for ViewportCapturePipeline
+    /// </summary>
+    public class ViewportCaptureOptions
+    {
+        /// <summary>Longest image side in pixels; 0 keeps the viewport size</summary>
+        public int MaxDimension { get; set; } = 1024;
+
+        public ViewportImageQuality Quality { get; set; } = ViewportImageQuality.Medium;
+
+        /// <summary>Frames whose hash differs from the last encoded frame in at most this many of 64 bits count as unchanged; negative disables</summary>
+        public int ChangeThreshold { get; set; } = 4;
+
+        public int JpegQuality => Quality switch
+        {
+            ViewportImageQuality.Low => 50,
+            ViewportImageQuality.High => 90,
+            _ => 75
+        };
+
+        /// <summary>
+        /// Read the Vision:* capture settings
+        /// </summary>
+        public static ViewportCaptureOptions FromConfiguration(ConfigurationManager configManager)
+        {
+            return new ViewportCaptureOptions
+            {
+                MaxDimension = configManager.GetSetting("Vision:MaxImageDimension", 1024),
+                Quality = Enum.TryParse<ViewportImageQuality>(configManager.GetSetting("Vision:ImageQuality", "Medium"), true, out var quality)
+                    ? quality
+                    : ViewportImageQuality.Medium,
+                ChangeThreshold = configManager.GetSetting("Vision:ChangeThreshold", 4)
+            };
+        }
+    }
+
+    /// <summary>
+    /// An encoded viewport frame in a pooled buffer; dispose to return the buffer
+    /// </summary>
+    public sealed class ViewportImage : IDisposable
+    {
+        private byte[]? _buffer;
+        private readonly int _length;
+
+        internal ViewportImage(byte[]? buffer, int length, string mediaType, int width, int height, ulong hash, int hashDistance)
+        {
+            _buffer = buffer;
+            _length = length;
+            MediaType = mediaType;
+            Width = width;
+            Height = height;
+            Hash = hash;
+            HashDistance = hashDistance;
+        }
+
+        internal static ViewportImage Unchanged(int width, int height, ulong hash, int hashDistance)
+        {
+            return new ViewportImage(null, 0, string.Empty, width, height, hash, hashDistance) { IsUnchanged = true };
+        }
+
+        /// <summary>Encoded image bytes; empty when the frame was unchanged</summary>
+        public ReadOnlyMemory<byte> Data => _buffer == null ? ReadOnlyMemory<byte>.Empty : new ReadOnlyMemory<byte>(_buffer, 0, _length);
+
+        public string MediaType { get; }
+        public int Width { get; }
+        public int Height { get; }
+        public ulong Hash { get; }
+
+        /// <summary>Bits differing from the last encoded frame; int.MaxValue for the first frame</summary>
+        public int HashDistance { get; }
+
+        /// <summary>The frame matched the last encoded frame and was not encoded</summary>
+        public bool IsUnchanged { get; private init; }
+
+        public void Dispose()
+        {
+            var buffer = _buffer;
+            _buffer = null;
+            if (buffer != null)
+            {
+                ArrayPool<byte>.Shared.Return(buffer);
+            }
+        }
+    }
+}
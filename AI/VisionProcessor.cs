@@ -1,5 +1,6 @@
 using System;
 using System.Collections.Generic;
+using System.Threading;
 using System.Threading.Tasks;
 using System.Text.Json;
 using System.Text.Json.Serialization;
@@ -22,6 +23,11 @@ namespace RhinoAI.AI
         private readonly ConfigurationManager _config;
         private readonly SimpleLogger _logger;
         private readonly OpenAIClient _openAIClient;
+        private readonly ViewportCapturePipeline _capturePipeline;
+
+        // One analysis at a time, so a caller waiting on an identical frame reuses the result instead of racing it
+        private readonly SemaphoreSlim _analysisLock = new SemaphoreSlim(1, 1);
+        private SceneAnalysis? _lastAnalysis;
         private bool _disposed = false;
 
         public VisionProcessor(ConfigurationManager config, SimpleLogger logger, OpenAIClient openAIClient)
@@ -29,13 +35,18 @@ namespace RhinoAI.AI
             _config = config ?? throw new ArgumentNullException(nameof(config));
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
             _openAIClient = openAIClient ?? throw new ArgumentNullException(nameof(openAIClient));
+            _capturePipeline = new ViewportCapturePipeline(ViewportCaptureOptions.FromConfiguration(config));
         }
 
         /// <summary>
-        /// Analyze a 3D scene using computer vision
+        /// Analyze a 3D scene using computer vision. If the viewport looks the same as at the
+        /// last analysis, that analysis is returned without calling the vision model.
         /// </summary>
-        public async Task<SceneAnalysis> AnalyzeSceneAsync(ViewportInfo viewport)
+        /// <param name="forceAnalysis">Analyze even if the viewport has not changed</param>
+        public async Task<SceneAnalysis> AnalyzeSceneAsync(ViewportInfo viewport, bool forceAnalysis = false,
+            CancellationToken cancellationToken = default)
         {
+            await _analysisLock.WaitAsync(cancellationToken);
             try
             {
                 _logger?.LogInformation("Starting AI scene analysis...");
@@ -46,29 +57,57 @@ namespace RhinoAI.AI
                     return new SceneAnalysis { Suggestions = new List<string> { "Error: OpenAI client is not configured." } };
                 }
 
-                var screenshot = await CaptureViewportAsync(viewport);
+                var lastAnalysis = _lastAnalysis;
+                using var screenshot = await CaptureViewportAsync(forceAnalysis || lastAnalysis == null);
                 if (screenshot == null)
                 {
                     _logger.LogWarning("Failed to capture viewport for analysis.");
                     return new SceneAnalysis { Suggestions = new List<string> { "Error: Failed to capture viewport." } };
                 }
 
+                if (screenshot.IsUnchanged && lastAnalysis != null)
+                {
+                    _logger?.LogInformation($"Viewport unchanged ({screenshot.HashDistance} of 64 hash bits differ); reusing previous analysis.");
+                    return lastAnalysis;
+                }
+
+                _logger?.LogInformation($"Sending {screenshot.Width}x{screenshot.Height} {screenshot.MediaType} ({screenshot.Data.Length / 1024.0:F0} KB) for analysis");
+
                 var prompt = CreateVisionPrompt();
-                var aiResponse = await _openAIClient.AnalyzeImageAsync(screenshot, prompt);
+                var aiResponse = await _openAIClient.AnalyzeImageAsync(screenshot.Data, screenshot.MediaType, prompt, cancellationToken);
 
-                var analysis = ParseAIResponse(aiResponse);
+                var parsed = TryParseAIResponse(aiResponse, out var analysis);
                 analysis.Timestamp = DateTime.UtcNow;
                 analysis.ViewportInfo = viewport;
-                analysis.Screenshot = screenshot;
+                analysis.Screenshot = screenshot.Data.ToArray();
+
+                if (!parsed)
+                {
+                    // Keep asking about this frame rather than replaying the parse failure
+                    _capturePipeline.ResetChangeDetection();
+                    return analysis;
+                }
 
+                _lastAnalysis = analysis;
                 _logger?.LogInformation("AI scene analysis complete.");
                 return analysis;
             }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                _capturePipeline.ResetChangeDetection();
+                throw;
+            }
             catch (Exception ex)
             {
+                // The captured frame was never analyzed, so it must not count as the reference frame
+                _capturePipeline.ResetChangeDetection();
                 _logger?.LogError(ex, "AI scene analysis failed");
                 return new SceneAnalysis { Suggestions = new List<string> { $"Error: {ex.Message}" } };
             }
+            finally
+            {
+                _analysisLock.Release();
+            }
         }
         
         /// <summary>
@@ -98,16 +137,18 @@ Focus on identifying key geometric elements, assessing the design's quality, cla
         }
 
         /// <summary>
-        /// Parses the JSON response from the AI into a SceneAnalysis object.
+        /// Parses the JSON response from the AI into a SceneAnalysis object. Returns false, with an
+        /// analysis describing the problem, if the response was empty or not valid analysis JSON.
         /// </summary>
-        private SceneAnalysis ParseAIResponse(string jsonResponse)
+        private bool TryParseAIResponse(string jsonResponse, out SceneAnalysis analysis)
         {
             try
             {
                 if (string.IsNullOrWhiteSpace(jsonResponse))
                 {
                     _logger.LogWarning("AI vision response was empty.");
-                    return new SceneAnalysis { Suggestions = new List<string> { "AI returned an empty response." }};
+                    analysis = new SceneAnalysis { Suggestions = new List<string> { "AI returned an empty response." }};
+                    return false;
                 }
 
                 // Clean the response to ensure it's valid JSON
@@ -117,38 +158,42 @@ Focus on identifying key geometric elements, assessing the design's quality, cla
                     cleanedJson = cleanedJson.Substring(4).Trim();
                 }
 
-                var options = new JsonSerializerOptions
+                var parsed = JsonSerializer.Deserialize(cleanedJson, RhinoAIJsonContext.CaseInsensitive.SceneAnalysis);
+                if (parsed == null)
                 {
-                    PropertyNameCaseInsensitive = true,
-                };
+                    _logger.LogWarning("AI vision response was a JSON null.");
+                    analysis = new SceneAnalysis { Suggestions = new List<string> { "AI returned an empty response." }};
+                    return false;
+                }
 
-                var analysis = JsonSerializer.Deserialize<SceneAnalysis>(cleanedJson, options);
-                
+                analysis = parsed;
                 // The deserializer should handle populating the lists.
                 // If they are null, initialize them.
                 analysis.DetectedObjects ??= new List<DetectedObject>();
                 analysis.Suggestions ??= new List<string>();
 
-                return analysis;
+                return true;
             }
             catch (JsonException ex)
             {
                 _logger.LogError(ex, "Failed to parse AI vision response JSON.");
                 // Return the raw response as a suggestion for debugging
-                return new SceneAnalysis { Suggestions = new List<string> { "Failed to parse AI response.", jsonResponse } };
+                analysis = new SceneAnalysis { Suggestions = new List<string> { "Failed to parse AI response.", jsonResponse } };
+                return false;
             }
              catch (Exception ex)
             {
                 _logger?.LogError(ex, "An unexpected error occurred while parsing the AI response.");
-                return new SceneAnalysis { Suggestions = new List<string> { "An unexpected error occurred during parsing." } };
+                analysis = new SceneAnalysis { Suggestions = new List<string> { "An unexpected error occurred during parsing." } };
+                return false;
             }
         }
 
 
         /// <summary>
-        /// Capture screenshot of viewport
+        /// Capture the active view, downscaled and encoded; unchanged frames come back without image data
         /// </summary>
-        private async Task<byte[]?> CaptureViewportAsync(ViewportInfo viewport)
+        private async Task<ViewportImage?> CaptureViewportAsync(bool force)
         {
             return await Task.Run(() =>
             {
@@ -161,20 +206,12 @@ Focus on identifying key geometric elements, assessing the design's quality, cla
                         return null;
                     }
 
-                    using (var bitmap = view.CaptureToBitmap())
+                    var image = _capturePipeline.Capture(view, force);
+                    if (image == null)
                     {
-                        if (bitmap == null)
-                        {
-                            _logger?.LogWarning("Failed to capture view to bitmap.");
-                            return null;
-                        }
-
-                        using (var ms = new System.IO.MemoryStream())
-                        {
-                            bitmap.Save(ms, System.Drawing.Imaging.ImageFormat.Png);
-                            return ms.ToArray();
-                        }
+                        _logger?.LogWarning("Failed to capture view to bitmap.");
                     }
+                    return image;
                 }
                 catch (Exception ex)
                 {
@@ -194,7 +231,8 @@ Focus on identifying key geometric elements, assessing the design's quality, cla
         {
             if (!_disposed && disposing)
             {
-                // Cleanup resources
+                _capturePipeline.Dispose();
+                _analysisLock.Dispose();
                 _disposed = true;
             }
         }
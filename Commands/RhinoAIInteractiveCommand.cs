@@ -71,12 +71,25 @@ namespace RhinoAI.Commands
                 {
                     RhinoApp.WriteLine($"\n🔄 Processing: {command}");
                     var startTime = DateTime.Now;
+                    var streaming = false;
                     
-                    var commandResult = await aiManager.ProcessNaturalLanguageAsync(command);
+                    var commandResult = await aiManager.ProcessNaturalLanguageAsync(command, token =>
+                    {
+                        if (!streaming)
+                        {
+                            streaming = true;
+                            RhinoApp.WriteLine($"⚡ First token after {(DateTime.Now - startTime).TotalMilliseconds:F0}ms");
+                        }
+                        RhinoApp.Write(token);
+                    });
                     
                     var endTime = DateTime.Now;
                     var duration = (endTime - startTime).TotalMilliseconds;
                     
+                    if (streaming)
+                    {
+                        RhinoApp.WriteLine(string.Empty);
+                    }
                     RhinoApp.WriteLine($"✅ Result ({duration:F0}ms): {commandResult}");
                     RhinoApp.WriteLine("Ready for next command...\n");
                 }
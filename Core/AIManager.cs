@@ -1,4 +1,5 @@
 using System;
+using System.Threading;
 using System.Threading.Tasks;
 
 using Rhino.Geometry;
@@ -16,6 +17,7 @@ namespace RhinoAI.Core
     {
         private readonly ConfigurationManager _configManager;
         private readonly SimpleLogger _logger;
+        private PooledHttpClientFactory _httpClientFactory;
         private bool _disposed = false;
 
         // AI Components
@@ -28,6 +30,11 @@ namespace RhinoAI.Core
         public ClaudeClient ClaudeClient { get; private set; }
         public OllamaClient OllamaClient { get; private set; }
         public MCPClient MCPClient { get; private set; }
+
+        /// <summary>
+        /// Records pipeline spans into latency histograms and logs slow traces
+        /// </summary>
+        public PerformanceMonitor PerformanceMonitor { get; private set; }
         
         // Core Components
         private ContextManager _contextManager;
@@ -52,6 +59,9 @@ namespace RhinoAI.Core
             {
                 _logger?.LogInformation("Initializing AI components...");
 
+                PerformanceMonitor ??= new PerformanceMonitor(_logger,
+                    TimeSpan.FromMilliseconds(_configManager.GetSetting("Performance:SlowTraceThresholdMs", 1000)));
+
                 // Check for API keys
                 if (!_configManager.HasApiKey("OpenAI"))
                 {
@@ -62,28 +72,31 @@ namespace RhinoAI.Core
                     _logger?.LogWarning("Claude API key not configured");
                 }
 
-                // Initialize clients
-                OpenAIClient = new OpenAIClient(_configManager, _logger);
-                ClaudeClient = new ClaudeClient(_configManager, _logger);
-                OllamaClient = new OllamaClient(_configManager, _logger);
+                // Initialize clients on shared connection pools
+                _httpClientFactory ??= new PooledHttpClientFactory(_configManager, _logger);
+                OpenAIClient = new OpenAIClient(_configManager, _logger, _httpClientFactory);
+                ClaudeClient = new ClaudeClient(_configManager, _logger, _httpClientFactory);
+                OllamaClient = new OllamaClient(_configManager, _logger, _httpClientFactory);
                 
                 // Initialize AI processors
-                NlpProcessor = new NLPProcessor(_configManager, _logger);
+                NlpProcessor = new NLPProcessor(_configManager, _logger, OpenAIClient, ClaudeClient, OllamaClient);
                 VisionProcessor = new VisionProcessor(_configManager, _logger, OpenAIClient);
                 GenerativeDesigner = new GenerativeDesigner(_configManager, _logger);
                 
                 // Initialize MCP Client
-                MCPClient = new MCPClient(_configManager, _logger);
+                MCPClient = new MCPClient(_configManager, _logger, _httpClientFactory);
 
                 RealTimeAssistant = new RealTimeAssistant(_configManager, _logger, MCPClient);
                 _logger?.LogInformation("AI processors initialized");
 
                 // Initialize Core Components
-                _contextManager = new ContextManager(_logger);
+                _contextManager = new ContextManager(_logger, ContextHistoryOptions.FromConfiguration(_configManager));
                 _suggestionEngine = new SuggestionEngine(_logger, OpenAIClient, ClaudeClient, OllamaClient);
 
                 // Initialize MCP server
-                MCPServer = new MCPServer(_configManager, _logger, _contextManager, _suggestionEngine, ProcessNaturalLanguageAsync);
+                MCPServer = new MCPServer(_configManager, _logger, _contextManager, _suggestionEngine,
+                    (input, cancellationToken) => ProcessNaturalLanguageAsync(input, onToken: null, cancellationToken),
+                    (batch, cancellationToken) => ExecuteCommandBatchAsync(batch.Commands, batch.StopOnError, cancellationToken));
                 if (!MCPServer.Start())
                 {
                     _logger?.LogWarning("MCP Server failed to start. Some features may be unavailable.");
@@ -109,8 +122,21 @@ namespace RhinoAI.Core
         /// </summary>
         /// <param name="input">Natural language input</param>
         /// <returns>AI response</returns>
-        public async Task<string> ProcessNaturalLanguageAsync(string input)
+        public Task<string> ProcessNaturalLanguageAsync(string input)
         {
+            return ProcessNaturalLanguageAsync(input, onToken: null);
+        }
+
+        /// <summary>
+        /// Process natural language input, streaming partial AI output as it arrives
+        /// </summary>
+        /// <param name="input">Natural language input</param>
+        /// <param name="onToken">Receives AI tokens as they are generated; may be null</param>
+        /// <param name="cancellationToken">Cancels the request, including any AI provider calls</param>
+        /// <returns>AI response</returns>
+        public async Task<string> ProcessNaturalLanguageAsync(string input, Action<string> onToken, CancellationToken cancellationToken = default)
+        {
+            using var span = PipelineTelemetry.StartSpan("AIManager.ProcessNaturalLanguage", "Pipeline");
             try
             {
                 if (NlpProcessor == null)
@@ -118,22 +144,56 @@ namespace RhinoAI.Core
                     throw new InvalidOperationException("NLP Processor not initialized");
                 }
 
-                return await NlpProcessor.ProcessNaturalLanguageAsync(input);
+                return await NlpProcessor.ProcessNaturalLanguageAsync(input, onToken, cancellationToken);
+            }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                span.SetError("Cancelled");
+                throw;
             }
             catch (Exception ex)
             {
+                span.SetError(ex.Message);
                 _logger.LogError(ex, $"Error processing natural language input: {input}");
                 throw;
             }
         }
 
+        /// <summary>
+        /// Execute an ordered batch of commands as one undo step with a single redraw
+        /// </summary>
+        /// <param name="commands">Natural-language or pre-parsed commands, in execution order</param>
+        /// <param name="stopOnError">Skip the remaining commands after the first failure</param>
+        /// <param name="cancellationToken">Cancels the batch between commands</param>
+        /// <returns>One result per executed command</returns>
+        public async Task<List<BatchCommandResult>> ExecuteCommandBatchAsync(IReadOnlyList<BatchCommand> commands, bool stopOnError = false,
+            CancellationToken cancellationToken = default)
+        {
+            try
+            {
+                if (NlpProcessor == null)
+                {
+                    throw new InvalidOperationException("NLP Processor not initialized");
+                }
+
+                return await NlpProcessor.ExecuteBatchAsync(commands, stopOnError, cancellationToken);
+            }
+            catch (Exception ex) when (!(ex is OperationCanceledException))
+            {
+                _logger.LogError(ex, $"Error executing batch of {commands?.Count ?? 0} commands");
+                throw;
+            }
+        }
+
         /// <summary>
         /// Generate design variants
         /// </summary>
         /// <param name="prompt">Design prompt</param>
         /// <param name="variantCount">Number of variants to generate</param>
+        /// <param name="cancellationToken">Cancels variants not yet generated</param>
         /// <returns>Generated variants</returns>
-        public async Task<IEnumerable<GeometryBase>> GenerateDesignVariantsAsync(string prompt, int variantCount = 3)
+        public async Task<IEnumerable<GeometryBase>> GenerateDesignVariantsAsync(string prompt, int variantCount = 3,
+            CancellationToken cancellationToken = default)
         {
             try
             {
@@ -143,7 +203,7 @@ namespace RhinoAI.Core
                 }
 
                 var designPrompt = new Models.DesignPrompt { Text = prompt };
-                return await GenerativeDesigner.GenerateVariantsAsync(designPrompt, variantCount);
+                return await GenerativeDesigner.GenerateVariantsAsync(designPrompt, variantCount, cancellationToken);
             }
             catch (Exception ex)
             {
@@ -221,13 +281,14 @@ namespace RhinoAI.Core
             {
                 _logger?.LogInformation("Reinitializing AI clients...");
 
-                // Reinitialize clients
-                OpenAIClient = new OpenAIClient(_configManager, _logger);
-                ClaudeClient = new ClaudeClient(_configManager, _logger);
-                OllamaClient = new OllamaClient(_configManager, _logger);
+                // Reinitialize clients; the connection pools are kept warm
+                _httpClientFactory ??= new PooledHttpClientFactory(_configManager, _logger);
+                OpenAIClient = new OpenAIClient(_configManager, _logger, _httpClientFactory);
+                ClaudeClient = new ClaudeClient(_configManager, _logger, _httpClientFactory);
+                OllamaClient = new OllamaClient(_configManager, _logger, _httpClientFactory);
                 
                 // Reinitialize AI processors that depend on clients
-                NlpProcessor = new NLPProcessor(_configManager, _logger);
+                NlpProcessor = new NLPProcessor(_configManager, _logger, OpenAIClient, ClaudeClient, OllamaClient);
                 VisionProcessor = new VisionProcessor(_configManager, _logger, OpenAIClient);
                 GenerativeDesigner = new GenerativeDesigner(_configManager, _logger);
                 
@@ -264,6 +325,8 @@ namespace RhinoAI.Core
                 MCPServer?.Dispose();
                 MCPClient?.Dispose();
                 RealTimeAssistant?.Dispose();
+                _httpClientFactory?.Dispose();
+                PerformanceMonitor?.Dispose();
 
                 _disposed = true;
                 _logger.LogInformation("AI Manager disposed");
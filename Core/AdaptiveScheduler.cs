@@ -0,0 +1,293 @@
+using System;
+using System.Diagnostics;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// Runs periodic work on a single loop, so runs never overlap, with an interval that adapts:
+    /// it drops to MinInterval while activity is reported, doubles towards MaxInterval while idle,
+    /// and is never shorter than the last run's cost divided by TargetDutyCycle.
+    /// Activity reported during a long idle wait cuts that wait short.
+    /// </summary>
+    public class AdaptiveScheduler : IDisposable
+    {
+        private readonly Func<CancellationToken, Task> _work;
+        private readonly SimpleLogger _logger;
+        private readonly AdaptiveSchedulerOptions _options;
+        private readonly object _lockObject = new object();
+        private readonly Stopwatch _lifetime = new Stopwatch();
+
+        private CancellationTokenSource? _shutdown;
+        private TaskCompletionSource<bool>? _wake;
+        private Task? _loop;
+        private TimeSpan _interval;
+        private long _activity;
+        private long _runs;
+        private long _busyTicks;
+        private TimeSpan _lastRunDuration;
+        private double _recentDutyCycle;
+        private bool _disposed = false;
+
+        public AdaptiveScheduler(Func<CancellationToken, Task> work, SimpleLogger logger, AdaptiveSchedulerOptions options = null)
+        {
+            _work = work ?? throw new ArgumentNullException(nameof(work));
+            _logger = logger ?? throw new ArgumentNullException(nameof(logger));
+            _options = options ?? new AdaptiveSchedulerOptions();
+            if (_options.MinInterval <= TimeSpan.Zero || _options.MaxInterval < _options.MinInterval)
+                throw new ArgumentOutOfRangeException(nameof(options), "Intervals must be positive with MinInterval <= MaxInterval");
+
+            _interval = Clamp(_options.InitialInterval);
+        }
+
+        public bool IsRunning => _loop != null && !_loop.IsCompleted;
+
+        /// <summary>Wait before the next run</summary>
+        public TimeSpan CurrentInterval
+        {
+            get
+            {
+                lock (_lockObject)
+                {
+                    return _interval;
+                }
+            }
+        }
+
+        public long Runs => Interlocked.Read(ref _runs);
+
+        public TimeSpan LastRunDuration
+        {
+            get
+            {
+                lock (_lockObject)
+                {
+                    return _lastRunDuration;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Fraction of wall-clock time spent running work since Start
+        /// </summary>
+        public double DutyCycle
+        {
+            get
+            {
+                var elapsed = _lifetime.Elapsed.Ticks;
+                return elapsed > 0 ? (double)Interlocked.Read(ref _busyTicks) / elapsed : 0;
+            }
+        }
+
+        /// <summary>
+        /// Run time over run-plus-wait time, exponentially averaged over recent runs
+        /// </summary>
+        public double RecentDutyCycle
+        {
+            get
+            {
+                lock (_lockObject)
+                {
+                    return _recentDutyCycle;
+                }
+            }
+        }
+
+        public void Start()
+        {
+            if (_disposed) throw new ObjectDisposedException(nameof(AdaptiveScheduler));
+            if (IsRunning) return;
+
+            _shutdown = new CancellationTokenSource();
+            _lifetime.Restart();
+            _loop = Task.Run(() => RunLoopAsync(_shutdown.Token));
+        }
+
+        /// <summary>
+        /// Stop scheduling and wait for a run in progress to observe cancellation
+        /// </summary>
+        public async Task StopAsync()
+        {
+            var loop = _loop;
+            if (loop == null) return;
+
+            _shutdown?.Cancel();
+            try
+            {
+                await loop;
+            }
+            catch (OperationCanceledException)
+            {
+            }
+
+            _lifetime.Stop();
+            _shutdown?.Dispose();
+            _shutdown = null;
+            _loop = null;
+        }
+
+        /// <summary>
+        /// Report work for the next run, e.g. a document change. Cheap; safe from any thread.
+        /// </summary>
+        public void NotifyActivity()
+        {
+            Interlocked.Increment(ref _activity);
+
+            lock (_lockObject)
+            {
+                // Waiting out an idle backoff: come back after the minimum interval instead. The wake
+                // continuation runs asynchronously, so the caller's thread never executes the work.
+                if (_interval > _options.MinInterval)
+                {
+                    _wake?.TrySetResult(true);
+                }
+            }
+        }
+
+        private async Task RunLoopAsync(CancellationToken cancellationToken)
+        {
+            while (!cancellationToken.IsCancellationRequested)
+            {
+                var waited = await WaitAsync(cancellationToken);
+
+                // Activity seen before the run belongs to it; later activity counts for the next one
+                var hadActivity = Interlocked.Exchange(ref _activity, 0) > 0;
+
+                var started = Stopwatch.GetTimestamp();
+                try
+                {
+                    await _work(cancellationToken);
+                }
+                catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+                {
+                    return;
+                }
+                catch (Exception ex)
+                {
+                    _logger.LogError(ex, "Scheduled work failed");
+                }
+
+                var cost = Stopwatch.GetElapsedTime(started);
+                Interlocked.Increment(ref _runs);
+                Interlocked.Add(ref _busyTicks, cost.Ticks);
+                Adapt(hadActivity, cost, waited);
+            }
+        }
+
+        private async Task<TimeSpan> WaitAsync(CancellationToken cancellationToken)
+        {
+            var started = Stopwatch.GetTimestamp();
+            var wake = new TaskCompletionSource<bool>(TaskCreationOptions.RunContinuationsAsynchronously);
+            using var delayCancellation = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+            TimeSpan interval;
+
+            lock (_lockObject)
+            {
+                interval = _interval;
+                _wake = wake;
+            }
+
+            try
+            {
+                var delay = Task.Delay(interval, delayCancellation.Token);
+                if (await Task.WhenAny(delay, wake.Task) == wake.Task)
+                {
+                    delayCancellation.Cancel();
+
+                    // Woken by activity; still leave at least the minimum interval between runs
+                    var remaining = _options.MinInterval - Stopwatch.GetElapsedTime(started);
+                    if (remaining > TimeSpan.Zero)
+                    {
+                        await Task.Delay(remaining, cancellationToken);
+                    }
+                }
+                else
+                {
+                    await delay;
+                }
+            }
+            finally
+            {
+                lock (_lockObject)
+                {
+                    _wake = null;
+                }
+            }
+
+            return Stopwatch.GetElapsedTime(started);
+        }
+
+        private void Adapt(bool hadActivity, TimeSpan cost, TimeSpan waited)
+        {
+            lock (_lockObject)
+            {
+                var next = hadActivity
+                    ? _options.MinInterval
+                    : TimeSpan.FromTicks((long)(_interval.Ticks * _options.IdleBackoffFactor));
+
+                // Expensive runs are spaced out so they stay within the duty cycle budget
+                if (_options.TargetDutyCycle > 0)
+                {
+                    var floor = TimeSpan.FromTicks((long)(cost.Ticks * (1 - _options.TargetDutyCycle) / _options.TargetDutyCycle));
+                    if (next < floor) next = floor;
+                }
+
+                _interval = Clamp(next);
+                _lastRunDuration = cost;
+
+                var cycle = cost + waited;
+                var duty = cycle > TimeSpan.Zero ? (double)cost.Ticks / cycle.Ticks : 0;
+                _recentDutyCycle = _runs <= 1 ? duty : 0.8 * _recentDutyCycle + 0.2 * duty;
+            }
+        }
+
+        private TimeSpan Clamp(TimeSpan interval)
+        {
+            if (interval < _options.MinInterval) return _options.MinInterval;
+            if (interval > _options.MaxInterval) return _options.MaxInterval;
+            return interval;
+        }
+
+        public void Dispose()
+        {
+            if (_disposed) return;
+            _disposed = true;
+
+            _shutdown?.Cancel();
+        }
+    }
+
+    /// <summary>
+    /// Interval bounds and adaptation rates for AdaptiveScheduler
+    /// </summary>
+    public class AdaptiveSchedulerOptions
+    {
+        public TimeSpan InitialInterval { get; set; } = TimeSpan.FromSeconds(5);
+
+        /// <summary>Interval while activity is reported</summary>
+        public TimeSpan MinInterval { get; set; } = TimeSpan.FromSeconds(2);
+
+        /// <summary>Longest idle backoff</summary>
+        public TimeSpan MaxInterval { get; set; } = TimeSpan.FromSeconds(60);
+
+        /// <summary>Interval multiplier after a run with no reported activity</summary>
+        public double IdleBackoffFactor { get; set; } = 2.0;
+
+        /// <summary>Largest fraction of time the work may take; 0 disables the cost-based floor</summary>
+        public double TargetDutyCycle { get; set; } = 0.02;
+
+        /// <summary>
+        /// Read the RealTime:* monitoring settings
+        /// </summary>
+        public static AdaptiveSchedulerOptions FromConfiguration(ConfigurationManager configManager)
+        {
+            return new AdaptiveSchedulerOptions
+            {
+                MinInterval = TimeSpan.FromMilliseconds(configManager.GetSetting("RealTime:MinIntervalMs", 2000)),
+                MaxInterval = TimeSpan.FromMilliseconds(configManager.GetSetting("RealTime:MaxIntervalMs", 60000)),
+                TargetDutyCycle = Math.Clamp(configManager.GetSetting("RealTime:TargetDutyCycle", 0.02), 0, 1)
+            };
+        }
+    }
+}
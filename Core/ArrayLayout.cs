@@ -0,0 +1,127 @@
+using System;
+using System.Numerics;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// Computes the placement offsets of array commands in one pass, as parallel X, Y and Z arrays.
+    /// Grid rows are filled with SIMD and copied rather than computed cell by cell.
+    /// </summary>
+    public static class ArrayLayout
+    {
+        /// <summary>
+        /// Row-major grid offsets: cell (row, column) is at index row * columns + column,
+        /// offset by column * spacingX along X and row * spacingY along Y
+        /// </summary>
+        public static ArrayOffsets Grid(int rows, int columns, double spacingX, double spacingY)
+        {
+            if (rows < 0) throw new ArgumentOutOfRangeException(nameof(rows));
+            if (columns < 0) throw new ArgumentOutOfRangeException(nameof(columns));
+
+            var offsets = new ArrayOffsets(checked(rows * columns));
+            if (offsets.Count == 0) return offsets;
+
+            // First row: X = column * spacing, Vector<double>.Count columns at a time
+            var firstRow = offsets.X.AsSpan(0, columns);
+            FillArithmetic(firstRow, spacingX);
+
+            for (int row = 0; row < rows; row++)
+            {
+                var start = row * columns;
+                if (row > 0)
+                {
+                    firstRow.CopyTo(offsets.X.AsSpan(start, columns));
+                }
+                offsets.Y.AsSpan(start, columns).Fill(row * spacingY);
+            }
+
+            return offsets;
+        }
+
+        /// <summary>
+        /// Offsets step * i for i = first .. first + count - 1, e.g. copies along a translation
+        /// </summary>
+        public static ArrayOffsets Linear(int count, double stepX, double stepY, double stepZ, int first = 1)
+        {
+            if (count < 0) throw new ArgumentOutOfRangeException(nameof(count));
+
+            var offsets = new ArrayOffsets(count);
+            for (int i = 0; i < count; i++)
+            {
+                var factor = first + i;
+                offsets.X[i] = stepX * factor;
+                offsets.Y[i] = stepY * factor;
+                offsets.Z[i] = stepZ * factor;
+            }
+
+            return offsets;
+        }
+
+        /// <summary>
+        /// Offsets to <paramref name="count"/> equally spaced points on a circle in the XY plane,
+        /// skipping the first <paramref name="first"/> of them (the original sits at angle zero)
+        /// </summary>
+        public static ArrayOffsets Circular(int count, double radius, int first = 1)
+        {
+            if (count < 0) throw new ArgumentOutOfRangeException(nameof(count));
+
+            var offsets = new ArrayOffsets(Math.Max(0, count - first));
+            var angleStep = count > 0 ? 2 * Math.PI / count : 0;
+            for (int i = 0; i < offsets.Count; i++)
+            {
+                var (sin, cos) = Math.SinCos((first + i) * angleStep);
+                offsets.X[i] = radius * cos;
+                offsets.Y[i] = radius * sin;
+            }
+
+            return offsets;
+        }
+
+        /// <summary>
+        /// values[i] = i * step; one multiply per element, so results match the scalar formula exactly
+        /// </summary>
+        private static void FillArithmetic(Span<double> values, double step)
+        {
+            var width = Vector<double>.Count;
+            var i = 0;
+            if (Vector.IsHardwareAccelerated && values.Length >= width)
+            {
+                Span<double> lanes = stackalloc double[width];
+                for (int lane = 0; lane < width; lane++)
+                {
+                    lanes[lane] = lane;
+                }
+
+                var laneIndices = new Vector<double>(lanes);
+                var steps = new Vector<double>(step);
+                for (; i <= values.Length - width; i += width)
+                {
+                    ((new Vector<double>(i) + laneIndices) * steps).CopyTo(values.Slice(i));
+                }
+            }
+
+            for (; i < values.Length; i++)
+            {
+                values[i] = i * step;
+            }
+        }
+    }
+
+    /// <summary>
+    /// Array placement offsets stored as parallel coordinate arrays
+    /// </summary>
+    public readonly struct ArrayOffsets
+    {
+        public ArrayOffsets(int count)
+        {
+            X = new double[count];
+            Y = new double[count];
+            Z = new double[count];
+        }
+
+        public double[] X { get; }
+        public double[] Y { get; }
+        public double[] Z { get; }
+        public int Count => X?.Length ?? 0;
+    }
+}
@@ -0,0 +1,604 @@
+using System;
+using System.Buffers;
+using System.Collections.Generic;
+using System.Globalization;
+using System.IO;
+using System.Text;
+using System.Text.Encodings.Web;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Channels;
+using System.Threading.Tasks;
+using Rhino;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// What happens to new log entries when the sink's queue is full
+    /// </summary>
+    public enum LogOverflowPolicy
+    {
+        /// <summary>Discard the oldest queued entry to make room</summary>
+        DropOldest,
+        /// <summary>Discard the entry being logged</summary>
+        DropNewest,
+        /// <summary>Block the logging thread until the writer catches up</summary>
+        Block
+    }
+
+    /// <summary>
+    /// Layout of the log file
+    /// </summary>
+    public enum LogFileFormat
+    {
+        /// <summary>One human-readable line per entry (*.log)</summary>
+        Text,
+        /// <summary>One JSON object per line, including structured fields (*.jsonl)</summary>
+        JsonLines
+    }
+
+    /// <summary>
+    /// Settings for an AsyncLogSink
+    /// </summary>
+    public class LogSinkOptions
+    {
+        public string LogDirectory { get; set; } = Path.Combine(
+            Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData), "RhinoAI", "Logs");
+
+        public string FilePrefix { get; set; } = "rhinoai";
+
+        /// <summary>Maximum number of entries waiting to be written</summary>
+        public int QueueCapacity { get; set; } = 10_000;
+
+        /// <summary>Maximum number of entries written between flushes</summary>
+        public int MaxBatchSize { get; set; } = 1024;
+
+        /// <summary>How long the writer lets entries accumulate after waking, bounding flushes per second</summary>
+        public TimeSpan FlushInterval { get; set; } = TimeSpan.FromMilliseconds(20);
+
+        /// <summary>Size at which the current file is rolled over; files also roll daily</summary>
+        public long MaxFileSizeBytes { get; set; } = 10 * 1024 * 1024;
+
+        public LogOverflowPolicy OverflowPolicy { get; set; } = LogOverflowPolicy.DropOldest;
+
+        public LogFileFormat Format { get; set; } = LogFileFormat.Text;
+
+        /// <summary>Echo each entry to the Rhino command line</summary>
+        public bool EchoToCommandLine { get; set; } = true;
+
+        /// <summary>
+        /// Read the Logging:* settings
+        /// </summary>
+        public static LogSinkOptions FromConfiguration(ConfigurationManager configManager)
+        {
+            return new LogSinkOptions
+            {
+                Format = Enum.TryParse<LogFileFormat>(configManager.GetSetting("Logging:Format", "Text"), true, out var format)
+                    ? format
+                    : LogFileFormat.Text,
+                OverflowPolicy = Enum.TryParse<LogOverflowPolicy>(configManager.GetSetting("Logging:OverflowPolicy", "DropOldest"), true, out var policy)
+                    ? policy
+                    : LogOverflowPolicy.DropOldest,
+                QueueCapacity = Math.Max(1, configManager.GetSetting("Logging:QueueCapacity", 10_000))
+            };
+        }
+    }
+
+    /// <summary>
+    /// A single message queued for the log file
+    /// </summary>
+    public sealed class LogEntry
+    {
+        public LogEntry(DateTime timestamp, LogLevel level, string category, string message,
+            IReadOnlyList<KeyValuePair<string, object?>>? fields = null)
+        {
+            Timestamp = timestamp;
+            Level = level;
+            Category = category;
+            Message = message;
+            Fields = fields;
+        }
+
+        private LogEntry(TaskCompletionSource<bool> flushCompletion)
+        {
+            FlushCompletion = flushCompletion;
+            Message = string.Empty;
+            Category = string.Empty;
+        }
+
+        public DateTime Timestamp { get; }
+        public LogLevel Level { get; }
+        public string Category { get; }
+        public string Message { get; }
+
+        /// <summary>
+        /// Structured values captured from the message, keyed by the expression that produced them
+        /// </summary>
+        public IReadOnlyList<KeyValuePair<string, object?>>? Fields { get; }
+
+        internal TaskCompletionSource<bool>? FlushCompletion { get; }
+
+        internal static LogEntry CreateFlushMarker() =>
+            new LogEntry(new TaskCompletionSource<bool>(TaskCreationOptions.RunContinuationsAsynchronously));
+    }
+
+    /// <summary>
+    /// Background log writer. Loggers enqueue entries on a bounded channel without taking a lock;
+    /// a single writer task drains them in batches into an open file, flushing at most once per
+    /// FlushInterval under steady load, and rolls files by date and size.
+    /// </summary>
+    public sealed class AsyncLogSink : IDisposable
+    {
+        private static readonly Lazy<AsyncLogSink> _default = new Lazy<AsyncLogSink>(CreateDefault);
+        private static LogSinkOptions? _defaultOptions;
+
+        private static readonly JsonEncodedText TimestampProperty = JsonEncodedText.Encode("ts");
+        private static readonly JsonEncodedText LevelProperty = JsonEncodedText.Encode("level");
+        private static readonly JsonEncodedText CategoryProperty = JsonEncodedText.Encode("category");
+        private static readonly JsonEncodedText MessageProperty = JsonEncodedText.Encode("message");
+        private static readonly JsonEncodedText FieldsProperty = JsonEncodedText.Encode("fields");
+
+        private readonly LogSinkOptions _options;
+        private readonly Channel<LogEntry> _channel;
+        private readonly Task _writerTask;
+        private readonly object _fallbackLock = new object();
+
+        private FileStream? _stream;
+        private StreamWriter? _textWriter;
+        private readonly ArrayBufferWriter<byte>? _jsonBuffer;
+        private readonly Utf8JsonWriter? _jsonWriter;
+        private DateTime _currentDate;
+        private string _currentFilePath = string.Empty;
+        private long _droppedCount;
+        private long _reportedDropCount;
+        private long _writtenCount;
+        private volatile bool _isShutdown;
+
+        public AsyncLogSink(LogSinkOptions? options = null)
+        {
+            _options = options ?? new LogSinkOptions();
+            if (_options.QueueCapacity <= 0)
+                throw new ArgumentOutOfRangeException(nameof(options), "Queue capacity must be positive");
+            if (_options.MaxBatchSize <= 0)
+                throw new ArgumentOutOfRangeException(nameof(options), "Batch size must be positive");
+
+            Directory.CreateDirectory(_options.LogDirectory);
+
+            if (_options.Format == LogFileFormat.JsonLines)
+            {
+                _jsonBuffer = new ArrayBufferWriter<byte>(1024);
+                _jsonWriter = new Utf8JsonWriter(_jsonBuffer, new JsonWriterOptions { Encoder = JavaScriptEncoder.UnsafeRelaxedJsonEscaping });
+            }
+
+            var channelOptions = new BoundedChannelOptions(_options.QueueCapacity)
+            {
+                SingleReader = true,
+                SingleWriter = false,
+                FullMode = _options.OverflowPolicy switch
+                {
+                    LogOverflowPolicy.DropOldest => BoundedChannelFullMode.DropOldest,
+                    LogOverflowPolicy.DropNewest => BoundedChannelFullMode.DropWrite,
+                    _ => BoundedChannelFullMode.Wait
+                }
+            };
+            _channel = Channel.CreateBounded<LogEntry>(channelOptions, OnEntryDropped);
+            _writerTask = Task.Factory.StartNew(WriteLoopAsync, CancellationToken.None,
+                TaskCreationOptions.LongRunning, TaskScheduler.Default).Unwrap();
+        }
+
+        /// <summary>
+        /// Process-wide sink shared by every SimpleLogger, created on the first message
+        /// </summary>
+        public static AsyncLogSink Default => _default.Value;
+
+        /// <summary>
+        /// Options the Default sink will be created with; returns false if it already exists
+        /// </summary>
+        public static bool ConfigureDefault(LogSinkOptions options)
+        {
+            if (options == null) throw new ArgumentNullException(nameof(options));
+            if (_default.IsValueCreated) return false;
+
+            Volatile.Write(ref _defaultOptions, options);
+            return !_default.IsValueCreated;
+        }
+
+        /// <summary>
+        /// Whether loggers should capture interpolated values as structured fields
+        /// </summary>
+        public bool CapturesFields => _options.Format == LogFileFormat.JsonLines;
+
+        public long DroppedCount => Interlocked.Read(ref _droppedCount);
+
+        public long WrittenCount => Interlocked.Read(ref _writtenCount);
+
+        /// <summary>
+        /// Path of the file currently being written, or empty before the first entry
+        /// </summary>
+        public string CurrentFilePath => Volatile.Read(ref _currentFilePath);
+
+        /// <summary>
+        /// Queues an entry for the writer. Never blocks unless the overflow policy is Block.
+        /// Entries logged after shutdown are appended to the file synchronously.
+        /// </summary>
+        public void Enqueue(LogEntry entry)
+        {
+            if (entry == null) throw new ArgumentNullException(nameof(entry));
+
+            if (_channel.Writer.TryWrite(entry)) return;
+
+            if (!_isShutdown)
+            {
+                if (_options.OverflowPolicy != LogOverflowPolicy.Block)
+                {
+                    // DropNewest rejected the entry; the drop callback is not raised for it
+                    Interlocked.Increment(ref _droppedCount);
+                    return;
+                }
+
+                try
+                {
+                    _channel.Writer.WriteAsync(entry).AsTask().GetAwaiter().GetResult();
+                    return;
+                }
+                catch (ChannelClosedException)
+                {
+                    // Shut down while waiting; fall through to the synchronous path
+                }
+            }
+
+            WriteSynchronously(entry);
+        }
+
+        /// <summary>
+        /// Waits until every entry queued before this call has been written and flushed
+        /// </summary>
+        public async Task<bool> FlushAsync(CancellationToken cancellationToken = default)
+        {
+            var marker = LogEntry.CreateFlushMarker();
+            try
+            {
+                await _channel.Writer.WriteAsync(marker, cancellationToken).ConfigureAwait(false);
+            }
+            catch (ChannelClosedException)
+            {
+                await _writerTask.ConfigureAwait(false);
+                return true;
+            }
+
+            using (cancellationToken.Register(() => marker.FlushCompletion!.TrySetCanceled(cancellationToken)))
+            {
+                return await marker.FlushCompletion!.Task.ConfigureAwait(false);
+            }
+        }
+
+        /// <summary>
+        /// Stops accepting queued entries, drains the queue and closes the file
+        /// </summary>
+        public bool Shutdown(TimeSpan timeout)
+        {
+            _isShutdown = true;
+            _channel.Writer.TryComplete();
+            try
+            {
+                return _writerTask.Wait(timeout);
+            }
+            catch (AggregateException)
+            {
+                return true;
+            }
+        }
+
+        public void Dispose()
+        {
+            Shutdown(TimeSpan.FromSeconds(5));
+        }
+
+        private static AsyncLogSink CreateDefault()
+        {
+            var sink = new AsyncLogSink(Volatile.Read(ref _defaultOptions));
+            // Safety net for hosts that exit without unloading the plugin
+            AppDomain.CurrentDomain.ProcessExit += (sender, args) => sink.Shutdown(TimeSpan.FromSeconds(2));
+            return sink;
+        }
+
+        private void OnEntryDropped(LogEntry entry)
+        {
+            if (entry.FlushCompletion != null)
+            {
+                entry.FlushCompletion.TrySetResult(false);
+                return;
+            }
+            Interlocked.Increment(ref _droppedCount);
+        }
+
+        private async Task WriteLoopAsync()
+        {
+            var reader = _channel.Reader;
+            var batch = new List<LogEntry>(_options.MaxBatchSize);
+
+            try
+            {
+                while (await reader.WaitToReadAsync().ConfigureAwait(false))
+                {
+                    // Let a burst accumulate so one write and flush covers many entries
+                    if (_options.FlushInterval > TimeSpan.Zero && !_isShutdown)
+                    {
+                        await Task.Delay(_options.FlushInterval).ConfigureAwait(false);
+                    }
+
+                    while (reader.TryRead(out var entry))
+                    {
+                        batch.Add(entry);
+                        if (batch.Count == _options.MaxBatchSize)
+                        {
+                            WriteBatch(batch);
+                            batch.Clear();
+                        }
+                    }
+
+                    if (batch.Count > 0)
+                    {
+                        WriteBatch(batch);
+                        batch.Clear();
+                    }
+                }
+            }
+            finally
+            {
+                CloseFile();
+            }
+        }
+
+        private void WriteBatch(List<LogEntry> batch)
+        {
+            List<TaskCompletionSource<bool>>? flushes = null;
+
+            try
+            {
+                foreach (var entry in batch)
+                {
+                    if (entry.FlushCompletion != null)
+                    {
+                        (flushes ??= new List<TaskCompletionSource<bool>>()).Add(entry.FlushCompletion);
+                        continue;
+                    }
+
+                    WriteEntry(entry);
+                    Interlocked.Increment(ref _writtenCount);
+
+                    if (_options.EchoToCommandLine)
+                    {
+                        RhinoApp.WriteLine($"RhinoAI: {entry.Message}");
+                    }
+                }
+
+                var dropped = DroppedCount;
+                if (dropped != _reportedDropCount && _stream != null)
+                {
+                    WriteEntry(new LogEntry(DateTime.Now, LogLevel.Warning, nameof(AsyncLogSink),
+                        $"{dropped - _reportedDropCount} log entries dropped because the queue was full"));
+                    _reportedDropCount = dropped;
+                }
+
+                if (_stream != null)
+                {
+                    // One flush per batch rather than per message
+                    FlushFile();
+                    if (_stream.Length >= _options.MaxFileSizeBytes)
+                    {
+                        CloseFile();
+                    }
+                }
+
+                flushes?.ForEach(f => f.TrySetResult(true));
+            }
+            catch (Exception ex)
+            {
+                System.Diagnostics.Debug.WriteLine($"Failed to write to log file: {ex.Message}");
+                CloseFile();
+                flushes?.ForEach(f => f.TrySetResult(false));
+            }
+        }
+
+        private void OpenFile(DateTime timestamp)
+        {
+            if (_stream != null && timestamp.Date == _currentDate)
+            {
+                return;
+            }
+
+            CloseFile();
+            _currentDate = timestamp.Date;
+
+            var path = GetAvailableFilePath(_currentDate);
+            _stream = new FileStream(path, FileMode.Append, FileAccess.Write, FileShare.ReadWrite | FileShare.Delete,
+                bufferSize: 64 * 1024, FileOptions.SequentialScan);
+            if (_options.Format == LogFileFormat.Text)
+            {
+                _textWriter = new StreamWriter(_stream, new UTF8Encoding(false), bufferSize: 16 * 1024);
+            }
+            Volatile.Write(ref _currentFilePath, path);
+        }
+
+        /// <summary>
+        /// First file for the date that is still below the size limit: prefix_yyyyMMdd.log,
+        /// then prefix_yyyyMMdd_1.log, prefix_yyyyMMdd_2.log and so on
+        /// </summary>
+        private string GetAvailableFilePath(DateTime date)
+        {
+            var extension = _options.Format == LogFileFormat.JsonLines ? ".jsonl" : ".log";
+            for (int index = 0; ; index++)
+            {
+                var suffix = index == 0 ? string.Empty : $"_{index}";
+                var path = Path.Combine(_options.LogDirectory, $"{_options.FilePrefix}_{date:yyyyMMdd}{suffix}{extension}");
+                var file = new FileInfo(path);
+                if (!file.Exists || file.Length < _options.MaxFileSizeBytes)
+                {
+                    return path;
+                }
+            }
+        }
+
+        private void WriteEntry(LogEntry entry)
+        {
+            OpenFile(entry.Timestamp);
+
+            if (_textWriter != null)
+            {
+                WriteTextEntry(_textWriter, entry);
+            }
+            else
+            {
+                WriteJsonEntry(_stream!, entry);
+            }
+        }
+
+        private static void WriteTextEntry(TextWriter writer, LogEntry entry)
+        {
+            Span<char> timestamp = stackalloc char[32];
+            entry.Timestamp.TryFormat(timestamp, out var length, "yyyy-MM-dd HH:mm:ss.fff", CultureInfo.InvariantCulture);
+
+            writer.Write('[');
+            writer.Write(timestamp.Slice(0, length));
+            writer.Write("] [");
+            writer.Write(entry.Level.ToString());
+            writer.Write("] [");
+            writer.Write(entry.Category);
+            writer.Write("] ");
+            writer.WriteLine(entry.Message);
+        }
+
+        /// <summary>
+        /// Writes one JSON object per line: timestamp, level, category, message and any captured fields
+        /// </summary>
+        private void WriteJsonEntry(Stream stream, LogEntry entry)
+        {
+            var json = _jsonWriter!;
+            json.WriteStartObject();
+            json.WriteString(TimestampProperty, entry.Timestamp);
+            json.WriteString(LevelProperty, entry.Level.ToString());
+            json.WriteString(CategoryProperty, entry.Category);
+            json.WriteString(MessageProperty, entry.Message);
+
+            if (entry.Fields != null && entry.Fields.Count > 0)
+            {
+                json.WriteStartObject(FieldsProperty);
+                foreach (var field in entry.Fields)
+                {
+                    json.WritePropertyName(field.Key);
+                    WriteJsonValue(json, field.Value);
+                }
+                json.WriteEndObject();
+            }
+
+            json.WriteEndObject();
+            json.Flush();
+
+            stream.Write(_jsonBuffer!.WrittenSpan);
+            stream.WriteByte((byte)'\n');
+            _jsonBuffer.Clear();
+            json.Reset();
+        }
+
+        private static void WriteJsonValue(Utf8JsonWriter json, object? value)
+        {
+            switch (value)
+            {
+                case null:
+                    json.WriteNullValue();
+                    break;
+                case string text:
+                    json.WriteStringValue(text);
+                    break;
+                case bool flag:
+                    json.WriteBooleanValue(flag);
+                    break;
+                case int number:
+                    json.WriteNumberValue(number);
+                    break;
+                case long number:
+                    json.WriteNumberValue(number);
+                    break;
+                case double number when double.IsFinite(number):
+                    json.WriteNumberValue(number);
+                    break;
+                case float number when float.IsFinite(number):
+                    json.WriteNumberValue(number);
+                    break;
+                case decimal number:
+                    json.WriteNumberValue(number);
+                    break;
+                case DateTime time:
+                    json.WriteStringValue(time);
+                    break;
+                case TimeSpan duration:
+                    json.WriteNumberValue(duration.TotalMilliseconds);
+                    break;
+                case Guid id:
+                    json.WriteStringValue(id);
+                    break;
+                case IFormattable formattable:
+                    json.WriteStringValue(formattable.ToString(null, CultureInfo.InvariantCulture));
+                    break;
+                default:
+                    json.WriteStringValue(value.ToString());
+                    break;
+            }
+        }
+
+        private void FlushFile()
+        {
+            if (_textWriter != null)
+            {
+                _textWriter.Flush();
+            }
+            else
+            {
+                _stream?.Flush();
+            }
+        }
+
+        private void WriteSynchronously(LogEntry entry)
+        {
+            // The writer task owns the file until it has drained the queue
+            _writerTask.Wait(TimeSpan.FromSeconds(2));
+
+            lock (_fallbackLock)
+            {
+                try
+                {
+                    WriteEntry(entry);
+                    FlushFile();
+                    CloseFile();
+                }
+                catch (Exception ex)
+                {
+                    System.Diagnostics.Debug.WriteLine($"Failed to write to log file: {ex.Message}");
+                }
+            }
+        }
+
+        private void CloseFile()
+        {
+            try
+            {
+                // Disposing the text writer also closes the stream underneath it
+                if (_textWriter != null)
+                {
+                    _textWriter.Dispose();
+                }
+                else
+                {
+                    _stream?.Dispose();
+                }
+            }
+            catch (IOException)
+            {
+                // Nothing more can be done with a file that failed to close
+            }
+            _textWriter = null;
+            _stream = null;
+        }
+    }
+}
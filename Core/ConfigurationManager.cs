@@ -1,5 +1,6 @@
 using System;
 using System.Collections.Generic;
+using System.Globalization;
 using System.IO;
 using System.Security.Cryptography;
 using System.Text;
@@ -13,6 +14,9 @@ namespace RhinoAI.Core
     /// </summary>
     public class ConfigurationManager : IDisposable
     {
+        // Settings hold arbitrary values, so they stay on reflection; reuse one options instance for its metadata cache
+        private static readonly JsonSerializerOptions IndentedJsonOptions = new JsonSerializerOptions { WriteIndented = true };
+
         private readonly SimpleLogger _logger;
         private readonly string _configPath;
         private readonly string _encryptedConfigPath;
@@ -93,6 +97,16 @@ namespace RhinoAI.Core
                 ["MCP:ServerUrl"] = "http://localhost:5005/",
                 ["MCP:Port"] = "5005",
                 ["MCP:Enabled"] = "true",
+                ["MCP:AcceptConcurrency"] = "4",
+                ["MCP:MaxConcurrentRequests"] = "8",
+                ["MCP:QueueCapacity"] = "64",
+                ["MCP:RequestTimeoutSeconds"] = "60",
+                ["MCP:DrainTimeoutSeconds"] = "10",
+                ["MCP:MaxBatchSize"] = "1000",
+                ["MCP:EnableCompression"] = "true",
+                ["MCP:DeltaSceneSync"] = "true",
+                ["MCP:CompressRequests"] = "true",
+                ["MCP:CompressionThresholdBytes"] = "1024",
                 
                 // UI Settings
                 ["UI:Theme"] = "Auto",
@@ -103,6 +117,61 @@ namespace RhinoAI.Core
                 ["Processing:EnableRealTime"] = "true",
                 ["Processing:CacheResults"] = "true",
                 ["Processing:MaxCacheSize"] = "100",
+                ["Processing:SemanticCache"] = "true",
+                ["Processing:SemanticCacheMaxEntries"] = "500",
+                ["Processing:SemanticCacheTtlHours"] = "168",
+                ["Processing:SemanticCacheEmbeddings"] = "false",
+                ["Processing:SemanticCacheSimilarity"] = "0.92",
+                ["Processing:ProviderScheduling"] = "Sequential",
+                ["Processing:HedgePercentile"] = "95",
+                ["Processing:HedgeDelayMs"] = "2000",
+                ["Processing:LatencyMinSamples"] = "5",
+
+                // Scene Context History Settings
+                ["Context:HistoryDepth"] = "120",
+                ["Context:HistoryMemoryBudgetMB"] = "16",
+
+                // Real-time Assistance Settings
+                ["RealTime:DebounceMs"] = "250",
+                ["RealTime:MaxBatchDelayMs"] = "2000",
+                ["RealTime:MaxBatchSize"] = "5000",
+                ["RealTime:MaxAnalysisConcurrency"] = "4",
+                ["RealTime:MinIntervalMs"] = "2000",
+                ["RealTime:MaxIntervalMs"] = "60000",
+                ["RealTime:TargetDutyCycle"] = "0.02",
+
+                // Geometry Generation Settings
+                ["Geometry:InstancingThreshold"] = "1000",
+                ["Generative:MaxParallelism"] = "0",
+                ["Generative:VariantCacheSize"] = "256",
+
+                // Optimization Settings
+                ["Optimization:PopulationSize"] = "0",
+                ["Optimization:MaxGenerations"] = "200",
+                ["Optimization:MaxEvaluations"] = "5000",
+                ["Optimization:StagnationGenerations"] = "30",
+                ["Optimization:MaxParallelism"] = "0",
+
+                // Vision Capture Settings
+                ["Vision:MaxImageDimension"] = "1024",
+                ["Vision:ImageQuality"] = "Medium",
+                ["Vision:ChangeThreshold"] = "4",
+
+                // Logging Settings (read once, when the log file is opened)
+                ["Logging:Format"] = "Text",
+                ["Logging:OverflowPolicy"] = "DropOldest",
+                ["Logging:QueueCapacity"] = "10000",
+
+                // Performance Monitoring
+                ["Performance:SlowTraceThresholdMs"] = "1000",
+                
+                // HTTP Connection Pool Settings
+                ["Http:EnableHttp2"] = "true",
+                ["Http:MaxConnectionsPerServer"] = "10",
+                ["Http:Ollama:MaxConnectionsPerServer"] = "4",
+                ["Http:PooledConnectionLifetimeMinutes"] = "5",
+                ["Http:PooledConnectionIdleTimeoutSeconds"] = "90",
+                ["Http:ConnectTimeoutSeconds"] = "10",
                 
                 // Security Settings
                 ["Security:EncryptApiKeys"] = "true",
@@ -148,10 +217,7 @@ namespace RhinoAI.Core
                     }
                 }
 
-                var json = JsonSerializer.Serialize(regularSettings, new JsonSerializerOptions 
-                { 
-                    WriteIndented = true 
-                });
+                var json = JsonSerializer.Serialize(regularSettings, IndentedJsonOptions);
                 
                 File.WriteAllText(_configPath, json);
 
@@ -280,12 +346,19 @@ namespace RhinoAI.Core
         }
 
         /// <summary>
-        /// Get a setting value as double
+        /// Get a setting value as double. Stored text is parsed with the invariant culture ("0.02"), so a
+        /// machine whose culture uses "." as a group separator does not read it as 2.
         /// </summary>
         public double GetSetting(string key, double defaultValue)
         {
+            // Numbers set in code are used as they are rather than round-tripped through culture-specific text
+            if (_settings.TryGetValue(key, out var value) && value is double or float or int or long or decimal)
+            {
+                return Convert.ToDouble(value, CultureInfo.InvariantCulture);
+            }
+
             var stringValue = GetSetting(key);
-            return double.TryParse(stringValue, out var result) ? result : defaultValue;
+            return double.TryParse(stringValue, NumberStyles.Float, CultureInfo.InvariantCulture, out var result) ? result : defaultValue;
         }
 
         /// <summary>
@@ -1,23 +1,82 @@
 using System;
 using System.Collections.Generic;
+using System.Linq;
+using System.Threading;
 
 using RhinoAI.Integration;
 
 namespace RhinoAI.Core
 {
     /// <summary>
-    /// Manages the scene context for AI processing
+    /// Manages the scene context for AI processing. Past contexts are kept in a ring buffer
+    /// bounded by entry count and an estimated memory budget, can be looked up by id or by
+    /// time, and share unchanged arrays and property maps with the snapshot before them.
+    /// Any number of readers may query concurrently with a single writer.
     /// </summary>
     public class ContextManager
     {
         private readonly SimpleLogger _logger;
-        private readonly Dictionary<string, SceneContext> _contextHistory;
+        private readonly ContextHistoryOptions _options;
+        private readonly Func<DateTime> _clock;
+        private readonly ReaderWriterLockSlim _lock = new ReaderWriterLockSlim(LockRecursionPolicy.NoRecursion);
+
+        // Oldest entry at _start; entries are in timestamp order
+        private readonly ContextHistoryEntry[] _history;
+        private readonly Dictionary<string, ContextHistoryEntry> _historyById = new Dictionary<string, ContextHistoryEntry>();
+        private int _start;
+        private int _count;
+        private long _historyBytes;
+
         private SceneContext _currentContext;
+        private long _currentVersion;
 
-        public ContextManager(SimpleLogger logger)
+        public ContextManager(SimpleLogger logger, ContextHistoryOptions options = null, Func<DateTime>? clock = null)
         {
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
-            _contextHistory = new Dictionary<string, SceneContext>();
+            _options = options ?? new ContextHistoryOptions();
+            if (_options.MaxEntries < 1)
+                throw new ArgumentOutOfRangeException(nameof(options), "History must hold at least one entry");
+
+            _clock = clock ?? (() => DateTime.UtcNow);
+            _history = new ContextHistoryEntry[_options.MaxEntries];
+        }
+
+        /// <summary>
+        /// Number of contexts currently kept in the history
+        /// </summary>
+        public int HistoryCount
+        {
+            get
+            {
+                _lock.EnterReadLock();
+                try
+                {
+                    return _count;
+                }
+                finally
+                {
+                    _lock.ExitReadLock();
+                }
+            }
+        }
+
+        /// <summary>
+        /// Estimated bytes held by the history, counting shared data once
+        /// </summary>
+        public long HistoryEstimatedBytes
+        {
+            get
+            {
+                _lock.EnterReadLock();
+                try
+                {
+                    return _historyBytes;
+                }
+                finally
+                {
+                    _lock.ExitReadLock();
+                }
+            }
         }
 
         /// <summary>
@@ -31,11 +90,66 @@ namespace RhinoAI.Core
                 return;
             }
 
-            _currentContext = newContext;
-            var contextId = Guid.NewGuid().ToString();
-            _contextHistory[contextId] = newContext;
+            _lock.EnterWriteLock();
+            try
+            {
+                // A full context from a client without versioning invalidates any delta base
+                StoreContext(newContext, 0);
+            }
+            finally
+            {
+                _lock.ExitWriteLock();
+            }
+        }
+
+        /// <summary>
+        /// Version of the current context as assigned by the client that sent it; 0 when unversioned
+        /// </summary>
+        public long CurrentVersion
+        {
+            get
+            {
+                _lock.EnterReadLock();
+                try
+                {
+                    return _currentVersion;
+                }
+                finally
+                {
+                    _lock.ExitReadLock();
+                }
+            }
+        }
+
+        /// <summary>
+        /// Apply a scene delta. Fails, leaving the context unchanged, when the delta was computed
+        /// against a version other than the current one; a delta with BaseVersion 0 is a full
+        /// snapshot and always applies. <paramref name="currentVersion"/> is the version held afterwards.
+        /// </summary>
+        public bool TryApplyDelta(SceneContextDelta delta, out long currentVersion)
+        {
+            if (delta == null) throw new ArgumentNullException(nameof(delta));
 
-            _logger.LogInformation("Scene context updated. New context ID: {0}", contextId);
+            _lock.EnterWriteLock();
+            try
+            {
+                if (delta.BaseVersion != 0 && delta.BaseVersion != _currentVersion)
+                {
+                    _logger.LogWarning("Scene delta for version {0} rejected; current version is {1}", delta.BaseVersion, _currentVersion);
+                    currentVersion = _currentVersion;
+                    return false;
+                }
+
+                var baseContext = delta.BaseVersion == 0 ? null : _currentContext;
+                StoreContext(SceneContextDiff.Apply(baseContext, delta), delta.Version);
+
+                currentVersion = _currentVersion;
+                return true;
+            }
+            finally
+            {
+                _lock.ExitWriteLock();
+            }
         }
 
         /// <summary>
@@ -43,7 +157,15 @@ namespace RhinoAI.Core
         /// </summary>
         public SceneContext? GetCurrentContext()
         {
-            return _currentContext;
+            _lock.EnterReadLock();
+            try
+            {
+                return _currentContext;
+            }
+            finally
+            {
+                _lock.ExitReadLock();
+            }
         }
 
         /// <summary>
@@ -51,13 +173,277 @@ namespace RhinoAI.Core
         /// </summary>
         public SceneContext? GetContextById(string contextId)
         {
-            if (_contextHistory.TryGetValue(contextId, out var context))
+            _lock.EnterReadLock();
+            try
+            {
+                if (contextId != null && _historyById.TryGetValue(contextId, out var entry))
+                {
+                    return entry.Context;
+                }
+            }
+            finally
             {
-                return context;
+                _lock.ExitReadLock();
             }
 
             _logger.LogWarning("Context ID not found: {0}", contextId);
             return null;
         }
+
+        /// <summary>
+        /// The context that was current at <paramref name="timestamp"/> (UTC), or null if that
+        /// is before the oldest context still in the history
+        /// </summary>
+        public SceneContext? GetContextAsOf(DateTime timestamp)
+        {
+            _lock.EnterReadLock();
+            try
+            {
+                // Binary search for the last entry stored at or before the timestamp
+                int low = 0, high = _count - 1, found = -1;
+                while (low <= high)
+                {
+                    var mid = low + (high - low) / 2;
+                    if (EntryAt(mid).Timestamp <= timestamp)
+                    {
+                        found = mid;
+                        low = mid + 1;
+                    }
+                    else
+                    {
+                        high = mid - 1;
+                    }
+                }
+
+                return found >= 0 ? EntryAt(found).Context : null;
+            }
+            finally
+            {
+                _lock.ExitReadLock();
+            }
+        }
+
+        /// <summary>
+        /// Copy of the history, oldest first
+        /// </summary>
+        public IReadOnlyList<ContextHistoryEntry> GetHistory()
+        {
+            _lock.EnterReadLock();
+            try
+            {
+                return Enumerable.Range(0, _count).Select(EntryAt).ToList();
+            }
+            finally
+            {
+                _lock.ExitReadLock();
+            }
+        }
+
+        private ContextHistoryEntry EntryAt(int logicalIndex) => _history[(_start + logicalIndex) % _history.Length];
+
+        /// <summary>
+        /// Caller holds the write lock
+        /// </summary>
+        private void StoreContext(SceneContext context, long version)
+        {
+            var previous = _count > 0 ? EntryAt(_count - 1) : null;
+            var shared = ShareWith(context, previous?.Context);
+
+            // Timestamps never go backwards, so the ring stays sorted for GetContextAsOf
+            var timestamp = _clock();
+            if (previous != null && timestamp < previous.Timestamp)
+            {
+                timestamp = previous.Timestamp;
+            }
+
+            var entry = new ContextHistoryEntry(Guid.NewGuid().ToString(), version, timestamp, shared,
+                EstimateUnsharedBytes(shared, previous?.Context));
+
+            if (_count == _history.Length)
+            {
+                EvictOldest();
+            }
+            while (_count > 0 && _historyBytes + entry.EstimatedBytes > _options.MemoryBudgetBytes)
+            {
+                EvictOldest();
+            }
+
+            _history[(_start + _count) % _history.Length] = entry;
+            _count++;
+            _historyBytes += entry.EstimatedBytes;
+            _historyById[entry.Id] = entry;
+
+            _currentContext = shared;
+            _currentVersion = version;
+
+            _logger.LogDebug("Scene context updated. New context ID: {0}", entry.Id);
+        }
+
+        private void EvictOldest()
+        {
+            var oldest = _history[_start];
+            _history[_start] = null;
+            _start = (_start + 1) % _history.Length;
+            _count--;
+            _historyById.Remove(oldest.Id);
+
+            // Data the next entry shared with the evicted one is now only held by it
+            if (_count > 0)
+            {
+                var next = EntryAt(0);
+                var unshared = EstimateUnsharedBytes(next.Context, null);
+                _historyBytes += unshared - next.EstimatedBytes;
+                next.EstimatedBytes = unshared;
+            }
+            _historyBytes -= oldest.EstimatedBytes;
+        }
+
+        /// <summary>
+        /// Reuse the previous snapshot's arrays and property map wherever the new one has equal contents
+        /// </summary>
+        private static SceneContext ShareWith(SceneContext context, SceneContext previous)
+        {
+            if (previous == null) return context;
+
+            return new SceneContext
+            {
+                ObjectCount = context.ObjectCount,
+                ObjectTypes = SameItems(context.ObjectTypes, previous.ObjectTypes) ? previous.ObjectTypes : context.ObjectTypes,
+                BoundingBox = SameItems(context.BoundingBox, previous.BoundingBox) ? previous.BoundingBox : context.BoundingBox,
+                ActiveLayers = SameItems(context.ActiveLayers, previous.ActiveLayers) ? previous.ActiveLayers : context.ActiveLayers,
+                CustomProperties = SameProperties(context.CustomProperties, previous.CustomProperties)
+                    ? previous.CustomProperties
+                    : context.CustomProperties
+            };
+        }
+
+        private static bool SameItems<T>(T[] a, T[] b)
+        {
+            if (ReferenceEquals(a, b)) return true;
+            if (a == null || b == null) return false;
+            return a.SequenceEqual(b);
+        }
+
+        private static bool SameProperties(Dictionary<string, object> a, Dictionary<string, object> b)
+        {
+            if (ReferenceEquals(a, b)) return true;
+            if (a == null || b == null || a.Count != b.Count) return false;
+
+            foreach (var property in a)
+            {
+                if (!b.TryGetValue(property.Key, out var other) || !Equals(property.Value, other))
+                {
+                    return false;
+                }
+            }
+            return true;
+        }
+
+        /// <summary>
+        /// Rough managed size of the parts of <paramref name="context"/> not shared with <paramref name="previous"/>
+        /// </summary>
+        private static long EstimateUnsharedBytes(SceneContext context, SceneContext previous)
+        {
+            const int ObjectOverhead = 24;
+            long bytes = ObjectOverhead + 40;
+
+            if (!ReferenceEquals(context.ObjectTypes, previous?.ObjectTypes)) bytes += EstimateStrings(context.ObjectTypes);
+            if (!ReferenceEquals(context.ActiveLayers, previous?.ActiveLayers)) bytes += EstimateStrings(context.ActiveLayers);
+            if (!ReferenceEquals(context.BoundingBox, previous?.BoundingBox)) bytes += ObjectOverhead + 8L * (context.BoundingBox?.Length ?? 0);
+
+            if (context.CustomProperties != null && !ReferenceEquals(context.CustomProperties, previous?.CustomProperties))
+            {
+                bytes += 80;
+                foreach (var property in context.CustomProperties)
+                {
+                    bytes += 24 + EstimateString(property.Key) + EstimateValue(property.Value);
+                }
+            }
+
+            return bytes;
+        }
+
+        private static long EstimateStrings(string[] items)
+        {
+            if (items == null) return 0;
+
+            long bytes = 24 + 8L * items.Length;
+            foreach (var item in items)
+            {
+                bytes += EstimateString(item);
+            }
+            return bytes;
+        }
+
+        private static long EstimateString(string value) => value == null ? 0 : 22 + 2L * value.Length;
+
+        private static long EstimateValue(object value)
+        {
+            switch (value)
+            {
+                case null:
+                    return 0;
+                case string text:
+                    return EstimateString(text);
+                case System.Text.Json.JsonElement element:
+                    return 48 + 2L * element.GetRawText().Length;
+                case System.Collections.IDictionary dictionary:
+                    long bytes = 80;
+                    foreach (System.Collections.DictionaryEntry item in dictionary)
+                    {
+                        bytes += 24 + EstimateValue(item.Key) + EstimateValue(item.Value);
+                    }
+                    return bytes;
+                default:
+                    return 24;
+            }
+        }
+    }
+
+    /// <summary>
+    /// One scene context kept in the ContextManager history
+    /// </summary>
+    public class ContextHistoryEntry
+    {
+        public ContextHistoryEntry(string id, long version, DateTime timestamp, SceneContext context, long estimatedBytes)
+        {
+            Id = id;
+            Version = version;
+            Timestamp = timestamp;
+            Context = context;
+            EstimatedBytes = estimatedBytes;
+        }
+
+        public string Id { get; }
+        public long Version { get; }
+        public DateTime Timestamp { get; }
+        public SceneContext Context { get; }
+
+        /// <summary>Estimated bytes of data not shared with the entry before it</summary>
+        public long EstimatedBytes { get; internal set; }
+    }
+
+    /// <summary>
+    /// Bounds for the ContextManager history
+    /// </summary>
+    public class ContextHistoryOptions
+    {
+        /// <summary>Most contexts kept; the default covers ten minutes of 5-second updates</summary>
+        public int MaxEntries { get; set; } = 120;
+
+        /// <summary>Oldest contexts are evicted once the estimated history size exceeds this</summary>
+        public long MemoryBudgetBytes { get; set; } = 16L * 1024 * 1024;
+
+        /// <summary>
+        /// Read the Context:* settings
+        /// </summary>
+        public static ContextHistoryOptions FromConfiguration(ConfigurationManager configManager)
+        {
+            return new ContextHistoryOptions
+            {
+                MaxEntries = Math.Max(1, configManager.GetSetting("Context:HistoryDepth", 120)),
+                MemoryBudgetBytes = configManager.GetSetting("Context:HistoryMemoryBudgetMB", 16) * 1024L * 1024
+            };
+        }
     }
-} 
\ No newline at end of file
+}
@@ -0,0 +1,276 @@
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+using System.Linq;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// Turns optimization goals such as "minimize surface area", "maximize volume" or "fit the
+    /// envelope" into one scalar to minimize. Each goal names a measure and a direction; targets
+    /// (targetVolume, density, maxWeight, envelopeX/Y/Z) come from the design parameters and
+    /// replace the direction where they apply. Directional terms are relative to the starting
+    /// design, so each contributes about 1 at the start.
+    /// </summary>
+    public class DesignObjective
+    {
+        /// <summary>Weight of target and limit terms relative to plain minimize and maximize terms</summary>
+        private const double ConstraintWeight = 100.0;
+
+        private static readonly char[] ClauseSeparators = { ',', ';' };
+        private static readonly string[] MaximizeWords = { "max", "increase", "largest", "biggest", "greatest", "most", "more", "raise", "heavier" };
+        private static readonly string[] MinimizeWords = { "min", "reduce", "decrease", "smallest", "least", "less", "lower", "lighter" };
+
+        private readonly List<(string Name, Func<DesignMeasures, double> Term)> _terms = new List<(string, Func<DesignMeasures, double>)>();
+
+        private DesignObjective()
+        {
+        }
+
+        private enum GoalDirection
+        {
+            None,
+            Minimize,
+            Maximize
+        }
+
+        /// <summary>Names of the goals that were recognized, e.g. "maximize volume", "fit"</summary>
+        public IReadOnlyList<string> Terms => _terms.Select(t => t.Name).ToList();
+
+        public bool IsEmpty => _terms.Count == 0;
+
+        /// <summary>Whether any term reads SurfaceArea, which is the expensive measure for real geometry</summary>
+        public bool NeedsSurfaceArea { get; private set; }
+
+        /// <summary>
+        /// Build the objective for <paramref name="goals"/>. Goals may list several clauses
+        /// ("maximize volume and minimize area"); a clause without a direction takes the one before it.
+        /// </summary>
+        /// <exception cref="ArgumentException">A goal names no known measure, or a measure without a direction or target</exception>
+        public static DesignObjective FromGoals(IEnumerable<string> goals, IReadOnlyDictionary<string, object> targets, DesignMeasures initial)
+        {
+            var objective = new DesignObjective();
+            targets ??= new Dictionary<string, object>();
+
+            var problems = new List<string>();
+            foreach (var goal in goals ?? Enumerable.Empty<string>())
+            {
+                if (string.IsNullOrWhiteSpace(goal)) continue;
+
+                var direction = GoalDirection.None;
+                foreach (var clause in SplitClauses(goal))
+                {
+                    var words = clause.Split(' ', StringSplitOptions.RemoveEmptyEntries);
+                    var clauseDirection = GetDirection(words);
+                    if (clauseDirection != GoalDirection.None)
+                    {
+                        direction = clauseDirection;
+                    }
+
+                    if (!objective.AddTerms(clause, direction, targets, initial, problems))
+                    {
+                        problems.Add($"'{clause}' names no measure (volume, area, weight or fit)");
+                    }
+                }
+            }
+
+            if (problems.Count > 0)
+            {
+                throw new ArgumentException($"Cannot interpret optimization goals: {string.Join("; ", problems)}", nameof(goals));
+            }
+
+            return objective;
+        }
+
+        /// <summary>
+        /// Add the terms for one clause; false if it names no measure
+        /// </summary>
+        private bool AddTerms(string clause, GoalDirection direction, IReadOnlyDictionary<string, object> targets,
+            DesignMeasures initial, List<string> problems)
+        {
+            var added = false;
+
+            if (clause.Contains("volume"))
+            {
+                added = true;
+                var target = GetTarget(targets, "targetVolume");
+                if (target.HasValue)
+                {
+                    _terms.Add(("volume", m => ConstraintWeight * Square((m.Volume - target.Value) / target.Value)));
+                }
+                else if (!TryAddDirectional("volume", direction, m => m.Volume, initial.Volume))
+                {
+                    problems.Add("volume needs minimize, maximize or a targetVolume");
+                }
+            }
+
+            if (clause.Contains("area") || clause.Contains("surface"))
+            {
+                added = true;
+                if (TryAddDirectional("area", direction, m => m.SurfaceArea, initial.SurfaceArea))
+                {
+                    NeedsSurfaceArea = true;
+                }
+                else
+                {
+                    problems.Add("surface area needs minimize or maximize");
+                }
+            }
+
+            if (clause.Contains("weight") || clause.Contains("mass"))
+            {
+                added = true;
+                var density = GetTarget(targets, "density") ?? 1.0;
+                var maxWeight = GetTarget(targets, "maxWeight");
+                if (maxWeight.HasValue)
+                {
+                    _terms.Add(("weight limit", m => ConstraintWeight * Square(Math.Max(0, m.Volume * density - maxWeight.Value) / maxWeight.Value)));
+                }
+
+                if (!TryAddDirectional("weight", direction, m => m.Volume * density, initial.Volume * density) && !maxWeight.HasValue)
+                {
+                    problems.Add("weight needs minimize, maximize or a maxWeight");
+                }
+            }
+
+            if (clause.Contains("fit") || clause.Contains("bound") || clause.Contains("envelope"))
+            {
+                added = true;
+                var limits = new[] { GetTarget(targets, "envelopeX"), GetTarget(targets, "envelopeY"), GetTarget(targets, "envelopeZ") };
+                if (limits.Any(l => l.HasValue))
+                {
+                    _terms.Add(("fit", m =>
+                    {
+                        var sizes = new[] { m.SizeX, m.SizeY, m.SizeZ };
+                        var sum = 0.0;
+                        for (int axis = 0; axis < 3; axis++)
+                        {
+                            if (limits[axis] is double limit)
+                            {
+                                sum += Square((sizes[axis] - limit) / limit);
+                            }
+                        }
+                        return ConstraintWeight * sum;
+                    }));
+                }
+                else
+                {
+                    problems.Add("fit needs envelopeX, envelopeY or envelopeZ");
+                }
+            }
+
+            return added;
+        }
+
+        /// <summary>
+        /// Minimize value / reference, or for maximize reference / value, which also falls as the value grows
+        /// </summary>
+        private bool TryAddDirectional(string measure, GoalDirection direction, Func<DesignMeasures, double> value, double reference)
+        {
+            switch (direction)
+            {
+                case GoalDirection.Minimize:
+                    _terms.Add(($"minimize {measure}", m => Relative(value(m), reference)));
+                    return true;
+                case GoalDirection.Maximize:
+                    _terms.Add(($"maximize {measure}", m => Inverse(value(m), reference)));
+                    return true;
+                default:
+                    return false;
+            }
+        }
+
+        private static IEnumerable<string> SplitClauses(string goal)
+        {
+            var text = goal.ToLowerInvariant().Replace(" and ", ",").Replace(" while ", ",");
+            return text.Split(ClauseSeparators, StringSplitOptions.RemoveEmptyEntries)
+                .Select(clause => new string(clause.Select(c => char.IsLetter(c) ? c : ' ').ToArray()).Trim())
+                .Where(clause => clause.Length > 0);
+        }
+
+        private static GoalDirection GetDirection(string[] words)
+        {
+            foreach (var word in words)
+            {
+                // "maximize", "maximise", "maximum" and "max" all start with the short form
+                if (MaximizeWords.Any(w => w == word || (w.Length == 3 && word.StartsWith(w, StringComparison.Ordinal))))
+                    return GoalDirection.Maximize;
+                if (MinimizeWords.Any(w => w == word || (w.Length == 3 && word.StartsWith(w, StringComparison.Ordinal))))
+                    return GoalDirection.Minimize;
+            }
+            return GoalDirection.None;
+        }
+
+        public double Evaluate(DesignMeasures measures)
+        {
+            var total = 0.0;
+            foreach (var (_, term) in _terms)
+            {
+                total += term(measures);
+            }
+            return total;
+        }
+
+        private static double? GetTarget(IReadOnlyDictionary<string, object> targets, string key)
+        {
+            if (!targets.TryGetValue(key, out var value) || value == null) return null;
+
+            var number = Convert.ToDouble(value, CultureInfo.InvariantCulture);
+            return number > 0 ? number : null;
+        }
+
+        private static double Relative(double value, double reference) => reference > 0 ? value / reference : value;
+
+        private static double Inverse(double value, double reference)
+        {
+            if (value <= 0) return double.PositiveInfinity;
+            return (reference > 0 ? reference : 1.0) / value;
+        }
+
+        private static double Square(double value) => value * value;
+    }
+
+    /// <summary>
+    /// Size measures of a design that objectives are written against
+    /// </summary>
+    public readonly struct DesignMeasures
+    {
+        public DesignMeasures(double volume, double surfaceArea, double sizeX, double sizeY, double sizeZ)
+        {
+            Volume = volume;
+            SurfaceArea = surfaceArea;
+            SizeX = sizeX;
+            SizeY = sizeY;
+            SizeZ = sizeZ;
+        }
+
+        public double Volume { get; }
+        public double SurfaceArea { get; }
+
+        /// <summary>Bounding box extents</summary>
+        public double SizeX { get; }
+        public double SizeY { get; }
+        public double SizeZ { get; }
+
+        /// <summary>
+        /// Exact measures of the primitive a variant spec describes, without building geometry
+        /// </summary>
+        public static DesignMeasures FromSpec(VariantSpec spec)
+        {
+            switch (spec.Kind)
+            {
+                case "box":
+                    var s = spec.Size;
+                    return new DesignMeasures(s * s * s, 6 * s * s, s, s, s);
+                case "cylinder":
+                    var r = spec.Radius;
+                    var h = spec.Height;
+                    return new DesignMeasures(Math.PI * r * r * h, 2 * Math.PI * r * (r + h), 2 * r, 2 * r, h);
+                default:
+                    var radius = spec.Radius;
+                    return new DesignMeasures(4.0 / 3.0 * Math.PI * radius * radius * radius, 4 * Math.PI * radius * radius,
+                        2 * radius, 2 * radius, 2 * radius);
+            }
+        }
+    }
+}
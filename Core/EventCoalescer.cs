@@ -0,0 +1,173 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Threading;
+using System.Threading.Channels;
+using System.Threading.Tasks;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// Collects keys posted from event handlers and hands them to a single consumer in
+    /// de-duplicated batches. A batch is flushed once no key has arrived for the debounce
+    /// window, when it reaches MaxBatchSize, or after MaxDelay so a steady stream of events
+    /// cannot postpone processing forever. Batches never overlap.
+    /// </summary>
+    public class EventCoalescer<TKey> : IDisposable where TKey : notnull
+    {
+        private readonly Func<IReadOnlyCollection<TKey>, CancellationToken, Task> _processBatch;
+        private readonly SimpleLogger _logger;
+        private readonly EventCoalescerOptions _options;
+        private readonly Channel<TKey> _channel;
+        private readonly CancellationTokenSource _shutdown = new CancellationTokenSource();
+        private readonly Task _processingLoop;
+        private bool _disposed = false;
+
+        private long _postedEvents;
+        private long _processedKeys;
+        private long _processedBatches;
+
+        public EventCoalescer(Func<IReadOnlyCollection<TKey>, CancellationToken, Task> processBatch, SimpleLogger logger,
+            EventCoalescerOptions options = null)
+        {
+            _processBatch = processBatch ?? throw new ArgumentNullException(nameof(processBatch));
+            _logger = logger ?? throw new ArgumentNullException(nameof(logger));
+            _options = options ?? new EventCoalescerOptions();
+
+            _channel = Channel.CreateUnbounded<TKey>(new UnboundedChannelOptions { SingleReader = true });
+            _processingLoop = Task.Run(ProcessLoopAsync);
+        }
+
+        /// <summary>Keys posted so far, including duplicates</summary>
+        public long PostedEvents => Interlocked.Read(ref _postedEvents);
+
+        /// <summary>Distinct keys handed to the batch processor</summary>
+        public long ProcessedKeys => Interlocked.Read(ref _processedKeys);
+
+        public long ProcessedBatches => Interlocked.Read(ref _processedBatches);
+
+        /// <summary>
+        /// Queue a key; cheap and safe to call from any thread, including Rhino event handlers
+        /// </summary>
+        public bool Post(TKey key)
+        {
+            if (!_channel.Writer.TryWrite(key)) return false;
+
+            Interlocked.Increment(ref _postedEvents);
+            return true;
+        }
+
+        private async Task ProcessLoopAsync()
+        {
+            var reader = _channel.Reader;
+            var pending = new HashSet<TKey>();
+
+            try
+            {
+                while (await reader.WaitToReadAsync(_shutdown.Token))
+                {
+                    await CollectBatchAsync(reader, pending);
+
+                    var batch = pending.ToArray();
+                    pending.Clear();
+
+                    try
+                    {
+                        await _processBatch(batch, _shutdown.Token);
+                        Interlocked.Add(ref _processedKeys, batch.Length);
+                        Interlocked.Increment(ref _processedBatches);
+                    }
+                    catch (OperationCanceledException) when (_shutdown.IsCancellationRequested)
+                    {
+                        return;
+                    }
+                    catch (Exception ex)
+                    {
+                        _logger.LogError(ex, $"Failed to process a batch of {batch.Length} coalesced events");
+                    }
+                }
+            }
+            catch (OperationCanceledException) when (_shutdown.IsCancellationRequested)
+            {
+                // Disposed while waiting for events
+            }
+        }
+
+        /// <summary>
+        /// Drain keys into <paramref name="pending"/> until the stream goes quiet, the batch is full or the maximum delay passes
+        /// </summary>
+        private async Task CollectBatchAsync(ChannelReader<TKey> reader, HashSet<TKey> pending)
+        {
+            var started = Stopwatch.GetTimestamp();
+
+            while (true)
+            {
+                while (pending.Count < _options.MaxBatchSize && reader.TryRead(out var key))
+                {
+                    pending.Add(key);
+                }
+
+                var remaining = _options.MaxDelay - Stopwatch.GetElapsedTime(started);
+                if (pending.Count >= _options.MaxBatchSize || remaining <= TimeSpan.Zero)
+                {
+                    return;
+                }
+
+                using var quiet = CancellationTokenSource.CreateLinkedTokenSource(_shutdown.Token);
+                quiet.CancelAfter(remaining < _options.DebounceWindow ? remaining : _options.DebounceWindow);
+
+                try
+                {
+                    if (!await reader.WaitToReadAsync(quiet.Token))
+                    {
+                        return; // Completed; flush what we have
+                    }
+                }
+                catch (OperationCanceledException) when (!_shutdown.IsCancellationRequested)
+                {
+                    return; // Nothing arrived within the debounce window
+                }
+            }
+        }
+
+        public void Dispose()
+        {
+            if (_disposed) return;
+            _disposed = true;
+
+            // Pending keys are dropped: after disposal nobody is interested in their analysis
+            _channel.Writer.TryComplete();
+            _shutdown.Cancel();
+            _processingLoop.ContinueWith(_ => _shutdown.Dispose(), TaskScheduler.Default);
+        }
+    }
+
+    /// <summary>
+    /// Batching windows for EventCoalescer
+    /// </summary>
+    public class EventCoalescerOptions
+    {
+        /// <summary>A batch is flushed once no event has arrived for this long</summary>
+        public TimeSpan DebounceWindow { get; set; } = TimeSpan.FromMilliseconds(250);
+
+        /// <summary>Longest time the first event of a batch waits while events keep arriving</summary>
+        public TimeSpan MaxDelay { get; set; } = TimeSpan.FromSeconds(2);
+
+        /// <summary>Most distinct keys in one batch</summary>
+        public int MaxBatchSize { get; set; } = 5000;
+
+        /// <summary>
+        /// Read the RealTime:* settings
+        /// </summary>
+        public static EventCoalescerOptions FromConfiguration(ConfigurationManager configManager)
+        {
+            return new EventCoalescerOptions
+            {
+                DebounceWindow = TimeSpan.FromMilliseconds(configManager.GetSetting("RealTime:DebounceMs", 250)),
+                MaxDelay = TimeSpan.FromMilliseconds(configManager.GetSetting("RealTime:MaxBatchDelayMs", 2000)),
+                MaxBatchSize = configManager.GetSetting("RealTime:MaxBatchSize", 5000)
+            };
+        }
+    }
+}
@@ -0,0 +1,156 @@
+using System;
+using System.Threading;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// Lock-free latency histogram with logarithmic buckets (about 5% relative error)
+    /// covering 0.1ms to roughly an hour
+    /// </summary>
+    public class LatencyHistogram
+    {
+        private const double MinimumMilliseconds = 0.1;
+        private const double GrowthFactor = 1.05;
+        private static readonly double LogGrowth = Math.Log(GrowthFactor);
+        private static readonly int BucketCount = (int)Math.Ceiling(Math.Log(3_600_000 / MinimumMilliseconds) / LogGrowth) + 1;
+
+        private readonly long[] _buckets = new long[BucketCount];
+        private long _count;
+        private long _totalTicks;
+        private long _maxTicks;
+        private long _minTicks = long.MaxValue;
+
+        public long Count => Interlocked.Read(ref _count);
+
+        public TimeSpan Mean
+        {
+            get
+            {
+                var count = Count;
+                return count == 0 ? TimeSpan.Zero : TimeSpan.FromTicks(Interlocked.Read(ref _totalTicks) / count);
+            }
+        }
+
+        public TimeSpan Total => TimeSpan.FromTicks(Interlocked.Read(ref _totalTicks));
+
+        public TimeSpan Max => TimeSpan.FromTicks(Interlocked.Read(ref _maxTicks));
+
+        public TimeSpan Min
+        {
+            get
+            {
+                var ticks = Interlocked.Read(ref _minTicks);
+                return ticks == long.MaxValue ? TimeSpan.Zero : TimeSpan.FromTicks(ticks);
+            }
+        }
+
+        public void Record(TimeSpan latency)
+        {
+            var ticks = Math.Max(0, latency.Ticks);
+
+            Interlocked.Increment(ref _buckets[GetBucketIndex(latency.TotalMilliseconds)]);
+            Interlocked.Increment(ref _count);
+            Interlocked.Add(ref _totalTicks, ticks);
+
+            UpdateMax(ticks);
+            UpdateMin(ticks);
+        }
+
+        /// <summary>
+        /// Adds all samples recorded by another histogram to this one
+        /// </summary>
+        public void Add(LatencyHistogram other)
+        {
+            if (other == null) throw new ArgumentNullException(nameof(other));
+
+            var count = other.Count;
+            if (count == 0) return;
+
+            for (int i = 0; i < _buckets.Length; i++)
+            {
+                var bucket = Interlocked.Read(ref other._buckets[i]);
+                if (bucket != 0)
+                {
+                    Interlocked.Add(ref _buckets[i], bucket);
+                }
+            }
+            Interlocked.Add(ref _count, count);
+            Interlocked.Add(ref _totalTicks, Interlocked.Read(ref other._totalTicks));
+            UpdateMax(Interlocked.Read(ref other._maxTicks));
+            UpdateMin(Interlocked.Read(ref other._minTicks));
+        }
+
+        /// <summary>
+        /// Returns the latency at or below which the given percentage (0-100) of samples fall,
+        /// or TimeSpan.Zero when no samples have been recorded
+        /// </summary>
+        public TimeSpan GetPercentile(double percentile)
+        {
+            if (percentile < 0 || percentile > 100)
+                throw new ArgumentOutOfRangeException(nameof(percentile), "Percentile must be between 0 and 100");
+
+            var count = Count;
+            if (count == 0) return TimeSpan.Zero;
+
+            var target = Math.Max(1, (long)Math.Ceiling(count * percentile / 100.0));
+            long cumulative = 0;
+
+            for (int i = 0; i < _buckets.Length; i++)
+            {
+                cumulative += Interlocked.Read(ref _buckets[i]);
+                if (cumulative >= target)
+                {
+                    // Report the bucket's upper bound, capped at the largest observed value
+                    var upperBound = TimeSpan.FromMilliseconds(GetBucketUpperBound(i));
+                    return upperBound < Max ? upperBound : Max;
+                }
+            }
+
+            return Max;
+        }
+
+        public void Reset()
+        {
+            for (int i = 0; i < _buckets.Length; i++)
+            {
+                Interlocked.Exchange(ref _buckets[i], 0);
+            }
+            Interlocked.Exchange(ref _count, 0);
+            Interlocked.Exchange(ref _totalTicks, 0);
+            Interlocked.Exchange(ref _maxTicks, 0);
+            Interlocked.Exchange(ref _minTicks, long.MaxValue);
+        }
+
+        private void UpdateMax(long ticks)
+        {
+            var currentMax = Interlocked.Read(ref _maxTicks);
+            while (ticks > currentMax)
+            {
+                var observed = Interlocked.CompareExchange(ref _maxTicks, ticks, currentMax);
+                if (observed == currentMax) break;
+                currentMax = observed;
+            }
+        }
+
+        private void UpdateMin(long ticks)
+        {
+            var currentMin = Interlocked.Read(ref _minTicks);
+            while (ticks < currentMin)
+            {
+                var observed = Interlocked.CompareExchange(ref _minTicks, ticks, currentMin);
+                if (observed == currentMin) break;
+                currentMin = observed;
+            }
+        }
+
+        private static int GetBucketIndex(double milliseconds)
+        {
+            if (milliseconds <= MinimumMilliseconds) return 0;
+
+            var index = (int)Math.Ceiling(Math.Log(milliseconds / MinimumMilliseconds) / LogGrowth);
+            return Math.Min(index, BucketCount - 1);
+        }
+
+        private static double GetBucketUpperBound(int index) => MinimumMilliseconds * Math.Pow(GrowthFactor, index);
+    }
+}
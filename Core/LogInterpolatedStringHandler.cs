@@ -0,0 +1,186 @@
+using System;
+using System.Collections.Generic;
+using System.Runtime.CompilerServices;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// Builds a log message from an interpolated string only when the level is enabled. When it is
+    /// not, the compiler skips every Append call, so holes are neither evaluated nor formatted.
+    /// If the sink records structured output, each hole is also captured as a field named after
+    /// its expression, e.g. {input} becomes the field "input".
+    /// </summary>
+    [InterpolatedStringHandler]
+    public ref struct LogInterpolatedStringHandler
+    {
+        private DefaultInterpolatedStringHandler _message;
+        private List<KeyValuePair<string, object?>>? _fields;
+
+        public LogInterpolatedStringHandler(int literalLength, int formattedCount, SimpleLogger logger, LogLevel level, out bool isEnabled)
+        {
+            IsEnabled = isEnabled = logger.IsEnabled(level);
+            if (isEnabled)
+            {
+                _message = new DefaultInterpolatedStringHandler(literalLength, formattedCount);
+                _fields = logger.CapturesFields && formattedCount > 0
+                    ? new List<KeyValuePair<string, object?>>(formattedCount)
+                    : null;
+            }
+            else
+            {
+                _message = default;
+                _fields = null;
+            }
+        }
+
+        public bool IsEnabled { get; }
+
+        internal IReadOnlyList<KeyValuePair<string, object?>>? Fields => _fields;
+
+        public void AppendLiteral(string value) => _message.AppendLiteral(value);
+
+        public void AppendFormatted<T>(T value, string? format = null, [CallerArgumentExpression("value")] string name = "")
+        {
+            _message.AppendFormatted(value, format);
+            _fields?.Add(new KeyValuePair<string, object?>(name, value));
+        }
+
+        public void AppendFormatted<T>(T value, int alignment, string? format = null, [CallerArgumentExpression("value")] string name = "")
+        {
+            _message.AppendFormatted(value, alignment, format);
+            _fields?.Add(new KeyValuePair<string, object?>(name, value));
+        }
+
+        public void AppendFormatted(ReadOnlySpan<char> value, [CallerArgumentExpression("value")] string name = "")
+        {
+            _message.AppendFormatted(value);
+            _fields?.Add(new KeyValuePair<string, object?>(name, value.ToString()));
+        }
+
+        internal string ToStringAndClear() => _message.ToStringAndClear();
+    }
+
+    /// <summary>
+    /// Interpolated message for SimpleLogger.LogDebug
+    /// </summary>
+    [InterpolatedStringHandler]
+    public ref struct LogDebugInterpolatedStringHandler
+    {
+        private LogInterpolatedStringHandler _handler;
+
+        public LogDebugInterpolatedStringHandler(int literalLength, int formattedCount, SimpleLogger logger, out bool isEnabled)
+        {
+            _handler = new LogInterpolatedStringHandler(literalLength, formattedCount, logger, LogLevel.Debug, out isEnabled);
+        }
+
+        public void AppendLiteral(string value) => _handler.AppendLiteral(value);
+
+        public void AppendFormatted<T>(T value, string? format = null, [CallerArgumentExpression("value")] string name = "") =>
+            _handler.AppendFormatted(value, format, name);
+
+        public void AppendFormatted<T>(T value, int alignment, string? format = null, [CallerArgumentExpression("value")] string name = "") =>
+            _handler.AppendFormatted(value, alignment, format, name);
+
+        public void AppendFormatted(ReadOnlySpan<char> value, [CallerArgumentExpression("value")] string name = "") =>
+            _handler.AppendFormatted(value, name);
+
+        internal bool IsEnabled => _handler.IsEnabled;
+
+        internal IReadOnlyList<KeyValuePair<string, object?>>? Fields => _handler.Fields;
+
+        internal string ToStringAndClear() => _handler.ToStringAndClear();
+    }
+
+    /// <summary>
+    /// Interpolated message for SimpleLogger.LogInformation
+    /// </summary>
+    [InterpolatedStringHandler]
+    public ref struct LogInformationInterpolatedStringHandler
+    {
+        private LogInterpolatedStringHandler _handler;
+
+        public LogInformationInterpolatedStringHandler(int literalLength, int formattedCount, SimpleLogger logger, out bool isEnabled)
+        {
+            _handler = new LogInterpolatedStringHandler(literalLength, formattedCount, logger, LogLevel.Information, out isEnabled);
+        }
+
+        public void AppendLiteral(string value) => _handler.AppendLiteral(value);
+
+        public void AppendFormatted<T>(T value, string? format = null, [CallerArgumentExpression("value")] string name = "") =>
+            _handler.AppendFormatted(value, format, name);
+
+        public void AppendFormatted<T>(T value, int alignment, string? format = null, [CallerArgumentExpression("value")] string name = "") =>
+            _handler.AppendFormatted(value, alignment, format, name);
+
+        public void AppendFormatted(ReadOnlySpan<char> value, [CallerArgumentExpression("value")] string name = "") =>
+            _handler.AppendFormatted(value, name);
+
+        internal bool IsEnabled => _handler.IsEnabled;
+
+        internal IReadOnlyList<KeyValuePair<string, object?>>? Fields => _handler.Fields;
+
+        internal string ToStringAndClear() => _handler.ToStringAndClear();
+    }
+
+    /// <summary>
+    /// Interpolated message for SimpleLogger.LogWarning
+    /// </summary>
+    [InterpolatedStringHandler]
+    public ref struct LogWarningInterpolatedStringHandler
+    {
+        private LogInterpolatedStringHandler _handler;
+
+        public LogWarningInterpolatedStringHandler(int literalLength, int formattedCount, SimpleLogger logger, out bool isEnabled)
+        {
+            _handler = new LogInterpolatedStringHandler(literalLength, formattedCount, logger, LogLevel.Warning, out isEnabled);
+        }
+
+        public void AppendLiteral(string value) => _handler.AppendLiteral(value);
+
+        public void AppendFormatted<T>(T value, string? format = null, [CallerArgumentExpression("value")] string name = "") =>
+            _handler.AppendFormatted(value, format, name);
+
+        public void AppendFormatted<T>(T value, int alignment, string? format = null, [CallerArgumentExpression("value")] string name = "") =>
+            _handler.AppendFormatted(value, alignment, format, name);
+
+        public void AppendFormatted(ReadOnlySpan<char> value, [CallerArgumentExpression("value")] string name = "") =>
+            _handler.AppendFormatted(value, name);
+
+        internal bool IsEnabled => _handler.IsEnabled;
+
+        internal IReadOnlyList<KeyValuePair<string, object?>>? Fields => _handler.Fields;
+
+        internal string ToStringAndClear() => _handler.ToStringAndClear();
+    }
+
+    /// <summary>
+    /// Interpolated message for SimpleLogger.LogError
+    /// </summary>
+    [InterpolatedStringHandler]
+    public ref struct LogErrorInterpolatedStringHandler
+    {
+        private LogInterpolatedStringHandler _handler;
+
+        public LogErrorInterpolatedStringHandler(int literalLength, int formattedCount, SimpleLogger logger, out bool isEnabled)
+        {
+            _handler = new LogInterpolatedStringHandler(literalLength, formattedCount, logger, LogLevel.Error, out isEnabled);
+        }
+
+        public void AppendLiteral(string value) => _handler.AppendLiteral(value);
+
+        public void AppendFormatted<T>(T value, string? format = null, [CallerArgumentExpression("value")] string name = "") =>
+            _handler.AppendFormatted(value, format, name);
+
+        public void AppendFormatted<T>(T value, int alignment, string? format = null, [CallerArgumentExpression("value")] string name = "") =>
+            _handler.AppendFormatted(value, alignment, format, name);
+
+        public void AppendFormatted(ReadOnlySpan<char> value, [CallerArgumentExpression("value")] string name = "") =>
+            _handler.AppendFormatted(value, name);
+
+        internal bool IsEnabled => _handler.IsEnabled;
+
+        internal IReadOnlyList<KeyValuePair<string, object?>>? Fields => _handler.Fields;
+
+        internal string ToStringAndClear() => _handler.ToStringAndClear();
+    }
+}
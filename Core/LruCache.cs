@@ -0,0 +1,209 @@
+using System;
+using System.Collections.Generic;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// Thread-safe, size-bounded LRU cache with per-entry time-to-live
+    /// </summary>
+    public class LruCache<TKey, TValue> where TKey : notnull
+    {
+        private readonly Dictionary<TKey, LinkedListNode<CacheEntry>> _entries;
+        private readonly LinkedList<CacheEntry> _recency;
+        private readonly object _lockObject = new object();
+        private readonly Func<DateTime> _clock;
+
+        private long _hits;
+        private long _misses;
+        private long _evictions;
+        private long _expirations;
+
+        public LruCache(int capacity, TimeSpan defaultTimeToLive, Func<DateTime>? clock = null)
+        {
+            if (capacity < 0)
+                throw new ArgumentOutOfRangeException(nameof(capacity), "Capacity cannot be negative");
+            if (defaultTimeToLive <= TimeSpan.Zero)
+                throw new ArgumentOutOfRangeException(nameof(defaultTimeToLive), "Time-to-live must be positive");
+
+            Capacity = capacity;
+            DefaultTimeToLive = defaultTimeToLive;
+            _clock = clock ?? (() => DateTime.UtcNow);
+            _entries = new Dictionary<TKey, LinkedListNode<CacheEntry>>(capacity);
+            _recency = new LinkedList<CacheEntry>();
+        }
+
+        /// <summary>
+        /// Maximum number of entries; a capacity of zero disables caching
+        /// </summary>
+        public int Capacity { get; }
+
+        public TimeSpan DefaultTimeToLive { get; }
+
+        public int Count
+        {
+            get
+            {
+                lock (_lockObject)
+                {
+                    return _entries.Count;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Looks up a live entry and marks it as most recently used
+        /// </summary>
+        public bool TryGet(TKey key, out TValue value)
+        {
+            lock (_lockObject)
+            {
+                if (_entries.TryGetValue(key, out var node))
+                {
+                    if (node.Value.ExpiryTime > _clock())
+                    {
+                        _recency.Remove(node);
+                        _recency.AddFirst(node);
+                        _hits++;
+                        value = node.Value.Value;
+                        return true;
+                    }
+
+                    RemoveNode(node);
+                    _expirations++;
+                }
+
+                _misses++;
+                value = default!;
+                return false;
+            }
+        }
+
+        /// <summary>
+        /// Adds or replaces an entry, evicting the least recently used entry when full
+        /// </summary>
+        public void Set(TKey key, TValue value, TimeSpan? timeToLive = null)
+        {
+            if (Capacity == 0) return;
+
+            lock (_lockObject)
+            {
+                var expiryTime = _clock() + (timeToLive ?? DefaultTimeToLive);
+
+                if (_entries.TryGetValue(key, out var existing))
+                {
+                    existing.Value.Value = value;
+                    existing.Value.ExpiryTime = expiryTime;
+                    _recency.Remove(existing);
+                    _recency.AddFirst(existing);
+                    return;
+                }
+
+                if (_entries.Count >= Capacity)
+                {
+                    RemoveExpiredEntries();
+                }
+
+                while (_entries.Count >= Capacity)
+                {
+                    RemoveNode(_recency.Last!);
+                    _evictions++;
+                }
+
+                var node = new LinkedListNode<CacheEntry>(new CacheEntry(key, value, expiryTime));
+                _recency.AddFirst(node);
+                _entries[key] = node;
+            }
+        }
+
+        public bool Remove(TKey key)
+        {
+            lock (_lockObject)
+            {
+                if (!_entries.TryGetValue(key, out var node)) return false;
+
+                RemoveNode(node);
+                return true;
+            }
+        }
+
+        /// <summary>
+        /// Removes all entries; statistics are preserved
+        /// </summary>
+        public void Clear()
+        {
+            lock (_lockObject)
+            {
+                _entries.Clear();
+                _recency.Clear();
+            }
+        }
+
+        public CacheStatistics GetStatistics()
+        {
+            lock (_lockObject)
+            {
+                return new CacheStatistics
+                {
+                    Hits = _hits,
+                    Misses = _misses,
+                    Evictions = _evictions,
+                    Expirations = _expirations,
+                    Count = _entries.Count,
+                    Capacity = Capacity
+                };
+            }
+        }
+
+        private void RemoveExpiredEntries()
+        {
+            var now = _clock();
+            var node = _recency.Last;
+
+            while (node != null)
+            {
+                var previous = node.Previous;
+                if (node.Value.ExpiryTime <= now)
+                {
+                    RemoveNode(node);
+                    _expirations++;
+                }
+                node = previous;
+            }
+        }
+
+        private void RemoveNode(LinkedListNode<CacheEntry> node)
+        {
+            _recency.Remove(node);
+            _entries.Remove(node.Value.Key);
+        }
+
+        private sealed class CacheEntry
+        {
+            public CacheEntry(TKey key, TValue value, DateTime expiryTime)
+            {
+                Key = key;
+                Value = value;
+                ExpiryTime = expiryTime;
+            }
+
+            public TKey Key { get; }
+            public TValue Value { get; set; }
+            public DateTime ExpiryTime { get; set; }
+        }
+    }
+
+    /// <summary>
+    /// Snapshot of cache counters
+    /// </summary>
+    public class CacheStatistics
+    {
+        public long Hits { get; set; }
+        public long Misses { get; set; }
+        public long Evictions { get; set; }
+        public long Expirations { get; set; }
+        public int Count { get; set; }
+        public int Capacity { get; set; }
+
+        public double HitRatio => Hits + Misses > 0 ? (double)Hits / (Hits + Misses) : 0.0;
+    }
+}
@@ -0,0 +1,532 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// Minimizes an objective over a box of named parameters with CMA-ES (covariance matrix
+    /// adaptation evolution strategy, Hansen 2016 tutorial). Design parameter spaces are small,
+    /// so the full covariance matrix is kept and decomposed every generation. Each generation's
+    /// candidates are evaluated as one parallel batch; parameter vectors that were already
+    /// evaluated are answered from a cache, which matters once integer parameters or clamping
+    /// at a bound make candidates repeat. The search works in coordinates scaled
+    /// to [0, 1] per parameter, so step sizes do not depend on parameter units.
+    /// </summary>
+    public class ParameterOptimizer
+    {
+        private readonly ParameterOptimizerOptions _options;
+
+        public ParameterOptimizer(ParameterOptimizerOptions options = null)
+        {
+            _options = options ?? new ParameterOptimizerOptions();
+        }
+
+        /// <summary>
+        /// Find the parameter values with the lowest objective. The objective receives values in
+        /// <paramref name="parameters"/> order and must be safe to call from several threads at once.
+        /// </summary>
+        public OptimizationResult Minimize(IReadOnlyList<ParameterRange> parameters, Func<double[], double> objective,
+            CancellationToken cancellationToken = default)
+        {
+            if (parameters == null) throw new ArgumentNullException(nameof(parameters));
+            if (objective == null) throw new ArgumentNullException(nameof(objective));
+            if (parameters.Count == 0) throw new ArgumentException("At least one parameter is required", nameof(parameters));
+            foreach (var parameter in parameters)
+            {
+                if (!(parameter.Max > parameter.Min))
+                    throw new ArgumentException($"Parameter '{parameter.Name}' needs Max greater than Min", nameof(parameters));
+            }
+
+            var n = parameters.Count;
+            var lambda = _options.PopulationSize > 0 ? Math.Max(2, _options.PopulationSize) : 4 + (int)(3 * Math.Log(n));
+            var mu = lambda / 2;
+            if (_options.MaxEvaluations < lambda)
+                throw new InvalidOperationException($"MaxEvaluations ({_options.MaxEvaluations}) must be at least the population size ({lambda})");
+
+            // Recombination weights and the learning rates that follow from them
+            var weights = new double[mu];
+            for (int i = 0; i < mu; i++)
+            {
+                weights[i] = Math.Log(mu + 0.5) - Math.Log(i + 1);
+            }
+            var weightSum = weights.Sum();
+            for (int i = 0; i < mu; i++)
+            {
+                weights[i] /= weightSum;
+            }
+            var muEff = 1.0 / weights.Sum(w => w * w);
+
+            var cs = (muEff + 2) / (n + muEff + 5);
+            var ds = 1 + 2 * Math.Max(0, Math.Sqrt((muEff - 1) / (n + 1)) - 1) + cs;
+            var cc = (4 + muEff / n) / (n + 4 + 2 * muEff / n);
+            var c1 = 2 / ((n + 1.3) * (n + 1.3) + muEff);
+            var cMu = Math.Min(1 - c1, 2 * (muEff - 2 + 1 / muEff) / ((n + 2) * (n + 2) + muEff));
+            var chiN = Math.Sqrt(n) * (1 - 1.0 / (4 * n) + 1.0 / (21.0 * n * n));
+
+            var random = _options.Seed.HasValue ? new Random(_options.Seed.Value) : new Random();
+            var mean = parameters.Select(p => Normalize(p, p.Initial ?? (p.Min + p.Max) / 2)).ToArray();
+            var sigma = _options.InitialStepSize;
+            var covariance = new double[n, n];
+            var basis = new double[n, n];
+            var scales = new double[n];
+            for (int d = 0; d < n; d++)
+            {
+                covariance[d, d] = 1;
+                basis[d, d] = 1;
+                scales[d] = 1;
+            }
+            var pathSigma = new double[n];
+            var pathC = new double[n];
+
+            var cache = new Dictionary<ParameterVector, double>();
+            var result = new OptimizationResult { BestValue = double.PositiveInfinity };
+            var lastImprovementGeneration = 0;
+            var lastImprovementValue = double.PositiveInfinity;
+
+            // The starting point is the first best result, so there is one even if no generation runs
+            // or every candidate scores +infinity
+            var start = new[] { mean.Select((m, d) => Normalize(parameters[d], Denormalize(parameters[d], m))).ToArray() };
+            var startValue = new double[1];
+            EvaluateBatch(parameters, start, startValue, objective, cache, result, cancellationToken);
+            result.BestValue = startValue[0];
+            result.BestParameters = parameters.Select((p, d) => Denormalize(p, start[0][d])).ToArray();
+            if (result.BestValue <= _options.TargetValue)
+            {
+                result.StopReason = OptimizationStopReason.TargetReached;
+                return result;
+            }
+
+            var candidates = new double[lambda][];
+            var steps = new double[lambda][];
+            var values = new double[lambda];
+            var order = new int[lambda];
+
+            while (true)
+            {
+                cancellationToken.ThrowIfCancellationRequested();
+
+                if (result.Generations >= _options.MaxGenerations)
+                {
+                    result.StopReason = OptimizationStopReason.MaxGenerations;
+                    break;
+                }
+                if (result.Evaluations + lambda > _options.MaxEvaluations)
+                {
+                    result.StopReason = OptimizationStopReason.MaxEvaluations;
+                    break;
+                }
+
+                // Sample x = mean + sigma * B * D * z, then repair candidates outside [0, 1] by clamping;
+                // the repaired step drives the update
+                var z = new double[n];
+                for (int k = 0; k < lambda; k++)
+                {
+                    for (int d = 0; d < n; d++)
+                    {
+                        z[d] = scales[d] * NextGaussian(random);
+                    }
+
+                    var x = new double[n];
+                    var y = new double[n];
+                    for (int d = 0; d < n; d++)
+                    {
+                        var step = 0.0;
+                        for (int e = 0; e < n; e++)
+                        {
+                            step += basis[d, e] * z[e];
+                        }
+                        x[d] = Normalize(parameters[d], Denormalize(parameters[d], mean[d] + sigma * step));
+                        y[d] = (x[d] - mean[d]) / sigma;
+                    }
+                    candidates[k] = x;
+                    steps[k] = y;
+                }
+
+                EvaluateBatch(parameters, candidates, values, objective, cache, result, cancellationToken);
+                result.Generations++;
+
+                for (int k = 0; k < lambda; k++)
+                {
+                    order[k] = k;
+                }
+                Array.Sort(order, (a, b) => values[a].CompareTo(values[b]));
+
+                if (values[order[0]] < result.BestValue)
+                {
+                    result.BestValue = values[order[0]];
+                    result.BestParameters = parameters.Select((p, d) => Denormalize(p, candidates[order[0]][d])).ToArray();
+                }
+                result.BestValueHistory.Add(result.BestValue);
+
+                if (result.BestValue <= _options.TargetValue)
+                {
+                    result.StopReason = OptimizationStopReason.TargetReached;
+                    break;
+                }
+
+                if (lastImprovementValue - result.BestValue > _options.FunctionTolerance)
+                {
+                    lastImprovementValue = result.BestValue;
+                    lastImprovementGeneration = result.Generations;
+                }
+                else if (result.Generations - lastImprovementGeneration >= _options.StagnationGenerations)
+                {
+                    result.StopReason = OptimizationStopReason.Stagnated;
+                    break;
+                }
+
+                // Move the mean to the weighted average of the best mu candidates
+                var meanStep = new double[n];
+                for (int i = 0; i < mu; i++)
+                {
+                    var y = steps[order[i]];
+                    for (int d = 0; d < n; d++)
+                    {
+                        meanStep[d] += weights[i] * y[d];
+                    }
+                }
+                for (int d = 0; d < n; d++)
+                {
+                    mean[d] += sigma * meanStep[d];
+                }
+
+                // Cumulative step-size adaptation, with the path whitened by C^-1/2 = B * D^-1 * B^T
+                var whitened = new double[n];
+                for (int e = 0; e < n; e++)
+                {
+                    var projection = 0.0;
+                    for (int d = 0; d < n; d++)
+                    {
+                        projection += basis[d, e] * meanStep[d];
+                    }
+                    projection /= scales[e];
+                    for (int d = 0; d < n; d++)
+                    {
+                        whitened[d] += basis[d, e] * projection;
+                    }
+                }
+
+                var pathSigmaNorm = 0.0;
+                var csFactor = Math.Sqrt(cs * (2 - cs) * muEff);
+                for (int d = 0; d < n; d++)
+                {
+                    pathSigma[d] = (1 - cs) * pathSigma[d] + csFactor * whitened[d];
+                    pathSigmaNorm += pathSigma[d] * pathSigma[d];
+                }
+                pathSigmaNorm = Math.Sqrt(pathSigmaNorm);
+
+                var hSigma = pathSigmaNorm / Math.Sqrt(1 - Math.Pow(1 - cs, 2 * result.Generations)) < (1.4 + 2.0 / (n + 1)) * chiN;
+                var ccFactor = Math.Sqrt(cc * (2 - cc) * muEff);
+                for (int d = 0; d < n; d++)
+                {
+                    pathC[d] = (1 - cc) * pathC[d] + (hSigma ? ccFactor * meanStep[d] : 0);
+                }
+
+                // Rank-one and rank-mu updates of the covariance
+                var keep = 1 - c1 - cMu + (hSigma ? 0 : c1 * cc * (2 - cc));
+                for (int d = 0; d < n; d++)
+                {
+                    for (int e = 0; e <= d; e++)
+                    {
+                        var rankMu = 0.0;
+                        for (int i = 0; i < mu; i++)
+                        {
+                            var y = steps[order[i]];
+                            rankMu += weights[i] * y[d] * y[e];
+                        }
+
+                        var value = keep * covariance[d, e] + c1 * pathC[d] * pathC[e] + cMu * rankMu;
+                        covariance[d, e] = value;
+                        covariance[e, d] = value;
+                    }
+                }
+
+                SymmetricEigen(covariance, basis, scales);
+                var maxDeviation = 0.0;
+                for (int d = 0; d < n; d++)
+                {
+                    scales[d] = Math.Sqrt(Math.Max(scales[d], 1e-300));
+                    maxDeviation = Math.Max(maxDeviation, scales[d]);
+                }
+
+                sigma *= Math.Exp(Math.Min(1.0, (cs / ds) * (pathSigmaNorm / chiN - 1)));
+
+                if (sigma * maxDeviation < _options.StepTolerance)
+                {
+                    result.StopReason = OptimizationStopReason.Converged;
+                    break;
+                }
+            }
+
+            return result;
+        }
+
+        /// <summary>
+        /// Fill <paramref name="values"/> for every candidate, evaluating only vectors not seen before
+        /// </summary>
+        private void EvaluateBatch(IReadOnlyList<ParameterRange> parameters, double[][] candidates, double[] values,
+            Func<double[], double> objective, Dictionary<ParameterVector, double> cache, OptimizationResult result,
+            CancellationToken cancellationToken)
+        {
+            var keys = new ParameterVector[candidates.Length];
+            var pending = new List<ParameterVector>();
+            var pendingSet = new HashSet<ParameterVector>();
+
+            for (int k = 0; k < candidates.Length; k++)
+            {
+                keys[k] = new ParameterVector(parameters.Select((p, d) => Denormalize(p, candidates[k][d])).ToArray());
+                if (cache.ContainsKey(keys[k]) || !pendingSet.Add(keys[k]))
+                {
+                    result.CacheHits++;
+                }
+                else
+                {
+                    pending.Add(keys[k]);
+                }
+            }
+
+            var pendingValues = new double[pending.Count];
+            var options = new ParallelOptions
+            {
+                MaxDegreeOfParallelism = _options.MaxParallelism > 0 ? _options.MaxParallelism : Environment.ProcessorCount,
+                CancellationToken = cancellationToken
+            };
+            Parallel.For(0, pending.Count, options, i =>
+            {
+                var value = objective((double[])pending[i].Values.Clone());
+                pendingValues[i] = double.IsNaN(value) ? double.PositiveInfinity : value;
+            });
+
+            for (int i = 0; i < pending.Count; i++)
+            {
+                cache[pending[i]] = pendingValues[i];
+            }
+            result.Evaluations += pending.Count;
+
+            for (int k = 0; k < candidates.Length; k++)
+            {
+                values[k] = cache[keys[k]];
+            }
+        }
+
+        private static double Normalize(ParameterRange parameter, double value)
+        {
+            return (value - parameter.Min) / (parameter.Max - parameter.Min);
+        }
+
+        /// <summary>
+        /// Back to parameter units, clamped to the range and rounded for integer parameters
+        /// </summary>
+        private static double Denormalize(ParameterRange parameter, double normalized)
+        {
+            var value = parameter.Min + Math.Clamp(normalized, 0, 1) * (parameter.Max - parameter.Min);
+            return parameter.IsInteger ? Math.Clamp(Math.Round(value), Math.Ceiling(parameter.Min), Math.Floor(parameter.Max)) : value;
+        }
+
+        /// <summary>
+        /// Eigenvectors (columns of <paramref name="vectors"/>) and eigenvalues of a symmetric matrix by cyclic Jacobi rotations
+        /// </summary>
+        private static void SymmetricEigen(double[,] matrix, double[,] vectors, double[] values)
+        {
+            var n = values.Length;
+            var a = (double[,])matrix.Clone();
+            for (int i = 0; i < n; i++)
+            {
+                for (int j = 0; j < n; j++)
+                {
+                    vectors[i, j] = i == j ? 1 : 0;
+                }
+            }
+
+            for (int sweep = 0; sweep < 50; sweep++)
+            {
+                var offDiagonal = 0.0;
+                for (int p = 0; p < n; p++)
+                {
+                    for (int q = p + 1; q < n; q++)
+                    {
+                        offDiagonal += a[p, q] * a[p, q];
+                    }
+                }
+                if (offDiagonal < 1e-30) break;
+
+                for (int p = 0; p < n; p++)
+                {
+                    for (int q = p + 1; q < n; q++)
+                    {
+                        if (a[p, q] == 0) continue;
+
+                        var theta = (a[q, q] - a[p, p]) / (2 * a[p, q]);
+                        var t = Math.Sign(theta == 0 ? 1 : theta) / (Math.Abs(theta) + Math.Sqrt(theta * theta + 1));
+                        var c = 1 / Math.Sqrt(t * t + 1);
+                        var sn = t * c;
+
+                        for (int k = 0; k < n; k++)
+                        {
+                            var akp = a[k, p];
+                            var akq = a[k, q];
+                            a[k, p] = c * akp - sn * akq;
+                            a[k, q] = sn * akp + c * akq;
+                        }
+                        for (int k = 0; k < n; k++)
+                        {
+                            var apk = a[p, k];
+                            var aqk = a[q, k];
+                            a[p, k] = c * apk - sn * aqk;
+                            a[q, k] = sn * apk + c * aqk;
+                        }
+                        for (int k = 0; k < n; k++)
+                        {
+                            var vkp = vectors[k, p];
+                            var vkq = vectors[k, q];
+                            vectors[k, p] = c * vkp - sn * vkq;
+                            vectors[k, q] = sn * vkp + c * vkq;
+                        }
+                    }
+                }
+            }
+
+            for (int i = 0; i < n; i++)
+            {
+                values[i] = a[i, i];
+            }
+        }
+
+        private static double NextGaussian(Random random)
+        {
+            // Box-Muller; 1 - NextDouble() keeps the logarithm finite
+            var u1 = 1.0 - random.NextDouble();
+            var u2 = random.NextDouble();
+            return Math.Sqrt(-2.0 * Math.Log(u1)) * Math.Cos(2.0 * Math.PI * u2);
+        }
+
+        /// <summary>
+        /// Parameter values compared by value, the key for already-evaluated candidates
+        /// </summary>
+        private readonly struct ParameterVector : IEquatable<ParameterVector>
+        {
+            private readonly int _hashCode;
+
+            public ParameterVector(double[] values)
+            {
+                Values = values;
+                var hash = new HashCode();
+                foreach (var value in values)
+                {
+                    hash.Add(value);
+                }
+                _hashCode = hash.ToHashCode();
+            }
+
+            public double[] Values { get; }
+
+            public bool Equals(ParameterVector other) => _hashCode == other._hashCode && Values.AsSpan().SequenceEqual(other.Values);
+
+            public override bool Equals(object obj) => obj is ParameterVector other && Equals(other);
+
+            public override int GetHashCode() => _hashCode;
+        }
+    }
+
+    /// <summary>
+    /// One optimization variable and the range it may take
+    /// </summary>
+    public class ParameterRange
+    {
+        public ParameterRange(string name, double min, double max, double? initial = null, bool isInteger = false)
+        {
+            Name = name ?? throw new ArgumentNullException(nameof(name));
+            Min = min;
+            Max = max;
+            Initial = initial;
+            IsInteger = isInteger;
+        }
+
+        public string Name { get; }
+        public double Min { get; }
+        public double Max { get; }
+
+        /// <summary>Starting value; null starts in the middle of the range</summary>
+        public double? Initial { get; }
+
+        /// <summary>Candidates are rounded to whole numbers before evaluation</summary>
+        public bool IsInteger { get; }
+    }
+
+    /// <summary>
+    /// Population size, stopping criteria and parallelism for ParameterOptimizer
+    /// </summary>
+    public class ParameterOptimizerOptions
+    {
+        /// <summary>Candidates per generation; 0 uses 4 + 3 ln(n)</summary>
+        public int PopulationSize { get; set; }
+
+        public int MaxGenerations { get; set; } = 200;
+
+        /// <summary>Objective evaluations, not counting cache hits</summary>
+        public int MaxEvaluations { get; set; } = 5000;
+
+        /// <summary>Initial step size as a fraction of each parameter's range</summary>
+        public double InitialStepSize { get; set; } = 0.3;
+
+        /// <summary>Stop as soon as the best value is at or below this</summary>
+        public double TargetValue { get; set; } = double.NegativeInfinity;
+
+        /// <summary>Stop after this many generations without improving the best value by FunctionTolerance</summary>
+        public int StagnationGenerations { get; set; } = 30;
+
+        public double FunctionTolerance { get; set; } = 1e-12;
+
+        /// <summary>Stop when the search distribution is narrower than this fraction of the ranges</summary>
+        public double StepTolerance { get; set; } = 1e-10;
+
+        /// <summary>Concurrent objective evaluations; 0 uses one per core</summary>
+        public int MaxParallelism { get; set; }
+
+        /// <summary>Fixed seed for reproducible runs; null seeds from the clock</summary>
+        public int? Seed { get; set; }
+
+        /// <summary>
+        /// Read the Optimization:* settings
+        /// </summary>
+        public static ParameterOptimizerOptions FromConfiguration(ConfigurationManager configManager)
+        {
+            return new ParameterOptimizerOptions
+            {
+                PopulationSize = configManager.GetSetting("Optimization:PopulationSize", 0),
+                MaxGenerations = configManager.GetSetting("Optimization:MaxGenerations", 200),
+                MaxEvaluations = configManager.GetSetting("Optimization:MaxEvaluations", 5000),
+                StagnationGenerations = configManager.GetSetting("Optimization:StagnationGenerations", 30),
+                MaxParallelism = configManager.GetSetting("Optimization:MaxParallelism", 0)
+            };
+        }
+    }
+
+    public enum OptimizationStopReason
+    {
+        MaxGenerations,
+        MaxEvaluations,
+        TargetReached,
+        Stagnated,
+        Converged
+    }
+
+    public class OptimizationResult
+    {
+        /// <summary>Best parameter values found, in ParameterRange order; at worst the starting point</summary>
+        public double[] BestParameters { get; set; } = Array.Empty<double>();
+        public double BestValue { get; set; }
+        public int Generations { get; set; }
+        public int Evaluations { get; set; }
+
+        /// <summary>Candidates answered from already-evaluated parameter vectors</summary>
+        public int CacheHits { get; set; }
+        public OptimizationStopReason StopReason { get; set; }
+
+        /// <summary>Best value after each generation</summary>
+        public List<double> BestValueHistory { get; } = new List<double>();
+    }
+}
@@ -0,0 +1,56 @@
+using System;
+using System.Numerics;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// Difference hash (dHash) of an image: the image is reduced to a 9x8 grayscale thumbnail and
+    /// each bit records whether a pixel is brighter than its right-hand neighbour. Small changes
+    /// in colour, compression or scale flip few bits, so the Hamming distance between two hashes
+    /// measures how much an image visibly changed.
+    /// </summary>
+    public static class PerceptualHash
+    {
+        /// <summary>Thumbnail width; one column more than bits per row</summary>
+        public const int ThumbnailWidth = 9;
+
+        public const int ThumbnailHeight = 8;
+
+        /// <summary>
+        /// Hash a row-major 9x8 grayscale thumbnail
+        /// </summary>
+        public static ulong FromThumbnail(ReadOnlySpan<byte> luminance)
+        {
+            if (luminance.Length != ThumbnailWidth * ThumbnailHeight)
+                throw new ArgumentException($"Expected {ThumbnailWidth * ThumbnailHeight} luminance values", nameof(luminance));
+
+            ulong hash = 0;
+            var bit = 0;
+            for (int row = 0; row < ThumbnailHeight; row++)
+            {
+                var rowStart = row * ThumbnailWidth;
+                for (int column = 0; column < ThumbnailWidth - 1; column++, bit++)
+                {
+                    if (luminance[rowStart + column] > luminance[rowStart + column + 1])
+                    {
+                        hash |= 1UL << bit;
+                    }
+                }
+            }
+            return hash;
+        }
+
+        /// <summary>
+        /// Number of differing bits, from 0 (same image) to 64
+        /// </summary>
+        public static int Distance(ulong first, ulong second) => BitOperations.PopCount(first ^ second);
+
+        /// <summary>
+        /// Rec. 601 luma of an RGB pixel
+        /// </summary>
+        public static byte Luminance(byte red, byte green, byte blue)
+        {
+            return (byte)((299 * red + 587 * green + 114 * blue + 500) / 1000);
+        }
+    }
+}
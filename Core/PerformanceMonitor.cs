@@ -9,22 +9,58 @@ using System.Threading.Tasks;
 namespace RhinoAI.Core
 {
     /// <summary>
-    /// Performance monitoring system for RhinoAI plugin
+    /// Performance monitoring system for RhinoAI plugin. Each operation is identified by an
+    /// interned OperationHandle whose latency histogram is recorded per thread without locks
+    /// and merged when metrics are read.
     /// </summary>
-    public class PerformanceMonitor
+    public class PerformanceMonitor : IDisposable
     {
         private readonly SimpleLogger _logger;
-        private readonly ConcurrentDictionary<string, PerformanceMetric> _metrics;
+        private readonly ConcurrentDictionary<(string Category, string OperationName), OperationHandle> _operations;
         private readonly System.Threading.Timer _reportingTimer;
-        private readonly object _lockObject = new object();
+        private readonly ActivityListener _spanListener;
+        private readonly ConcurrentDictionary<ActivityTraceId, ConcurrentQueue<Activity>> _openTraces;
+        private readonly TimeSpan _slowTraceThreshold;
 
-        public PerformanceMonitor(SimpleLogger logger)
+        private const int MaxOpenTraces = 256;
+
+        public PerformanceMonitor(SimpleLogger logger) : this(logger, TimeSpan.FromSeconds(1))
+        {
+        }
+
+        /// <param name="logger">Receives periodic reports and slow trace breakdowns</param>
+        /// <param name="slowTraceThreshold">Pipeline traces at least this long are logged span by span</param>
+        public PerformanceMonitor(SimpleLogger logger, TimeSpan slowTraceThreshold)
         {
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
-            _metrics = new ConcurrentDictionary<string, PerformanceMetric>();
+            _operations = new ConcurrentDictionary<(string Category, string OperationName), OperationHandle>();
+            _openTraces = new ConcurrentDictionary<ActivityTraceId, ConcurrentQueue<Activity>>();
+            _slowTraceThreshold = slowTraceThreshold;
             
             // Report performance metrics every 5 minutes
             _reportingTimer = new System.Threading.Timer(ReportMetrics, null, TimeSpan.FromMinutes(5), TimeSpan.FromMinutes(5));
+
+            // Record every pipeline span into the operation histograms
+            _spanListener = new ActivityListener
+            {
+                ShouldListenTo = source => source.Name == PipelineTelemetry.SourceName,
+                Sample = (ref ActivityCreationOptions<ActivityContext> options) => ActivitySamplingResult.AllDataAndRecorded,
+                ActivityStopped = OnSpanStopped
+            };
+            ActivitySource.AddActivityListener(_spanListener);
+        }
+
+        /// <summary>
+        /// Get the handle for an operation, creating it on first use. Hot paths should keep the
+        /// handle rather than looking it up by name on every call.
+        /// </summary>
+        public OperationHandle GetOperation(string operationName, string category = "General")
+        {
+            if (_operations.TryGetValue((category, operationName), out var handle))
+            {
+                return handle;
+            }
+            return _operations.GetOrAdd((category, operationName), key => new OperationHandle(key.OperationName, key.Category));
         }
 
         /// <summary>
@@ -32,7 +68,15 @@ namespace RhinoAI.Core
         /// </summary>
         public IDisposable StartTracking(string operationName, string category = "General")
         {
-            return new PerformanceTracker(this, operationName, category);
+            return new PerformanceTracker(GetOperation(operationName, category));
+        }
+
+        /// <summary>
+        /// Start tracking a performance operation by handle
+        /// </summary>
+        public IDisposable StartTracking(OperationHandle operation)
+        {
+            return new PerformanceTracker(operation);
         }
 
         /// <summary>
@@ -40,39 +84,16 @@ namespace RhinoAI.Core
         /// </summary>
         public void RecordMeasurement(string operationName, TimeSpan duration, string category = "General", bool success = true)
         {
-            var key = $"{category}:{operationName}";
-            
-            _metrics.AddOrUpdate(key, 
-                new PerformanceMetric
-                {
-                    OperationName = operationName,
-                    Category = category,
-                    TotalCalls = 1,
-                    SuccessfulCalls = success ? 1 : 0,
-                    FailedCalls = success ? 0 : 1,
-                    TotalDuration = duration,
-                    MinDuration = duration,
-                    MaxDuration = duration,
-                    LastCall = DateTime.Now
-                },
-                (k, existing) =>
-                {
-                    lock (_lockObject)
-                    {
-                        existing.TotalCalls++;
-                        if (success)
-                            existing.SuccessfulCalls++;
-                        else
-                            existing.FailedCalls++;
-                            
-                        existing.TotalDuration = existing.TotalDuration.Add(duration);
-                        existing.MinDuration = duration < existing.MinDuration ? duration : existing.MinDuration;
-                        existing.MaxDuration = duration > existing.MaxDuration ? duration : existing.MaxDuration;
-                        existing.LastCall = DateTime.Now;
-                        
-                        return existing;
-                    }
-                });
+            GetOperation(operationName, category).Record(duration, success);
+        }
+
+        /// <summary>
+        /// Record a performance measurement by handle
+        /// </summary>
+        public void RecordMeasurement(OperationHandle operation, TimeSpan duration, bool success = true)
+        {
+            if (operation == null) throw new ArgumentNullException(nameof(operation));
+            operation.Record(duration, success);
         }
 
         /// <summary>
@@ -80,8 +101,9 @@ namespace RhinoAI.Core
         /// </summary>
         public PerformanceMetric? GetMetrics(string operationName, string category = "General")
         {
-            var key = $"{category}:{operationName}";
-            return _metrics.TryGetValue(key, out var metric) ? metric : null;
+            return _operations.TryGetValue((category, operationName), out var operation) && operation.HasSamples
+                ? operation.GetMetric()
+                : null;
         }
 
         /// <summary>
@@ -89,7 +111,7 @@ namespace RhinoAI.Core
         /// </summary>
         public IEnumerable<PerformanceMetric> GetAllMetrics()
         {
-            return _metrics.Values.ToList();
+            return _operations.Values.Where(o => o.HasSamples).Select(o => o.GetMetric()).ToList();
         }
 
         /// <summary>
@@ -97,7 +119,10 @@ namespace RhinoAI.Core
         /// </summary>
         public IEnumerable<PerformanceMetric> GetMetricsByCategory(string category)
         {
-            return _metrics.Values.Where(m => m.Category == category).ToList();
+            return _operations.Values
+                .Where(o => o.Category == category && o.HasSamples)
+                .Select(o => o.GetMetric())
+                .ToList();
         }
 
         /// <summary>
@@ -105,7 +130,8 @@ namespace RhinoAI.Core
         /// </summary>
         public PerformanceSummary GetSummary()
         {
-            var allMetrics = GetAllMetrics().ToList();
+            var operations = _operations.Values.Where(o => o.HasSamples).ToList();
+            var allMetrics = operations.Select(o => o.GetMetric()).ToList();
             
             return new PerformanceSummary
             {
@@ -116,23 +142,37 @@ namespace RhinoAI.Core
                     ? allMetrics.Average(m => m.SuccessRate) 
                     : 0,
                 TotalDuration = allMetrics.Aggregate(TimeSpan.Zero, (sum, m) => sum.Add(m.TotalDuration)),
-                Categories = allMetrics.GroupBy(m => m.Category).Select(g => new CategorySummary
+                Categories = operations.GroupBy(o => o.Category).Select(g =>
                 {
-                    Category = g.Key,
-                    OperationCount = g.Count(),
-                    TotalCalls = g.Sum(m => m.TotalCalls),
-                    AverageSuccessRate = g.Average(m => m.SuccessRate),
-                    AverageDuration = TimeSpan.FromMilliseconds(g.Average(m => m.AverageDuration.TotalMilliseconds))
+                    var metrics = g.Select(o => o.GetMetric()).ToList();
+                    var latency = new LatencyHistogram();
+                    foreach (var operation in g)
+                    {
+                        operation.MergeInto(latency);
+                    }
+
+                    return new CategorySummary
+                    {
+                        Category = g.Key,
+                        OperationCount = metrics.Count,
+                        TotalCalls = metrics.Sum(m => m.TotalCalls),
+                        AverageSuccessRate = metrics.Average(m => m.SuccessRate),
+                        AverageDuration = TimeSpan.FromMilliseconds(metrics.Average(m => m.AverageDuration.TotalMilliseconds)),
+                        P99Duration = latency.GetPercentile(99)
+                    };
                 }).ToList()
             };
         }
 
         /// <summary>
-        /// Clear all metrics
+        /// Clear all metrics. Operation handles stay valid and start again from zero.
         /// </summary>
         public void ClearMetrics()
         {
-            _metrics.Clear();
+            foreach (var operation in _operations.Values)
+            {
+                operation.Reset();
+            }
             _logger.LogInformation("Performance metrics cleared");
         }
 
@@ -152,21 +192,21 @@ namespace RhinoAI.Core
                 
                 foreach (var category in summary.Categories)
                 {
-                    _logger.LogInformation($"Category '{category.Category}': {category.TotalCalls} calls, {category.AverageSuccessRate:F1}% success, avg {category.AverageDuration.TotalMilliseconds:F0}ms");
+                    _logger.LogInformation($"Category '{category.Category}': {category.TotalCalls} calls, {category.AverageSuccessRate:F1}% success, avg {category.AverageDuration.TotalMilliseconds:F0}ms, p99 {category.P99Duration.TotalMilliseconds:F0}ms");
                 }
                 
-                // Report slowest operations
+                // Report the operations with the worst tail latency; averages hide stalls
                 var slowestOps = GetAllMetrics()
-                    .OrderByDescending(m => m.AverageDuration)
+                    .OrderByDescending(m => m.P99Duration)
                     .Take(5)
                     .ToList();
                     
                 if (slowestOps.Any())
                 {
-                    _logger.LogInformation("Slowest Operations:");
+                    _logger.LogInformation("Slowest Operations (by p99):");
                     foreach (var op in slowestOps)
                     {
-                        _logger.LogInformation($"  {op.Category}:{op.OperationName} - Avg: {op.AverageDuration.TotalMilliseconds:F0}ms, Max: {op.MaxDuration.TotalMilliseconds:F0}ms");
+                        _logger.LogInformation($"  {op.Category}:{op.OperationName} - p50: {op.P50Duration.TotalMilliseconds:F0}ms, p90: {op.P90Duration.TotalMilliseconds:F0}ms, p99: {op.P99Duration.TotalMilliseconds:F0}ms, p99.9: {op.P999Duration.TotalMilliseconds:F0}ms, Max: {op.MaxDuration.TotalMilliseconds:F0}ms");
                     }
                 }
             }
@@ -176,37 +216,185 @@ namespace RhinoAI.Core
             }
         }
 
+        private void OnSpanStopped(Activity span)
+        {
+            var category = span.GetTagItem(PipelineTelemetry.CategoryTag) as string ?? "General";
+            GetOperation(span.OperationName, category).Record(span.Duration, span.Status != ActivityStatusCode.Error);
+
+            var isRoot = span.Parent == null || span.Parent.Source != span.Source;
+            if (!isRoot)
+            {
+                // Children stop before their root; keep them until the whole trace is known
+                if (_openTraces.Count >= MaxOpenTraces)
+                {
+                    _openTraces.Clear();
+                }
+                _openTraces.GetOrAdd(span.TraceId, id => new ConcurrentQueue<Activity>()).Enqueue(span);
+                return;
+            }
+
+            _openTraces.TryRemove(span.TraceId, out var children);
+            if (span.Duration >= _slowTraceThreshold)
+            {
+                LogTrace(span, children?.ToList() ?? new List<Activity>());
+            }
+        }
+
+        /// <summary>
+        /// Logs a slow trace as an indented tree so the dominant stage is obvious
+        /// </summary>
+        private void LogTrace(Activity root, List<Activity> spans)
+        {
+            var childrenByParent = spans
+                .GroupBy(s => s.ParentSpanId)
+                .ToDictionary(g => g.Key, g => g.OrderBy(s => s.StartTimeUtc).ToList());
+
+            var report = new System.Text.StringBuilder();
+            report.Append($"Slow pipeline trace {root.OperationName}: {root.Duration.TotalMilliseconds:F0}ms");
+
+            void AppendChildren(Activity parent, int depth)
+            {
+                if (!childrenByParent.TryGetValue(parent.SpanId, out var children)) return;
+
+                foreach (var child in children)
+                {
+                    report.AppendLine();
+                    report.Append(' ', depth * 2);
+                    report.Append($"{child.OperationName}: {child.Duration.TotalMilliseconds:F0}ms");
+                    if (child.Status == ActivityStatusCode.Error)
+                    {
+                        report.Append($" (failed: {child.StatusDescription})");
+                    }
+                    AppendChildren(child, depth + 1);
+                }
+            }
+
+            AppendChildren(root, 1);
+            _logger.LogWarning(report.ToString());
+        }
+
         public void Dispose()
         {
+            _spanListener.Dispose();
             _reportingTimer?.Dispose();
         }
     }
 
+    /// <summary>
+    /// Interned identity of a monitored operation. Each thread records into its own histogram,
+    /// so concurrent callers never contend; readers merge the per-thread histograms.
+    /// </summary>
+    public sealed class OperationHandle
+    {
+        private readonly ThreadLocal<OperationRecorder> _recorders;
+
+        internal OperationHandle(string operationName, string category)
+        {
+            OperationName = operationName;
+            Category = category;
+            _recorders = new ThreadLocal<OperationRecorder>(() => new OperationRecorder(), trackAllValues: true);
+        }
+
+        public string OperationName { get; }
+        public string Category { get; }
+
+        internal bool HasSamples => _recorders.Values.Any(r => r.Latency.Count > 0);
+
+        internal void Record(TimeSpan duration, bool success)
+        {
+            var recorder = _recorders.Value!;
+            recorder.Latency.Record(duration);
+            if (!success)
+            {
+                Interlocked.Increment(ref recorder.FailedCalls);
+            }
+            Volatile.Write(ref recorder.LastCallTickCount, Environment.TickCount64);
+        }
+
+        internal void MergeInto(LatencyHistogram target)
+        {
+            foreach (var recorder in _recorders.Values)
+            {
+                target.Add(recorder.Latency);
+            }
+        }
+
+        internal PerformanceMetric GetMetric()
+        {
+            var latency = new LatencyHistogram();
+            long failed = 0;
+            long lastCallTickCount = long.MinValue;
+
+            foreach (var recorder in _recorders.Values)
+            {
+                latency.Add(recorder.Latency);
+                failed += Interlocked.Read(ref recorder.FailedCalls);
+                lastCallTickCount = Math.Max(lastCallTickCount, Volatile.Read(ref recorder.LastCallTickCount));
+            }
+
+            var totalCalls = (int)latency.Count;
+            return new PerformanceMetric
+            {
+                OperationName = OperationName,
+                Category = Category,
+                TotalCalls = totalCalls,
+                SuccessfulCalls = totalCalls - (int)failed,
+                FailedCalls = (int)failed,
+                TotalDuration = latency.Total,
+                MinDuration = latency.Min,
+                MaxDuration = latency.Max,
+                P50Duration = latency.GetPercentile(50),
+                P90Duration = latency.GetPercentile(90),
+                P99Duration = latency.GetPercentile(99),
+                P999Duration = latency.GetPercentile(99.9),
+                LastCall = lastCallTickCount == long.MinValue
+                    ? DateTime.MinValue
+                    : DateTime.Now - TimeSpan.FromMilliseconds(Environment.TickCount64 - lastCallTickCount)
+            };
+        }
+
+        internal void Reset()
+        {
+            foreach (var recorder in _recorders.Values)
+            {
+                recorder.Latency.Reset();
+                Interlocked.Exchange(ref recorder.FailedCalls, 0);
+            }
+        }
+
+        private sealed class OperationRecorder
+        {
+            public readonly LatencyHistogram Latency = new LatencyHistogram();
+            public long FailedCalls;
+            public long LastCallTickCount = long.MinValue;
+        }
+    }
+
     /// <summary>
     /// Performance tracker for individual operations
     /// </summary>
     public class PerformanceTracker : IDisposable
     {
-        private readonly PerformanceMonitor _monitor;
-        private readonly string _operationName;
-        private readonly string _category;
-        private readonly Stopwatch _stopwatch;
+        private readonly OperationHandle _operation;
+        private readonly long _startTimestamp;
         private bool _disposed;
 
         public PerformanceTracker(PerformanceMonitor monitor, string operationName, string category)
+            : this(monitor.GetOperation(operationName, category))
+        {
+        }
+
+        public PerformanceTracker(OperationHandle operation)
         {
-            _monitor = monitor;
-            _operationName = operationName;
-            _category = category;
-            _stopwatch = Stopwatch.StartNew();
+            _operation = operation ?? throw new ArgumentNullException(nameof(operation));
+            _startTimestamp = Stopwatch.GetTimestamp();
         }
 
         public void Dispose()
         {
             if (!_disposed)
             {
-                _stopwatch.Stop();
-                _monitor.RecordMeasurement(_operationName, _stopwatch.Elapsed, _category, true);
+                _operation.Record(Stopwatch.GetElapsedTime(_startTimestamp), true);
                 _disposed = true;
             }
         }
@@ -215,8 +403,7 @@ namespace RhinoAI.Core
         {
             if (!_disposed)
             {
-                _stopwatch.Stop();
-                _monitor.RecordMeasurement(_operationName, _stopwatch.Elapsed, _category, false);
+                _operation.Record(Stopwatch.GetElapsedTime(_startTimestamp), false);
                 _disposed = true;
             }
         }
@@ -235,6 +422,10 @@ namespace RhinoAI.Core
         public TimeSpan TotalDuration { get; set; }
         public TimeSpan MinDuration { get; set; }
         public TimeSpan MaxDuration { get; set; }
+        public TimeSpan P50Duration { get; set; }
+        public TimeSpan P90Duration { get; set; }
+        public TimeSpan P99Duration { get; set; }
+        public TimeSpan P999Duration { get; set; }
         public DateTime LastCall { get; set; }
 
         public double SuccessRate => TotalCalls > 0 ? (double)SuccessfulCalls / TotalCalls * 100 : 0;
@@ -264,5 +455,6 @@ namespace RhinoAI.Core
         public int TotalCalls { get; set; }
         public double AverageSuccessRate { get; set; }
         public TimeSpan AverageDuration { get; set; }
+        public TimeSpan P99Duration { get; set; }
     }
 } 
\ No newline at end of file
@@ -0,0 +1,48 @@
+using System;
+using System.Diagnostics;
+using Rhino;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// Tracing spans for the command pipeline. Spans are System.Diagnostics.Activity instances,
+    /// so a span started inside another becomes its child across awaits. When nothing listens
+    /// to the source (no PerformanceMonitor is running), StartSpan returns null and costs almost nothing.
+    /// </summary>
+    public static class PipelineTelemetry
+    {
+        public const string SourceName = "RhinoAI.Pipeline";
+
+        /// <summary>Tag holding the PerformanceMonitor category of a span</summary>
+        public const string CategoryTag = "rhinoai.category";
+
+        public static readonly ActivitySource Source = new ActivitySource(SourceName, "1.0");
+
+        /// <summary>
+        /// Starts a span as a child of the current one. Dispose the result to end the span.
+        /// </summary>
+        public static Activity? StartSpan(string name, string category)
+        {
+            var activity = Source.StartActivity(name, ActivityKind.Internal);
+            activity?.SetTag(CategoryTag, category);
+            return activity;
+        }
+
+        /// <summary>
+        /// Marks the span as failed so it is counted as a failed call
+        /// </summary>
+        public static void SetError(this Activity? span, string message)
+        {
+            span?.SetStatus(ActivityStatusCode.Error, message);
+        }
+
+        /// <summary>
+        /// Redraws the document's views inside a "Document.Redraw" span
+        /// </summary>
+        public static void RedrawViews(RhinoDoc doc)
+        {
+            using var span = StartSpan("Document.Redraw", "Rhino");
+            doc?.Views.Redraw();
+        }
+    }
+}
@@ -0,0 +1,58 @@
+using System.Collections.Generic;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using System.Text.Json.Serialization.Metadata;
+using RhinoAI.AI;
+using RhinoAI.Integration;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// Source-generated serialization metadata for every type RhinoAI exchanges as JSON: provider
+    /// requests and responses, AI command and vision results, MCP messages and the semantic cache
+    /// file. Serialize with the typed properties (e.g. RhinoAIJsonContext.Default.OpenAIChatRequest)
+    /// rather than constructing JsonSerializerOptions per call, which throws away the metadata cache.
+    /// </summary>
+    [JsonSerializable(typeof(OpenAIChatRequest))]
+    [JsonSerializable(typeof(OpenAIChatResponse))]
+    [JsonSerializable(typeof(OpenAIVisionRequest))]
+    [JsonSerializable(typeof(ClaudeRequest))]
+    [JsonSerializable(typeof(ClaudeResponse))]
+    [JsonSerializable(typeof(OllamaRequest))]
+    [JsonSerializable(typeof(OllamaResponse))]
+    [JsonSerializable(typeof(OllamaModelsResponse))]
+    [JsonSerializable(typeof(AICommandRequest))]
+    [JsonSerializable(typeof(AICommandResponse))]
+    [JsonSerializable(typeof(SceneAnalysis))]
+    [JsonSerializable(typeof(SemanticCacheFile))]
+    [JsonSerializable(typeof(MCPRequest))]
+    [JsonSerializable(typeof(MCPResponse))]
+    [JsonSerializable(typeof(MCPStatusResponse))]
+    [JsonSerializable(typeof(SuggestionsResponse))]
+    [JsonSerializable(typeof(SceneSyncResponse))]
+    [JsonSerializable(typeof(BatchCommandRequest))]
+    [JsonSerializable(typeof(BatchCommandResponse))]
+    [JsonSerializable(typeof(List<string>))]
+    internal partial class RhinoAIJsonContext : JsonSerializerContext
+    {
+        // Created on first use: Default is initialized by the generated half of this class
+        private static RhinoAIJsonContext _caseInsensitive;
+        private static JsonSerializerOptions _lenientOptions;
+
+        /// <summary>
+        /// Metadata for JSON written by language models, whose property casing varies
+        /// </summary>
+        public static RhinoAIJsonContext CaseInsensitive => _caseInsensitive ??=
+            new RhinoAIJsonContext(new JsonSerializerOptions { PropertyNameCaseInsensitive = true });
+
+        /// <summary>
+        /// Case-insensitive options for messages from MCP clients. Values typed as object
+        /// (MCPResponse.Data, custom properties) fall back to reflection.
+        /// </summary>
+        public static JsonSerializerOptions LenientOptions => _lenientOptions ??= new JsonSerializerOptions
+        {
+            PropertyNameCaseInsensitive = true,
+            TypeInfoResolver = JsonTypeInfoResolver.Combine(Default, new DefaultJsonTypeInfoResolver())
+        };
+    }
+}
@@ -0,0 +1,134 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Text.Json;
+using RhinoAI.Integration;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// Computes and applies SceneContextDelta: the fields, set entries and custom properties
+    /// that changed between two scene contexts. A delta from an empty context is a full snapshot.
+    /// </summary>
+    public static class SceneContextDiff
+    {
+        /// <summary>
+        /// Changes that turn <paramref name="previous"/> into <paramref name="current"/>;
+        /// pass null as previous to describe the whole of <paramref name="current"/>
+        /// </summary>
+        public static SceneContextDelta Compute(SceneContext previous, SceneContext current, long baseVersion, long version)
+        {
+            if (current == null) throw new ArgumentNullException(nameof(current));
+            var delta = new SceneContextDelta { BaseVersion = baseVersion, Version = version };
+
+            if (previous == null || previous.ObjectCount != current.ObjectCount)
+            {
+                delta.ObjectCount = current.ObjectCount;
+            }
+
+            if (!SameValues(previous?.BoundingBox, current.BoundingBox))
+            {
+                delta.BoundingBox = current.BoundingBox ?? Array.Empty<double>();
+            }
+
+            (delta.AddedObjectTypes, delta.RemovedObjectTypes) = DiffSets(previous?.ObjectTypes, current.ObjectTypes);
+            (delta.AddedLayers, delta.RemovedLayers) = DiffSets(previous?.ActiveLayers, current.ActiveLayers);
+            (delta.ChangedProperties, delta.RemovedProperties) = DiffProperties(previous?.CustomProperties, current.CustomProperties);
+
+            return delta;
+        }
+
+        /// <summary>
+        /// A new context with <paramref name="delta"/> applied to <paramref name="baseContext"/>, which is left unchanged
+        /// </summary>
+        public static SceneContext Apply(SceneContext baseContext, SceneContextDelta delta)
+        {
+            if (delta == null) throw new ArgumentNullException(nameof(delta));
+
+            // Unchanged parts are shared with the base context rather than copied
+            var properties = baseContext?.CustomProperties;
+            if (properties == null || delta.ChangedProperties != null || delta.RemovedProperties != null)
+            {
+                properties = properties != null ? new Dictionary<string, object>(properties) : new Dictionary<string, object>();
+            }
+            foreach (var key in delta.RemovedProperties ?? Array.Empty<string>())
+            {
+                properties.Remove(key);
+            }
+            foreach (var property in delta.ChangedProperties ?? new Dictionary<string, object>())
+            {
+                properties[property.Key] = property.Value;
+            }
+
+            return new SceneContext
+            {
+                ObjectCount = delta.ObjectCount ?? baseContext?.ObjectCount ?? 0,
+                BoundingBox = delta.BoundingBox ?? baseContext?.BoundingBox ?? new double[6],
+                ObjectTypes = ApplySet(baseContext?.ObjectTypes, delta.AddedObjectTypes, delta.RemovedObjectTypes),
+                ActiveLayers = ApplySet(baseContext?.ActiveLayers, delta.AddedLayers, delta.RemovedLayers),
+                CustomProperties = properties
+            };
+        }
+
+        private static bool SameValues(double[] a, double[] b)
+        {
+            if (ReferenceEquals(a, b)) return true;
+            if (a == null || b == null) return false;
+            return a.AsSpan().SequenceEqual(b);
+        }
+
+        private static (string[] added, string[] removed) DiffSets(string[] previous, string[] current)
+        {
+            // Index snapshots reuse their arrays until something changes
+            if (ReferenceEquals(previous, current)) return (null, null);
+
+            var before = new HashSet<string>(previous ?? Array.Empty<string>(), StringComparer.Ordinal);
+            var after = new HashSet<string>(current ?? Array.Empty<string>(), StringComparer.Ordinal);
+
+            var added = after.Where(item => !before.Contains(item)).ToArray();
+            var removed = before.Where(item => !after.Contains(item)).ToArray();
+            return (added.Length > 0 ? added : null, removed.Length > 0 ? removed : null);
+        }
+
+        private static string[] ApplySet(string[] baseItems, string[] added, string[] removed)
+        {
+            if (added == null && removed == null) return baseItems ?? Array.Empty<string>();
+
+            var items = new HashSet<string>(baseItems ?? Array.Empty<string>(), StringComparer.Ordinal);
+            items.ExceptWith(removed ?? Array.Empty<string>());
+            items.UnionWith(added ?? Array.Empty<string>());
+            return items.OrderBy(item => item, StringComparer.Ordinal).ToArray();
+        }
+
+        private static (Dictionary<string, object> changed, string[] removed) DiffProperties(
+            Dictionary<string, object> previous, Dictionary<string, object> current)
+        {
+            Dictionary<string, object> changed = null;
+            foreach (var property in current ?? new Dictionary<string, object>())
+            {
+                if (previous == null || !previous.TryGetValue(property.Key, out var old) || !SameJson(old, property.Value))
+                {
+                    changed ??= new Dictionary<string, object>();
+                    changed[property.Key] = property.Value;
+                }
+            }
+
+            var removed = previous?.Keys.Where(key => current == null || !current.ContainsKey(key)).ToArray();
+            return (changed, removed?.Length > 0 ? removed : null);
+        }
+
+        /// <summary>
+        /// Property values are arbitrary objects (and JsonElements once received), so compare their JSON
+        /// </summary>
+        private static bool SameJson(object a, object b)
+        {
+            if (ReferenceEquals(a, b)) return true;
+            if (a == null || b == null) return false;
+            if (a.Equals(b)) return true;
+
+            return JsonSerializer.SerializeToUtf8Bytes(a, a.GetType(), RhinoAIJsonContext.LenientOptions)
+                .AsSpan()
+                .SequenceEqual(JsonSerializer.SerializeToUtf8Bytes(b, b.GetType(), RhinoAIJsonContext.LenientOptions));
+        }
+    }
+}
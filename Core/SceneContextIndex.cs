@@ -0,0 +1,339 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using RhinoAI.Integration;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// Incrementally maintained scene summary: object counts per type and layer and the overall
+    /// bounding box, updated one object at a time from document events instead of rescanning
+    /// the document. Works on SceneObjectInfo only, so it has no dependency on Rhino geometry.
+    /// </summary>
+    public class SceneContextIndex
+    {
+        private readonly Dictionary<Guid, SceneObjectInfo> _objects = new Dictionary<Guid, SceneObjectInfo>();
+        private readonly Dictionary<string, int> _typeCounts = new Dictionary<string, int>(StringComparer.Ordinal);
+        private readonly Dictionary<string, int> _layerCounts = new Dictionary<string, int>(StringComparer.Ordinal);
+        private readonly object _lockObject = new object();
+
+        private SceneBounds _bounds = SceneBounds.Empty;
+        private bool _boundsDirty;
+        private long _version;
+
+        // Arrays handed out by the last snapshot, reused until the index changes
+        private long _snapshotVersion = -1;
+        private string[] _snapshotTypes;
+        private string[] _snapshotLayers;
+        private double[] _snapshotBounds;
+
+        public int Count
+        {
+            get
+            {
+                lock (_lockObject)
+                {
+                    return _objects.Count;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Incremented on every change; equal versions mean equal snapshots
+        /// </summary>
+        public long Version
+        {
+            get
+            {
+                lock (_lockObject)
+                {
+                    return _version;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Number of times a delete forced the bounding box to be rebuilt from every object
+        /// </summary>
+        public int BoundsRecomputations { get; private set; }
+
+        /// <summary>
+        /// Adds an object, or replaces the entry with the same id
+        /// </summary>
+        public void Upsert(SceneObjectInfo info)
+        {
+            lock (_lockObject)
+            {
+                if (_objects.TryGetValue(info.Id, out var existing))
+                {
+                    RemoveEntry(existing);
+                }
+
+                _objects[info.Id] = info;
+                Increment(_typeCounts, info.ObjectType);
+                Increment(_layerCounts, info.Layer);
+
+                if (!_boundsDirty)
+                {
+                    _bounds = _bounds.Union(info.Bounds);
+                }
+                _version++;
+            }
+        }
+
+        /// <summary>
+        /// Removes an object; returns false if it was not indexed
+        /// </summary>
+        public bool Remove(Guid id)
+        {
+            lock (_lockObject)
+            {
+                if (!_objects.TryGetValue(id, out var existing))
+                {
+                    return false;
+                }
+
+                RemoveEntry(existing);
+                _objects.Remove(id);
+                _version++;
+                return true;
+            }
+        }
+
+        /// <summary>
+        /// Replaces the whole index, e.g. after a document is opened
+        /// </summary>
+        public void Reset(IEnumerable<SceneObjectInfo> objects)
+        {
+            lock (_lockObject)
+            {
+                _objects.Clear();
+                _typeCounts.Clear();
+                _layerCounts.Clear();
+                _bounds = SceneBounds.Empty;
+                _boundsDirty = false;
+
+                foreach (var info in objects ?? Enumerable.Empty<SceneObjectInfo>())
+                {
+                    Upsert(info);
+                }
+                _version++;
+            }
+        }
+
+        public void Clear() => Reset(null);
+
+        public int GetTypeCount(string objectType)
+        {
+            lock (_lockObject)
+            {
+                return _typeCounts.GetValueOrDefault(objectType ?? string.Empty);
+            }
+        }
+
+        public int GetLayerCount(string layer)
+        {
+            lock (_lockObject)
+            {
+                return _layerCounts.GetValueOrDefault(layer ?? string.Empty);
+            }
+        }
+
+        public SceneBounds GetBounds()
+        {
+            lock (_lockObject)
+            {
+                EnsureBounds();
+                return _bounds;
+            }
+        }
+
+        /// <summary>
+        /// Builds a SceneContext from the running totals. Cost depends on the number of distinct
+        /// types and layers, not on the number of objects; the bounding box is only rebuilt when a
+        /// delete removed an object lying on its boundary.
+        /// </summary>
+        public SceneContext CreateSnapshot()
+        {
+            lock (_lockObject)
+            {
+                if (_snapshotVersion != _version)
+                {
+                    EnsureBounds();
+                    _snapshotTypes = _typeCounts.Keys.OrderBy(k => k, StringComparer.Ordinal).ToArray();
+                    _snapshotLayers = _layerCounts.Keys.OrderBy(k => k, StringComparer.Ordinal).ToArray();
+                    _snapshotBounds = _bounds.IsValid ? _bounds.ToArray() : new double[6];
+                    _snapshotVersion = _version;
+                }
+
+                return new SceneContext
+                {
+                    ObjectCount = _objects.Count,
+                    ObjectTypes = _snapshotTypes,
+                    BoundingBox = _snapshotBounds,
+                    ActiveLayers = _snapshotLayers,
+                    CustomProperties = new Dictionary<string, object>
+                    {
+                        ["ObjectTypeCounts"] = new Dictionary<string, int>(_typeCounts),
+                        ["LayerObjectCounts"] = new Dictionary<string, int>(_layerCounts)
+                    }
+                };
+            }
+        }
+
+        private void RemoveEntry(SceneObjectInfo info)
+        {
+            Decrement(_typeCounts, info.ObjectType);
+            Decrement(_layerCounts, info.Layer);
+
+            // Objects strictly inside the box cannot shrink it; anything touching an edge might
+            if (!_boundsDirty && info.Bounds.IsValid && info.Bounds.TouchesBoundaryOf(_bounds))
+            {
+                _boundsDirty = true;
+            }
+        }
+
+        private void EnsureBounds()
+        {
+            if (!_boundsDirty) return;
+
+            var bounds = SceneBounds.Empty;
+            foreach (var info in _objects.Values)
+            {
+                bounds = bounds.Union(info.Bounds);
+            }
+
+            _bounds = bounds;
+            _boundsDirty = false;
+            BoundsRecomputations++;
+        }
+
+        private static void Increment(Dictionary<string, int> counts, string key)
+        {
+            key ??= string.Empty;
+            counts[key] = counts.GetValueOrDefault(key) + 1;
+        }
+
+        private static void Decrement(Dictionary<string, int> counts, string key)
+        {
+            key ??= string.Empty;
+            if (!counts.TryGetValue(key, out var count)) return;
+
+            if (count <= 1)
+            {
+                counts.Remove(key);
+            }
+            else
+            {
+                counts[key] = count - 1;
+            }
+        }
+    }
+
+    /// <summary>
+    /// What the scene index needs to know about one document object
+    /// </summary>
+    public readonly struct SceneObjectInfo
+    {
+        public SceneObjectInfo(Guid id, string objectType, string layer, SceneBounds bounds)
+        {
+            Id = id;
+            ObjectType = objectType ?? string.Empty;
+            Layer = layer ?? string.Empty;
+            Bounds = bounds;
+        }
+
+        public Guid Id { get; }
+        public string ObjectType { get; }
+        public string Layer { get; }
+        public SceneBounds Bounds { get; }
+    }
+
+    /// <summary>
+    /// Axis-aligned bounding box; Empty is the identity for Union
+    /// </summary>
+    public readonly struct SceneBounds
+    {
+        public static readonly SceneBounds Empty = new SceneBounds(
+            double.PositiveInfinity, double.PositiveInfinity, double.PositiveInfinity,
+            double.NegativeInfinity, double.NegativeInfinity, double.NegativeInfinity);
+
+        public SceneBounds(double minX, double minY, double minZ, double maxX, double maxY, double maxZ)
+        {
+            MinX = minX;
+            MinY = minY;
+            MinZ = minZ;
+            MaxX = maxX;
+            MaxY = maxY;
+            MaxZ = maxZ;
+        }
+
+        public double MinX { get; }
+        public double MinY { get; }
+        public double MinZ { get; }
+        public double MaxX { get; }
+        public double MaxY { get; }
+        public double MaxZ { get; }
+
+        public bool IsValid => MinX <= MaxX && MinY <= MaxY && MinZ <= MaxZ;
+
+        public SceneBounds Union(SceneBounds other)
+        {
+            if (!other.IsValid) return this;
+            if (!IsValid) return other;
+
+            return new SceneBounds(
+                Math.Min(MinX, other.MinX), Math.Min(MinY, other.MinY), Math.Min(MinZ, other.MinZ),
+                Math.Max(MaxX, other.MaxX), Math.Max(MaxY, other.MaxY), Math.Max(MaxZ, other.MaxZ));
+        }
+
+        /// <summary>
+        /// True if any face of this box lies on (or outside) the matching face of <paramref name="outer"/>
+        /// </summary>
+        public bool TouchesBoundaryOf(SceneBounds outer)
+        {
+            return MinX <= outer.MinX || MinY <= outer.MinY || MinZ <= outer.MinZ ||
+                   MaxX >= outer.MaxX || MaxY >= outer.MaxY || MaxZ >= outer.MaxZ;
+        }
+
+        /// <summary>
+        /// True if the boxes share any point; boxes that only touch overlap
+        /// </summary>
+        public bool Overlaps(SceneBounds other)
+        {
+            return MinX <= other.MaxX && MaxX >= other.MinX &&
+                   MinY <= other.MaxY && MaxY >= other.MinY &&
+                   MinZ <= other.MaxZ && MaxZ >= other.MinZ;
+        }
+
+        /// <summary>
+        /// Squared distance from a point to the nearest point of the box; zero inside it
+        /// </summary>
+        public double DistanceSquaredTo(double x, double y, double z)
+        {
+            var dx = Math.Max(Math.Max(MinX - x, 0), x - MaxX);
+            var dy = Math.Max(Math.Max(MinY - y, 0), y - MaxY);
+            var dz = Math.Max(Math.Max(MinZ - z, 0), z - MaxZ);
+            return dx * dx + dy * dy + dz * dz;
+        }
+
+        /// <summary>
+        /// Half the surface area, the cost measure for building bounding volume hierarchies
+        /// </summary>
+        public double HalfSurfaceArea
+        {
+            get
+            {
+                var dx = MaxX - MinX;
+                var dy = MaxY - MinY;
+                var dz = MaxZ - MinZ;
+                return dx * dy + dy * dz + dz * dx;
+            }
+        }
+
+        /// <summary>
+        /// Min X, Y, Z followed by max X, Y, Z, the layout SceneContext.BoundingBox uses
+        /// </summary>
+        public double[] ToArray() => new[] { MinX, MinY, MinZ, MaxX, MaxY, MaxZ };
+    }
+}
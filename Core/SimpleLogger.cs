@@ -1,6 +1,6 @@
 using System;
-using System.IO;
-using Rhino;
+using System.Collections.Generic;
+using System.Runtime.CompilerServices;
 
 namespace RhinoAI.Core
 {
@@ -16,51 +16,53 @@ namespace RhinoAI.Core
     }
 
     /// <summary>
-    /// Simple logger implementation for Rhino compatibility
+    /// Simple logger implementation for Rhino compatibility. Messages are handed to an
+    /// AsyncLogSink, which writes them to the log file and command line in the background.
     /// </summary>
     public class SimpleLogger
     {
         private readonly string _name;
-        private readonly string _logFilePath;
         private readonly LogLevel _minimumLevel;
-        private static readonly object _lock = new object();
+        private readonly AsyncLogSink? _sink;
 
+        /// <summary>
+        /// A logger for AsyncLogSink.Default, which is looked up on first use so it can be configured after loggers exist
+        /// </summary>
         public SimpleLogger(string name, LogLevel minimumLevel = LogLevel.Information)
         {
             _name = name;
             _minimumLevel = minimumLevel;
-            var appDataPath = Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData);
-            var logDir = Path.Combine(appDataPath, "RhinoAI", "Logs");
-            Directory.CreateDirectory(logDir);
-            _logFilePath = Path.Combine(logDir, $"rhinoai_{DateTime.Now:yyyyMMdd}.log");
         }
 
-        private void Log(LogLevel level, string message)
+        public SimpleLogger(string name, LogLevel minimumLevel, AsyncLogSink sink)
         {
-            if (level < _minimumLevel) return;
+            _name = name;
+            _minimumLevel = minimumLevel;
+            _sink = sink ?? throw new ArgumentNullException(nameof(sink));
+        }
 
-            var logMessage = $"[{DateTime.Now:yyyy-MM-dd HH:mm:ss.fff}] [{level}] [{_name}] {message}";
+        /// <summary>
+        /// Whether messages at the given level are recorded; check before building expensive log data
+        /// </summary>
+        public bool IsEnabled(LogLevel level) => level >= _minimumLevel && level != LogLevel.None;
 
-            // Write to Rhino command line for immediate feedback
-            RhinoApp.WriteLine($"RhinoAI: {message}");
+        /// <summary>
+        /// Whether interpolated values should be captured as structured fields for the sink
+        /// </summary>
+        internal bool CapturesFields => Sink.CapturesFields;
 
-            // Write to log file
-            lock (_lock)
-            {
-                try
-                {
-                    File.AppendAllText(_logFilePath, logMessage + Environment.NewLine);
-                }
-                catch (Exception ex)
-                {
-                    // Fallback to debug output if file writing fails
-                    System.Diagnostics.Debug.WriteLine($"Failed to write to log file: {ex.Message}");
-                }
-            }
+        private AsyncLogSink Sink => _sink ?? AsyncLogSink.Default;
+
+        private void Log(LogLevel level, string message, IReadOnlyList<KeyValuePair<string, object?>>? fields = null)
+        {
+            if (!IsEnabled(level)) return;
+
+            var entry = new LogEntry(DateTime.Now, level, _name, message, fields);
+            Sink.Enqueue(entry);
 
 #if DEBUG
             // Write to debug output as well in debug builds
-            System.Diagnostics.Debug.WriteLine(logMessage);
+            System.Diagnostics.Debug.WriteLine($"[{entry.Timestamp:yyyy-MM-dd HH:mm:ss.fff}] [{level}] [{_name}] {message}");
 #endif
         }
 
@@ -86,18 +88,56 @@ namespace RhinoAI.Core
 
         public void LogTrace(string message) => Log(LogLevel.Trace, message);
         
-        public void LogDebug(string template, params object[] args) => Log(LogLevel.Debug, FormatMessage(template, args));
+        public void LogDebug(string template, params object[] args)
+        {
+            if (IsEnabled(LogLevel.Debug)) Log(LogLevel.Debug, FormatMessage(template, args));
+        }
+
+        public void LogDebug([InterpolatedStringHandlerArgument("")] ref LogDebugInterpolatedStringHandler message)
+        {
+            if (message.IsEnabled) Log(LogLevel.Debug, message.ToStringAndClear(), message.Fields);
+        }
         
-        public void LogInformation(string template, params object[] args) => Log(LogLevel.Information, FormatMessage(template, args));
+        public void LogInformation(string template, params object[] args)
+        {
+            if (IsEnabled(LogLevel.Information)) Log(LogLevel.Information, FormatMessage(template, args));
+        }
+
+        public void LogInformation([InterpolatedStringHandlerArgument("")] ref LogInformationInterpolatedStringHandler message)
+        {
+            if (message.IsEnabled) Log(LogLevel.Information, message.ToStringAndClear(), message.Fields);
+        }
         
-        public void LogWarning(string template, params object[] args) => Log(LogLevel.Warning, FormatMessage(template, args));
+        public void LogWarning(string template, params object[] args)
+        {
+            if (IsEnabled(LogLevel.Warning)) Log(LogLevel.Warning, FormatMessage(template, args));
+        }
+
+        public void LogWarning([InterpolatedStringHandlerArgument("")] ref LogWarningInterpolatedStringHandler message)
+        {
+            if (message.IsEnabled) Log(LogLevel.Warning, message.ToStringAndClear(), message.Fields);
+        }
         
         public void LogError(string message) => Log(LogLevel.Error, message);
+
+        public void LogError([InterpolatedStringHandlerArgument("")] ref LogErrorInterpolatedStringHandler message)
+        {
+            if (message.IsEnabled) Log(LogLevel.Error, message.ToStringAndClear(), message.Fields);
+        }
         
         public void LogError(Exception ex, string message)
         {
             Log(LogLevel.Error, $"{message}: {ex.Message}{Environment.NewLine}{ex.StackTrace}");
         }
+
+        public void LogError(Exception ex, [InterpolatedStringHandlerArgument("")] ref LogErrorInterpolatedStringHandler message)
+        {
+            if (message.IsEnabled)
+            {
+                var fields = message.Fields;
+                Log(LogLevel.Error, $"{message.ToStringAndClear()}: {ex.Message}{Environment.NewLine}{ex.StackTrace}", fields);
+            }
+        }
         
         public void LogCritical(string message) => Log(LogLevel.Critical, message);
 
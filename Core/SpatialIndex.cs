@@ -0,0 +1,665 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// Bounding volume hierarchy over object bounding boxes, keyed by object id. Objects are
+    /// inserted and removed one at a time as the document changes (the tree is kept balanced
+    /// with rotations), or bulk-loaded with a median split when a document is indexed.
+    /// Answers overlap, range and nearest-neighbour queries without scanning every object.
+    /// Any number of readers may query concurrently with a single writer.
+    /// </summary>
+    public class SpatialIndex
+    {
+        private const int Null = -1;
+
+        private readonly Dictionary<Guid, int> _leaves = new Dictionary<Guid, int>();
+        private readonly ReaderWriterLockSlim _lock = new ReaderWriterLockSlim(LockRecursionPolicy.NoRecursion);
+
+        private Node[] _nodes = new Node[16];
+        private int _nodeCount;
+        private int _freeList = Null;
+        private int _root = Null;
+
+        private struct Node
+        {
+            public SceneBounds Bounds;
+            public Guid Id;
+            public int Parent; // Next free node while on the free list
+            public int Child1;
+            public int Child2;
+            public int Height; // Leaves are 0
+
+            public bool IsLeaf => Child1 == Null;
+        }
+
+        /// <summary>
+        /// Number of indexed objects; objects without valid bounds are not indexed
+        /// </summary>
+        public int Count
+        {
+            get
+            {
+                _lock.EnterReadLock();
+                try
+                {
+                    return _leaves.Count;
+                }
+                finally
+                {
+                    _lock.ExitReadLock();
+                }
+            }
+        }
+
+        /// <summary>
+        /// Levels below the root; stays logarithmic in Count
+        /// </summary>
+        public int Height
+        {
+            get
+            {
+                _lock.EnterReadLock();
+                try
+                {
+                    return _root == Null ? 0 : _nodes[_root].Height;
+                }
+                finally
+                {
+                    _lock.ExitReadLock();
+                }
+            }
+        }
+
+        /// <summary>
+        /// Adds an object, or moves the entry with the same id; objects without valid bounds are removed
+        /// </summary>
+        public void Upsert(SceneObjectInfo info) => Upsert(info.Id, info.Bounds);
+
+        /// <summary>
+        /// Adds an object, or moves the entry with the same id; objects without valid bounds are removed
+        /// </summary>
+        public void Upsert(Guid id, SceneBounds bounds)
+        {
+            _lock.EnterWriteLock();
+            try
+            {
+                if (_leaves.TryGetValue(id, out var leaf))
+                {
+                    // Attribute changes re-describe an object without moving it
+                    if (bounds.IsValid && SameBounds(_nodes[leaf].Bounds, bounds)) return;
+
+                    RemoveLeaf(leaf);
+                    FreeNode(leaf);
+                    _leaves.Remove(id);
+                }
+
+                if (!bounds.IsValid) return;
+
+                leaf = AllocateNode();
+                _nodes[leaf].Bounds = bounds;
+                _nodes[leaf].Id = id;
+                InsertLeaf(leaf);
+                _leaves[id] = leaf;
+            }
+            finally
+            {
+                _lock.ExitWriteLock();
+            }
+        }
+
+        /// <summary>
+        /// Removes an object; returns false if it was not indexed
+        /// </summary>
+        public bool Remove(Guid id)
+        {
+            _lock.EnterWriteLock();
+            try
+            {
+                if (!_leaves.Remove(id, out var leaf)) return false;
+
+                RemoveLeaf(leaf);
+                FreeNode(leaf);
+                return true;
+            }
+            finally
+            {
+                _lock.ExitWriteLock();
+            }
+        }
+
+        /// <summary>
+        /// Replaces the whole index with a tree built top-down from <paramref name="objects"/>,
+        /// which is faster and gives a better tree than inserting them one by one
+        /// </summary>
+        public void Reset(IEnumerable<SceneObjectInfo> objects)
+        {
+            _lock.EnterWriteLock();
+            try
+            {
+                _leaves.Clear();
+                _nodes = new Node[16];
+                _nodeCount = 0;
+                _freeList = Null;
+                _root = Null;
+
+                var leaves = new List<int>();
+                foreach (var info in objects ?? Enumerable.Empty<SceneObjectInfo>())
+                {
+                    if (!info.Bounds.IsValid) continue;
+
+                    if (_leaves.TryGetValue(info.Id, out var existing))
+                    {
+                        // Last description wins, as with Upsert
+                        _nodes[existing].Bounds = info.Bounds;
+                        continue;
+                    }
+
+                    var leaf = AllocateNode();
+                    _nodes[leaf].Bounds = info.Bounds;
+                    _nodes[leaf].Id = info.Id;
+                    _leaves[info.Id] = leaf;
+                    leaves.Add(leaf);
+                }
+
+                if (leaves.Count > 0)
+                {
+                    // A tree over n leaves has n - 1 internal nodes
+                    if (_nodes.Length < 2 * leaves.Count)
+                    {
+                        Array.Resize(ref _nodes, 2 * leaves.Count);
+                    }
+
+                    var items = leaves.Select(leaf => new BuildItem(leaf, _nodes[leaf].Bounds)).ToArray();
+                    _root = Build(items, 0, items.Length);
+                    _nodes[_root].Parent = Null;
+                }
+            }
+            finally
+            {
+                _lock.ExitWriteLock();
+            }
+        }
+
+        public void Clear() => Reset(null);
+
+        public bool TryGetBounds(Guid id, out SceneBounds bounds)
+        {
+            _lock.EnterReadLock();
+            try
+            {
+                if (_leaves.TryGetValue(id, out var leaf))
+                {
+                    bounds = _nodes[leaf].Bounds;
+                    return true;
+                }
+
+                bounds = SceneBounds.Empty;
+                return false;
+            }
+            finally
+            {
+                _lock.ExitReadLock();
+            }
+        }
+
+        /// <summary>
+        /// Objects whose bounding boxes intersect <paramref name="box"/>; touching counts
+        /// </summary>
+        public List<Guid> QueryOverlap(SceneBounds box)
+        {
+            var results = new List<Guid>();
+            if (!box.IsValid) return results;
+
+            _lock.EnterReadLock();
+            try
+            {
+                if (_root == Null) return results;
+
+                var stack = new Stack<int>(64);
+                stack.Push(_root);
+                while (stack.Count > 0)
+                {
+                    ref readonly var node = ref _nodes[stack.Pop()];
+                    if (!node.Bounds.Overlaps(box)) continue;
+
+                    if (node.IsLeaf)
+                    {
+                        results.Add(node.Id);
+                    }
+                    else
+                    {
+                        stack.Push(node.Child1);
+                        stack.Push(node.Child2);
+                    }
+                }
+
+                return results;
+            }
+            finally
+            {
+                _lock.ExitReadLock();
+            }
+        }
+
+        /// <summary>
+        /// Objects whose bounding boxes come within <paramref name="radius"/> of a point, e.g.
+        /// "everything within 20 units"; a small radius asks whether the point is occupied
+        /// </summary>
+        public List<Guid> QueryRange(double x, double y, double z, double radius)
+        {
+            var results = new List<Guid>();
+            if (radius < 0) return results;
+            var radiusSquared = radius * radius;
+
+            _lock.EnterReadLock();
+            try
+            {
+                if (_root == Null) return results;
+
+                var stack = new Stack<int>(64);
+                stack.Push(_root);
+                while (stack.Count > 0)
+                {
+                    ref readonly var node = ref _nodes[stack.Pop()];
+                    if (node.Bounds.DistanceSquaredTo(x, y, z) > radiusSquared) continue;
+
+                    if (node.IsLeaf)
+                    {
+                        results.Add(node.Id);
+                    }
+                    else
+                    {
+                        stack.Push(node.Child1);
+                        stack.Push(node.Child2);
+                    }
+                }
+
+                return results;
+            }
+            finally
+            {
+                _lock.ExitReadLock();
+            }
+        }
+
+        /// <summary>
+        /// Up to <paramref name="count"/> objects closest to a point, nearest first, with the distance
+        /// from the point to each bounding box (zero when the point is inside it)
+        /// </summary>
+        public List<(Guid Id, double Distance)> Nearest(double x, double y, double z, int count = 1,
+            double maxDistance = double.PositiveInfinity)
+        {
+            var results = new List<(Guid Id, double Distance)>();
+            if (count <= 0) return results;
+            var maxDistanceSquared = maxDistance * maxDistance;
+
+            _lock.EnterReadLock();
+            try
+            {
+                if (_root == Null) return results;
+
+                // Best-first: a node is never closer than its parent, so leaves come off the queue in distance order
+                var queue = new PriorityQueue<int, double>();
+                queue.Enqueue(_root, _nodes[_root].Bounds.DistanceSquaredTo(x, y, z));
+                while (queue.TryDequeue(out var index, out var distanceSquared))
+                {
+                    if (distanceSquared > maxDistanceSquared) break;
+
+                    ref readonly var node = ref _nodes[index];
+                    if (node.IsLeaf)
+                    {
+                        results.Add((node.Id, Math.Sqrt(distanceSquared)));
+                        if (results.Count == count) break;
+                    }
+                    else
+                    {
+                        queue.Enqueue(node.Child1, _nodes[node.Child1].Bounds.DistanceSquaredTo(x, y, z));
+                        queue.Enqueue(node.Child2, _nodes[node.Child2].Bounds.DistanceSquaredTo(x, y, z));
+                    }
+                }
+
+                return results;
+            }
+            finally
+            {
+                _lock.ExitReadLock();
+            }
+        }
+
+        private int AllocateNode()
+        {
+            int index;
+            if (_freeList != Null)
+            {
+                index = _freeList;
+                _freeList = _nodes[index].Parent;
+            }
+            else
+            {
+                if (_nodeCount == _nodes.Length)
+                {
+                    Array.Resize(ref _nodes, _nodes.Length * 2);
+                }
+                index = _nodeCount++;
+            }
+
+            _nodes[index] = new Node { Parent = Null, Child1 = Null, Child2 = Null };
+            return index;
+        }
+
+        private void FreeNode(int index)
+        {
+            _nodes[index] = new Node { Parent = _freeList, Child1 = Null, Child2 = Null, Height = -1 };
+            _freeList = index;
+        }
+
+        /// <summary>
+        /// Top-down build: split at the median centroid along the longest axis of the centroids' extent
+        /// </summary>
+        private int Build(BuildItem[] items, int start, int count)
+        {
+            if (count == 1) return items[start].Node;
+
+            double minX = double.PositiveInfinity, minY = double.PositiveInfinity, minZ = double.PositiveInfinity;
+            double maxX = double.NegativeInfinity, maxY = double.NegativeInfinity, maxZ = double.NegativeInfinity;
+            for (var i = start; i < start + count; i++)
+            {
+                ref readonly var item = ref items[i];
+                minX = Math.Min(minX, item.X);
+                minY = Math.Min(minY, item.Y);
+                minZ = Math.Min(minZ, item.Z);
+                maxX = Math.Max(maxX, item.X);
+                maxY = Math.Max(maxY, item.Y);
+                maxZ = Math.Max(maxZ, item.Z);
+            }
+
+            var dx = maxX - minX;
+            var dy = maxY - minY;
+            var dz = maxZ - minZ;
+            var axis = dx >= dy && dx >= dz ? 0 : dy >= dz ? 1 : 2;
+
+            var half = count / 2;
+            SelectMedian(items, start, start + count - 1, start + half, axis);
+
+            var left = Build(items, start, half);
+            var right = Build(items, start + half, count - half);
+
+            var parent = AllocateNode();
+            ref var node = ref _nodes[parent];
+            node.Child1 = left;
+            node.Child2 = right;
+            node.Bounds = _nodes[left].Bounds.Union(_nodes[right].Bounds);
+            node.Height = 1 + Math.Max(_nodes[left].Height, _nodes[right].Height);
+            _nodes[left].Parent = parent;
+            _nodes[right].Parent = parent;
+            return parent;
+        }
+
+        /// <summary>
+        /// Partially orders items[left..right] so items[k] has the k-th smallest centroid on the axis
+        /// </summary>
+        private static void SelectMedian(BuildItem[] items, int left, int right, int k, int axis)
+        {
+            while (right > left)
+            {
+                var pivot = items[(left + right) >> 1].Centroid(axis);
+                var i = left;
+                var j = right;
+                while (i <= j)
+                {
+                    while (items[i].Centroid(axis) < pivot) i++;
+                    while (items[j].Centroid(axis) > pivot) j--;
+                    if (i <= j)
+                    {
+                        (items[i], items[j]) = (items[j], items[i]);
+                        i++;
+                        j--;
+                    }
+                }
+
+                if (k <= j) right = j;
+                else if (k >= i) left = i;
+                else return;
+            }
+        }
+
+        /// <summary>
+        /// A leaf and its centroid, kept together so building does not chase node indices
+        /// </summary>
+        private readonly struct BuildItem
+        {
+            public BuildItem(int node, SceneBounds bounds)
+            {
+                Node = node;
+                X = (bounds.MinX + bounds.MaxX) / 2;
+                Y = (bounds.MinY + bounds.MaxY) / 2;
+                Z = (bounds.MinZ + bounds.MaxZ) / 2;
+            }
+
+            public readonly int Node;
+            public readonly double X;
+            public readonly double Y;
+            public readonly double Z;
+
+            public double Centroid(int axis) => axis == 0 ? X : axis == 1 ? Y : Z;
+        }
+
+        /// <summary>
+        /// Attach a leaf next to the sibling that grows the tree's total surface area least
+        /// </summary>
+        private void InsertLeaf(int leaf)
+        {
+            if (_root == Null)
+            {
+                _root = leaf;
+                _nodes[leaf].Parent = Null;
+                return;
+            }
+
+            var leafBounds = _nodes[leaf].Bounds;
+            var index = _root;
+            while (!_nodes[index].IsLeaf)
+            {
+                ref readonly var node = ref _nodes[index];
+                var area = node.Bounds.HalfSurfaceArea;
+                var combinedArea = node.Bounds.Union(leafBounds).HalfSurfaceArea;
+
+                // Cost of pairing with this node, and the area every descent below it adds anyway
+                var cost = 2 * combinedArea;
+                var inheritanceCost = 2 * (combinedArea - area);
+
+                var cost1 = DescentCost(node.Child1, leafBounds) + inheritanceCost;
+                var cost2 = DescentCost(node.Child2, leafBounds) + inheritanceCost;
+
+                if (cost < cost1 && cost < cost2) break;
+                index = cost1 < cost2 ? node.Child1 : node.Child2;
+            }
+
+            var sibling = index;
+            var oldParent = _nodes[sibling].Parent;
+            var newParent = AllocateNode();
+            _nodes[newParent].Parent = oldParent;
+            _nodes[newParent].Bounds = leafBounds.Union(_nodes[sibling].Bounds);
+            _nodes[newParent].Height = _nodes[sibling].Height + 1;
+            _nodes[newParent].Child1 = sibling;
+            _nodes[newParent].Child2 = leaf;
+            _nodes[sibling].Parent = newParent;
+            _nodes[leaf].Parent = newParent;
+
+            if (oldParent == Null)
+            {
+                _root = newParent;
+            }
+            else
+            {
+                ReplaceChild(oldParent, sibling, newParent);
+            }
+
+            Refit(newParent);
+        }
+
+        private double DescentCost(int child, SceneBounds leafBounds)
+        {
+            ref readonly var node = ref _nodes[child];
+            var combinedArea = node.Bounds.Union(leafBounds).HalfSurfaceArea;
+            return node.IsLeaf ? combinedArea : combinedArea - node.Bounds.HalfSurfaceArea;
+        }
+
+        private void RemoveLeaf(int leaf)
+        {
+            if (leaf == _root)
+            {
+                _root = Null;
+                return;
+            }
+
+            var parent = _nodes[leaf].Parent;
+            var grandParent = _nodes[parent].Parent;
+            var sibling = _nodes[parent].Child1 == leaf ? _nodes[parent].Child2 : _nodes[parent].Child1;
+
+            FreeNode(parent);
+            _nodes[sibling].Parent = grandParent;
+
+            if (grandParent == Null)
+            {
+                _root = sibling;
+                return;
+            }
+
+            ReplaceChild(grandParent, parent, sibling);
+            Refit(grandParent);
+        }
+
+        /// <summary>
+        /// Rebalance and recompute bounds and heights from <paramref name="index"/> up to the root
+        /// </summary>
+        private void Refit(int index)
+        {
+            while (index != Null)
+            {
+                index = Balance(index);
+
+                ref var node = ref _nodes[index];
+                node.Height = 1 + Math.Max(_nodes[node.Child1].Height, _nodes[node.Child2].Height);
+                node.Bounds = _nodes[node.Child1].Bounds.Union(_nodes[node.Child2].Bounds);
+                index = node.Parent;
+            }
+        }
+
+        private void ReplaceChild(int parent, int oldChild, int newChild)
+        {
+            if (_nodes[parent].Child1 == oldChild)
+            {
+                _nodes[parent].Child1 = newChild;
+            }
+            else
+            {
+                _nodes[parent].Child2 = newChild;
+            }
+        }
+
+        /// <summary>
+        /// If one subtree of A is more than one level taller than the other, rotate it up;
+        /// returns the index of the node now at A's position
+        /// </summary>
+        private int Balance(int iA)
+        {
+            ref var a = ref _nodes[iA];
+            if (a.IsLeaf || a.Height < 2) return iA;
+
+            var iB = a.Child1;
+            var iC = a.Child2;
+            ref var b = ref _nodes[iB];
+            ref var c = ref _nodes[iC];
+            var balance = c.Height - b.Height;
+
+            if (balance > 1)
+            {
+                // Rotate C up
+                var iF = c.Child1;
+                var iG = c.Child2;
+                ref var f = ref _nodes[iF];
+                ref var g = ref _nodes[iG];
+
+                c.Child1 = iA;
+                c.Parent = a.Parent;
+                a.Parent = iC;
+                if (c.Parent == Null) _root = iC;
+                else ReplaceChild(c.Parent, iA, iC);
+
+                if (f.Height > g.Height)
+                {
+                    c.Child2 = iF;
+                    a.Child2 = iG;
+                    g.Parent = iA;
+                    a.Bounds = b.Bounds.Union(g.Bounds);
+                    c.Bounds = a.Bounds.Union(f.Bounds);
+                    a.Height = 1 + Math.Max(b.Height, g.Height);
+                    c.Height = 1 + Math.Max(a.Height, f.Height);
+                }
+                else
+                {
+                    c.Child2 = iG;
+                    a.Child2 = iF;
+                    f.Parent = iA;
+                    a.Bounds = b.Bounds.Union(f.Bounds);
+                    c.Bounds = a.Bounds.Union(g.Bounds);
+                    a.Height = 1 + Math.Max(b.Height, f.Height);
+                    c.Height = 1 + Math.Max(a.Height, g.Height);
+                }
+
+                return iC;
+            }
+
+            if (balance < -1)
+            {
+                // Rotate B up
+                var iD = b.Child1;
+                var iE = b.Child2;
+                ref var d = ref _nodes[iD];
+                ref var e = ref _nodes[iE];
+
+                b.Child1 = iA;
+                b.Parent = a.Parent;
+                a.Parent = iB;
+                if (b.Parent == Null) _root = iB;
+                else ReplaceChild(b.Parent, iA, iB);
+
+                if (d.Height > e.Height)
+                {
+                    b.Child2 = iD;
+                    a.Child1 = iE;
+                    e.Parent = iA;
+                    a.Bounds = c.Bounds.Union(e.Bounds);
+                    b.Bounds = a.Bounds.Union(d.Bounds);
+                    a.Height = 1 + Math.Max(c.Height, e.Height);
+                    b.Height = 1 + Math.Max(a.Height, d.Height);
+                }
+                else
+                {
+                    b.Child2 = iE;
+                    a.Child1 = iD;
+                    d.Parent = iA;
+                    a.Bounds = c.Bounds.Union(d.Bounds);
+                    b.Bounds = a.Bounds.Union(e.Bounds);
+                    a.Height = 1 + Math.Max(c.Height, d.Height);
+                    b.Height = 1 + Math.Max(a.Height, e.Height);
+                }
+
+                return iB;
+            }
+
+            return iA;
+        }
+
+        private static bool SameBounds(SceneBounds a, SceneBounds b)
+        {
+            return a.MinX == b.MinX && a.MinY == b.MinY && a.MinZ == b.MinZ &&
+                   a.MaxX == b.MaxX && a.MaxY == b.MaxY && a.MaxZ == b.MaxZ;
+        }
+    }
+}
@@ -0,0 +1,162 @@
+using System;
+using System.Collections.Generic;
+
+namespace RhinoAI.Core
+{
+    /// <summary>
+    /// Resolves the parameters of every generative design variant up front, so variants can be
+    /// built in any order and on any thread. Each variant's random jitter comes from its own seed,
+    /// derived from the base seed and the variant index, so a variant is the same however many
+    /// run alongside it. Specs with equal values describe identical geometry.
+    /// </summary>
+    public static class VariantPlanner
+    {
+        /// <summary>
+        /// Default growth per variant index for each kind of variant
+        /// </summary>
+        public static double DefaultVariation(string kind) => kind switch
+        {
+            "box" => 0.15,
+            "cylinder" => 0.25,
+            _ => 0.2
+        };
+
+        /// <summary>
+        /// Seed for one variant; stable across processes, unlike HashCode.Combine
+        /// </summary>
+        public static int SeedFor(int baseSeed, int index)
+        {
+            // SplitMix64 finalizer over both inputs
+            var z = unchecked(((ulong)(uint)baseSeed << 32 | (uint)index) + 0x9E3779B97F4A7C15UL);
+            z = unchecked((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9UL);
+            z = unchecked((z ^ (z >> 27)) * 0x94D049BB133111EBUL);
+            return (int)(z ^ (z >> 31));
+        }
+
+        /// <summary>
+        /// One spec per variant index, in index order
+        /// </summary>
+        public static VariantSpec[] Plan(VariantInputs inputs, int count)
+        {
+            if (count < 0) throw new ArgumentOutOfRangeException(nameof(count));
+
+            var kind = inputs.Kind is "sphere" or "box" or "cylinder" ? inputs.Kind : "sphere";
+            var variation = inputs.Variation ?? DefaultVariation(kind);
+            var specs = new VariantSpec[count];
+
+            for (int i = 0; i < count; i++)
+            {
+                var scale = 1.0 + i * variation;
+                if (inputs.Jitter > 0)
+                {
+                    var random = new Random(SeedFor(inputs.Seed, i));
+                    scale *= 1.0 + inputs.Jitter * (2 * random.NextDouble() - 1);
+                }
+
+                // Only the dimensions a kind uses go into its spec, so equal geometry means equal specs
+                specs[i] = kind switch
+                {
+                    "box" => new VariantSpec(kind, inputs.CenterX, inputs.CenterY, inputs.CenterZ, 0, inputs.Size * scale, 0),
+                    "cylinder" => new VariantSpec(kind, inputs.CenterX, inputs.CenterY, inputs.CenterZ, inputs.Radius * scale, 0, inputs.Height * scale),
+                    _ => new VariantSpec(kind, inputs.CenterX, inputs.CenterY, inputs.CenterZ, inputs.Radius * scale, 0, 0)
+                };
+            }
+
+            return specs;
+        }
+
+        /// <summary>
+        /// Variant indices grouped by spec, in order of each spec's first index
+        /// </summary>
+        public static List<VariantGroup> GroupIdentical(IReadOnlyList<VariantSpec> specs)
+        {
+            var groups = new List<VariantGroup>();
+            var groupBySpec = new Dictionary<VariantSpec, VariantGroup>();
+
+            for (int i = 0; i < specs.Count; i++)
+            {
+                if (!groupBySpec.TryGetValue(specs[i], out var group))
+                {
+                    group = new VariantGroup(specs[i]);
+                    groupBySpec[specs[i]] = group;
+                    groups.Add(group);
+                }
+                group.Indices.Add(i);
+            }
+
+            return groups;
+        }
+    }
+
+    /// <summary>
+    /// Prompt parameters a variant plan is computed from
+    /// </summary>
+    public class VariantInputs
+    {
+        public string Kind { get; set; } = "sphere";
+        public double CenterX { get; set; }
+        public double CenterY { get; set; }
+        public double CenterZ { get; set; }
+        public double Radius { get; set; } = 1.0;
+        public double Size { get; set; } = 1.0;
+        public double Height { get; set; } = 2.0;
+
+        /// <summary>Growth per variant index; null uses the kind's default</summary>
+        public double? Variation { get; set; }
+
+        /// <summary>Relative random scale change per variant, e.g. 0.1 for up to ±10%; zero disables</summary>
+        public double Jitter { get; set; }
+
+        public int Seed { get; set; }
+    }
+
+    /// <summary>
+    /// Everything that determines one variant's geometry; equal specs build equal geometry
+    /// </summary>
+    public readonly struct VariantSpec : IEquatable<VariantSpec>
+    {
+        public VariantSpec(string kind, double centerX, double centerY, double centerZ, double radius, double size, double height)
+        {
+            Kind = kind ?? string.Empty;
+            CenterX = centerX;
+            CenterY = centerY;
+            CenterZ = centerZ;
+            Radius = radius;
+            Size = size;
+            Height = height;
+        }
+
+        public string Kind { get; }
+        public double CenterX { get; }
+        public double CenterY { get; }
+        public double CenterZ { get; }
+        public double Radius { get; }
+        public double Size { get; }
+        public double Height { get; }
+
+        public bool Equals(VariantSpec other)
+        {
+            return string.Equals(Kind, other.Kind, StringComparison.Ordinal) &&
+                   CenterX.Equals(other.CenterX) && CenterY.Equals(other.CenterY) && CenterZ.Equals(other.CenterZ) &&
+                   Radius.Equals(other.Radius) && Size.Equals(other.Size) && Height.Equals(other.Height);
+        }
+
+        public override bool Equals(object obj) => obj is VariantSpec other && Equals(other);
+
+        public override int GetHashCode() => HashCode.Combine(Kind, CenterX, CenterY, CenterZ, Radius, Size, Height);
+    }
+
+    /// <summary>
+    /// Variant indices sharing one spec
+    /// </summary>
+    public class VariantGroup
+    {
+        public VariantGroup(VariantSpec spec)
+        {
+            Spec = spec;
+        }
+
+        public VariantSpec Spec { get; }
+        public List<int> Indices { get; } = new List<int>();
+    }
+}
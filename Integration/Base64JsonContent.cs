@@ -0,0 +1,123 @@
+using System;
+using System.Buffers;
+using System.Buffers.Text;
+using System.IO;
+using System.Net;
+using System.Net.Http;
+using System.Net.Http.Headers;
+using System.Text;
+using System.Text.Json;
+using System.Text.Json.Serialization.Metadata;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace RhinoAI.Integration
+{
+    /// <summary>
+    /// JSON request body carrying one binary payload as a base64 string, e.g. an image data URL.
+    /// The request is serialized once with a placeholder where the payload goes; the payload is
+    /// base64-encoded chunk by chunk into a pooled buffer while the body is written to the
+    /// request stream, so neither the base64 string nor the full JSON string is ever built.
+    /// </summary>
+    public class Base64JsonContent : HttpContent
+    {
+        /// <summary>Multiple of 3, so every chunk but the last encodes without padding</summary>
+        private const int ChunkSize = 3 * 16 * 1024;
+
+        private readonly byte[] _prefix;
+        private readonly byte[] _suffix;
+        private readonly ReadOnlyMemory<byte> _payload;
+
+        private Base64JsonContent(byte[] prefix, ReadOnlyMemory<byte> payload, byte[] suffix)
+        {
+            _prefix = prefix;
+            _payload = payload;
+            _suffix = suffix;
+            Headers.ContentType = new MediaTypeHeaderValue("application/json") { CharSet = "utf-8" };
+        }
+
+        /// <summary>
+        /// Serialize <paramref name="request"/>, whose one string value contains <paramref name="placeholder"/>,
+        /// and stream <paramref name="payload"/> as base64 in its place. The payload must stay valid until the request is sent.
+        /// </summary>
+        public static Base64JsonContent Create<T>(T request, JsonTypeInfo<T> typeInfo, string placeholder, ReadOnlyMemory<byte> payload)
+        {
+            if (typeInfo == null) throw new ArgumentNullException(nameof(typeInfo));
+            if (string.IsNullOrEmpty(placeholder)) throw new ArgumentException("A placeholder is required", nameof(placeholder));
+
+            var json = JsonSerializer.SerializeToUtf8Bytes(request, typeInfo);
+            var marker = Encoding.UTF8.GetBytes(placeholder);
+            var index = json.AsSpan().IndexOf(marker);
+            if (index < 0)
+            {
+                throw new ArgumentException("The serialized request does not contain the placeholder verbatim", nameof(placeholder));
+            }
+
+            return new Base64JsonContent(json[..index], payload, json[(index + marker.Length)..]);
+        }
+
+        protected override Task SerializeToStreamAsync(Stream stream, TransportContext? context)
+        {
+            return SerializeToStreamAsync(stream, context, CancellationToken.None);
+        }
+
+        protected override async Task SerializeToStreamAsync(Stream stream, TransportContext? context, CancellationToken cancellationToken)
+        {
+            await stream.WriteAsync(_prefix, cancellationToken);
+
+            var buffer = ArrayPool<byte>.Shared.Rent(Base64.GetMaxEncodedToUtf8Length(ChunkSize));
+            try
+            {
+                for (int offset = 0; offset < _payload.Length; offset += ChunkSize)
+                {
+                    var written = EncodeChunk(offset, buffer);
+                    await stream.WriteAsync(buffer.AsMemory(0, written), cancellationToken);
+                }
+            }
+            finally
+            {
+                ArrayPool<byte>.Shared.Return(buffer);
+            }
+
+            await stream.WriteAsync(_suffix, cancellationToken);
+        }
+
+        protected override void SerializeToStream(Stream stream, TransportContext? context, CancellationToken cancellationToken)
+        {
+            stream.Write(_prefix);
+
+            var buffer = ArrayPool<byte>.Shared.Rent(Base64.GetMaxEncodedToUtf8Length(ChunkSize));
+            try
+            {
+                for (int offset = 0; offset < _payload.Length; offset += ChunkSize)
+                {
+                    cancellationToken.ThrowIfCancellationRequested();
+                    var written = EncodeChunk(offset, buffer);
+                    stream.Write(buffer, 0, written);
+                }
+            }
+            finally
+            {
+                ArrayPool<byte>.Shared.Return(buffer);
+            }
+
+            stream.Write(_suffix);
+        }
+
+        /// <summary>
+        /// Exact length, so the body is sent with Content-Length rather than chunked
+        /// </summary>
+        protected override bool TryComputeLength(out long length)
+        {
+            length = _prefix.Length + 4L * ((_payload.Length + 2) / 3) + _suffix.Length;
+            return true;
+        }
+
+        private int EncodeChunk(int offset, byte[] buffer)
+        {
+            var chunk = _payload.Span.Slice(offset, Math.Min(ChunkSize, _payload.Length - offset));
+            Base64.EncodeToUtf8(chunk, buffer, out _, out var written);
+            return written;
+        }
+    }
+}
@@ -1,8 +1,11 @@
 using System;
+using System.Collections.Generic;
 using System.Net.Http;
+using System.Runtime.CompilerServices;
 using System.Text;
 using System.Text.Json;
 using System.Text.Json.Serialization;
+using System.Threading;
 using System.Threading.Tasks;
 
 using RhinoAI.Core;
@@ -20,10 +23,16 @@ namespace RhinoAI.Integration
         private bool _disposed = false;
 
         public ClaudeClient(ConfigurationManager configManager, SimpleLogger logger)
+            : this(configManager, logger, PooledHttpClientFactory.Default)
+        {
+        }
+
+        public ClaudeClient(ConfigurationManager configManager, SimpleLogger logger, PooledHttpClientFactory httpClientFactory)
         {
             _configManager = configManager ?? throw new ArgumentNullException(nameof(configManager));
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
-            _httpClient = new HttpClient();
+            if (httpClientFactory == null) throw new ArgumentNullException(nameof(httpClientFactory));
+            _httpClient = httpClientFactory.CreateClient(PooledHttpClientFactory.ClaudeProvider);
             
             InitializeClient();
         }
@@ -66,7 +75,8 @@ namespace RhinoAI.Integration
         /// <summary>
         /// Process text input using Claude models
         /// </summary>
-        public async Task<string> ProcessTextAsync(string systemPrompt, string userInput, string model = "claude-3-sonnet-20240229")
+        public async Task<string> ProcessTextAsync(string systemPrompt, string userInput, string model = "claude-3-sonnet-20240229",
+            CancellationToken cancellationToken = default)
         {
             if (!IsConfigured)
                 throw new InvalidOperationException("Claude client not configured");
@@ -84,20 +94,32 @@ namespace RhinoAI.Integration
                     }
                 };
 
-                var json = JsonSerializer.Serialize(request, new JsonSerializerOptions { WriteIndented = false });
+                var json = JsonSerializer.Serialize(request, RhinoAIJsonContext.Default.ClaudeRequest);
                 var content = new StringContent(json, Encoding.UTF8, "application/json");
 
-                var response = await _httpClient.PostAsync("messages", content);
-                response.EnsureSuccessStatusCode();
+                string responseJson;
+                using (PipelineTelemetry.StartSpan("Claude.Http", "Provider"))
+                {
+                    var response = await _httpClient.PostAsync("messages", content, cancellationToken);
+                    response.EnsureSuccessStatusCode();
+                    responseJson = await response.Content.ReadAsStringAsync(cancellationToken);
+                }
 
-                var responseJson = await response.Content.ReadAsStringAsync();
-                var claudeResponse = JsonSerializer.Deserialize<ClaudeResponse>(responseJson);
+                ClaudeResponse claudeResponse;
+                using (PipelineTelemetry.StartSpan("Claude.ParseResponse", "Provider"))
+                {
+                    claudeResponse = JsonSerializer.Deserialize(responseJson, RhinoAIJsonContext.Default.ClaudeResponse);
+                }
 
                 var result = claudeResponse?.Content?[0]?.Text ?? "No response received";
                 _logger.LogInformation("Claude text processing completed successfully");
 
                 return result;
             }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                throw;
+            }
             catch (Exception ex)
             {
                 _logger.LogError(ex, "Claude text processing failed");
@@ -105,6 +127,45 @@ namespace RhinoAI.Integration
             }
         }
 
+        /// <summary>
+        /// Stream a Claude response token by token
+        /// </summary>
+        public async IAsyncEnumerable<string> StreamTextAsync(string systemPrompt, string userInput, string model = "claude-3-sonnet-20240229",
+            [EnumeratorCancellation] CancellationToken cancellationToken = default)
+        {
+            if (!IsConfigured)
+                throw new InvalidOperationException("Claude client not configured");
+
+            var request = new ClaudeRequest
+            {
+                Model = model,
+                MaxTokens = 1000,
+                System = systemPrompt,
+                Messages = new[]
+                {
+                    new ClaudeMessage { Role = "user", Content = userInput }
+                },
+                Stream = true
+            };
+
+            using var httpRequest = new HttpRequestMessage(HttpMethod.Post, "messages")
+            {
+                Content = new StringContent(JsonSerializer.Serialize(request, RhinoAIJsonContext.Default.ClaudeRequest), Encoding.UTF8, "application/json")
+            };
+
+            // Read headers only so tokens can be consumed while the body is still arriving
+            using var response = await _httpClient.SendAsync(httpRequest, HttpCompletionOption.ResponseHeadersRead, cancellationToken);
+            response.EnsureSuccessStatusCode();
+
+            await using var stream = await response.Content.ReadAsStreamAsync(cancellationToken);
+            await foreach (var token in StreamingResponseReader.ReadClaudeStreamAsync(stream, cancellationToken))
+            {
+                yield return token;
+            }
+
+            _logger.LogInformation("Claude text streaming completed successfully");
+        }
+
         /// <summary>
         /// Analyze and provide detailed reasoning for 3D modeling tasks
         /// </summary>
@@ -193,6 +254,10 @@ Provide specific, actionable recommendations with Rhino-specific guidance.";
 
         [JsonPropertyName("messages")]
         public ClaudeMessage[] Messages { get; set; }
+
+        [JsonPropertyName("stream")]
+        [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingDefault)]
+        public bool Stream { get; set; }
     }
 
     public class ClaudeMessage
@@ -1,7 +1,11 @@
 using System;
+using System.IO;
+using System.IO.Compression;
+using System.Net;
 using System.Net.Http;
-using System.Text;
+using System.Net.Http.Headers;
 using System.Text.Json;
+using System.Threading;
 using System.Threading.Tasks;
 
 using RhinoAI.Core;
@@ -16,25 +20,56 @@ namespace RhinoAI.Integration
         private readonly HttpClient _httpClient;
         private readonly SimpleLogger _logger;
         private readonly ConfigurationManager _configManager;
+        private readonly SemaphoreSlim _sceneSyncLock = new SemaphoreSlim(1, 1);
         private bool _disposed = false;
 
+        // Last scene context the server confirmed, the base for the next delta
+        private SceneContext _acknowledgedContext;
+        private long _acknowledgedVersion;
+
+        private bool _deltaSceneSync = true;
+        private bool _compressRequests = true;
+        private int _compressionThresholdBytes = 1024;
+
+        private long _sceneUpdatesSent;
+        private long _sceneUpdatesSkipped;
+        private long _sceneBytesSent;
+
         public MCPClient(ConfigurationManager configManager, SimpleLogger logger)
+            : this(configManager, logger, PooledHttpClientFactory.Default)
+        {
+        }
+
+        public MCPClient(ConfigurationManager configManager, SimpleLogger logger, PooledHttpClientFactory httpClientFactory)
         {
             _configManager = configManager ?? throw new ArgumentNullException(nameof(configManager));
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
-            _httpClient = new HttpClient();
+            if (httpClientFactory == null) throw new ArgumentNullException(nameof(httpClientFactory));
+            _httpClient = httpClientFactory.CreateClient(PooledHttpClientFactory.MCPProvider);
             
             InitializeClient();
         }
 
         public bool IsConnected { get; private set; }
 
+        /// <summary>Scene updates posted to the server, including full snapshots</summary>
+        public long SceneUpdatesSent => Interlocked.Read(ref _sceneUpdatesSent);
+
+        /// <summary>Scene updates not sent because nothing changed since the acknowledged version</summary>
+        public long SceneUpdatesSkipped => Interlocked.Read(ref _sceneUpdatesSkipped);
+
+        /// <summary>Request body bytes of scene updates, after compression</summary>
+        public long SceneBytesSent => Interlocked.Read(ref _sceneBytesSent);
+
         private void InitializeClient()
         {
             try
             {
                 var serverUrl = _configManager.GetSetting("MCP:ServerUrl", "http://localhost:5005/");
                 _httpClient.BaseAddress = new Uri(serverUrl);
+                _deltaSceneSync = _configManager.GetSetting("MCP:DeltaSceneSync", true);
+                _compressRequests = _configManager.GetSetting("MCP:CompressRequests", true);
+                _compressionThresholdBytes = _configManager.GetSetting("MCP:CompressionThresholdBytes", 1024);
                 IsConnected = true;
                 _logger.LogInformation("MCP Client configured for: {0}", serverUrl);
             }
@@ -46,9 +81,10 @@ namespace RhinoAI.Integration
         }
 
         /// <summary>
-        /// Send scene context to MCP server for AI processing
+        /// Send scene context to MCP server for AI processing. Only the changes since the last
+        /// version the server acknowledged are sent, and nothing at all if the scene is unchanged.
         /// </summary>
-        public async Task SendSceneContextAsync(SceneContext context)
+        public async Task SendSceneContextAsync(SceneContext context, CancellationToken cancellationToken = default)
         {
             if (!IsConnected)
             {
@@ -56,27 +92,105 @@ namespace RhinoAI.Integration
                 return;
             }
 
+            if (context == null) return;
+
+            // Updates from the monitoring timer and analysis batches must not race for the same base version
+            await _sceneSyncLock.WaitAsync(cancellationToken);
             try
             {
-                var request = new MCPRequest
+                if (!_deltaSceneSync)
                 {
-                    Type = "scene_analysis",
-                    Context = context,
-                    Timestamp = DateTime.UtcNow
-                };
+                    using var fullResponse = await PostAsync("/api/context",
+                        new MCPRequest { Type = "scene_analysis", Context = context, Timestamp = DateTime.UtcNow }, cancellationToken);
+                    fullResponse.EnsureSuccessStatusCode();
+                    _logger.LogInformation("Scene context sent to MCP server successfully");
+                    return;
+                }
 
-                var json = JsonSerializer.Serialize(request, new JsonSerializerOptions { WriteIndented = true });
-                var content = new StringContent(json, Encoding.UTF8, "application/json");
+                var delta = SceneContextDiff.Compute(_acknowledgedContext, context, _acknowledgedVersion, _acknowledgedVersion + 1);
+                if (_acknowledgedContext != null && delta.IsEmpty)
+                {
+                    Interlocked.Increment(ref _sceneUpdatesSkipped);
+                    return;
+                }
 
-                var response = await _httpClient.PostAsync("/api/context", content);
-                response.EnsureSuccessStatusCode();
+                var (statusCode, sync) = await SendSceneDeltaAsync(delta, cancellationToken);
+                if (statusCode == HttpStatusCode.Conflict)
+                {
+                    // The server lost our base version, e.g. it restarted; start over with a full snapshot
+                    var nextVersion = Math.Max(_acknowledgedVersion, sync?.Version ?? 0) + 1;
+                    delta = SceneContextDiff.Compute(null, context, 0, nextVersion);
+                    (statusCode, sync) = await SendSceneDeltaAsync(delta, cancellationToken);
+                }
+
+                if (statusCode != HttpStatusCode.OK || sync?.Success != true)
+                {
+                    _logger.LogWarning("MCP server did not accept scene context version {0}: {1}", delta.Version, statusCode);
+                    return;
+                }
 
-                _logger.LogInformation("Scene context sent to MCP server successfully");
+                _acknowledgedContext = context;
+                _acknowledgedVersion = sync.Version;
+                _logger.LogDebug("Scene context version {0} acknowledged by MCP server", sync.Version);
+            }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                throw;
             }
             catch (Exception ex)
             {
                 _logger.LogError(ex, "Failed to send scene context to MCP server");
             }
+            finally
+            {
+                _sceneSyncLock.Release();
+            }
+        }
+
+        private async Task<(HttpStatusCode statusCode, SceneSyncResponse sync)> SendSceneDeltaAsync(SceneContextDelta delta, CancellationToken cancellationToken)
+        {
+            var request = new MCPRequest { Type = "scene_delta", ContextDelta = delta, Timestamp = DateTime.UtcNow };
+
+            using var response = await PostAsync("/api/context", request, cancellationToken);
+            if (response.StatusCode != HttpStatusCode.OK && response.StatusCode != HttpStatusCode.Conflict)
+            {
+                return (response.StatusCode, null);
+            }
+
+            await using var stream = await response.Content.ReadAsStreamAsync(cancellationToken);
+            var sync = await JsonSerializer.DeserializeAsync(stream, RhinoAIJsonContext.CaseInsensitive.SceneSyncResponse, cancellationToken);
+            return (response.StatusCode, sync);
+        }
+
+        /// <summary>
+        /// POST compact JSON, brotli-compressed once it reaches MCP:CompressionThresholdBytes
+        /// </summary>
+        private async Task<HttpResponseMessage> PostAsync(string path, MCPRequest request, CancellationToken cancellationToken)
+        {
+            // Custom properties hold arbitrary values, so allow the reflection fallback
+            var body = JsonSerializer.SerializeToUtf8Bytes(request, RhinoAIJsonContext.LenientOptions);
+            var compress = _compressRequests && body.Length >= _compressionThresholdBytes;
+
+            if (compress)
+            {
+                using var compressed = new MemoryStream(body.Length / 4);
+                using (var brotli = new BrotliStream(compressed, CompressionLevel.Fastest, leaveOpen: true))
+                {
+                    brotli.Write(body);
+                }
+                body = compressed.ToArray();
+            }
+
+            var content = new ByteArrayContent(body);
+            content.Headers.ContentType = new MediaTypeHeaderValue("application/json") { CharSet = "utf-8" };
+            if (compress)
+            {
+                content.Headers.ContentEncoding.Add("br");
+            }
+
+            Interlocked.Increment(ref _sceneUpdatesSent);
+            Interlocked.Add(ref _sceneBytesSent, body.Length);
+            return await _httpClient.PostAsync(path, content, cancellationToken);
         }
 
         /// <summary>
@@ -96,7 +210,7 @@ namespace RhinoAI.Integration
                 response.EnsureSuccessStatusCode();
 
                 var json = await response.Content.ReadAsStringAsync();
-                var suggestions = JsonSerializer.Deserialize<System.Collections.Generic.List<string>>(json);
+                var suggestions = JsonSerializer.Deserialize(json, RhinoAIJsonContext.Default.ListString);
 
                 return suggestions ?? new System.Collections.Generic.List<string>();
             }
@@ -112,6 +226,7 @@ namespace RhinoAI.Integration
             if (!_disposed)
             {
                 _httpClient?.Dispose();
+                _sceneSyncLock.Dispose();
                 _disposed = true;
             }
         }
@@ -1,10 +1,14 @@
 using System;
 using System.Collections.Generic;
+using System.Diagnostics;
+using System.Globalization;
 using System.IO;
+using System.IO.Compression;
 using System.Net;
-using System.Text;
 using System.Text.Json;
+using System.Text.Json.Serialization;
 using System.Threading;
+using System.Threading.Channels;
 using System.Threading.Tasks;
 
 using RhinoAI.Core;
@@ -12,7 +16,9 @@ using RhinoAI.Core;
 namespace RhinoAI.Integration
 {
     /// <summary>
-    /// In-process MCP Server for AI context management and suggestions
+    /// In-process MCP Server for AI context management and suggestions.
+    /// Several accept loops feed a bounded work queue that a fixed number of workers drain;
+    /// when the queue is full new requests are rejected with 503 instead of piling up.
     /// </summary>
     public class MCPServer : IDisposable
     {
@@ -21,10 +27,19 @@ namespace RhinoAI.Integration
         private readonly ConfigurationManager _configManager;
         private readonly ContextManager _contextManager;
         private readonly SuggestionEngine _suggestionEngine;
-        private readonly Func<string, Task<string>> _commandProcessor;
-        private Thread _serverThread;
-        private bool _isRunning = false;
+        private readonly Func<string, CancellationToken, Task<string>> _commandProcessor;
+        private readonly Func<BatchCommandRequest, CancellationToken, Task<List<BatchCommandResult>>> _batchProcessor;
+        private readonly MCPServerOptions _options;
+        private Channel<HttpListenerContext> _workQueue;
+        private CancellationTokenSource _shutdown;
+        private Task[] _acceptLoops = Array.Empty<Task>();
+        private Task[] _workers = Array.Empty<Task>();
+        private volatile bool _isRunning = false;
         private bool _disposed = false;
+        private long _completedRequests;
+        private long _rejectedRequests;
+        private long _timedOutRequests;
+        private int _activeRequests;
 
         public MCPServer(
             ConfigurationManager configManager, 
@@ -32,18 +47,48 @@ namespace RhinoAI.Integration
             ContextManager contextManager, 
             SuggestionEngine suggestionEngine,
             Func<string, Task<string>> commandProcessor)
+            : this(configManager, logger, contextManager, suggestionEngine,
+                WithoutCancellation(commandProcessor ?? throw new ArgumentNullException(nameof(commandProcessor))))
+        {
+        }
+
+        public MCPServer(
+            ConfigurationManager configManager,
+            SimpleLogger logger,
+            ContextManager contextManager,
+            SuggestionEngine suggestionEngine,
+            Func<string, CancellationToken, Task<string>> commandProcessor,
+            Func<BatchCommandRequest, CancellationToken, Task<List<BatchCommandResult>>> batchProcessor = null,
+            MCPServerOptions options = null)
         {
             _configManager = configManager ?? throw new ArgumentNullException(nameof(configManager));
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
             _contextManager = contextManager ?? throw new ArgumentNullException(nameof(contextManager));
             _suggestionEngine = suggestionEngine ?? throw new ArgumentNullException(nameof(suggestionEngine));
             _commandProcessor = commandProcessor ?? throw new ArgumentNullException(nameof(commandProcessor));
+            _batchProcessor = batchProcessor;
+            _options = options ?? MCPServerOptions.FromConfiguration(configManager);
             
             _listener = new HttpListener();
         }
 
         public bool IsRunning => _isRunning;
 
+        /// <summary>Requests that received a response from a handler</summary>
+        public long CompletedRequests => Interlocked.Read(ref _completedRequests);
+
+        /// <summary>Requests turned away with 503 because the work queue was full or the server was stopping</summary>
+        public long RejectedRequests => Interlocked.Read(ref _rejectedRequests);
+
+        /// <summary>Requests cancelled by the per-request timeout</summary>
+        public long TimedOutRequests => Interlocked.Read(ref _timedOutRequests);
+
+        /// <summary>Requests currently being handled by a worker</summary>
+        public int ActiveRequests => Volatile.Read(ref _activeRequests);
+
+        /// <summary>Requests accepted and waiting for a worker</summary>
+        public int QueuedRequests => _workQueue?.Reader.Count ?? 0;
+
         /// <summary>
         /// Start the MCP server
         /// </summary>
@@ -57,15 +102,34 @@ namespace RhinoAI.Integration
 
             try
             {
-                var serverUrl = _configManager.GetSetting("MCP:ServerUrl", "http://localhost:5005/");
-                _listener.Prefixes.Add(serverUrl);
+                var serverUrl = _options.Prefix;
+                if (!_listener.Prefixes.Contains(serverUrl))
+                {
+                    _listener.Prefixes.Add(serverUrl);
+                }
                 _listener.Start();
                 _isRunning = true;
 
-                _serverThread = new Thread(HandleRequests);
-                _serverThread.Start();
+                _shutdown = new CancellationTokenSource();
+                _workQueue = Channel.CreateBounded<HttpListenerContext>(new BoundedChannelOptions(Math.Max(1, _options.QueueCapacity))
+                {
+                    FullMode = BoundedChannelFullMode.Wait
+                });
+
+                _workers = new Task[Math.Max(1, _options.MaxConcurrentRequests)];
+                for (int i = 0; i < _workers.Length; i++)
+                {
+                    _workers[i] = Task.Run(WorkerLoopAsync);
+                }
 
-                _logger.LogInformation("MCP Server started and listening on {0}", serverUrl);
+                _acceptLoops = new Task[Math.Max(1, _options.AcceptConcurrency)];
+                for (int i = 0; i < _acceptLoops.Length; i++)
+                {
+                    _acceptLoops[i] = Task.Run(AcceptLoopAsync);
+                }
+
+                _logger.LogInformation("MCP Server started and listening on {0} ({1} workers, queue {2})",
+                    serverUrl, _workers.Length, _options.QueueCapacity);
                 return true;
             }
             catch (Exception ex)
@@ -77,17 +141,45 @@ namespace RhinoAI.Integration
         }
 
         /// <summary>
-        /// Stop the MCP server
+        /// Stop the MCP server, letting queued and in-flight requests finish within the drain timeout
         /// </summary>
         public void Stop()
+        {
+            StopAsync().GetAwaiter().GetResult();
+        }
+
+        /// <summary>
+        /// Stop accepting requests, drain the work queue, then close the listener.
+        /// Requests still running after the drain timeout are cancelled.
+        /// </summary>
+        public async Task StopAsync()
         {
             if (!_isRunning) return;
 
             try
             {
                 _isRunning = false;
+
+                // Requests accepted from now on are rejected; queued ones still run
+                _workQueue.Writer.TryComplete();
+
+                var drained = Task.WhenAll(_workers);
+                if (await Task.WhenAny(drained, Task.Delay(_options.DrainTimeout)).ConfigureAwait(false) != drained)
+                {
+                    _logger.LogWarning("MCP Server drain timed out with {0} requests in flight; cancelling them", ActiveRequests);
+                    _shutdown.Cancel();
+                    await Task.WhenAny(drained, Task.Delay(TimeSpan.FromSeconds(1))).ConfigureAwait(false);
+                }
+
+                // Stopping the listener completes the pending accepts
                 _listener.Stop();
-                _serverThread.Join();
+                await Task.WhenAll(_acceptLoops).ConfigureAwait(false);
+
+                // A worker stuck past cancellation still reads the token, so only dispose once all have exited
+                if (drained.IsCompleted)
+                {
+                    _shutdown.Dispose();
+                }
                 _logger.LogInformation("MCP Server stopped.");
             }
             catch (Exception ex)
@@ -96,126 +188,310 @@ namespace RhinoAI.Integration
             }
         }
 
-        private void HandleRequests()
+        private async Task AcceptLoopAsync()
         {
             while (_isRunning)
             {
+                HttpListenerContext context;
                 try
                 {
-                    var context = _listener.GetContext();
-                    Task.Run(() => ProcessRequest(context));
+                    context = await _listener.GetContextAsync().ConfigureAwait(false);
                 }
-                catch (HttpListenerException ex)
+                catch (Exception ex) when (ex is HttpListenerException || ex is ObjectDisposedException || ex is InvalidOperationException)
                 {
-                    // This exception is expected when the listener is stopped.
-                    if (ex.ErrorCode == 995) 
-                    {
-                        _logger.LogInformation("HttpListener was gracefully stopped.");
-                    }
-                    else
+                    // Expected when the listener is stopped
+                    if (_isRunning)
                     {
-                        _logger.LogError(ex, "HttpListenerException in request handler loop.");
+                        _logger.LogError(ex, "HttpListener failed while accepting requests.");
                     }
-                    
-                    _isRunning = false;
+                    return;
                 }
-                catch (Exception ex)
+
+                if (!_workQueue.Writer.TryWrite(context))
                 {
-                    _logger.LogError(ex, "Unhandled exception in request handler loop.");
-                    _isRunning = false;
+                    await RejectAsync(context).ConfigureAwait(false);
                 }
             }
         }
 
-        private async void ProcessRequest(HttpListenerContext context)
+        private async Task WorkerLoopAsync()
+        {
+            var reader = _workQueue.Reader;
+            while (await reader.WaitToReadAsync().ConfigureAwait(false))
+            {
+                while (reader.TryRead(out var context))
+                {
+                    Interlocked.Increment(ref _activeRequests);
+                    try
+                    {
+                        using var timeout = CancellationTokenSource.CreateLinkedTokenSource(_shutdown.Token);
+                        timeout.CancelAfter(_options.RequestTimeout);
+                        await ProcessRequestAsync(context, timeout.Token).ConfigureAwait(false);
+                    }
+                    catch (Exception ex)
+                    {
+                        // Never let one request take a worker down
+                        _logger.LogError(ex, "Unhandled exception while processing request.");
+                    }
+                    finally
+                    {
+                        Interlocked.Decrement(ref _activeRequests);
+                    }
+                }
+            }
+        }
+
+        /// <summary>
+        /// Turn a request away without queueing it, telling the client when to retry
+        /// </summary>
+        private async Task RejectAsync(HttpListenerContext context)
+        {
+            Interlocked.Increment(ref _rejectedRequests);
+            try
+            {
+                context.Response.AddHeader("Retry-After", "1");
+                await SendResponseAsync(context.Response, HttpStatusCode.ServiceUnavailable, new MCPStatusResponse { Message = "Server is busy, retry later." });
+            }
+            catch (Exception ex) when (ex is HttpListenerException || ex is ObjectDisposedException || ex is IOException)
+            {
+                // The client may already have gone away
+            }
+            finally
+            {
+                context.Response.Close();
+            }
+        }
+
+        private async Task ProcessRequestAsync(HttpListenerContext context, CancellationToken cancellationToken)
         {
             var request = context.Request;
             var response = context.Response;
 
+            // Fixed span names keep the number of tracked operations bounded
+            using var span = PipelineTelemetry.StartSpan(request.Url.AbsolutePath switch
+            {
+                "/api/context" => "MCP.Context",
+                "/api/suggestions" => "MCP.Suggestions",
+                "/api/model" => "MCP.Model",
+                "/api/command" => "MCP.Command",
+                "/api/commands/batch" => "MCP.CommandBatch",
+                _ => "MCP.Other"
+            }, "MCP");
+
             try
             {
                 _logger.LogDebug("Received request: {0} {1}", request.HttpMethod, request.Url.AbsolutePath);
 
+                if (_options.EnableCompression)
+                {
+                    var encoding = NegotiateResponseEncoding(request.Headers["Accept-Encoding"]);
+                    if (encoding != null)
+                    {
+                        response.AddHeader("Content-Encoding", encoding);
+                    }
+                    response.AddHeader("Vary", "Accept-Encoding");
+                }
+
+                if (request.HasEntityBody && !IsSupportedRequestEncoding(request.Headers["Content-Encoding"]))
+                {
+                    await SendResponseAsync(response, HttpStatusCode.UnsupportedMediaType,
+                        new MCPStatusResponse { Message = "Unsupported Content-Encoding; use gzip, br or deflate." });
+                    return;
+                }
+
                 if (request.HttpMethod == "POST")
                 {
                     switch (request.Url.AbsolutePath)
                     {
                         case "/api/context":
-                            await HandleContextRequest(request, response);
+                            await HandleContextRequest(request, response, cancellationToken);
                             break;
                         case "/api/suggestions":
-                            await HandleSuggestionsRequest(request, response);
+                            await HandleSuggestionsRequest(request, response, cancellationToken);
                             break;
                         case "/api/model":
                             await HandleModelRequest(request, response);
                             break;
+                        case "/api/commands/batch":
+                            await HandleBatchCommandRequestAsync(request, response, cancellationToken);
+                            break;
                         default:
-                            SendResponse(response, HttpStatusCode.NotFound, new { message = "Endpoint not found" });
+                            await SendResponseAsync(response, HttpStatusCode.NotFound, new MCPStatusResponse { Message = "Endpoint not found" });
                             break;
                     }
                 }
                 else if (request.HttpMethod == "GET" && request.Url.AbsolutePath == "/api/command")
                 {
-                    await HandleCommandRequestAsync(request, response);
+                    await HandleCommandRequestAsync(request, response, cancellationToken);
                 }
                 else
                 {
-                    SendResponse(response, HttpStatusCode.MethodNotAllowed, new { message = "Method not allowed" });
+                    await SendResponseAsync(response, HttpStatusCode.MethodNotAllowed, new MCPStatusResponse { Message = "Method not allowed" });
                 }
+
+                Interlocked.Increment(ref _completedRequests);
+            }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                if (_shutdown.IsCancellationRequested)
+                {
+                    span.SetError("Server stopping");
+                    Interlocked.Increment(ref _rejectedRequests);
+                    await TrySendResponseAsync(response, HttpStatusCode.ServiceUnavailable, new MCPStatusResponse { Message = "Server is shutting down." });
+                }
+                else
+                {
+                    span.SetError("Request timed out");
+                    Interlocked.Increment(ref _timedOutRequests);
+                    _logger.LogWarning("Request {0} timed out after {1}s", request.Url.AbsolutePath, _options.RequestTimeout.TotalSeconds);
+                    await TrySendResponseAsync(response, HttpStatusCode.GatewayTimeout, new MCPStatusResponse { Message = "The request timed out." });
+                }
+            }
+            catch (JsonException ex)
+            {
+                span.SetError(ex.Message);
+                await TrySendResponseAsync(response, HttpStatusCode.BadRequest, new MCPStatusResponse { Message = $"Invalid JSON: {ex.Message}" });
             }
             catch (Exception ex)
             {
+                span.SetError(ex.Message);
                 _logger.LogError(ex, "Error processing request.");
-                SendResponse(response, HttpStatusCode.InternalServerError, new { message = "An internal server error occurred." });
+                await TrySendResponseAsync(response, HttpStatusCode.InternalServerError, new MCPStatusResponse { Message = "An internal server error occurred." });
             }
             finally
             {
-                response.Close();
+                try
+                {
+                    response.Close();
+                }
+                catch (Exception ex) when (ex is HttpListenerException || ex is ObjectDisposedException)
+                {
+                    // The client disconnected before the response was sent
+                }
             }
         }
         
-        private async Task HandleCommandRequestAsync(HttpListenerRequest request, HttpListenerResponse response)
+        private async Task HandleCommandRequestAsync(HttpListenerRequest request, HttpListenerResponse response, CancellationToken cancellationToken)
         {
             var commandText = request.QueryString["text"];
 
             if (string.IsNullOrWhiteSpace(commandText))
             {
-                SendResponse(response, HttpStatusCode.BadRequest, new { message = "Command text cannot be empty." });
+                await SendResponseAsync(response, HttpStatusCode.BadRequest, new MCPStatusResponse { Message = "Command text cannot be empty." });
                 return;
             }
 
             try
             {
-                var result = await _commandProcessor(commandText);
-                SendResponse(response, HttpStatusCode.OK, new { success = true, message = "Command processed.", result });
+                var result = await _commandProcessor(commandText, cancellationToken);
+                await SendResponseAsync(response, HttpStatusCode.OK, new MCPStatusResponse { Success = true, Message = "Command processed.", Result = result });
+            }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                throw;
             }
             catch (Exception ex)
             {
                 _logger.LogError(ex, $"Error processing command: {commandText}");
-                SendResponse(response, HttpStatusCode.InternalServerError, new { success = false, message = ex.Message });
+                await SendResponseAsync(response, HttpStatusCode.InternalServerError, new MCPStatusResponse { Success = false, Message = ex.Message });
             }
         }
 
-        private async Task HandleContextRequest(HttpListenerRequest request, HttpListenerResponse response)
+        /// <summary>
+        /// Run an ordered list of commands in one round-trip; the processor applies them
+        /// as a single document transaction with one redraw at the end
+        /// </summary>
+        private async Task HandleBatchCommandRequestAsync(HttpListenerRequest request, HttpListenerResponse response, CancellationToken cancellationToken)
         {
-            var requestBody = await new StreamReader(request.InputStream).ReadToEndAsync();
-            var mcpRequest = JsonSerializer.Deserialize<MCPRequest>(requestBody);
+            if (_batchProcessor == null)
+            {
+                await SendResponseAsync(response, HttpStatusCode.NotImplemented, new MCPStatusResponse { Message = "Batch commands are not supported." });
+                return;
+            }
 
-            _contextManager.UpdateContext(mcpRequest.Context);
-            
-            var mcpResponse = new MCPResponse { Success = true, Message = "Context updated successfully." };
-            SendResponse(response, HttpStatusCode.OK, mcpResponse);
+            BatchCommandRequest batchRequest;
+            try
+            {
+                batchRequest = await ReadRequestAsync<BatchCommandRequest>(request, cancellationToken);
+            }
+            catch (JsonException ex)
+            {
+                await SendResponseAsync(response, HttpStatusCode.BadRequest, new MCPStatusResponse { Message = $"Invalid batch request: {ex.Message}" });
+                return;
+            }
+
+            if (batchRequest?.Commands == null || batchRequest.Commands.Count == 0)
+            {
+                await SendResponseAsync(response, HttpStatusCode.BadRequest, new MCPStatusResponse { Message = "Batch must contain at least one command." });
+                return;
+            }
+
+            if (batchRequest.Commands.Count > _options.MaxBatchSize)
+            {
+                await SendResponseAsync(response, HttpStatusCode.RequestEntityTooLarge,
+                    new MCPStatusResponse { Message = $"Batch contains {batchRequest.Commands.Count} commands; the limit is {_options.MaxBatchSize}." });
+                return;
+            }
+
+            try
+            {
+                var stopwatch = Stopwatch.StartNew();
+                var results = await _batchProcessor(batchRequest, cancellationToken);
+                stopwatch.Stop();
+
+                await SendResponseAsync(response, HttpStatusCode.OK, new BatchCommandResponse
+                {
+                    Success = results.Count == batchRequest.Commands.Count && results.TrueForAll(r => r.Success),
+                    Executed = results.Count,
+                    Results = results,
+                    DurationMs = stopwatch.Elapsed.TotalMilliseconds
+                });
+            }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                throw;
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, $"Error processing batch of {batchRequest.Commands.Count} commands");
+                await SendResponseAsync(response, HttpStatusCode.InternalServerError, new MCPStatusResponse { Success = false, Message = ex.Message });
+            }
+        }
+
+        private async Task HandleContextRequest(HttpListenerRequest request, HttpListenerResponse response, CancellationToken cancellationToken)
+        {
+            var mcpRequest = await ReadRequestAsync<MCPRequest>(request, cancellationToken);
+
+            if (mcpRequest?.ContextDelta == null)
+            {
+                // Full context from clients that do not send deltas
+                _contextManager.UpdateContext(mcpRequest?.Context);
+                var mcpResponse = new MCPResponse { Success = true, Message = "Context updated successfully." };
+                await SendResponseAsync(response, HttpStatusCode.OK, mcpResponse);
+                return;
+            }
+
+            if (_contextManager.TryApplyDelta(mcpRequest.ContextDelta, out var currentVersion))
+            {
+                await SendResponseAsync(response, HttpStatusCode.OK,
+                    new SceneSyncResponse { Success = true, Message = "Context updated successfully.", Version = currentVersion });
+            }
+            else
+            {
+                // The client's base is not what we hold (e.g. after a server restart); it resends a full snapshot
+                await SendResponseAsync(response, HttpStatusCode.Conflict,
+                    new SceneSyncResponse { Success = false, Message = "Context version mismatch.", Version = currentVersion });
+            }
         }
         
-        private async Task HandleSuggestionsRequest(HttpListenerRequest request, HttpListenerResponse response)
+        private async Task HandleSuggestionsRequest(HttpListenerRequest request, HttpListenerResponse response, CancellationToken cancellationToken)
         {
-            var requestBody = await new StreamReader(request.InputStream).ReadToEndAsync();
-            var mcpRequest = JsonSerializer.Deserialize<MCPRequest>(requestBody);
+            var mcpRequest = await ReadRequestAsync<MCPRequest>(request, cancellationToken);
 
             var suggestions = await _suggestionEngine.GetSuggestionsAsync(mcpRequest.UserInput, mcpRequest.Context);
             var suggestionsResponse = new SuggestionsResponse { Success = true, Suggestions = suggestions };
             
-            SendResponse(response, HttpStatusCode.OK, suggestionsResponse);
+            await SendResponseAsync(response, HttpStatusCode.OK, suggestionsResponse);
         }
 
         private async Task HandleModelRequest(HttpListenerRequest request, HttpListenerResponse response)
@@ -223,19 +499,132 @@ namespace RhinoAI.Integration
             // Placeholder for model update logic
             await Task.CompletedTask;
             var mcpResponse = new MCPResponse { Success = true, Message = "Model update processed." };
-            SendResponse(response, HttpStatusCode.OK, mcpResponse);
+            await SendResponseAsync(response, HttpStatusCode.OK, mcpResponse);
         }
 
-        private void SendResponse(HttpListenerResponse response, HttpStatusCode statusCode, object responseObject)
+        /// <summary>
+        /// Serialize the response straight to the output stream, compressed if the request
+        /// negotiated an encoding. The body length is not known up front, so it is sent chunked.
+        /// </summary>
+        private static async Task SendResponseAsync<T>(HttpListenerResponse response, HttpStatusCode statusCode, T responseObject)
         {
             response.StatusCode = (int)statusCode;
             response.ContentType = "application/json";
-            
-            var json = JsonSerializer.Serialize(responseObject);
-            var buffer = Encoding.UTF8.GetBytes(json);
-            
-            response.ContentLength64 = buffer.Length;
-            response.OutputStream.Write(buffer, 0, buffer.Length);
+
+            var output = response.OutputStream;
+            Stream compressed = response.Headers["Content-Encoding"] switch
+            {
+                "br" => new BrotliStream(output, CompressionLevel.Fastest, leaveOpen: true),
+                "gzip" => new GZipStream(output, CompressionLevel.Fastest, leaveOpen: true),
+                _ => null
+            };
+
+            if (compressed == null)
+            {
+                await JsonSerializer.SerializeAsync(output, responseObject, RhinoAIJsonContext.LenientOptions);
+                return;
+            }
+
+            await using (compressed)
+            {
+                await JsonSerializer.SerializeAsync(compressed, responseObject, RhinoAIJsonContext.LenientOptions);
+            }
+        }
+
+        /// <summary>
+        /// Send an error response unless the handler already started writing one
+        /// </summary>
+        private async Task TrySendResponseAsync<T>(HttpListenerResponse response, HttpStatusCode statusCode, T responseObject)
+        {
+            try
+            {
+                await SendResponseAsync(response, statusCode, responseObject);
+            }
+            catch (Exception ex) when (ex is InvalidOperationException || ex is HttpListenerException || ex is ObjectDisposedException || ex is IOException)
+            {
+                _logger.LogDebug("Could not send {0} response: {1}", (int)statusCode, ex.Message);
+            }
+        }
+
+        /// <summary>
+        /// Deserialize the request body directly from the input stream, decompressing it first
+        /// if the client sent it with a Content-Encoding
+        /// </summary>
+        private static async Task<T> ReadRequestAsync<T>(HttpListenerRequest request, CancellationToken cancellationToken)
+        {
+            var input = request.InputStream;
+            Stream decompressed = request.Headers["Content-Encoding"]?.Trim().ToLowerInvariant() switch
+            {
+                "br" => new BrotliStream(input, CompressionMode.Decompress, leaveOpen: true),
+                "gzip" => new GZipStream(input, CompressionMode.Decompress, leaveOpen: true),
+                "deflate" => new ZLibStream(input, CompressionMode.Decompress, leaveOpen: true),
+                _ => null
+            };
+
+            if (decompressed == null)
+            {
+                return await JsonSerializer.DeserializeAsync<T>(input, RhinoAIJsonContext.LenientOptions, cancellationToken);
+            }
+
+            await using (decompressed)
+            {
+                return await JsonSerializer.DeserializeAsync<T>(decompressed, RhinoAIJsonContext.LenientOptions, cancellationToken);
+            }
+        }
+
+        private static bool IsSupportedRequestEncoding(string contentEncoding)
+        {
+            return string.IsNullOrWhiteSpace(contentEncoding) ||
+                   contentEncoding.Trim().ToLowerInvariant() is "identity" or "br" or "gzip" or "deflate";
+        }
+
+        /// <summary>
+        /// Pick a response encoding from Accept-Encoding, preferring brotli over gzip.
+        /// Returns null when neither is acceptable.
+        /// </summary>
+        private static string NegotiateResponseEncoding(string acceptEncoding)
+        {
+            if (string.IsNullOrEmpty(acceptEncoding))
+            {
+                return null;
+            }
+
+            var brotli = false;
+            var gzip = false;
+            foreach (var entry in acceptEncoding.Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries))
+            {
+                var parts = entry.Split(';', StringSplitOptions.TrimEntries);
+                var quality = 1.0;
+                if (parts.Length > 1 && parts[1].StartsWith("q=", StringComparison.OrdinalIgnoreCase))
+                {
+                    double.TryParse(parts[1].AsSpan(2), NumberStyles.Float, CultureInfo.InvariantCulture, out quality);
+                }
+
+                if (quality <= 0)
+                {
+                    continue;
+                }
+
+                switch (parts[0].ToLowerInvariant())
+                {
+                    case "br":
+                        brotli = true;
+                        break;
+                    case "gzip":
+                        gzip = true;
+                        break;
+                    case "*":
+                        brotli = gzip = true;
+                        break;
+                }
+            }
+
+            return brotli ? "br" : gzip ? "gzip" : null;
+        }
+
+        private static Func<string, CancellationToken, Task<string>> WithoutCancellation(Func<string, Task<string>> commandProcessor)
+        {
+            return (text, cancellationToken) => commandProcessor(text);
         }
 
         public void Dispose()
@@ -248,6 +637,52 @@ namespace RhinoAI.Integration
         }
     }
 
+    /// <summary>
+    /// Listener prefix, concurrency and timeout settings for MCPServer
+    /// </summary>
+    public class MCPServerOptions
+    {
+        public string Prefix { get; set; } = "http://localhost:5005/";
+
+        /// <summary>Number of GetContextAsync calls kept outstanding</summary>
+        public int AcceptConcurrency { get; set; } = 4;
+
+        /// <summary>Number of requests handled at the same time</summary>
+        public int MaxConcurrentRequests { get; set; } = 8;
+
+        /// <summary>Accepted requests that may wait for a worker before new ones get 503</summary>
+        public int QueueCapacity { get; set; } = 64;
+
+        public TimeSpan RequestTimeout { get; set; } = TimeSpan.FromSeconds(60);
+
+        /// <summary>How long Stop waits for queued and in-flight requests before cancelling them</summary>
+        public TimeSpan DrainTimeout { get; set; } = TimeSpan.FromSeconds(10);
+
+        /// <summary>Most commands accepted in one /api/commands/batch request</summary>
+        public int MaxBatchSize { get; set; } = 1000;
+
+        /// <summary>Compress responses with brotli or gzip when the client accepts it</summary>
+        public bool EnableCompression { get; set; } = true;
+
+        /// <summary>
+        /// Read the MCP:* settings
+        /// </summary>
+        public static MCPServerOptions FromConfiguration(ConfigurationManager configManager)
+        {
+            return new MCPServerOptions
+            {
+                Prefix = configManager.GetSetting("MCP:ServerUrl", "http://localhost:5005/"),
+                AcceptConcurrency = configManager.GetSetting("MCP:AcceptConcurrency", 4),
+                MaxConcurrentRequests = configManager.GetSetting("MCP:MaxConcurrentRequests", 8),
+                QueueCapacity = configManager.GetSetting("MCP:QueueCapacity", 64),
+                RequestTimeout = TimeSpan.FromSeconds(configManager.GetSetting("MCP:RequestTimeoutSeconds", 60)),
+                DrainTimeout = TimeSpan.FromSeconds(configManager.GetSetting("MCP:DrainTimeoutSeconds", 10)),
+                MaxBatchSize = configManager.GetSetting("MCP:MaxBatchSize", 1000),
+                EnableCompression = configManager.GetSetting("MCP:EnableCompression", true)
+            };
+        }
+    }
+
     #region Data Models
 
     public class MCPRequest
@@ -255,6 +690,10 @@ namespace RhinoAI.Integration
         public string Type { get; set; }
         public string UserInput { get; set; }
         public SceneContext Context { get; set; }
+
+        [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+        public SceneContextDelta ContextDelta { get; set; }
+
         public ModelContext ModelContext { get; set; }
         public DateTime Timestamp { get; set; }
     }
@@ -290,6 +729,107 @@ namespace RhinoAI.Integration
         public Dictionary<string, object> CustomProperties { get; set; }
     }
 
+    /// <summary>
+    /// Scene changes since BaseVersion; null members are unchanged. BaseVersion 0 means a full snapshot.
+    /// </summary>
+    public class SceneContextDelta
+    {
+        public long BaseVersion { get; set; }
+        public long Version { get; set; }
+
+        [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+        public int? ObjectCount { get; set; }
+
+        [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+        public double[] BoundingBox { get; set; }
+
+        [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+        public string[] AddedObjectTypes { get; set; }
+
+        [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+        public string[] RemovedObjectTypes { get; set; }
+
+        [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+        public string[] AddedLayers { get; set; }
+
+        [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+        public string[] RemovedLayers { get; set; }
+
+        [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+        public Dictionary<string, object> ChangedProperties { get; set; }
+
+        [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+        public string[] RemovedProperties { get; set; }
+
+        [JsonIgnore]
+        public bool IsEmpty => ObjectCount == null && BoundingBox == null &&
+            AddedObjectTypes == null && RemovedObjectTypes == null &&
+            AddedLayers == null && RemovedLayers == null &&
+            ChangedProperties == null && RemovedProperties == null;
+    }
+
+    /// <summary>
+    /// Reply to a scene context update: the version the server now holds
+    /// </summary>
+    public class SceneSyncResponse
+    {
+        public bool Success { get; set; }
+        public string Message { get; set; }
+        public long Version { get; set; }
+    }
+
+    /// <summary>
+    /// One command in a batch: either natural-language Text, or a CommandName with its Parameters
+    /// </summary>
+    public class BatchCommand
+    {
+        public string Text { get; set; }
+        public string CommandName { get; set; }
+        public Dictionary<string, JsonElement> Parameters { get; set; }
+    }
+
+    public class BatchCommandRequest
+    {
+        public List<BatchCommand> Commands { get; set; }
+
+        /// <summary>Skip the remaining commands after the first failure</summary>
+        public bool StopOnError { get; set; }
+    }
+
+    public class BatchCommandResult
+    {
+        public int Index { get; set; }
+        public string Command { get; set; }
+        public bool Success { get; set; }
+        public string Message { get; set; }
+        public double DurationMs { get; set; }
+    }
+
+    /// <summary>
+    /// Status message for command and error responses; property names are lower case on the wire
+    /// </summary>
+    public class MCPStatusResponse
+    {
+        [JsonPropertyName("success")]
+        [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+        public bool? Success { get; set; }
+
+        [JsonPropertyName("message")]
+        public string Message { get; set; }
+
+        [JsonPropertyName("result")]
+        [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+        public string Result { get; set; }
+    }
+
+    public class BatchCommandResponse
+    {
+        public bool Success { get; set; }
+        public int Executed { get; set; }
+        public List<BatchCommandResult> Results { get; set; }
+        public double DurationMs { get; set; }
+    }
+
     public class ModelContext
     {
         public string ModelId { get; set; }
@@ -1,8 +1,11 @@
 using System;
+using System.Collections.Generic;
 using System.Net.Http;
+using System.Runtime.CompilerServices;
 using System.Text;
 using System.Text.Json;
 using System.Text.Json.Serialization;
+using System.Threading;
 using System.Threading.Tasks;
 using RhinoAI.Core;
 
@@ -19,10 +22,16 @@ namespace RhinoAI.Integration
         private bool _disposed = false;
 
         public OllamaClient(ConfigurationManager configManager, SimpleLogger logger)
+            : this(configManager, logger, PooledHttpClientFactory.Default)
+        {
+        }
+
+        public OllamaClient(ConfigurationManager configManager, SimpleLogger logger, PooledHttpClientFactory httpClientFactory)
         {
             _configManager = configManager ?? throw new ArgumentNullException(nameof(configManager));
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
-            _httpClient = new HttpClient();
+            if (httpClientFactory == null) throw new ArgumentNullException(nameof(httpClientFactory));
+            _httpClient = httpClientFactory.CreateClient(PooledHttpClientFactory.OllamaProvider);
             
             InitializeClient();
         }
@@ -87,7 +96,7 @@ namespace RhinoAI.Integration
                 response.EnsureSuccessStatusCode();
 
                 var responseJson = await response.Content.ReadAsStringAsync();
-                var modelsResponse = JsonSerializer.Deserialize<OllamaModelsResponse>(responseJson);
+                var modelsResponse = JsonSerializer.Deserialize(responseJson, RhinoAIJsonContext.Default.OllamaModelsResponse);
 
                 var modelNames = new string[modelsResponse?.Models?.Length ?? 0];
                 for (int i = 0; i < modelNames.Length; i++)
@@ -107,7 +116,8 @@ namespace RhinoAI.Integration
         /// <summary>
         /// Process text input using Ollama models
         /// </summary>
-        public async Task<string> ProcessTextAsync(string systemPrompt, string userInput, string model = null)
+        public async Task<string> ProcessTextAsync(string systemPrompt, string userInput, string model = null,
+            CancellationToken cancellationToken = default)
         {
             if (!IsConfigured)
                 throw new InvalidOperationException("Ollama client not configured");
@@ -129,20 +139,32 @@ namespace RhinoAI.Integration
                     }
                 };
 
-                var json = JsonSerializer.Serialize(request, new JsonSerializerOptions { WriteIndented = false });
+                var json = JsonSerializer.Serialize(request, RhinoAIJsonContext.Default.OllamaRequest);
                 var content = new StringContent(json, Encoding.UTF8, "application/json");
 
-                var response = await _httpClient.PostAsync("/api/generate", content);
-                response.EnsureSuccessStatusCode();
+                string responseJson;
+                using (PipelineTelemetry.StartSpan("Ollama.Http", "Provider"))
+                {
+                    var response = await _httpClient.PostAsync("/api/generate", content, cancellationToken);
+                    response.EnsureSuccessStatusCode();
+                    responseJson = await response.Content.ReadAsStringAsync(cancellationToken);
+                }
 
-                var responseJson = await response.Content.ReadAsStringAsync();
-                var ollamaResponse = JsonSerializer.Deserialize<OllamaResponse>(responseJson);
+                OllamaResponse ollamaResponse;
+                using (PipelineTelemetry.StartSpan("Ollama.ParseResponse", "Provider"))
+                {
+                    ollamaResponse = JsonSerializer.Deserialize(responseJson, RhinoAIJsonContext.Default.OllamaResponse);
+                }
 
                 var result = ollamaResponse?.Response ?? "No response received";
                 _logger.LogInformation("Ollama text processing completed successfully");
 
                 return result;
             }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                throw;
+            }
             catch (Exception ex)
             {
                 _logger.LogError(ex, "Ollama text processing failed");
@@ -150,6 +172,46 @@ namespace RhinoAI.Integration
             }
         }
 
+        /// <summary>
+        /// Stream an Ollama generation token by token
+        /// </summary>
+        public async IAsyncEnumerable<string> StreamTextAsync(string systemPrompt, string userInput, string model = null,
+            [EnumeratorCancellation] CancellationToken cancellationToken = default)
+        {
+            if (!IsConfigured)
+                throw new InvalidOperationException("Ollama client not configured");
+
+            var request = new OllamaRequest
+            {
+                Model = model ?? DefaultModel,
+                Prompt = $"System: {systemPrompt}\n\nUser: {userInput}\n\nAssistant:",
+                Stream = true,
+                Options = new OllamaOptions
+                {
+                    Temperature = 0.7f,
+                    TopP = 0.9f,
+                    TopK = 40
+                }
+            };
+
+            using var httpRequest = new HttpRequestMessage(HttpMethod.Post, "/api/generate")
+            {
+                Content = new StringContent(JsonSerializer.Serialize(request, RhinoAIJsonContext.Default.OllamaRequest), Encoding.UTF8, "application/json")
+            };
+
+            // Read headers only so tokens can be consumed while the model is still generating
+            using var response = await _httpClient.SendAsync(httpRequest, HttpCompletionOption.ResponseHeadersRead, cancellationToken);
+            response.EnsureSuccessStatusCode();
+
+            await using var stream = await response.Content.ReadAsStreamAsync(cancellationToken);
+            await foreach (var token in StreamingResponseReader.ReadOllamaStreamAsync(stream, cancellationToken))
+            {
+                yield return token;
+            }
+
+            _logger.LogInformation("Ollama text streaming completed successfully");
+        }
+
         /// <summary>
         /// Analyze and provide detailed reasoning for 3D modeling tasks
         /// </summary>
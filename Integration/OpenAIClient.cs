@@ -1,8 +1,10 @@
 using System;
 using System.Collections.Generic;
 using System.Net.Http;
+using System.Runtime.CompilerServices;
 using System.Text;
 using System.Text.Json;
+using System.Threading;
 using System.Threading.Tasks;
 
 using RhinoAI.Core;
@@ -20,11 +22,20 @@ namespace RhinoAI.Integration
         private readonly ConfigurationManager _configManager;
         private bool _disposed = false;
 
+        /// <summary>Stands in for the image in the serialized vision request; replaced while streaming</summary>
+        private const string ImagePlaceholder = "__RHINOAI_IMAGE_DATA__";
+
         public OpenAIClient(ConfigurationManager configManager, SimpleLogger logger)
+            : this(configManager, logger, PooledHttpClientFactory.Default)
+        {
+        }
+
+        public OpenAIClient(ConfigurationManager configManager, SimpleLogger logger, PooledHttpClientFactory httpClientFactory)
         {
             _configManager = configManager ?? throw new ArgumentNullException(nameof(configManager));
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
-            _httpClient = new HttpClient();
+            if (httpClientFactory == null) throw new ArgumentNullException(nameof(httpClientFactory));
+            _httpClient = httpClientFactory.CreateClient(PooledHttpClientFactory.OpenAIProvider);
             
             InitializeClient();
         }
@@ -68,7 +79,8 @@ namespace RhinoAI.Integration
         /// <summary>
         /// Process text input using OpenAI GPT models
         /// </summary>
-        public async Task<string> ProcessTextAsync(string systemPrompt, string userInput, string model = "gpt-3.5-turbo")
+        public async Task<string> ProcessTextAsync(string systemPrompt, string userInput, string model = "gpt-3.5-turbo",
+            CancellationToken cancellationToken = default)
         {
             if (!IsConfigured)
                 throw new InvalidOperationException("OpenAI client not configured");
@@ -85,20 +97,32 @@ namespace RhinoAI.Integration
                     }
                 };
 
-                var json = JsonSerializer.Serialize(request);
+                var json = JsonSerializer.Serialize(request, RhinoAIJsonContext.Default.OpenAIChatRequest);
                 var content = new StringContent(json, Encoding.UTF8, "application/json");
 
-                var response = await _httpClient.PostAsync("chat/completions", content);
-                response.EnsureSuccessStatusCode();
+                string responseJson;
+                using (PipelineTelemetry.StartSpan("OpenAI.Http", "Provider"))
+                {
+                    var response = await _httpClient.PostAsync("chat/completions", content, cancellationToken);
+                    response.EnsureSuccessStatusCode();
+                    responseJson = await response.Content.ReadAsStringAsync(cancellationToken);
+                }
 
-                var responseJson = await response.Content.ReadAsStringAsync();
-                var openAIResponse = JsonSerializer.Deserialize<OpenAIChatResponse>(responseJson);
+                OpenAIChatResponse openAIResponse;
+                using (PipelineTelemetry.StartSpan("OpenAI.ParseResponse", "Provider"))
+                {
+                    openAIResponse = JsonSerializer.Deserialize(responseJson, RhinoAIJsonContext.Default.OpenAIChatResponse);
+                }
 
                 var result = openAIResponse?.Choices?[0]?.Message?.Content ?? "No response received";
                 _logger.LogInformation("OpenAI text processing completed successfully");
 
                 return result;
             }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                throw;
+            }
             catch (Exception ex)
             {
                 _logger.LogError(ex, "OpenAI text processing failed");
@@ -106,19 +130,64 @@ namespace RhinoAI.Integration
             }
         }
 
+        /// <summary>
+        /// Stream a chat completion token by token
+        /// </summary>
+        public async IAsyncEnumerable<string> StreamTextAsync(string systemPrompt, string userInput, string model = "gpt-3.5-turbo",
+            [EnumeratorCancellation] CancellationToken cancellationToken = default)
+        {
+            if (!IsConfigured)
+                throw new InvalidOperationException("OpenAI client not configured");
+
+            var request = new OpenAIChatRequest
+            {
+                Model = model,
+                Messages = new List<OpenAIMessage>
+                {
+                    new OpenAIMessage { Role = "system", Content = systemPrompt },
+                    new OpenAIMessage { Role = "user", Content = userInput }
+                },
+                Stream = true
+            };
+
+            using var httpRequest = new HttpRequestMessage(HttpMethod.Post, "chat/completions")
+            {
+                Content = new StringContent(JsonSerializer.Serialize(request, RhinoAIJsonContext.Default.OpenAIChatRequest), Encoding.UTF8, "application/json")
+            };
+
+            // Read headers only so tokens can be consumed while the body is still arriving
+            using var response = await _httpClient.SendAsync(httpRequest, HttpCompletionOption.ResponseHeadersRead, cancellationToken);
+            response.EnsureSuccessStatusCode();
+
+            await using var stream = await response.Content.ReadAsStreamAsync(cancellationToken);
+            await foreach (var token in StreamingResponseReader.ReadOpenAIStreamAsync(stream, cancellationToken))
+            {
+                yield return token;
+            }
+
+            _logger.LogInformation("OpenAI text streaming completed successfully");
+        }
+
         /// <summary>
         /// Analyze image using OpenAI Vision models
         /// </summary>
-        public async Task<string> AnalyzeImageAsync(byte[] imageData, string prompt = "Analyze this 3D model image")
+        public Task<string> AnalyzeImageAsync(byte[] imageData, string prompt = "Analyze this 3D model image")
+        {
+            return AnalyzeImageAsync(imageData, "image/png", prompt);
+        }
+
+        /// <summary>
+        /// Analyze an encoded image (e.g. image/jpeg) using OpenAI Vision models. The image is
+        /// base64-encoded straight into the request stream and must stay valid until this completes.
+        /// </summary>
+        public async Task<string> AnalyzeImageAsync(ReadOnlyMemory<byte> imageData, string mediaType, string prompt,
+            CancellationToken cancellationToken = default)
         {
             if (!IsConfigured)
                 throw new InvalidOperationException("OpenAI client not configured");
 
             try
             {
-                var base64Image = Convert.ToBase64String(imageData);
-                var imageUrl = $"data:image/png;base64,{base64Image}";
-
                 var request = new OpenAIVisionRequest
                 {
                     Model = "gpt-4-vision-preview",
@@ -130,27 +199,35 @@ namespace RhinoAI.Integration
                             Content = new List<OpenAIVisionContent>
                             {
                                 new OpenAIVisionContent { Type = "text", Text = prompt },
-                                new OpenAIVisionContent { Type = "image_url", ImageUrl = new OpenAIVisionImageUrl { Url = imageUrl } }
+                                new OpenAIVisionContent { Type = "image_url", ImageUrl = new OpenAIVisionImageUrl { Url = $"data:{mediaType};base64,{ImagePlaceholder}" } }
                             }
                         }
                     },
                     MaxTokens = 1500
                 };
 
-                var json = JsonSerializer.Serialize(request);
-                var content = new StringContent(json, Encoding.UTF8, "application/json");
+                using var content = Base64JsonContent.Create(request, RhinoAIJsonContext.Default.OpenAIVisionRequest, ImagePlaceholder, imageData);
 
-                var response = await _httpClient.PostAsync("chat/completions", content);
-                response.EnsureSuccessStatusCode();
+                string responseJson;
+                using (var span = PipelineTelemetry.StartSpan("OpenAI.Http", "Provider"))
+                {
+                    span?.SetTag("rhinoai.request_bytes", content.Headers.ContentLength);
+                    var response = await _httpClient.PostAsync("chat/completions", content, cancellationToken);
+                    response.EnsureSuccessStatusCode();
+                    responseJson = await response.Content.ReadAsStringAsync(cancellationToken);
+                }
 
-                var responseJson = await response.Content.ReadAsStringAsync();
-                var visionResponse = JsonSerializer.Deserialize<OpenAIChatResponse>(responseJson);
+                var visionResponse = JsonSerializer.Deserialize(responseJson, RhinoAIJsonContext.Default.OpenAIChatResponse);
 
                 var result = visionResponse?.Choices?[0]?.Message?.Content ?? "No analysis received";
                 _logger.LogInformation("OpenAI image analysis completed successfully");
 
                 return result;
             }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                throw;
+            }
             catch (Exception ex)
             {
                 _logger.LogError(ex, "OpenAI image analysis failed");
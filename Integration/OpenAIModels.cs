@@ -14,6 +14,10 @@ namespace RhinoAI.Integration
 
         [JsonPropertyName("messages")]
         public List<OpenAIMessage> Messages { get; set; }
+
+        [JsonPropertyName("stream")]
+        [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingDefault)]
+        public bool Stream { get; set; }
     }
 
     public class OpenAIChatResponse
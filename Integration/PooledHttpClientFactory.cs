@@ -0,0 +1,111 @@
+using System;
+using System.Collections.Concurrent;
+using System.Diagnostics;
+using System.Net;
+using System.Net.Http;
+
+using RhinoAI.Core;
+
+namespace RhinoAI.Integration
+{
+    /// <summary>
+    /// Creates HttpClients that share one SocketsHttpHandler connection pool per provider
+    /// </summary>
+    public class PooledHttpClientFactory : IDisposable
+    {
+        public const string OpenAIProvider = "OpenAI";
+        public const string ClaudeProvider = "Claude";
+        public const string OllamaProvider = "Ollama";
+        public const string MCPProvider = "MCP";
+
+        private static readonly Lazy<PooledHttpClientFactory> _default =
+            new Lazy<PooledHttpClientFactory>(() => new PooledHttpClientFactory(null, null));
+
+        private readonly ConfigurationManager? _configManager;
+        private readonly SimpleLogger? _logger;
+        private readonly ConcurrentDictionary<string, SocketsHttpHandler> _handlers;
+        private bool _disposed = false;
+
+        /// <param name="configManager">Source of pool settings; defaults are used when null</param>
+        /// <param name="logger">Optional logger for pool creation</param>
+        public PooledHttpClientFactory(ConfigurationManager? configManager, SimpleLogger? logger)
+        {
+            _configManager = configManager;
+            _logger = logger;
+            _handlers = new ConcurrentDictionary<string, SocketsHttpHandler>(StringComparer.OrdinalIgnoreCase);
+        }
+
+        /// <summary>
+        /// Process-wide factory with default pool settings, used by clients created without a factory
+        /// </summary>
+        public static PooledHttpClientFactory Default => _default.Value;
+
+        /// <summary>
+        /// Creates a client backed by the provider's shared connection pool. Disposing the
+        /// client does not close pooled connections.
+        /// </summary>
+        public HttpClient CreateClient(string provider)
+        {
+            if (_disposed)
+                throw new ObjectDisposedException(nameof(PooledHttpClientFactory));
+
+            var handler = _handlers.GetOrAdd(provider, CreateHandler);
+            var client = new HttpClient(handler, disposeHandler: false);
+
+            if (GetSetting("Http:EnableHttp2", true))
+            {
+                // Multiplex requests over one HTTP/2 connection where the server supports it
+                client.DefaultRequestVersion = HttpVersion.Version20;
+                client.DefaultVersionPolicy = HttpVersionPolicy.RequestVersionOrLower;
+            }
+
+            return client;
+        }
+
+        private SocketsHttpHandler CreateHandler(string provider)
+        {
+            var handler = new SocketsHttpHandler
+            {
+                // Recycle connections periodically so DNS changes are picked up
+                PooledConnectionLifetime = TimeSpan.FromMinutes(GetSetting("Http:PooledConnectionLifetimeMinutes", 5.0)),
+                PooledConnectionIdleTimeout = TimeSpan.FromSeconds(GetSetting("Http:PooledConnectionIdleTimeoutSeconds", 90.0)),
+                MaxConnectionsPerServer = GetSetting($"Http:{provider}:MaxConnectionsPerServer",
+                    GetSetting("Http:MaxConnectionsPerServer", 10)),
+                ConnectTimeout = TimeSpan.FromSeconds(GetSetting("Http:ConnectTimeoutSeconds", 10.0)),
+                EnableMultipleHttp2Connections = true,
+                KeepAlivePingPolicy = HttpKeepAlivePingPolicy.WithActiveRequests,
+                KeepAlivePingDelay = TimeSpan.FromSeconds(30),
+                KeepAlivePingTimeout = TimeSpan.FromSeconds(10),
+                AutomaticDecompression = DecompressionMethods.GZip | DecompressionMethods.Deflate | DecompressionMethods.Brotli,
+                // Pipeline spans are local diagnostics; do not send trace headers to AI providers
+                ActivityHeadersPropagator = DistributedContextPropagator.CreateNoOutputPropagator()
+            };
+
+            _logger?.LogInformation("Created HTTP connection pool for {0} (max {1} connections per server)",
+                provider, handler.MaxConnectionsPerServer);
+            return handler;
+        }
+
+        private int GetSetting(string key, int defaultValue) =>
+            _configManager?.GetSetting(key, defaultValue) ?? defaultValue;
+
+        private double GetSetting(string key, double defaultValue) =>
+            _configManager?.GetSetting(key, defaultValue) ?? defaultValue;
+
+        private bool GetSetting(string key, bool defaultValue) =>
+            _configManager?.GetSetting(key, defaultValue) ?? defaultValue;
+
+        public void Dispose()
+        {
+            if (!_disposed)
+            {
+                foreach (var handler in _handlers.Values)
+                {
+                    handler.Dispose();
+                }
+                _handlers.Clear();
+                _disposed = true;
+            }
+        }
+    }
+}
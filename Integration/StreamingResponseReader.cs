@@ -0,0 +1,244 @@
+using System;
+using System.Buffers;
+using System.Collections.Generic;
+using System.IO;
+using System.Net.Http;
+using System.Runtime.CompilerServices;
+using System.Text.Json;
+using System.Threading;
+
+namespace RhinoAI.Integration
+{
+    /// <summary>
+    /// Incremental parsers for streamed AI provider responses: OpenAI and Claude server-sent
+    /// events and Ollama newline-delimited JSON. Lines are read into a pooled buffer and each
+    /// event is parsed in place with Utf8JsonReader.
+    /// </summary>
+    public static class StreamingResponseReader
+    {
+        private const int InitialBufferSize = 4096;
+
+        private static readonly string[] OpenAIContentPath = { "choices", "[0]", "delta", "content" };
+        private static readonly string[] ClaudeTypePath = { "type" };
+        private static readonly string[] ClaudeTextPath = { "delta", "text" };
+        private static readonly string[] ClaudeErrorPath = { "error", "message" };
+        private static readonly string[] OllamaResponsePath = { "response" };
+        private static readonly string[] OllamaDonePath = { "done" };
+        private static readonly string[] OllamaErrorPath = { "error" };
+
+        /// <summary>
+        /// Yields content deltas from an OpenAI chat completions event stream
+        /// </summary>
+        public static async IAsyncEnumerable<string> ReadOpenAIStreamAsync(Stream stream,
+            [EnumeratorCancellation] CancellationToken cancellationToken = default)
+        {
+            await foreach (var line in ReadLinesAsync(stream, cancellationToken))
+            {
+                var chunk = ParseOpenAIEvent(line);
+                if (chunk.IsDone) yield break;
+                if (!string.IsNullOrEmpty(chunk.Text)) yield return chunk.Text;
+            }
+        }
+
+        /// <summary>
+        /// Yields text deltas from a Claude messages event stream
+        /// </summary>
+        public static async IAsyncEnumerable<string> ReadClaudeStreamAsync(Stream stream,
+            [EnumeratorCancellation] CancellationToken cancellationToken = default)
+        {
+            await foreach (var line in ReadLinesAsync(stream, cancellationToken))
+            {
+                var chunk = ParseClaudeEvent(line);
+                if (chunk.IsDone) yield break;
+                if (!string.IsNullOrEmpty(chunk.Text)) yield return chunk.Text;
+            }
+        }
+
+        /// <summary>
+        /// Yields response fragments from an Ollama generate stream
+        /// </summary>
+        public static async IAsyncEnumerable<string> ReadOllamaStreamAsync(Stream stream,
+            [EnumeratorCancellation] CancellationToken cancellationToken = default)
+        {
+            await foreach (var line in ReadLinesAsync(stream, cancellationToken))
+            {
+                var chunk = ParseOllamaLine(line);
+                if (!string.IsNullOrEmpty(chunk.Text)) yield return chunk.Text;
+                if (chunk.IsDone) yield break;
+            }
+        }
+
+        /// <summary>
+        /// Splits a stream into lines without the terminating CR/LF. Each yielded segment points
+        /// into a pooled buffer and is only valid until the next line is requested.
+        /// </summary>
+        public static async IAsyncEnumerable<ReadOnlyMemory<byte>> ReadLinesAsync(Stream stream,
+            [EnumeratorCancellation] CancellationToken cancellationToken = default)
+        {
+            if (stream == null) throw new ArgumentNullException(nameof(stream));
+
+            var buffer = ArrayPool<byte>.Shared.Rent(InitialBufferSize);
+            var start = 0;
+            var end = 0;
+
+            try
+            {
+                while (true)
+                {
+                    var newline = Array.IndexOf(buffer, (byte)'\n', start, end - start);
+                    if (newline >= 0)
+                    {
+                        var lineEnd = newline > start && buffer[newline - 1] == (byte)'\r' ? newline - 1 : newline;
+                        yield return new ReadOnlyMemory<byte>(buffer, start, lineEnd - start);
+                        start = newline + 1;
+                        continue;
+                    }
+
+                    // Move the partial line to the front, growing the buffer if it is full
+                    if (start > 0)
+                    {
+                        Buffer.BlockCopy(buffer, start, buffer, 0, end - start);
+                        end -= start;
+                        start = 0;
+                    }
+                    else if (end == buffer.Length)
+                    {
+                        var larger = ArrayPool<byte>.Shared.Rent(buffer.Length * 2);
+                        Buffer.BlockCopy(buffer, 0, larger, 0, end);
+                        ArrayPool<byte>.Shared.Return(buffer);
+                        buffer = larger;
+                    }
+
+                    var read = await stream.ReadAsync(buffer.AsMemory(end), cancellationToken);
+                    if (read == 0)
+                    {
+                        if (end > start)
+                        {
+                            yield return new ReadOnlyMemory<byte>(buffer, start, end - start);
+                        }
+                        yield break;
+                    }
+
+                    end += read;
+                }
+            }
+            finally
+            {
+                ArrayPool<byte>.Shared.Return(buffer);
+            }
+        }
+
+        private static StreamChunk ParseOpenAIEvent(ReadOnlyMemory<byte> line)
+        {
+            if (!TryGetEventData(line.Span, out var data)) return default;
+            if (data.SequenceEqual("[DONE]"u8)) return new StreamChunk(null, isDone: true);
+
+            return new StreamChunk(ReadString(data, OpenAIContentPath), isDone: false);
+        }
+
+        private static StreamChunk ParseClaudeEvent(ReadOnlyMemory<byte> line)
+        {
+            if (!TryGetEventData(line.Span, out var data)) return default;
+
+            switch (ReadString(data, ClaudeTypePath))
+            {
+                case "content_block_delta":
+                    return new StreamChunk(ReadString(data, ClaudeTextPath), isDone: false);
+                case "message_stop":
+                    return new StreamChunk(null, isDone: true);
+                case "error":
+                    throw new HttpRequestException($"Claude stream error: {ReadString(data, ClaudeErrorPath)}");
+                default:
+                    return default;
+            }
+        }
+
+        private static StreamChunk ParseOllamaLine(ReadOnlyMemory<byte> line)
+        {
+            var json = line.Span;
+            if (json.IsEmpty) return default;
+
+            var error = ReadString(json, OllamaErrorPath);
+            if (error != null)
+                throw new HttpRequestException($"Ollama stream error: {error}");
+
+            var reader = new Utf8JsonReader(json);
+            var isDone = TryFind(ref reader, OllamaDonePath) && reader.TokenType == JsonTokenType.True;
+
+            return new StreamChunk(ReadString(json, OllamaResponsePath), isDone);
+        }
+
+        /// <summary>
+        /// Extracts the payload of an SSE "data:" line; event names, comments and blank lines are ignored
+        /// </summary>
+        private static bool TryGetEventData(ReadOnlySpan<byte> line, out ReadOnlySpan<byte> data)
+        {
+            data = default;
+            if (!line.StartsWith("data:"u8)) return false;
+
+            data = line.Slice(5);
+            if (!data.IsEmpty && data[0] == (byte)' ')
+            {
+                data = data.Slice(1);
+            }
+            return !data.IsEmpty;
+        }
+
+        private static string ReadString(ReadOnlySpan<byte> json, string[] path)
+        {
+            var reader = new Utf8JsonReader(json);
+            return TryFind(ref reader, path) && reader.TokenType == JsonTokenType.String
+                ? reader.GetString()
+                : null;
+        }
+
+        /// <summary>
+        /// Positions the reader on the value at the given path; "[0]" selects the first array element
+        /// </summary>
+        private static bool TryFind(ref Utf8JsonReader reader, string[] path)
+        {
+            if (!reader.Read()) return false;
+
+            foreach (var segment in path)
+            {
+                if (segment == "[0]")
+                {
+                    if (reader.TokenType != JsonTokenType.StartArray || !reader.Read() || reader.TokenType == JsonTokenType.EndArray)
+                        return false;
+                    continue;
+                }
+
+                if (reader.TokenType != JsonTokenType.StartObject) return false;
+
+                var found = false;
+                while (reader.Read() && reader.TokenType == JsonTokenType.PropertyName)
+                {
+                    var isMatch = reader.ValueTextEquals(segment);
+                    reader.Read();
+                    if (isMatch)
+                    {
+                        found = true;
+                        break;
+                    }
+                    reader.Skip();
+                }
+
+                if (!found) return false;
+            }
+
+            return true;
+        }
+
+        private readonly struct StreamChunk
+        {
+            public StreamChunk(string text, bool isDone)
+            {
+                Text = text;
+                IsDone = isDone;
+            }
+
+            public string Text { get; }
+            public bool IsDone { get; }
+        }
+    }
+}
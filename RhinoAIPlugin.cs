@@ -33,13 +33,17 @@ namespace RhinoAI
         {
             try
             {
-                // Initialize logger first
+                // Initialize logger and configuration first
                 Logger = new SimpleLogger(nameof(RhinoAIPlugin));
-                Logger.LogInformation("Initializing RhinoAI Plugin...");
-
-                // Initialize Configuration Manager
                 ConfigManager = new ConfigurationManager(Logger);
 
+                // Before the first message, which opens the log file with these settings
+                if (!AsyncLogSink.ConfigureDefault(LogSinkOptions.FromConfiguration(ConfigManager)))
+                {
+                    Logger.LogWarning("Log sink was already started; Logging:* settings apply after restarting Rhino");
+                }
+                Logger.LogInformation("Initializing RhinoAI Plugin...");
+
                 // Initialize AI Manager
                 AIManager = new AIManager(ConfigManager, Logger);
                 if (!AIManager.InitializeAll())
@@ -78,6 +82,9 @@ namespace RhinoAI
                 RhinoApp.WriteLine($"Error during plugin shutdown: {ex.Message}");
                 Logger?.LogError(ex, "Plugin shutdown error");
             }
+
+            // Drain queued log entries and close the log file
+            AsyncLogSink.Default.Shutdown(TimeSpan.FromSeconds(2));
             
             base.OnShutdown();
         }
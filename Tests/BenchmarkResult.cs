@@ -0,0 +1,43 @@
+using System;
+using System.Collections.Generic;
+using System.Text;
+
+namespace RhinoAI.Tests
+{
+    /// <summary>
+    /// Timing comparison between a baseline and an optimized implementation
+    /// </summary>
+    public class BenchmarkResult
+    {
+        public string Name { get; set; } = string.Empty;
+        public int Iterations { get; set; }
+        public TimeSpan BaselineDuration { get; set; }
+        public TimeSpan OptimizedDuration { get; set; }
+        public long BaselineAllocatedBytes { get; set; }
+        public long OptimizedAllocatedBytes { get; set; }
+        public bool ResultsMatch { get; set; } = true;
+        public List<string> Notes { get; set; } = new List<string>();
+
+        public double Speedup => OptimizedDuration.TotalMilliseconds > 0
+            ? BaselineDuration.TotalMilliseconds / OptimizedDuration.TotalMilliseconds
+            : 0;
+
+        public override string ToString()
+        {
+            var builder = new StringBuilder();
+            builder.AppendLine($"📊 {Name} ({Iterations} iterations)");
+            builder.AppendLine($"   Baseline:  {BaselineDuration.TotalMilliseconds:F1}ms, {BaselineAllocatedBytes / 1024.0:F0} KB allocated");
+            builder.AppendLine($"   Optimized: {OptimizedDuration.TotalMilliseconds:F1}ms, {OptimizedAllocatedBytes / 1024.0:F0} KB allocated");
+            builder.AppendLine($"   Speedup:   {Speedup:F1}x");
+            builder.Append($"   Results match: {(ResultsMatch ? "✅" : "❌")}");
+
+            foreach (var note in Notes)
+            {
+                builder.AppendLine();
+                builder.Append($"   {note}");
+            }
+
+            return builder.ToString();
+        }
+    }
+}
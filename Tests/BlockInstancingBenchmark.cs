@@ -0,0 +1,129 @@
+using System;
+using System.Diagnostics;
+using System.IO;
+using Rhino;
+using Rhino.FileIO;
+using Rhino.Geometry;
+using RhinoAI.AI;
+using RhinoAI.Core;
+
+namespace RhinoAI.Tests
+{
+    /// <summary>
+    /// Compares adding a large grid of one prototype as full copies with adding it as block
+    /// instances, each in its own headless document: time to add and save, memory growth and file size
+    /// </summary>
+    public static class BlockInstancingBenchmark
+    {
+        private const double Spacing = 3.0;
+
+        /// <summary>
+        /// Run the benchmark and report timings, memory and file sizes
+        /// </summary>
+        public static BenchmarkResult Run(int rows = 100, int columns = 100)
+        {
+            var prototype = new Sphere(Point3d.Origin, 1.0).ToBrep();
+            var placements = ArrayGenerator.ToTransforms(ArrayLayout.Grid(rows, columns, Spacing, Spacing));
+
+            var result = new BenchmarkResult
+            {
+                Name = $"Array of {rows * columns:N0} spheres: copies vs block instances (add + save)",
+                Iterations = 1
+            };
+
+            var copies = Measure(prototype, placements, useInstances: false);
+            var instances = Measure(prototype, placements, useInstances: true);
+
+            result.BaselineDuration = copies.Duration;
+            result.OptimizedDuration = instances.Duration;
+            result.BaselineAllocatedBytes = copies.MemoryGrowth;
+            result.OptimizedAllocatedBytes = instances.MemoryGrowth;
+
+            result.ResultsMatch = copies.CreatedCount == rows * columns &&
+                                  instances.CreatedCount == copies.CreatedCount &&
+                                  copies.Bounds.Min.DistanceTo(instances.Bounds.Min) < 1e-6 &&
+                                  copies.Bounds.Max.DistanceTo(instances.Bounds.Max) < 1e-6;
+
+            result.Notes.Add($"File size: copies {copies.FileBytes / 1024.0:N0} KB, instances {instances.FileBytes / 1024.0:N0} KB");
+            result.Notes.Add($"Save time: copies {copies.SaveDuration.TotalMilliseconds:F0}ms, instances {instances.SaveDuration.TotalMilliseconds:F0}ms");
+            result.Notes.Add($"Block definitions created: {instances.DefinitionCount}");
+
+            RhinoApp.WriteLine(result.ToString());
+            return result;
+        }
+
+        private static RunMeasurement Measure(GeometryBase prototype, Transform[] placements, bool useInstances)
+        {
+            var path = Path.Combine(Path.GetTempPath(), $"rhinoai_instancing_{Guid.NewGuid():N}.3dm");
+            var doc = RhinoDoc.CreateHeadless(null);
+            try
+            {
+                var request = new ArrayRequest
+                {
+                    Prototypes = new[] { prototype },
+                    Placements = placements,
+                    SelectCreated = false,
+                    UseInstances = useInstances
+                };
+
+                var memoryBefore = PrivateMemory();
+                var stopwatch = Stopwatch.StartNew();
+
+                var arrayResult = useInstances
+                    ? ArrayGenerator.CommitInstances(doc, request)
+                    : ArrayGenerator.Commit(doc, request, ArrayGenerator.CreateCopies(request.Prototypes, placements));
+
+                var addDuration = stopwatch.Elapsed;
+                var memoryGrowth = PrivateMemory() - memoryBefore;
+
+                var saveStopwatch = Stopwatch.StartNew();
+                if (!doc.Write3dmFile(path, new FileWriteOptions()))
+                {
+                    throw new IOException($"Could not write {path}");
+                }
+                saveStopwatch.Stop();
+
+                return new RunMeasurement
+                {
+                    Duration = addDuration + saveStopwatch.Elapsed,
+                    SaveDuration = saveStopwatch.Elapsed,
+                    MemoryGrowth = memoryGrowth,
+                    FileBytes = new FileInfo(path).Length,
+                    CreatedCount = arrayResult.CreatedCount,
+                    DefinitionCount = arrayResult.DefinitionCount,
+                    Bounds = doc.Objects.BoundingBox
+                };
+            }
+            finally
+            {
+                doc.Dispose();
+                if (File.Exists(path))
+                {
+                    File.Delete(path);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Geometry lives in native memory, so the managed heap size would miss most of it
+        /// </summary>
+        private static long PrivateMemory()
+        {
+            GC.Collect();
+            GC.WaitForPendingFinalizers();
+            using var process = Process.GetCurrentProcess();
+            return process.PrivateMemorySize64;
+        }
+
+        private struct RunMeasurement
+        {
+            public TimeSpan Duration;
+            public TimeSpan SaveDuration;
+            public long MemoryGrowth;
+            public long FileBytes;
+            public int CreatedCount;
+            public int DefinitionCount;
+            public BoundingBox Bounds;
+        }
+    }
+}
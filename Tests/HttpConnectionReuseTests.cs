@@ -0,0 +1,117 @@
+using System;
+using System.Collections.Generic;
+using System.Net;
+using System.Net.Http;
+using System.Net.Sockets;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using RhinoAI.Integration;
+
+namespace RhinoAI.Tests
+{
+    /// <summary>
+    /// Verifies that clients from PooledHttpClientFactory reuse connections, using a local
+    /// HttpListener that records the client endpoint of every request
+    /// </summary>
+    public static class HttpConnectionReuseTests
+    {
+        /// <summary>
+        /// Sends requests through several pooled clients and through one-off HttpClients,
+        /// and counts the distinct TCP connections the server saw for each
+        /// </summary>
+        public static async Task<ConnectionReuseResult> RunAsync(int requestCount = 10)
+        {
+            var port = GetFreePort();
+            var prefix = $"http://localhost:{port}/";
+
+            using var listener = new HttpListener();
+            listener.Prefixes.Add(prefix);
+            listener.Start();
+
+            var endpoints = new List<string>();
+            using var cancellation = new CancellationTokenSource();
+            var serverTask = ServeAsync(listener, endpoints, cancellation.Token);
+
+            try
+            {
+                using (var factory = new PooledHttpClientFactory(null, null))
+                {
+                    for (int i = 0; i < requestCount; i++)
+                    {
+                        // A new client per request, as components do, still shares the provider pool
+                        using var client = factory.CreateClient(PooledHttpClientFactory.OllamaProvider);
+                        await client.GetStringAsync(prefix + "ping");
+                    }
+                }
+
+                var pooledConnections = CountDistinct(endpoints);
+
+                for (int i = 0; i < requestCount; i++)
+                {
+                    using var client = new HttpClient();
+                    await client.GetStringAsync(prefix + "ping");
+                }
+
+                return new ConnectionReuseResult
+                {
+                    RequestCount = requestCount,
+                    PooledConnections = pooledConnections,
+                    UnpooledConnections = CountDistinct(endpoints) - pooledConnections
+                };
+            }
+            finally
+            {
+                cancellation.Cancel();
+                listener.Stop();
+                try { await serverTask; } catch (ObjectDisposedException) { } catch (HttpListenerException) { }
+            }
+        }
+
+        private static async Task ServeAsync(HttpListener listener, List<string> endpoints, CancellationToken token)
+        {
+            while (!token.IsCancellationRequested)
+            {
+                var context = await listener.GetContextAsync();
+                lock (endpoints)
+                {
+                    endpoints.Add(context.Request.RemoteEndPoint.ToString());
+                }
+
+                var body = Encoding.UTF8.GetBytes("pong");
+                context.Response.ContentLength64 = body.Length;
+                await context.Response.OutputStream.WriteAsync(body, 0, body.Length);
+                context.Response.Close();
+            }
+        }
+
+        private static int CountDistinct(List<string> endpoints)
+        {
+            lock (endpoints)
+            {
+                return new HashSet<string>(endpoints).Count;
+            }
+        }
+
+        private static int GetFreePort()
+        {
+            var socket = new TcpListener(IPAddress.Loopback, 0);
+            socket.Start();
+            var port = ((IPEndPoint)socket.LocalEndpoint).Port;
+            socket.Stop();
+            return port;
+        }
+    }
+
+    /// <summary>
+    /// Number of TCP connections observed for pooled and unpooled clients
+    /// </summary>
+    public class ConnectionReuseResult
+    {
+        public int RequestCount { get; set; }
+        public int PooledConnections { get; set; }
+        public int UnpooledConnections { get; set; }
+
+        public bool ConnectionsReused => PooledConnections == 1;
+    }
+}
@@ -0,0 +1,79 @@
+using System;
+using System.Diagnostics;
+using System.Linq;
+using System.Threading.Tasks;
+using Rhino;
+using RhinoAI.AI;
+
+namespace RhinoAI.Tests
+{
+    /// <summary>
+    /// Compares the per-keyword Regex classifier with the compiled keyword index
+    /// on the complex geometry test corpus
+    /// </summary>
+    public static class IntentClassifierBenchmark
+    {
+        /// <summary>
+        /// Run the benchmark and report timings and result equivalence
+        /// </summary>
+        public static async Task<BenchmarkResult> RunAsync(int iterations = 200)
+        {
+            var baseline = new IntentClassifier(useKeywordIndex: false);
+            var optimized = new IntentClassifier(useKeywordIndex: true);
+            var corpus = ComplexGeometryTests.TestCommands;
+
+            var result = new BenchmarkResult
+            {
+                Name = $"IntentClassifier on {corpus.Count} test commands",
+                Iterations = iterations
+            };
+
+            // Verify both classifiers agree before timing anything
+            foreach (var command in corpus)
+            {
+                var expected = await baseline.ClassifyIntentAsync(command, new ConversationContext());
+                var actual = await optimized.ClassifyIntentAsync(command, new ConversationContext());
+
+                if (expected.Category != actual.Category ||
+                    expected.Confidence != actual.Confidence ||
+                    expected.CommandTemplate?.CommandName != actual.CommandTemplate?.CommandName ||
+                    !expected.Keywords.SequenceEqual(actual.Keywords))
+                {
+                    result.ResultsMatch = false;
+                    result.Notes.Add($"Mismatch: '{command}' => {expected.CommandTemplate?.CommandName} ({expected.Confidence:F4}) vs {actual.CommandTemplate?.CommandName} ({actual.Confidence:F4})");
+                }
+            }
+
+            (result.BaselineDuration, result.BaselineAllocatedBytes) = await MeasureAsync(baseline, iterations);
+            (result.OptimizedDuration, result.OptimizedAllocatedBytes) = await MeasureAsync(optimized, iterations);
+
+            RhinoApp.WriteLine(result.ToString());
+            return result;
+        }
+
+        private static async Task<(TimeSpan duration, long allocatedBytes)> MeasureAsync(IntentClassifier classifier, int iterations)
+        {
+            var context = new ConversationContext();
+
+            // Warm up JIT and the Regex cache
+            foreach (var command in ComplexGeometryTests.TestCommands)
+            {
+                await classifier.ClassifyIntentAsync(command, context);
+            }
+
+            var allocatedBefore = GC.GetAllocatedBytesForCurrentThread();
+            var stopwatch = Stopwatch.StartNew();
+
+            for (int i = 0; i < iterations; i++)
+            {
+                foreach (var command in ComplexGeometryTests.TestCommands)
+                {
+                    await classifier.ClassifyIntentAsync(command, context);
+                }
+            }
+
+            stopwatch.Stop();
+            return (stopwatch.Elapsed, GC.GetAllocatedBytesForCurrentThread() - allocatedBefore);
+        }
+    }
+}
@@ -0,0 +1,144 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Text.Json;
+using Rhino;
+using RhinoAI.AI;
+using RhinoAI.Core;
+using RhinoAI.Integration;
+
+namespace RhinoAI.Tests
+{
+    /// <summary>
+    /// Compares reflection-based System.Text.Json, called the way the provider clients used to call it,
+    /// with the source-generated RhinoAIJsonContext over one natural-language round-trip:
+    /// command request, OpenAI chat request and response, Claude response and the AI command reply
+    /// </summary>
+    public static class JsonSerializationBenchmark
+    {
+        private const string ClaudeResponseJson =
+            "{\"id\":\"msg_01\",\"type\":\"message\",\"role\":\"assistant\",\"model\":\"claude-3-sonnet-20240229\"," +
+            "\"content\":[{\"type\":\"text\",\"text\":\"Create a sphere at the origin with radius 5.\"}]," +
+            "\"usage\":{\"input_tokens\":1412,\"output_tokens\":58}}";
+
+        // Property casing deliberately differs from the model, as it does in real model output
+        private const string AICommandResponseJson =
+            "{\"actions\":[{\"commandName\":\"CreateSphere\",\"parameters\":{\"radius\":5,\"center\":[0,0,0],\"color\":\"red\"}}," +
+            "{\"commandName\":\"MoveObjects\",\"parameters\":{\"x\":10,\"y\":0,\"z\":2.5}}]," +
+            "\"responseText\":\"Created a red sphere and moved it along X.\"}";
+
+        /// <summary>
+        /// Run the benchmark and report timings and result equivalence
+        /// </summary>
+        public static BenchmarkResult Run(int iterations = 2000)
+        {
+            var commandRequest = new AICommandRequest
+            {
+                UserInput = "create a red sphere with radius 5 and move it 10 units along x",
+                AvailableCommands = CreateCommandCatalog(40)
+            };
+            var openAIResponseJson = JsonSerializer.Serialize(new OpenAIChatResponse
+            {
+                Choices = new List<OpenAIChoice>
+                {
+                    new OpenAIChoice { Message = new OpenAIMessage { Role = "assistant", Content = AICommandResponseJson } }
+                }
+            }, RhinoAIJsonContext.Default.OpenAIChatResponse);
+
+            var result = new BenchmarkResult
+            {
+                Name = $"JSON round-trip with {commandRequest.AvailableCommands.Count} command templates",
+                Iterations = iterations
+            };
+
+            // Verify both paths produce identical wire JSON and parse to the same objects before timing anything
+            var expected = RoundTripReflection(commandRequest, openAIResponseJson);
+            var actual = RoundTripSourceGenerated(commandRequest, openAIResponseJson);
+            if (expected != actual)
+            {
+                result.ResultsMatch = false;
+                result.Notes.Add($"Mismatch: {expected.Length} vs {actual.Length} characters of output");
+            }
+
+            (result.BaselineDuration, result.BaselineAllocatedBytes) =
+                Measure(() => RoundTripReflection(commandRequest, openAIResponseJson), iterations);
+            (result.OptimizedDuration, result.OptimizedAllocatedBytes) =
+                Measure(() => RoundTripSourceGenerated(commandRequest, openAIResponseJson), iterations);
+
+            RhinoApp.WriteLine(result.ToString());
+            return result;
+        }
+
+        private static string RoundTripReflection(AICommandRequest commandRequest, string openAIResponseJson)
+        {
+            var requestJson = JsonSerializer.Serialize(commandRequest);
+            var chatJson = JsonSerializer.Serialize(CreateChatRequest(requestJson));
+
+            var chatResponse = JsonSerializer.Deserialize<OpenAIChatResponse>(openAIResponseJson);
+            var commandResponse = JsonSerializer.Deserialize<AICommandResponse>(chatResponse.Choices[0].Message.Content,
+                new JsonSerializerOptions { PropertyNameCaseInsensitive = true });
+            var claudeResponse = JsonSerializer.Deserialize<ClaudeResponse>(ClaudeResponseJson);
+
+            return chatJson + JsonSerializer.Serialize(commandResponse) + claudeResponse.Content[0].Text + claudeResponse.Usage.OutputTokens;
+        }
+
+        private static string RoundTripSourceGenerated(AICommandRequest commandRequest, string openAIResponseJson)
+        {
+            var requestJson = JsonSerializer.Serialize(commandRequest, RhinoAIJsonContext.Default.AICommandRequest);
+            var chatJson = JsonSerializer.Serialize(CreateChatRequest(requestJson), RhinoAIJsonContext.Default.OpenAIChatRequest);
+
+            var chatResponse = JsonSerializer.Deserialize(openAIResponseJson, RhinoAIJsonContext.Default.OpenAIChatResponse);
+            var commandResponse = JsonSerializer.Deserialize(chatResponse.Choices[0].Message.Content,
+                RhinoAIJsonContext.CaseInsensitive.AICommandResponse);
+            var claudeResponse = JsonSerializer.Deserialize(ClaudeResponseJson, RhinoAIJsonContext.Default.ClaudeResponse);
+
+            return chatJson + JsonSerializer.Serialize(commandResponse, RhinoAIJsonContext.Default.AICommandResponse) +
+                claudeResponse.Content[0].Text + claudeResponse.Usage.OutputTokens;
+        }
+
+        private static OpenAIChatRequest CreateChatRequest(string requestJson)
+        {
+            return new OpenAIChatRequest
+            {
+                Model = "gpt-4",
+                Messages = new List<OpenAIMessage>
+                {
+                    new OpenAIMessage { Role = "system", Content = "You are an AI assistant for Rhino 3D. Respond with JSON only." },
+                    new OpenAIMessage { Role = "user", Content = requestJson }
+                }
+            };
+        }
+
+        private static List<CommandTemplate> CreateCommandCatalog(int count)
+        {
+            return Enumerable.Range(0, count).Select(i => new CommandTemplate
+            {
+                CommandName = $"Command{i}",
+                Description = $"Performs modeling operation number {i} on the selected geometry",
+                Parameters = new[] { "radius", "center", "color", "layer" },
+                Keywords = new[] { $"keyword{i}", "create", "modify" }
+            }).ToList();
+        }
+
+        private static (TimeSpan duration, long allocatedBytes) Measure(Func<string> roundTrip, int iterations)
+        {
+            // Warm up JIT and the reflection metadata cache
+            for (int i = 0; i < 10; i++)
+            {
+                roundTrip();
+            }
+
+            var allocatedBefore = GC.GetAllocatedBytesForCurrentThread();
+            var stopwatch = Stopwatch.StartNew();
+
+            for (int i = 0; i < iterations; i++)
+            {
+                roundTrip();
+            }
+
+            stopwatch.Stop();
+            return (stopwatch.Elapsed, GC.GetAllocatedBytesForCurrentThread() - allocatedBefore);
+        }
+    }
+}
@@ -0,0 +1,180 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Net;
+using System.Net.Http;
+using System.Net.Sockets;
+using System.Threading;
+using System.Threading.Tasks;
+using RhinoAI.Core;
+using RhinoAI.Integration;
+
+namespace RhinoAI.Tests
+{
+    /// <summary>
+    /// Drives a local MCPServer with many concurrent clients and reports throughput, latency
+    /// percentiles and how many requests were rejected by backpressure or timed out.
+    /// The command processor is replaced by a fixed delay so only the server pipeline is measured.
+    /// </summary>
+    public static class MCPServerLoadTest
+    {
+        /// <summary>
+        /// Sends <paramref name="requestCount"/> command requests from <paramref name="clientConcurrency"/>
+        /// concurrent clients. The listener prefix of <paramref name="options"/> is replaced with a free local port.
+        /// </summary>
+        public static async Task<MCPLoadTestResult> RunAsync(ConfigurationManager configManager, SimpleLogger logger,
+            int requestCount = 2000, int clientConcurrency = 32, TimeSpan? workDuration = null, MCPServerOptions options = null)
+        {
+            var work = workDuration ?? TimeSpan.FromMilliseconds(5);
+            options ??= new MCPServerOptions();
+            options.Prefix = $"http://localhost:{GetFreePort()}/";
+
+            using var server = CreateServer(configManager, logger, options, work);
+            if (!server.Start())
+            {
+                throw new InvalidOperationException($"MCP Server could not listen on {options.Prefix}");
+            }
+
+            var latency = new LatencyHistogram();
+            var statusCounts = new Dictionary<HttpStatusCode, int>();
+            var failed = 0;
+            var issued = 0;
+
+            using var handler = new SocketsHttpHandler { MaxConnectionsPerServer = clientConcurrency };
+            using var client = new HttpClient(handler) { Timeout = TimeSpan.FromMinutes(2) };
+
+            var stopwatch = Stopwatch.StartNew();
+            await Task.WhenAll(Enumerable.Range(0, clientConcurrency).Select(_ => Task.Run(async () =>
+            {
+                int index;
+                while ((index = Interlocked.Increment(ref issued)) <= requestCount)
+                {
+                    var started = Stopwatch.GetTimestamp();
+                    try
+                    {
+                        using var response = await client.GetAsync($"{options.Prefix}api/command?text=load+{index}");
+                        await response.Content.ReadAsByteArrayAsync();
+                        latency.Record(Stopwatch.GetElapsedTime(started));
+
+                        lock (statusCounts)
+                        {
+                            statusCounts[response.StatusCode] = statusCounts.GetValueOrDefault(response.StatusCode) + 1;
+                        }
+                    }
+                    catch (HttpRequestException)
+                    {
+                        Interlocked.Increment(ref failed);
+                    }
+                }
+            })));
+            stopwatch.Stop();
+
+            await server.StopAsync();
+
+            var result = new MCPLoadTestResult
+            {
+                RequestCount = requestCount,
+                ClientConcurrency = clientConcurrency,
+                Succeeded = statusCounts.GetValueOrDefault(HttpStatusCode.OK),
+                Rejected = statusCounts.GetValueOrDefault(HttpStatusCode.ServiceUnavailable),
+                TimedOut = statusCounts.GetValueOrDefault(HttpStatusCode.GatewayTimeout),
+                Elapsed = stopwatch.Elapsed,
+                P50 = latency.GetPercentile(50),
+                P99 = latency.GetPercentile(99),
+                Max = latency.Max
+            };
+            result.Failed = requestCount - result.Succeeded - result.Rejected - result.TimedOut;
+
+            logger.LogInformation("MCP load test: {0} requests from {1} clients in {2:F2}s, {3:F0} req/s, p50 {4:F1}ms, p99 {5:F1}ms, {6} rejected, {7} timed out, {8} failed",
+                requestCount, clientConcurrency, result.Elapsed.TotalSeconds, result.Throughput,
+                result.P50.TotalMilliseconds, result.P99.TotalMilliseconds, result.Rejected, result.TimedOut, result.Failed);
+            return result;
+        }
+
+        /// <summary>
+        /// Starts slow requests, stops the server while they run, and returns true if every one
+        /// of them still completed successfully
+        /// </summary>
+        public static async Task<bool> RunDrainAsync(ConfigurationManager configManager, SimpleLogger logger, int requestCount = 8)
+        {
+            var options = new MCPServerOptions
+            {
+                Prefix = $"http://localhost:{GetFreePort()}/",
+                MaxConcurrentRequests = Math.Max(1, requestCount / 2),
+                QueueCapacity = requestCount
+            };
+
+            using var server = CreateServer(configManager, logger, options, TimeSpan.FromMilliseconds(300));
+            if (!server.Start())
+            {
+                throw new InvalidOperationException($"MCP Server could not listen on {options.Prefix}");
+            }
+
+            using var client = new HttpClient();
+            var requests = Enumerable.Range(0, requestCount)
+                .Select(i => client.GetAsync($"{options.Prefix}api/command?text=drain+{i}"))
+                .ToList();
+
+            // Stop once every request has been accepted, so some are running and the rest are queued
+            var deadline = Stopwatch.StartNew();
+            while (server.ActiveRequests + server.QueuedRequests < requestCount && deadline.Elapsed < TimeSpan.FromSeconds(5))
+            {
+                await Task.Delay(10);
+            }
+            await server.StopAsync();
+
+            var responses = await Task.WhenAll(requests);
+            var succeeded = responses.Count(r => r.StatusCode == HttpStatusCode.OK);
+            foreach (var response in responses)
+            {
+                response.Dispose();
+            }
+
+            logger.LogInformation("MCP drain test: {0} of {1} in-flight requests completed after Stop", succeeded, requestCount);
+            return succeeded == requestCount && !server.IsRunning;
+        }
+
+        private static MCPServer CreateServer(ConfigurationManager configManager, SimpleLogger logger, MCPServerOptions options, TimeSpan work)
+        {
+            var suggestionEngine = new SuggestionEngine(logger,
+                new OpenAIClient(configManager, logger), new ClaudeClient(configManager, logger), new OllamaClient(configManager, logger));
+
+            return new MCPServer(configManager, logger, new ContextManager(logger), suggestionEngine,
+                async (text, cancellationToken) =>
+                {
+                    await Task.Delay(work, cancellationToken);
+                    return text;
+                },
+                options: options);
+        }
+
+        private static int GetFreePort()
+        {
+            var socket = new TcpListener(IPAddress.Loopback, 0);
+            socket.Start();
+            var port = ((IPEndPoint)socket.LocalEndpoint).Port;
+            socket.Stop();
+            return port;
+        }
+    }
+
+    /// <summary>
+    /// Outcome of an MCPServer load test
+    /// </summary>
+    public class MCPLoadTestResult
+    {
+        public int RequestCount { get; set; }
+        public int ClientConcurrency { get; set; }
+        public int Succeeded { get; set; }
+        public int Rejected { get; set; }
+        public int TimedOut { get; set; }
+        public int Failed { get; set; }
+        public TimeSpan Elapsed { get; set; }
+        public TimeSpan P50 { get; set; }
+        public TimeSpan P99 { get; set; }
+        public TimeSpan Max { get; set; }
+
+        public double Throughput => Elapsed > TimeSpan.Zero ? RequestCount / Elapsed.TotalSeconds : 0;
+    }
+}
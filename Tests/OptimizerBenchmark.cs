@@ -0,0 +1,159 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using Rhino;
+using RhinoAI.Core;
+
+namespace RhinoAI.Tests
+{
+    /// <summary>
+    /// Runs ParameterOptimizer on analytic objectives with known minima and compares it with
+    /// random search given the same number of evaluations. Needs no document or geometry.
+    /// </summary>
+    public static class OptimizerBenchmark
+    {
+        /// <summary>
+        /// Run every problem and report timings, accuracy and evaluation counts
+        /// </summary>
+        public static BenchmarkResult Run(int seed = 24)
+        {
+            var problems = CreateProblems();
+            var result = new BenchmarkResult
+            {
+                Name = $"Parameter optimizer on {problems.Count} analytic problems (CMA-ES vs random search)",
+                Iterations = problems.Count
+            };
+
+            var optimizerTime = TimeSpan.Zero;
+            var randomTime = TimeSpan.Zero;
+
+            foreach (var problem in problems)
+            {
+                var optimizer = new ParameterOptimizer(new ParameterOptimizerOptions
+                {
+                    Seed = seed,
+                    PopulationSize = problem.PopulationSize,
+                    MaxEvaluations = 20_000,
+                    MaxGenerations = 2_000,
+                    TargetValue = problem.StopAtTarget ? problem.Minimum + problem.Tolerance / 10 : double.NegativeInfinity
+                });
+
+                var stopwatch = Stopwatch.StartNew();
+                var optimized = optimizer.Minimize(problem.Ranges, problem.Objective);
+                optimizerTime += stopwatch.Elapsed;
+
+                stopwatch.Restart();
+                var randomBest = RandomSearch(problem, optimized.Evaluations, seed);
+                randomTime += stopwatch.Elapsed;
+
+                var error = optimized.BestValue - problem.Minimum;
+                var solved = error <= problem.Tolerance && (problem.CheckSolution?.Invoke(optimized.BestParameters) ?? true);
+                if (!solved)
+                {
+                    result.ResultsMatch = false;
+                }
+
+                result.Notes.Add($"{problem.Name}: error {error:G3} in {optimized.Evaluations} evaluations, " +
+                    $"{optimized.Generations} generations, {optimized.CacheHits} cache hits ({optimized.StopReason}); " +
+                    $"random search error {randomBest - problem.Minimum:G3}{(solved ? "" : " - NOT SOLVED")}");
+            }
+
+            result.BaselineDuration = randomTime;
+            result.OptimizedDuration = optimizerTime;
+
+            RhinoApp.WriteLine(result.ToString());
+            return result;
+        }
+
+        private static List<Problem> CreateProblems()
+        {
+            var problems = new List<Problem>
+            {
+                new Problem("Sphere 10-D", Ranges(10, -5, 5, 3), x => x.Sum(v => v * v)),
+                new Problem("Ellipsoid 8-D (condition 1e6)", Ranges(8, -5, 5, 3), x =>
+                    x.Select((v, i) => Math.Pow(1e6, i / (x.Length - 1.0)) * v * v).Sum()),
+                new Problem("Rosenbrock 4-D", Ranges(4, -2, 2, -1), x =>
+                    Enumerable.Range(0, x.Length - 1).Sum(i => 100 * Math.Pow(x[i + 1] - x[i] * x[i], 2) + Math.Pow(1 - x[i], 2)))
+                {
+                    Tolerance = 1e-6
+                },
+                new Problem("Rastrigin 3-D", Ranges(3, -5.12, 5.12, 2), x =>
+                    10 * x.Length + x.Sum(v => v * v - 10 * Math.Cos(2 * Math.PI * v)))
+                {
+                    PopulationSize = 60,
+                    Tolerance = 1e-6
+                },
+                new Problem("Integer grid 6-D", Enumerable.Range(0, 6).Select(i => new ParameterRange($"n{i}", 0, 20, 15, isInteger: true)).ToList(),
+                    x => x.Sum(v => (v - 7) * (v - 7)))
+            };
+
+            // Cylinder of volume 1000 with the least surface area: height equals diameter
+            const double volume = 1000;
+            var start = new VariantSpec("cylinder", 0, 0, 0, 10, 0, 2);
+            var objective = DesignObjective.FromGoals(new[] { "volume", "minimize surface area" },
+                new Dictionary<string, object> { ["targetVolume"] = volume }, DesignMeasures.FromSpec(start));
+            var optimalRadius = Math.Cbrt(volume / (2 * Math.PI));
+            var optimalHeight = 2 * optimalRadius;
+            var optimalValue = objective.Evaluate(DesignMeasures.FromSpec(new VariantSpec("cylinder", 0, 0, 0, optimalRadius, 0, optimalHeight)));
+
+            problems.Add(new Problem("Cylinder min area at volume 1000",
+                new List<ParameterRange> { new ParameterRange("radius", 1, 100, 10), new ParameterRange("height", 0.2, 20, 2) },
+                x => objective.Evaluate(DesignMeasures.FromSpec(new VariantSpec("cylinder", 0, 0, 0, x[0], 0, x[1]))))
+            {
+                // The volume term is a penalty, so the true minimum sits slightly below V = 1000, still with h = 2r;
+                // run to convergence and check the shape rather than stopping at a value
+                Minimum = optimalValue,
+                Tolerance = 1e-6,
+                StopAtTarget = false,
+                CheckSolution = x => Math.Abs(x[1] / x[0] - 2) < 1e-3
+            });
+
+            return problems;
+        }
+
+        private static List<ParameterRange> Ranges(int dimensions, double min, double max, double initial)
+        {
+            return Enumerable.Range(0, dimensions).Select(i => new ParameterRange($"x{i}", min, max, initial)).ToList();
+        }
+
+        private static double RandomSearch(Problem problem, int evaluations, int seed)
+        {
+            var random = new Random(seed);
+            var best = double.PositiveInfinity;
+            var x = new double[problem.Ranges.Count];
+
+            for (int e = 0; e < evaluations; e++)
+            {
+                for (int d = 0; d < x.Length; d++)
+                {
+                    var range = problem.Ranges[d];
+                    var value = range.Min + random.NextDouble() * (range.Max - range.Min);
+                    x[d] = range.IsInteger ? Math.Round(value) : value;
+                }
+                best = Math.Min(best, problem.Objective(x));
+            }
+
+            return best;
+        }
+
+        private class Problem
+        {
+            public Problem(string name, List<ParameterRange> ranges, Func<double[], double> objective)
+            {
+                Name = name;
+                Ranges = ranges;
+                Objective = objective;
+            }
+
+            public string Name { get; }
+            public List<ParameterRange> Ranges { get; }
+            public Func<double[], double> Objective { get; }
+            public double Minimum { get; set; }
+            public double Tolerance { get; set; } = 1e-8;
+            public int PopulationSize { get; set; }
+            public bool StopAtTarget { get; set; } = true;
+            public Func<double[], bool> CheckSolution { get; set; }
+        }
+    }
+}
@@ -0,0 +1,179 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Net.Http;
+using System.Threading;
+using System.Threading.Tasks;
+using RhinoAI.AI;
+using RhinoAI.Core;
+
+namespace RhinoAI.Tests
+{
+    /// <summary>
+    /// Exercises ProviderScheduler against fake providers with scripted delays and failures:
+    /// hedging a stalled provider, failing over on errors and invalid responses, and
+    /// ordering providers by observed median latency
+    /// </summary>
+    public static class ProviderSchedulerTests
+    {
+        private const string ValidResponse = "{\"actions\":[]}";
+
+        /// <summary>
+        /// Runs every scenario and returns one result per scenario
+        /// </summary>
+        public static async Task<List<ProviderSchedulerTestResult>> RunAllAsync(ConfigurationManager configManager, SimpleLogger logger)
+        {
+            return new List<ProviderSchedulerTestResult>
+            {
+                await RunHedgeOnStallAsync(logger),
+                await RunFailoverOnErrorAsync(configManager, logger),
+                await RunFailoverOnInvalidResponseAsync(configManager, logger),
+                RunLatencyOrdering(configManager, logger)
+            };
+        }
+
+        /// <summary>
+        /// The primary normally answers in 150ms but stalls; the hedge to the secondary should
+        /// answer long before the stall ends, and the primary request should be cancelled
+        /// </summary>
+        private static async Task<ProviderSchedulerTestResult> RunHedgeOnStallAsync(SimpleLogger logger)
+        {
+            var primaryCancelled = false;
+            var primary = CreateEndpoint("Primary", async token =>
+            {
+                try
+                {
+                    await Task.Delay(TimeSpan.FromSeconds(3), token);
+                }
+                catch (OperationCanceledException)
+                {
+                    primaryCancelled = true;
+                    throw;
+                }
+                return ValidResponse;
+            });
+            var secondary = CreateEndpoint("Secondary", async token =>
+            {
+                await Task.Delay(100, token);
+                return ValidResponse;
+            });
+            Prime(primary, TimeSpan.FromMilliseconds(150));
+
+            // Hedging is opt-in, so turn it on for this scheduler only
+            var hedgeConfig = new ConfigurationManager(logger);
+            hedgeConfig.SetSetting("UI:AutoSaveSettings", false);
+            hedgeConfig.SetSetting("Processing:ProviderScheduling", "Hedge");
+            var scheduler = new ProviderScheduler(hedgeConfig, logger, new[] { primary, secondary });
+
+            var stopwatch = Stopwatch.StartNew();
+            var result = await scheduler.ExecuteAsync("system", "input", IsValid);
+            stopwatch.Stop();
+
+            // Give the cancelled request a moment to observe its token
+            await Task.Delay(50);
+
+            return new ProviderSchedulerTestResult
+            {
+                Scenario = "HedgeOnStall",
+                Provider = result.Provider,
+                Duration = stopwatch.Elapsed,
+                Passed = result.Provider == "Secondary" && stopwatch.Elapsed < TimeSpan.FromSeconds(1) && primaryCancelled,
+                Notes = primaryCancelled ? "Stalled request cancelled" : "Stalled request still running"
+            };
+        }
+
+        private static async Task<ProviderSchedulerTestResult> RunFailoverOnErrorAsync(ConfigurationManager configManager, SimpleLogger logger)
+        {
+            var primary = CreateEndpoint("Primary", token => throw new HttpRequestException("connection refused"));
+            var secondary = CreateEndpoint("Secondary", async token =>
+            {
+                await Task.Delay(20, token);
+                return ValidResponse;
+            });
+
+            var scheduler = new ProviderScheduler(configManager, logger, new[] { primary, secondary });
+            var stopwatch = Stopwatch.StartNew();
+            var result = await scheduler.ExecuteAsync("system", "input", IsValid);
+            stopwatch.Stop();
+
+            return new ProviderSchedulerTestResult
+            {
+                Scenario = "FailoverOnError",
+                Provider = result.Provider,
+                Duration = stopwatch.Elapsed,
+                Passed = result.Provider == "Secondary" && result.Response == ValidResponse
+            };
+        }
+
+        private static async Task<ProviderSchedulerTestResult> RunFailoverOnInvalidResponseAsync(ConfigurationManager configManager, SimpleLogger logger)
+        {
+            var primary = CreateEndpoint("Primary", token => Task.FromResult("I cannot help with that"));
+            var secondary = CreateEndpoint("Secondary", async token =>
+            {
+                await Task.Delay(20, token);
+                return ValidResponse;
+            });
+
+            var scheduler = new ProviderScheduler(configManager, logger, new[] { primary, secondary });
+            var stopwatch = Stopwatch.StartNew();
+            var result = await scheduler.ExecuteAsync("system", "input", IsValid);
+            stopwatch.Stop();
+
+            return new ProviderSchedulerTestResult
+            {
+                Scenario = "FailoverOnInvalidResponse",
+                Provider = result.Provider,
+                Duration = stopwatch.Elapsed,
+                Passed = result.Provider == "Secondary" && result.Response == ValidResponse
+            };
+        }
+
+        private static ProviderSchedulerTestResult RunLatencyOrdering(ConfigurationManager configManager, SimpleLogger logger)
+        {
+            var slow = CreateEndpoint("Slow", token => Task.FromResult(ValidResponse));
+            var fast = CreateEndpoint("Fast", token => Task.FromResult(ValidResponse));
+            Prime(slow, TimeSpan.FromMilliseconds(800));
+            Prime(fast, TimeSpan.FromMilliseconds(100));
+
+            var scheduler = new ProviderScheduler(configManager, logger, new[] { slow, fast });
+            var first = scheduler.GetOrderedProviders()[0].Name;
+            var expected = scheduler.Mode == ProviderSchedulingMode.Sequential ? "Slow" : "Fast";
+
+            return new ProviderSchedulerTestResult
+            {
+                Scenario = "LatencyOrdering",
+                Provider = first,
+                Passed = first == expected
+            };
+        }
+
+        private static AIProviderEndpoint CreateEndpoint(string name, Func<CancellationToken, Task<string>> respond)
+        {
+            return new AIProviderEndpoint(name, () => true,
+                (system, user, token) => respond(token),
+                (system, user, token) => throw new NotSupportedException());
+        }
+
+        private static void Prime(AIProviderEndpoint endpoint, TimeSpan latency)
+        {
+            for (int i = 0; i < 10; i++)
+            {
+                endpoint.Latency.Record(latency);
+            }
+        }
+
+        private static bool IsValid(string response) => response != null && response.StartsWith("{");
+    }
+
+    /// <summary>
+    /// Outcome of one provider scheduling scenario
+    /// </summary>
+    public class ProviderSchedulerTestResult
+    {
+        public string Scenario { get; set; } = string.Empty;
+        public string Provider { get; set; } = string.Empty;
+        public TimeSpan Duration { get; set; }
+        public bool Passed { get; set; }
+        public string Notes { get; set; } = string.Empty;
+    }
+}
@@ -0,0 +1,142 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using Rhino;
+using RhinoAI.Core;
+
+namespace RhinoAI.Tests
+{
+    /// <summary>
+    /// Compares scanning every object's bounding box, which is what spatial commands had to do
+    /// with doc.Objects, with SpatialIndex queries over a synthetic scene of random boxes
+    /// </summary>
+    public static class SpatialIndexBenchmark
+    {
+        private const double SceneSize = 1000.0;
+
+        /// <summary>
+        /// Run the benchmark and report timings and result equivalence
+        /// </summary>
+        public static BenchmarkResult Run(int objectCount = 100_000, int queries = 500)
+        {
+            var random = new Random(20);
+            var objects = CreateScene(random, objectCount);
+            var probes = Enumerable.Range(0, queries)
+                .Select(_ => (X: random.NextDouble() * SceneSize, Y: random.NextDouble() * SceneSize, Z: random.NextDouble() * SceneSize))
+                .ToArray();
+
+            var result = new BenchmarkResult
+            {
+                Name = $"Spatial queries over {objectCount:N0} boxes (range, overlap, nearest per probe)",
+                Iterations = queries
+            };
+
+            var buildStopwatch = Stopwatch.StartNew();
+            var index = new SpatialIndex();
+            index.Reset(objects);
+            buildStopwatch.Stop();
+            result.Notes.Add($"Bulk build: {buildStopwatch.Elapsed.TotalMilliseconds:F0}ms, tree height {index.Height}");
+
+            // Verify both approaches agree before timing anything
+            foreach (var probe in probes.Take(Math.Min(queries, 50)))
+            {
+                var expected = ScanQueries(objects, probe);
+                var actual = IndexQueries(index, probe);
+                if (!expected.Range.SetEquals(actual.Range) || !expected.Overlap.SetEquals(actual.Overlap) ||
+                    Math.Abs(expected.NearestDistance - actual.NearestDistance) > 1e-9)
+                {
+                    result.ResultsMatch = false;
+                    result.Notes.Add($"Mismatch at ({probe.X:F1}, {probe.Y:F1}, {probe.Z:F1})");
+                }
+            }
+
+            (result.BaselineDuration, result.BaselineAllocatedBytes) = Measure(probes, probe => ScanQueries(objects, probe));
+            (result.OptimizedDuration, result.OptimizedAllocatedBytes) = Measure(probes, probe => IndexQueries(index, probe));
+
+            // Document edits: move a tenth of the objects one at a time
+            var updateStopwatch = Stopwatch.StartNew();
+            for (int i = 0; i < objectCount; i += 10)
+            {
+                var moved = RandomBox(random);
+                index.Upsert(objects[i].Id, moved);
+            }
+            updateStopwatch.Stop();
+            result.Notes.Add($"Incremental updates: {objectCount / 10:N0} moves in {updateStopwatch.Elapsed.TotalMilliseconds:F0}ms, tree height {index.Height}");
+
+            RhinoApp.WriteLine(result.ToString());
+            return result;
+        }
+
+        private static SceneObjectInfo[] CreateScene(Random random, int objectCount)
+        {
+            var objects = new SceneObjectInfo[objectCount];
+            for (int i = 0; i < objectCount; i++)
+            {
+                objects[i] = new SceneObjectInfo(Guid.NewGuid(), "Brep", "Default", RandomBox(random));
+            }
+            return objects;
+        }
+
+        private static SceneBounds RandomBox(Random random)
+        {
+            var x = random.NextDouble() * SceneSize;
+            var y = random.NextDouble() * SceneSize;
+            var z = random.NextDouble() * SceneSize;
+            var size = 0.5 + random.NextDouble() * 4.5;
+            return new SceneBounds(x, y, z, x + size, y + size, z + size);
+        }
+
+        private static SceneBounds ProbeBox((double X, double Y, double Z) probe)
+        {
+            return new SceneBounds(probe.X - 10, probe.Y - 10, probe.Z - 10, probe.X + 10, probe.Y + 10, probe.Z + 10);
+        }
+
+        private static (HashSet<Guid> Range, HashSet<Guid> Overlap, double NearestDistance) ScanQueries(
+            SceneObjectInfo[] objects, (double X, double Y, double Z) probe)
+        {
+            var range = new HashSet<Guid>();
+            var overlap = new HashSet<Guid>();
+            var probeBox = ProbeBox(probe);
+            var nearest = double.PositiveInfinity;
+
+            foreach (var info in objects)
+            {
+                var distanceSquared = info.Bounds.DistanceSquaredTo(probe.X, probe.Y, probe.Z);
+                if (distanceSquared <= 20 * 20) range.Add(info.Id);
+                if (info.Bounds.Overlaps(probeBox)) overlap.Add(info.Id);
+                nearest = Math.Min(nearest, distanceSquared);
+            }
+
+            return (range, overlap, Math.Sqrt(nearest));
+        }
+
+        private static (HashSet<Guid> Range, HashSet<Guid> Overlap, double NearestDistance) IndexQueries(
+            SpatialIndex index, (double X, double Y, double Z) probe)
+        {
+            var range = new HashSet<Guid>(index.QueryRange(probe.X, probe.Y, probe.Z, 20));
+            var overlap = new HashSet<Guid>(index.QueryOverlap(ProbeBox(probe)));
+            var nearest = index.Nearest(probe.X, probe.Y, probe.Z);
+
+            return (range, overlap, nearest.Count > 0 ? nearest[0].Distance : double.PositiveInfinity);
+        }
+
+        private static (TimeSpan duration, long allocatedBytes) Measure(
+            (double X, double Y, double Z)[] probes, Func<(double X, double Y, double Z), object> query)
+        {
+            // Warm up the JIT
+            query(probes[0]);
+
+            var allocatedBefore = GC.GetAllocatedBytesForCurrentThread();
+            var stopwatch = Stopwatch.StartNew();
+
+            foreach (var probe in probes)
+            {
+                query(probe);
+            }
+
+            stopwatch.Stop();
+            return (stopwatch.Elapsed, GC.GetAllocatedBytesForCurrentThread() - allocatedBefore);
+        }
+    }
+}
@@ -0,0 +1,155 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Net;
+using System.Net.Http;
+using System.Net.Sockets;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using RhinoAI.Integration;
+
+namespace RhinoAI.Tests
+{
+    /// <summary>
+    /// Runs the streaming parsers against a local HttpListener that writes each provider's
+    /// wire format as delayed chunks, and checks tokens arrive before the body completes
+    /// </summary>
+    public static class StreamingResponseTests
+    {
+        private static readonly TimeSpan ChunkDelay = TimeSpan.FromMilliseconds(100);
+
+        private static readonly string[] OpenAIChunks =
+        {
+            "data: {\"choices\":[{\"delta\":{\"role\":\"assistant\"}}]}\n\n",
+            "data: {\"choices\":[{\"delta\":{\"content\":\"Create\"}}]}\n\n",
+            "data: {\"choices\":[{\"delta\":{\"content\":\" a \"}}]}\n\n",
+            "data: {\"choices\":[{\"delta\":{\"content\":\"sphere\"}}]}\n\ndata: [DONE]\n\n"
+        };
+
+        private static readonly string[] ClaudeChunks =
+        {
+            "event: message_start\ndata: {\"type\":\"message_start\",\"message\":{\"content\":[]}}\n\n",
+            "event: content_block_delta\ndata: {\"type\":\"content_block_delta\",\"index\":0,\"delta\":{\"type\":\"text_delta\",\"text\":\"Create\"}}\n\n",
+            // A chunk boundary in the middle of an event
+            "event: content_block_delta\ndata: {\"type\":\"content_block_delta\",\"index\":0,\"delta\":{\"type\":\"text_",
+            "delta\",\"text\":\" a \"}}\n\nevent: ping\ndata: {\"type\":\"ping\"}\n\n",
+            "event: content_block_delta\ndata: {\"type\":\"content_block_delta\",\"index\":0,\"delta\":{\"type\":\"text_delta\",\"text\":\"sphere\"}}\n\n",
+            "event: message_stop\ndata: {\"type\":\"message_stop\"}\n\n"
+        };
+
+        private static readonly string[] OllamaChunks =
+        {
+            "{\"model\":\"llama3.1:8b\",\"response\":\"Create\",\"done\":false}\n",
+            "{\"model\":\"llama3.1:8b\",\"response\":\" a \",\"done\":false}\n{\"model\":\"llama3.1:8b\",\"resp",
+            "onse\":\"sphere\",\"done\":false}\n",
+            "{\"model\":\"llama3.1:8b\",\"response\":\"\",\"done\":true,\"eval_count\":3}\n"
+        };
+
+        /// <summary>
+        /// Streams each provider format and returns one result per provider
+        /// </summary>
+        public static async Task<List<StreamingTestResult>> RunAllAsync()
+        {
+            return new List<StreamingTestResult>
+            {
+                await RunAsync("OpenAI", OpenAIChunks, "text/event-stream",
+                    stream => StreamingResponseReader.ReadOpenAIStreamAsync(stream)),
+                await RunAsync("Claude", ClaudeChunks, "text/event-stream",
+                    stream => StreamingResponseReader.ReadClaudeStreamAsync(stream)),
+                await RunAsync("Ollama", OllamaChunks, "application/x-ndjson",
+                    stream => StreamingResponseReader.ReadOllamaStreamAsync(stream))
+            };
+        }
+
+        private static async Task<StreamingTestResult> RunAsync(string provider, string[] chunks, string contentType,
+            Func<Stream, IAsyncEnumerable<string>> parse)
+        {
+            var port = GetFreePort();
+            var prefix = $"http://localhost:{port}/";
+
+            using var listener = new HttpListener();
+            listener.Prefixes.Add(prefix);
+            listener.Start();
+
+            var serverTask = ServeChunksAsync(listener, chunks, contentType);
+
+            try
+            {
+                using var client = new HttpClient();
+                var stopwatch = Stopwatch.StartNew();
+                using var response = await client.GetAsync(prefix + "stream", HttpCompletionOption.ResponseHeadersRead);
+                response.EnsureSuccessStatusCode();
+
+                var result = new StreamingTestResult { Provider = provider };
+                var text = new StringBuilder();
+
+                await using var stream = await response.Content.ReadAsStreamAsync();
+                await foreach (var token in parse(stream))
+                {
+                    if (result.TokenCount == 0)
+                    {
+                        result.TimeToFirstToken = stopwatch.Elapsed;
+                    }
+                    result.TokenCount++;
+                    text.Append(token);
+                }
+
+                result.TotalDuration = stopwatch.Elapsed;
+                result.Text = text.ToString();
+                return result;
+            }
+            finally
+            {
+                listener.Stop();
+                try { await serverTask; } catch (ObjectDisposedException) { } catch (HttpListenerException) { }
+            }
+        }
+
+        private static async Task ServeChunksAsync(HttpListener listener, string[] chunks, string contentType)
+        {
+            var context = await listener.GetContextAsync();
+            context.Response.ContentType = contentType;
+            context.Response.SendChunked = true;
+
+            var output = context.Response.OutputStream;
+            foreach (var chunk in chunks)
+            {
+                var bytes = Encoding.UTF8.GetBytes(chunk);
+                await output.WriteAsync(bytes, 0, bytes.Length);
+                await output.FlushAsync();
+                await Task.Delay(ChunkDelay);
+            }
+
+            context.Response.Close();
+        }
+
+        private static int GetFreePort()
+        {
+            var socket = new TcpListener(IPAddress.Loopback, 0);
+            socket.Start();
+            var port = ((IPEndPoint)socket.LocalEndpoint).Port;
+            socket.Stop();
+            return port;
+        }
+    }
+
+    /// <summary>
+    /// Outcome of streaming one provider format from the fake server
+    /// </summary>
+    public class StreamingTestResult
+    {
+        public string Provider { get; set; } = string.Empty;
+        public string Text { get; set; } = string.Empty;
+        public int TokenCount { get; set; }
+        public TimeSpan TimeToFirstToken { get; set; }
+        public TimeSpan TotalDuration { get; set; }
+
+        /// <summary>
+        /// Tokens were reassembled correctly and the first one arrived well before the stream ended
+        /// </summary>
+        public bool Passed => Text == "Create a sphere" && TokenCount == 3 &&
+                              TimeToFirstToken < TotalDuration / 2;
+    }
+}
@@ -0,0 +1,200 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Drawing;
+using System.Drawing.Drawing2D;
+using System.Drawing.Imaging;
+using System.IO;
+using System.Text;
+using System.Text.Json;
+using Rhino;
+using RhinoAI.AI;
+using RhinoAI.Core;
+using RhinoAI.Integration;
+
+namespace RhinoAI.Tests
+{
+    /// <summary>
+    /// Compares the old vision upload path (full-resolution PNG, base64 string, serialized JSON
+    /// string) with ViewportCapturePipeline plus Base64JsonContent, on synthetic viewport-like
+    /// frames so it runs without a visible view. Counts request body bytes and managed allocations;
+    /// network latency is proportional to the byte counts but is not measured here.
+    /// </summary>
+    public static class VisionCaptureBenchmark
+    {
+        private const string Placeholder = "__RHINOAI_IMAGE_DATA__";
+
+        /// <summary>
+        /// Run the benchmark over <paramref name="frames"/> frames, of which every other one repeats the previous view
+        /// </summary>
+        public static BenchmarkResult Run(int width = 1920, int height = 1080, int frames = 10)
+        {
+            var result = new BenchmarkResult
+            {
+                Name = $"Vision request bodies for {frames} {width}x{height} frames (PNG + base64 string vs downscaled JPEG streamed)",
+                Iterations = frames
+            };
+
+            var bitmaps = new List<Bitmap>();
+            try
+            {
+                for (int i = 0; i < frames; i++)
+                {
+                    // Pairs of identical frames, as when analysis is requested again without editing
+                    bitmaps.Add(CreateFrame(width, height, i / 2));
+                }
+
+                long baselineBytes = 0;
+                var baselineAllocated = GC.GetAllocatedBytesForCurrentThread();
+                var stopwatch = Stopwatch.StartNew();
+                foreach (var bitmap in bitmaps)
+                {
+                    baselineBytes += BaselineRequest(bitmap).Length;
+                }
+                result.BaselineDuration = stopwatch.Elapsed;
+                result.BaselineAllocatedBytes = GC.GetAllocatedBytesForCurrentThread() - baselineAllocated;
+
+                long optimizedBytes = 0;
+                var skipped = 0;
+                var encodedWidth = 0;
+                using var pipeline = new ViewportCapturePipeline(new ViewportCaptureOptions());
+                var optimizedAllocated = GC.GetAllocatedBytesForCurrentThread();
+                stopwatch.Restart();
+                foreach (var bitmap in bitmaps)
+                {
+                    using var image = pipeline.Process(bitmap);
+                    if (image.IsUnchanged)
+                    {
+                        skipped++;
+                        continue;
+                    }
+
+                    encodedWidth = image.Width;
+                    using var content = Base64JsonContent.Create(CreateRequest($"data:{image.MediaType};base64,{Placeholder}"),
+                        RhinoAIJsonContext.Default.OpenAIVisionRequest, Placeholder, image.Data);
+                    var counter = new CountingStream();
+                    content.CopyTo(counter, null, default);
+                    optimizedBytes += counter.Length;
+                }
+                result.OptimizedDuration = stopwatch.Elapsed;
+                result.OptimizedAllocatedBytes = GC.GetAllocatedBytesForCurrentThread() - optimizedAllocated;
+
+                result.ResultsMatch = skipped == frames / 2 && encodedWidth == Math.Min(width, 1024);
+                result.Notes.Add($"Request bytes: baseline {baselineBytes / 1024.0:N0} KB, pipeline {optimizedBytes / 1024.0:N0} KB " +
+                    $"({(optimizedBytes > 0 ? (double)baselineBytes / optimizedBytes : 0):F1}x smaller)");
+                result.Notes.Add($"Frames skipped as unchanged: {skipped} of {frames}");
+            }
+            finally
+            {
+                foreach (var bitmap in bitmaps)
+                {
+                    bitmap.Dispose();
+                }
+            }
+
+            RhinoApp.WriteLine(result.ToString());
+            return result;
+        }
+
+        /// <summary>
+        /// What AnalyzeImageAsync used to send: PNG bytes, a base64 string, a data URL string and the JSON string
+        /// </summary>
+        private static byte[] BaselineRequest(Bitmap bitmap)
+        {
+            byte[] png;
+            using (var stream = new MemoryStream())
+            {
+                bitmap.Save(stream, ImageFormat.Png);
+                png = stream.ToArray();
+            }
+
+            var imageUrl = $"data:image/png;base64,{Convert.ToBase64String(png)}";
+            var json = JsonSerializer.Serialize(CreateRequest(imageUrl), RhinoAIJsonContext.Default.OpenAIVisionRequest);
+            return Encoding.UTF8.GetBytes(json);
+        }
+
+        private static OpenAIVisionRequest CreateRequest(string imageUrl)
+        {
+            return new OpenAIVisionRequest
+            {
+                Model = "gpt-4-vision-preview",
+                Messages = new List<OpenAIVisionMessage>
+                {
+                    new OpenAIVisionMessage
+                    {
+                        Role = "user",
+                        Content = new List<OpenAIVisionContent>
+                        {
+                            new OpenAIVisionContent { Type = "text", Text = "Analyze this 3D model image" },
+                            new OpenAIVisionContent { Type = "image_url", ImageUrl = new OpenAIVisionImageUrl { Url = imageUrl } }
+                        }
+                    }
+                },
+                MaxTokens = 1500
+            };
+        }
+
+        /// <summary>
+        /// A shaded viewport look-alike: gradient background, construction grid and a few shaded solids
+        /// </summary>
+        private static Bitmap CreateFrame(int width, int height, int variant)
+        {
+            var bitmap = new Bitmap(width, height, PixelFormat.Format24bppRgb);
+            using var graphics = Graphics.FromImage(bitmap);
+            graphics.SmoothingMode = SmoothingMode.AntiAlias;
+
+            using (var background = new LinearGradientBrush(new Rectangle(0, 0, width, height),
+                       Color.FromArgb(190, 190, 200), Color.FromArgb(120, 120, 135), LinearGradientMode.Vertical))
+            {
+                graphics.FillRectangle(background, 0, 0, width, height);
+            }
+
+            using (var gridPen = new Pen(Color.FromArgb(150, 150, 160)))
+            {
+                for (int x = 0; x < width; x += 40) graphics.DrawLine(gridPen, x, height / 3, x - width / 4, height);
+                for (int y = height / 3; y < height; y += 30) graphics.DrawLine(gridPen, 0, y, width, y);
+            }
+
+            var random = new Random(variant);
+            for (int i = 0; i < 6; i++)
+            {
+                var size = random.Next(height / 8, height / 3);
+                var bounds = new Rectangle(random.Next(0, width - size), random.Next(0, height - size), size, size);
+                using var shading = new LinearGradientBrush(bounds, Color.FromArgb(random.Next(80, 255), random.Next(80, 255), random.Next(80, 255)),
+                    Color.FromArgb(40, 40, 50), LinearGradientMode.ForwardDiagonal);
+                if (i % 2 == 0)
+                {
+                    graphics.FillEllipse(shading, bounds);
+                }
+                else
+                {
+                    graphics.FillRectangle(shading, bounds);
+                }
+                graphics.DrawRectangle(Pens.Black, bounds);
+            }
+
+            return bitmap;
+        }
+
+        /// <summary>
+        /// Write-only stream that only counts bytes, standing in for the network
+        /// </summary>
+        private sealed class CountingStream : Stream
+        {
+            private long _length;
+
+            public override bool CanRead => false;
+            public override bool CanSeek => false;
+            public override bool CanWrite => true;
+            public override long Length => _length;
+            public override long Position { get => _length; set => throw new NotSupportedException(); }
+
+            public override void Write(byte[] buffer, int offset, int count) => _length += count;
+            public override void Write(ReadOnlySpan<byte> buffer) => _length += buffer.Length;
+            public override void Flush() { }
+            public override int Read(byte[] buffer, int offset, int count) => throw new NotSupportedException();
+            public override long Seek(long offset, SeekOrigin origin) => throw new NotSupportedException();
+            public override void SetLength(long value) => throw new NotSupportedException();
+        }
+    }
+}
@@ -4,6 +4,7 @@ using Rhino;
 using Rhino.Commands;
 using Rhino.Input;
 using Rhino.Input.Custom;
+using RhinoAI.AI;
 using RhinoAI.Core;
 using RhinoAI.Integration;
 using System.Text.Json;
@@ -162,71 +163,32 @@ namespace RhinoAI.UI.Commands
 
         private SceneContext CreateSceneContext(RhinoDoc doc)
         {
-            var objectTypes = new System.Collections.Generic.List<string>();
-            var boundingBox = new double[6] { 0, 0, 0, 0, 0, 0 };
-            var activeLayers = new System.Collections.Generic.List<string>();
+            SceneContext context;
 
             try
             {
-                // Collect object information
-                foreach (var obj in doc.Objects)
-                {
-                    if (obj != null && obj.Geometry != null)
-                    {
-                        objectTypes.Add(obj.Geometry.ObjectType.ToString());
-                    }
-                }
-
-                // Get overall bounding box
-                if (doc.Objects.Count > 0)
-                {
-                    var bbox = Rhino.Geometry.BoundingBox.Empty;
-                    foreach (var obj in doc.Objects)
-                    {
-                        if (obj?.Geometry != null)
-                        {
-                            bbox.Union(obj.Geometry.GetBoundingBox(true));
-                        }
-                    }
-
-                    if (bbox.IsValid)
-                    {
-                        boundingBox = new double[] 
-                        { 
-                            bbox.Min.X, bbox.Min.Y, bbox.Min.Z,
-                            bbox.Max.X, bbox.Max.Y, bbox.Max.Z 
-                        };
-                    }
-                }
-
-                // Get active layers
-                foreach (var layer in doc.Layers)
-                {
-                    if (layer != null && layer.IsVisible)
-                    {
-                        activeLayers.Add(layer.Name);
-                    }
-                }
+                // While real-time assistance runs its event-maintained index answers without a document scan
+                context = RhinoAIPlugin.Instance?.AIManager?.RealTimeAssistant?.GetSceneContext(doc)
+                    ?? RhinoSceneContext.Capture(doc);
             }
             catch (Exception ex)
             {
                 RhinoApp.WriteLine($"Error creating scene context: {ex.Message}");
+                context = new SceneContext
+                {
+                    ObjectCount = doc.Objects.Count,
+                    ObjectTypes = new string[0],
+                    BoundingBox = new double[6],
+                    ActiveLayers = new string[0],
+                    CustomProperties = new System.Collections.Generic.Dictionary<string, object>()
+                };
             }
 
-            // Build custom properties dictionary separately to avoid initializer complexities
-            var customProps = new System.Collections.Generic.Dictionary<string, object>();
-            customProps["DocumentName"] = doc.Name ?? "Untitled";
-            customProps["Units"] = doc.ModelUnitSystem.ToString();
-            customProps["ViewCount"] = doc.Views.Count();
+            context.CustomProperties["DocumentName"] = doc.Name ?? "Untitled";
+            context.CustomProperties["Units"] = doc.ModelUnitSystem.ToString();
+            context.CustomProperties["ViewCount"] = doc.Views.Count();
 
-            return new SceneContext
-            {
-                ObjectCount = doc.Objects.Count,
-                ObjectTypes = objectTypes.ToArray(),
-                BoundingBox = boundingBox,
-                ActiveLayers = activeLayers.ToArray(),
-                CustomProperties = customProps
-            };
+            return context;
         }
 
         private string GenerateSceneDescription(SceneContext context)
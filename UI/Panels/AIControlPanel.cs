@@ -385,7 +385,17 @@ namespace RhinoAI.UI.Panels
 
             try
             {
-                var response = await _aiManager.NlpProcessor.ProcessNaturalLanguageAsync(input);
+                var streaming = false;
+                var response = await _aiManager.NlpProcessor.ProcessNaturalLanguageAsync(input, token =>
+                {
+                    AppendStreamingToken(token, isFirst: !streaming);
+                    streaming = true;
+                });
+
+                if (streaming)
+                {
+                    AppendStreamingToken(Environment.NewLine, isFirst: false);
+                }
                 LogInteraction("AI", response);
                 AddHistoryItem(input, response);
             }
@@ -464,6 +474,31 @@ namespace RhinoAI.UI.Panels
             _outputTextBox.ScrollToCaret();
         }
 
+        /// <summary>
+        /// Appends a streamed AI token to the output without waiting for the UI thread
+        /// </summary>
+        private void AppendStreamingToken(string token, bool isFirst)
+        {
+            if (InvokeRequired)
+            {
+                // BeginInvoke preserves token order without blocking the network read
+                BeginInvoke(new Action(() => AppendStreamingToken(token, isFirst)));
+                return;
+            }
+
+            _outputTextBox.SelectionStart = _outputTextBox.TextLength;
+            _outputTextBox.SelectionLength = 0;
+            _outputTextBox.SelectionColor = Color.Gray;
+            if (isFirst)
+            {
+                _outputTextBox.AppendText($"{DateTime.Now:HH:mm:ss} - AI (streaming): ");
+                SetStatus("Receiving response...", Color.Orange);
+            }
+            _outputTextBox.AppendText(token);
+            _outputTextBox.SelectionColor = _outputTextBox.ForeColor;
+            _outputTextBox.ScrollToCaret();
+        }
+
         private void AddToHistory(string input, string model)
         {
             var item = new ListViewItem(DateTime.Now.ToString("HH:mm:ss"));
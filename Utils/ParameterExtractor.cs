@@ -1,6 +1,7 @@
 using System;
 using System.Collections.Generic;
 using System.Linq;
+using System.Text.Json;
 using System.Text.RegularExpressions;
 using System.Drawing;
 using Rhino.Geometry;
@@ -9,6 +10,24 @@ namespace RhinoAI.Utils
 {
     public static class ParameterExtractor
     {
+        private static readonly Dictionary<string, Color> ColorMap = new Dictionary<string, Color>
+        {
+            {"red", Color.Red},
+            {"green", Color.Green},
+            {"blue", Color.Blue},
+            {"yellow", Color.Yellow},
+            {"orange", Color.Orange},
+            {"purple", Color.Purple},
+            {"pink", Color.Pink},
+            {"cyan", Color.Cyan},
+            {"magenta", Color.Magenta},
+            {"white", Color.White},
+            {"black", Color.Black},
+            {"gray", Color.Gray},
+            {"grey", Color.Gray},
+            {"brown", Color.Brown}
+        };
+
         public static Dictionary<string, object> Extract(string input, List<string> expectedParams)
         {
             var parameters = new Dictionary<string, object>();
@@ -110,6 +129,84 @@ namespace RhinoAI.Utils
             return parameters;
         }
 
+        /// <summary>
+        /// Convert pre-parsed JSON parameters to the values command handlers expect:
+        /// "center" as Point3d, "size"/"scale"/"translation" as Vector3d (a single number is uniform),
+        /// "rows"/"columns" as int, "color" as a color name or #RRGGBB, other numbers as double
+        /// </summary>
+        public static Dictionary<string, object> FromJson(IReadOnlyDictionary<string, JsonElement> values)
+        {
+            var parameters = new Dictionary<string, object>();
+            if (values == null)
+            {
+                return parameters;
+            }
+
+            foreach (var (key, value) in values)
+            {
+                switch (key)
+                {
+                    case "center" when TryGetTriple(value, out var x, out var y, out var z):
+                        parameters[key] = new Point3d(x, y, z);
+                        break;
+                    case "size" or "scale" or "translation" when TryGetTriple(value, out var x, out var y, out var z):
+                        parameters[key] = new Vector3d(x, y, z);
+                        break;
+                    case "size" or "scale" when value.ValueKind == JsonValueKind.Number:
+                        var uniform = value.GetDouble();
+                        parameters[key] = new Vector3d(uniform, uniform, uniform);
+                        break;
+                    case "rows" or "columns" when value.ValueKind == JsonValueKind.Number && value.TryGetInt32(out var count):
+                        parameters[key] = count;
+                        break;
+                    case "color" when value.ValueKind == JsonValueKind.String && TryParseColor(value.GetString(), out var color):
+                        parameters[key] = color;
+                        break;
+                    default:
+                        if (value.ValueKind == JsonValueKind.Number)
+                        {
+                            parameters[key] = value.GetDouble();
+                        }
+                        else if (value.ValueKind == JsonValueKind.String)
+                        {
+                            parameters[key] = value.GetString();
+                        }
+                        break;
+                }
+            }
+
+            return parameters;
+        }
+
+        private static bool TryGetTriple(JsonElement value, out double x, out double y, out double z)
+        {
+            x = y = z = 0;
+            if (value.ValueKind != JsonValueKind.Array || value.GetArrayLength() != 3)
+            {
+                return false;
+            }
+
+            return value[0].TryGetDouble(out x) && value[1].TryGetDouble(out y) && value[2].TryGetDouble(out z);
+        }
+
+        private static bool TryParseColor(string text, out Color color)
+        {
+            if (ColorMap.TryGetValue(text.ToLowerInvariant(), out color))
+            {
+                return true;
+            }
+
+            try
+            {
+                color = ColorTranslator.FromHtml(text);
+                return !color.IsEmpty;
+            }
+            catch (Exception ex) when (ex is ArgumentException || ex is FormatException)
+            {
+                return false;
+            }
+        }
+
         private static List<double> ExtractNumbers(string input)
         {
             var numbers = new List<double>();
@@ -131,29 +228,11 @@ namespace RhinoAI.Utils
             var colors = new List<Color>();
             var lowerInput = input.ToLowerInvariant();
             
-            var colorMap = new Dictionary<string, Color>
-            {
-                {"red", Color.Red},
-                {"green", Color.Green},
-                {"blue", Color.Blue},
-                {"yellow", Color.Yellow},
-                {"orange", Color.Orange},
-                {"purple", Color.Purple},
-                {"pink", Color.Pink},
-                {"cyan", Color.Cyan},
-                {"magenta", Color.Magenta},
-                {"white", Color.White},
-                {"black", Color.Black},
-                {"gray", Color.Gray},
-                {"grey", Color.Gray},
-                {"brown", Color.Brown}
-            };
-            
-            foreach (var colorName in colorMap.Keys)
+            foreach (var colorName in ColorMap.Keys)
             {
                 if (lowerInput.Contains(colorName))
                 {
-                    colors.Add(colorMap[colorName]);
+                    colors.Add(ColorMap[colorName]);
                 }
             }
             
@@ -0,0 +1,70 @@
+using System;
+
+namespace RhinoAI.Utils
+{
+    /// <summary>
+    /// 64-bit FNV-1a hash that, unlike string.GetHashCode, is stable across processes and runs
+    /// </summary>
+    public class StableHash
+    {
+        private const ulong OffsetBasis = 14695981039346656037;
+        private const ulong Prime = 1099511628211;
+
+        private ulong _value = OffsetBasis;
+
+        public ulong Value => _value;
+
+        public StableHash Add(string? text)
+        {
+            if (text == null)
+            {
+                // Distinguish null from empty
+                Mix(0xFF);
+                return this;
+            }
+
+            foreach (var c in text)
+            {
+                Mix((byte)c);
+                Mix((byte)(c >> 8));
+            }
+
+            // Length terminator so ("ab", "c") and ("a", "bc") hash differently
+            return Add(text.Length);
+        }
+
+        public StableHash Add(int value) => Add((long)value);
+
+        public StableHash Add(double value) => Add(BitConverter.DoubleToInt64Bits(value));
+
+        public StableHash Add(long value)
+        {
+            for (int i = 0; i < 64; i += 8)
+            {
+                Mix((byte)(value >> i));
+            }
+            return this;
+        }
+
+        public StableHash Add(Guid value)
+        {
+            Span<byte> bytes = stackalloc byte[16];
+            value.TryWriteBytes(bytes);
+            foreach (var b in bytes)
+            {
+                Mix(b);
+            }
+            return this;
+        }
+
+        public override string ToString() => _value.ToString("x16");
+
+        public static ulong Of(string? text) => new StableHash().Add(text).Value;
+
+        private void Mix(byte b)
+        {
+            _value ^= b;
+            _value *= Prime;
+        }
+    }
+}